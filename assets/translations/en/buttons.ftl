@@ -128,6 +128,7 @@ btn-statistics-current-page =
 
 # Users
 btn-users-search = 🔍 Search User
+btn-users-search-more = ⏬ Show More Results
 btn-users-recent-registered = 🆕 Recently Registered
 btn-users-recent-activity = 📝 Recent Activity
 btn-users-blacklist = 🚫 Blacklist
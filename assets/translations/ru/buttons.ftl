@@ -128,6 +128,7 @@ btn-statistics-current-page =
 
 # Users
 btn-users-search = 🔍 Поиск пользователя
+btn-users-search-more = ⏬ Показать ещё
 btn-users-recent-registered = 🆕 Последние зарегистрированные
 btn-users-recent-activity = 📝 Последние взаимодействующие
 btn-users-blacklist = 🚫 Черный список
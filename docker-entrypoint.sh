@@ -5,6 +5,7 @@ export ASSETS_CONTAINER_PATH="/opt/altshop/assets"
 export ASSETS_DEFAULT_PATH="/opt/altshop/assets.default"
 
 UVICORN_RELOAD_ARGS=""
+UVICORN_WORKER_ARGS=""
 if ! python -m src.core.utils.assets_sync; then
     echo "Asset initialization failed! Exiting container..."
     exit 1
@@ -27,9 +28,10 @@ if [ "$UVICORN_RELOAD_ENABLED" = "true" ]; then
     echo "Uvicorn will run with reload enabled"
     UVICORN_RELOAD_ARGS="--reload --reload-dir /opt/altshop/src --reload-dir /opt/altshop/assets --reload-include *.ftl"
 else
-    echo "Uvicorn will run without reload"
+    echo "Uvicorn will run without reload with ${APP_WORKERS:-1} worker(s)"
+    UVICORN_WORKER_ARGS="--workers ${APP_WORKERS:-1}"
 fi
 
 FORWARDED_ALLOW_IPS="${APP_TRUSTED_PROXY_IPS:-127.0.0.1,::1}"
 
-exec uvicorn src.__main__:application --host "${APP_HOST}" --port "${APP_PORT}" --factory --use-colors --proxy-headers --forwarded-allow-ips "${FORWARDED_ALLOW_IPS}" ${UVICORN_RELOAD_ARGS}
+exec uvicorn src.__main__:application --host "${APP_HOST}" --port "${APP_PORT}" --factory --use-colors --proxy-headers --forwarded-allow-ips "${FORWARDED_ALLOW_IPS}" ${UVICORN_RELOAD_ARGS} ${UVICORN_WORKER_ARGS}
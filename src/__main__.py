@@ -2,10 +2,12 @@ import uvicorn
 from dishka.integrations.aiogram import setup_dishka as setup_aiogram_dishka
 from dishka.integrations.fastapi import setup_dishka as setup_fastapi_dishka
 from fastapi import FastAPI
+from loguru import logger
 
 from src.api.app import create_app
 from src.bot.dispatcher import create_bg_manager_factory, create_dispatcher, setup_dispatcher
 from src.core.config import AppConfig
+from src.core.enums import BotUpdateMode
 from src.core.logger import setup_logger
 from src.infrastructure.di import create_container
 
@@ -14,6 +16,12 @@ def application() -> FastAPI:
     setup_logger()
 
     config = AppConfig.get()
+    if config.workers > 1 and config.bot.update_mode == BotUpdateMode.INLINE:
+        logger.warning(
+            "Several API workers handle Telegram updates inline; updates of one chat may be "
+            "processed out of order across workers. Use BOT_UPDATE_MODE=stream"
+        )
+
     dispatcher = create_dispatcher(config=config)
     bg_manager_factory = create_bg_manager_factory(dispatcher=dispatcher)
     setup_dispatcher(dispatcher)
@@ -30,10 +38,11 @@ def application() -> FastAPI:
 if __name__ == "__main__":
     config = AppConfig.get()
     uvicorn.run(
-        app=application,
+        app="src.__main__:application",
         host="0.0.0.0",
         port=8000,
         factory=True,
         proxy_headers=True,
         forwarded_allow_ips=config.forwarded_allow_ips,
+        workers=config.workers,
     )
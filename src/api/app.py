@@ -1,5 +1,6 @@
 from aiogram import Dispatcher
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from src.api.endpoints import (
@@ -12,9 +13,21 @@ from src.api.endpoints import (
     web_auth_router,
 )
 from src.core.config import AppConfig
+from src.core.security.password import PasswordHasherBusyError
 from src.lifespan import lifespan
 
 
+async def _password_hasher_busy_handler(
+    request: Request,
+    exception: Exception,
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Authentication is busy, retry later"},
+        headers={"Retry-After": "1"},
+    )
+
+
 def create_app(config: AppConfig, dispatcher: Dispatcher) -> FastAPI:
     app: FastAPI = FastAPI(lifespan=lifespan)
     app.add_middleware(
@@ -24,6 +37,7 @@ def create_app(config: AppConfig, dispatcher: Dispatcher) -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_exception_handler(PasswordHasherBusyError, _password_hasher_busy_handler)
     app.include_router(analytics_router)
     app.include_router(internal_router)
     app.include_router(payments_router)
@@ -34,6 +48,7 @@ def create_app(config: AppConfig, dispatcher: Dispatcher) -> FastAPI:
     telegram_webhook_endpoint = TelegramWebhookEndpoint(
         dispatcher=dispatcher,
         secret_token=config.bot.secret_token.get_secret_value(),
+        config=config.bot,
     )
     telegram_webhook_endpoint.register(app=app, path=config.bot.webhook_path)
     app.state.telegram_webhook_endpoint = telegram_webhook_endpoint
@@ -4,7 +4,8 @@ from typing import Any, Literal, Optional
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -70,33 +71,42 @@ def _resolve_optional_user_telegram_id(
     return None
 
 
-@router.post("/web-events", response_model=OkResponse)
+@router.post(
+    "/web-events",
+    response_model=OkResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": OkResponse}},
+)
 @inject
 async def create_web_event(
     payload: WebAnalyticsEventRequest,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     web_analytics_event_service: FromDishka[WebAnalyticsEventService] = None,  # type: ignore[assignment]
-) -> OkResponse:
+) -> OkResponse | JSONResponse:
     if web_analytics_event_service is None:
         return OkResponse(ok=True)
 
     user_telegram_id = _resolve_optional_user_telegram_id(credentials=credentials)
 
-    try:
-        await web_analytics_event_service.create_event(
-            event_name=payload.event_name,
-            source_path=payload.source_path,
-            session_id=payload.session_id,
-            user_telegram_id=user_telegram_id,
-            device_mode=payload.device_mode,
-            is_in_telegram=payload.is_in_telegram,
-            has_init_data=payload.has_init_data,
-            start_param=payload.start_param,
-            has_query_id=payload.has_query_id,
-            chat_type=payload.chat_type,
-            meta=payload.meta,
+    accepted = web_analytics_event_service.enqueue_event(
+        event_name=payload.event_name,
+        source_path=payload.source_path,
+        session_id=payload.session_id,
+        user_telegram_id=user_telegram_id,
+        device_mode=payload.device_mode,
+        is_in_telegram=payload.is_in_telegram,
+        has_init_data=payload.has_init_data,
+        start_param=payload.start_param,
+        has_query_id=payload.has_query_id,
+        chat_type=payload.chat_type,
+        meta=payload.meta,
+    )
+    if not accepted:
+        logger.debug("Analytics buffer is full, dropping event '{}'", payload.event_name)
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=OkResponse(ok=False).model_dump(),
+            headers={"Retry-After": "5"},
         )
-    except Exception as exc:
-        logger.warning("Failed to persist analytics event '{}': {}", payload.event_name, exc)
 
     return OkResponse(ok=True)
@@ -114,6 +114,7 @@ async def payments_webhook(
             gateway_type=gateway_enum.value,
             payment_id=payment_id,
             payload_hash=payload_hash,
+            payment_status=payment_status.value,
         )
         if inbox_result.already_processed:
             emit_counter(
@@ -128,10 +129,14 @@ async def payments_webhook(
             return await gateway.build_webhook_response(request)
 
         logger.info(
-            "Webhook processed successfully - Payment ID: '{}' Status: '{}'",
+            "Webhook recorded - Payment ID: '{}' Status: '{}'",
             payment_id,
             payment_status,
         )
+        if not inbox_result.needs_dispatch:
+            # The worker holding this payment applies the newly recorded status next.
+            return await gateway.build_webhook_response(request)
+
         try:
             await handle_payment_transaction_task.kiq(
                 str(payment_id),
@@ -139,27 +144,18 @@ async def payments_webhook(
                 gateway_enum.value,
             )
         except Exception as queue_exception:
+            # The inbox row is durable; the retry sweep dispatches it once the queue is back.
             emit_counter(
                 "payment_webhook_enqueue_failures_total",
                 gateway_type=gateway_enum.value,
             )
-            await payment_webhook_event_service.mark_failed(
-                gateway_type=gateway_enum.value,
-                payment_id=payment_id,
-                error_message=f"enqueue_failed: {queue_exception}",
-            )
-            logger.exception(
+            logger.warning(
                 "Failed to enqueue payment webhook for gateway='{}' payment_id='{}': {}",
                 gateway_enum.value,
                 payment_id,
                 queue_exception,
             )
-            return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
 
-        await payment_webhook_event_service.mark_enqueued(
-            gateway_type=gateway_enum.value,
-            payment_id=payment_id,
-        )
         return await gateway.build_webhook_response(request)
 
     except ValueError as e:
@@ -1,65 +1,84 @@
-import asyncio
 import secrets
-from typing import Annotated, Any
+from functools import partial
+from typing import Annotated
 
 from aiogram import Bot, Dispatcher
-from aiogram.methods import TelegramMethod
 from aiogram.types import Update
 from dishka.integrations.fastapi import FromDishka, inject
 from fastapi import Body, FastAPI, Header, HTTPException, Response, status
-from starlette.background import BackgroundTask
+from loguru import logger
 from starlette.responses import JSONResponse
 
+from src.bot.dispatcher import feed_update
+from src.bot.update_processor import UpdateProcessor
+from src.bot.update_stream import UpdateStreamPublisher
+from src.core.config.bot import BotConfig
+from src.core.enums import BotUpdateMode
+
 
 class TelegramWebhookEndpoint:
     dispatcher: Dispatcher
     secret_token: str
-    _feed_update_tasks: set[asyncio.Task[Any]]
+    update_mode: BotUpdateMode
+    update_processor: UpdateProcessor
 
-    def __init__(self, dispatcher: Dispatcher, secret_token: str) -> None:
+    def __init__(self, dispatcher: Dispatcher, secret_token: str, config: BotConfig) -> None:
         self.dispatcher = dispatcher
         self.secret_token = secret_token
-        self._feed_update_tasks = set()
+        self.update_mode = config.update_mode
+        self.update_processor = UpdateProcessor(
+            partial(feed_update, dispatcher),
+            concurrency=config.update_concurrency,
+            max_pending=config.update_queue_size,
+            max_pending_per_chat=config.update_chat_queue_size,
+            drain_timeout=config.update_drain_timeout,
+        )
 
     async def startup(self) -> None:
         await self.dispatcher.emit_startup(**self.dispatcher.workflow_data)
+        if self.update_mode == BotUpdateMode.INLINE:
+            self.update_processor.start()
 
     async def shutdown(self) -> None:
+        # Finish queued updates while the dispatcher's resources are still available.
+        await self.update_processor.close()
         await self.dispatcher.emit_shutdown(**self.dispatcher.workflow_data)
 
-        for task in list(self._feed_update_tasks):
-            if not task.done():
-                task.cancel()
-
-        await asyncio.gather(*self._feed_update_tasks, return_exceptions=True)
-
     def register(self, app: FastAPI, path: str) -> None:
         app.add_api_route(path=path, endpoint=self._handle_request, methods=["POST"])
 
     def _verify_secret(self, telegram_secret_token: str) -> bool:
         return secrets.compare_digest(telegram_secret_token, self.secret_token)
 
-    async def _feed_update(self, bot: Bot, update: Update) -> None:
-        result = await self.dispatcher.feed_update(bot=bot, update=update)
-        if isinstance(result, TelegramMethod):
-            await self.dispatcher.silent_call_request(bot=bot, result=result)
-
     @inject
     async def _handle_request(
         self,
         update: Annotated[Update, Body()],
         x_telegram_bot_api_secret_token: Annotated[str, Header()],
         bot: FromDishka[Bot],
+        update_stream: FromDishka[UpdateStreamPublisher],
     ) -> Response:
         if not self._verify_secret(x_telegram_bot_api_secret_token):
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
 
-        async def run_feed_update_and_track() -> None:
-            task = asyncio.create_task(self._feed_update(bot=bot, update=update))
-            self._feed_update_tasks.add(task)
-            task.add_done_callback(self._feed_update_tasks.discard)
-            await task
+        if self.update_mode == BotUpdateMode.STREAM:
+            try:
+                await update_stream.publish(update)
+            except Exception as exception:
+                logger.error(f"Failed to queue Telegram update '{update.update_id}': {exception}")
+                return JSONResponse(
+                    {"detail": "Update queue is unavailable, retry later"},
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    headers={"Retry-After": "1"},
+                )
+            return JSONResponse({}, status_code=status.HTTP_200_OK)
 
-        background_task = BackgroundTask(run_feed_update_and_track)
+        if not self.update_processor.submit(bot, update):
+            # Telegram redelivers updates that were not acknowledged with a 2xx.
+            return JSONResponse(
+                {"detail": "Update queue is full, retry later"},
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": "1"},
+            )
 
-        return JSONResponse({}, background=background_task, status_code=status.HTTP_200_OK)
+        return JSONResponse({}, status_code=status.HTTP_200_OK)
@@ -0,0 +1,59 @@
+"""User event stream endpoint: server-sent change notifications for the web cabinet."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from typing import Any, Optional, cast
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from src.api.dependencies.web_auth import require_web_product_access
+from src.core.constants import USER_EVENT_STREAM_RETRY_MS
+from src.infrastructure.database import UnitOfWork
+from src.infrastructure.database.models.dto import UserDto
+from src.services.user_event_stream import UserEventStreamService, UserStreamEvent
+
+router = APIRouter(prefix="/api/v1", tags=["User API"])
+_DISHKA_DEFAULT = cast(Any, None)
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def _format_sse(event: Optional[UserStreamEvent]) -> str:
+    if event is None:
+        return ": keep-alive\n\n"
+    return f"event: {event.type.value}\ndata: {event.model_dump_json()}\n\n"
+
+
+@router.get("/user/events", response_class=StreamingResponse)
+@inject
+async def stream_user_events(
+    request: Request,
+    current_user: UserDto = Depends(require_web_product_access),
+    uow: FromDishka[UnitOfWork] = _DISHKA_DEFAULT,
+    user_event_stream_service: FromDishka[UserEventStreamService] = _DISHKA_DEFAULT,
+) -> StreamingResponse:
+    """Stream change events so the client refetches only what changed."""
+    # Release the request-scoped DB connection; the stream itself only needs Redis.
+    await uow.commit()
+
+    async def event_source() -> AsyncIterator[str]:
+        yield f"retry: {USER_EVENT_STREAM_RETRY_MS}\n\n"
+        events = user_event_stream_service.listen(user_telegram_id=current_user.telegram_id)
+        async with aclosing(events):
+            async for event in events:
+                if await request.is_disconnected():
+                    break
+                yield _format_sse(event)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
@@ -5,7 +5,6 @@ from typing import Any, cast
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
-from redis.asyncio import Redis
 
 from src.api.contracts.web_auth import (
     ChangePasswordRequest,
@@ -22,6 +21,7 @@ from src.api.utils.web_auth_transport import set_auth_cookies
 from src.core.config import AppConfig
 from src.core.security.jwt_handler import create_access_token, create_refresh_token
 from src.infrastructure.database.models.dto import UserDto, WebAccountDto
+from src.infrastructure.redis import RedisRateLimiter
 from src.services.email_recovery import EmailRecoveryService
 
 from .web_auth_support import _enforce_rate_limit, _request_ip, _resolve_web_auth_message
@@ -38,12 +38,12 @@ async def request_email_verification(
     web_account: WebAccountDto = Depends(get_current_web_account),
     email_recovery_service: FromDishka[EmailRecoveryService] = _DISHKA_DEFAULT,
     config: FromDishka[AppConfig] = _DISHKA_DEFAULT,
-    redis_client: FromDishka[Redis] = _DISHKA_DEFAULT,
+    rate_limiter: FromDishka[RedisRateLimiter] = _DISHKA_DEFAULT,
 ) -> MessageResponse:
     locale = _resolve_web_request_locale(request, config=config, current_user=current_user)
     await _enforce_rate_limit(
         config,
-        redis_client,
+        rate_limiter,
         f"auth:email_verify:request:{web_account.id}:{_request_ip(request)}",
     )
     try:
@@ -82,13 +82,13 @@ async def forgot_password(
     request: Request,
     email_recovery_service: FromDishka[EmailRecoveryService] = _DISHKA_DEFAULT,
     config: FromDishka[AppConfig] = _DISHKA_DEFAULT,
-    redis_client: FromDishka[Redis] = _DISHKA_DEFAULT,
+    rate_limiter: FromDishka[RedisRateLimiter] = _DISHKA_DEFAULT,
 ) -> MessageResponse:
     locale = _resolve_web_request_locale(request, config=config)
     identity = (payload.username or payload.email or "unknown").strip().lower()
     await _enforce_rate_limit(
         config,
-        redis_client,
+        rate_limiter,
         f"auth:password_forgot:{identity}:{_request_ip(request)}",
     )
     await email_recovery_service.forgot_password(username=payload.username, email=payload.email)
@@ -102,13 +102,13 @@ async def forgot_password_telegram(
     request: Request,
     email_recovery_service: FromDishka[EmailRecoveryService] = _DISHKA_DEFAULT,
     config: FromDishka[AppConfig] = _DISHKA_DEFAULT,
-    redis_client: FromDishka[Redis] = _DISHKA_DEFAULT,
+    rate_limiter: FromDishka[RedisRateLimiter] = _DISHKA_DEFAULT,
 ) -> MessageResponse:
     locale = _resolve_web_request_locale(request, config=config)
     identity = payload.username.strip().lower()
     await _enforce_rate_limit(
         config,
-        redis_client,
+        rate_limiter,
         f"auth:password_forgot_tg:{identity}:{_request_ip(request)}",
     )
     await email_recovery_service.request_telegram_password_reset(username=payload.username)
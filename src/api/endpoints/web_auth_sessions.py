@@ -7,7 +7,6 @@ from dishka.integrations.fastapi import inject
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import HTMLResponse
 from loguru import logger
-from redis.asyncio import Redis
 
 from src.api.contracts.web_auth import LoginRequest, RegisterRequest, WebAccountBootstrapRequest
 from src.api.dependencies.web_access import (
@@ -49,6 +48,7 @@ from src.core.security.jwt_handler import (
 from src.core.utils.bot_menu import resolve_bot_menu_url
 from src.core.utils.branding import normalize_text, resolve_project_name
 from src.infrastructure.database.models.dto import UserDto, WebAccountDto
+from src.infrastructure.redis import RedisRateLimiter
 from src.services.notification import NotificationService
 from src.services.partner import PartnerService
 from src.services.referral import ReferralService
@@ -228,11 +228,11 @@ async def login(
     web_account_service: FromDishka[WebAccountService],
     settings_service: FromDishka[SettingsService],
     config: FromDishka[AppConfig],
-    redis_client: FromDishka[Redis],
+    rate_limiter: FromDishka[RedisRateLimiter],
 ) -> SessionResponse:
     await _enforce_rate_limit(
         config,
-        redis_client,
+        rate_limiter,
         f"auth:login:{login_data.username.lower()}:{_request_ip(request)}",
     )
 
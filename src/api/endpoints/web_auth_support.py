@@ -3,13 +3,13 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
+import math
 from typing import Any, Callable, Literal
 from urllib.parse import parse_qsl
 
 from fastapi import HTTPException, Request
 from loguru import logger
 from pydantic import BaseModel
-from redis.asyncio import Redis
 
 from src.api.contracts.web_auth import TelegramAuthRequest
 from src.api.dependencies.web_access import normalize_web_referral_code
@@ -21,6 +21,7 @@ from src.core.constants import REFERRAL_PREFIX
 from src.core.enums import ReferralInviteSource, SystemNotificationType
 from src.core.utils.system_events import build_system_event_payload
 from src.infrastructure.database.models.dto import UserDto
+from src.infrastructure.redis import RedisRateLimiter
 from src.services.notification import NotificationService
 from src.services.partner import PartnerService
 from src.services.referral import ReferralService
@@ -173,7 +174,7 @@ async def _track_web_analytics_event(
         return
 
     try:
-        await web_analytics_event_service.create_event(
+        web_analytics_event_service.enqueue_event(
             event_name=event_name,
             source_path=source_path,
             session_id=session_id,
@@ -187,7 +188,7 @@ async def _track_web_analytics_event(
             meta=meta or {},
         )
     except Exception as exc:
-        logger.warning("Failed to persist auth analytics event '{}': {}", event_name, exc)
+        logger.warning("Failed to queue auth analytics event '{}': {}", event_name, exc)
 
 
 async def _apply_referral_for_new_user(
@@ -307,20 +308,28 @@ async def _notify_web_account_linked(
     )
 
 
-async def _enforce_rate_limit(config: AppConfig, redis_client: Redis, key: str) -> None:
+async def _enforce_rate_limit(
+    config: AppConfig,
+    rate_limiter: RedisRateLimiter,
+    key: str,
+) -> None:
     if not config.web_app.rate_limit_enabled:
         return
-    limit = max(config.web_app.rate_limit_max_requests, 1)
-    window = config.web_app.rate_limit_window
     try:
-        current = await redis_client.incr(key)
-        if current == 1:
-            await redis_client.expire(key, window)
+        decision = await rate_limiter.hit(
+            key,
+            limit=max(config.web_app.rate_limit_max_requests, 1),
+            window=config.web_app.rate_limit_window,
+        )
     except Exception as exc:
         logger.warning("Rate-limit fallback disabled for key '{}': {}", key, exc)
         return
-    if current > limit:
-        raise HTTPException(status_code=429, detail="Too many requests. Please try again later.")
+    if not decision.allowed:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests. Please try again later.",
+            headers={"Retry-After": str(max(math.ceil(decision.retry_after), 1))},
+        )
 
 
 def _request_ip(request: Request) -> str:
@@ -9,7 +9,6 @@ from dishka import FromDishka
 from dishka.integrations.fastapi import inject
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from loguru import logger
-from redis.asyncio import Redis
 
 from src.api.contracts.web_auth import (
     TelegramAuthRequest,
@@ -34,6 +33,7 @@ from src.api.utils.web_auth_transport import build_session_response, set_auth_co
 from src.core.config import AppConfig
 from src.core.security.jwt_handler import create_access_token, create_refresh_token
 from src.infrastructure.database.models.dto import UserDto, WebAccountDto
+from src.infrastructure.redis import RedisRateLimiter
 from src.services.notification import NotificationService
 from src.services.partner import PartnerService
 from src.services.referral import ReferralService
@@ -281,11 +281,11 @@ async def request_telegram_link_code(
     telegram_link_service: FromDishka[TelegramLinkService] = _DISHKA_DEFAULT,
     settings_service: FromDishka[SettingsService] = _DISHKA_DEFAULT,
     config: FromDishka[AppConfig] = _DISHKA_DEFAULT,
-    redis_client: FromDishka[Redis] = _DISHKA_DEFAULT,
+    rate_limiter: FromDishka[RedisRateLimiter] = _DISHKA_DEFAULT,
 ) -> TelegramLinkRequestResponse:
     await _enforce_rate_limit(
         config,
-        redis_client,
+        rate_limiter,
         f"auth:tg_link:request:{web_account.id}:{_request_ip(request)}",
     )
     locale = _resolve_web_request_locale(request, config=config, current_user=current_user)
@@ -332,11 +332,11 @@ async def request_telegram_link_auto_confirm(
     telegram_link_service: FromDishka[TelegramLinkService] = _DISHKA_DEFAULT,
     settings_service: FromDishka[SettingsService] = _DISHKA_DEFAULT,
     config: FromDishka[AppConfig] = _DISHKA_DEFAULT,
-    redis_client: FromDishka[Redis] = _DISHKA_DEFAULT,
+    rate_limiter: FromDishka[RedisRateLimiter] = _DISHKA_DEFAULT,
 ) -> TelegramLinkRequestResponse:
     await _enforce_rate_limit(
         config,
-        redis_client,
+        rate_limiter,
         f"auth:tg_link:request_auto:{web_account.id}:{_request_ip(request)}",
     )
     locale = _resolve_web_request_locale(request, config=config, current_user=current_user)
@@ -395,12 +395,12 @@ async def confirm_telegram_link_code(
     user_service: FromDishka[UserService] = _DISHKA_DEFAULT,
     notification_service: FromDishka[NotificationService] = _DISHKA_DEFAULT,
     settings_service: FromDishka[SettingsService] = _DISHKA_DEFAULT,
-    redis_client: FromDishka[Redis] = _DISHKA_DEFAULT,
+    rate_limiter: FromDishka[RedisRateLimiter] = _DISHKA_DEFAULT,
     config: FromDishka[AppConfig] = _DISHKA_DEFAULT,
 ) -> TelegramLinkConfirmResponse:
     await _enforce_rate_limit(
         config,
-        redis_client,
+        rate_limiter,
         f"auth:tg_link:confirm:{web_account.id}:{_request_ip(request)}",
     )
     locale = _resolve_web_request_locale(request, config=config, current_user=current_user)
@@ -1,6 +1,8 @@
-from aiogram import Dispatcher
+from aiogram import Bot, Dispatcher
 from aiogram.fsm.storage.base import DefaultKeyBuilder
 from aiogram.fsm.storage.redis import RedisStorage
+from aiogram.methods import TelegramMethod
+from aiogram.types import Update
 from aiogram_dialog import BgManagerFactory, setup_dialogs
 
 from src.bot.filters import setup_global_filters
@@ -37,3 +39,9 @@ def setup_dispatcher(dispatcher: Dispatcher) -> None:
     setup_global_filters(router=dispatcher)
     setup_routers(router=dispatcher)
     setup_error_handlers(router=dispatcher)
+
+
+async def feed_update(dispatcher: Dispatcher, bot: Bot, update: Update) -> None:
+    result = await dispatcher.feed_update(bot=bot, update=update)
+    if isinstance(result, TelegramMethod):
+        await dispatcher.silent_call_request(bot=bot, result=result)
@@ -1,7 +1,6 @@
 import traceback
-from typing import Any, Awaitable, Callable, Union
+from typing import Any, Awaitable, Callable, Optional, Union
 
-from aiogram import Bot
 from aiogram.enums import ChatMemberStatus
 from aiogram.types import CallbackQuery, Message, TelegramObject
 from aiogram.utils.formatting import Text
@@ -14,17 +13,12 @@ from src.core.enums import MiddlewareEventType
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import UserDto
 from src.infrastructure.taskiq.tasks.notifications import send_error_notification_task
+from src.services.channel_membership import ChannelMembershipService
 from src.services.notification import NotificationService
 from src.services.settings import SettingsService
 
 from .base import EventTypedMiddleware
 
-ALLOWED_STATUSES = (
-    ChatMemberStatus.CREATOR,
-    ChatMemberStatus.ADMINISTRATOR,
-    ChatMemberStatus.MEMBER,
-)
-
 
 class ChannelMiddleware(EventTypedMiddleware):
     __event_types__ = [MiddlewareEventType.MESSAGE, MiddlewareEventType.CALLBACK_QUERY]
@@ -46,7 +40,9 @@ class ChannelMiddleware(EventTypedMiddleware):
             logger.debug(f"User '{user.telegram_id}' skipped channel check (privileged)")
             return await handler(event, data)
 
-        bot: Bot = await container.get(Bot)
+        channel_membership_service: ChannelMembershipService = await container.get(
+            ChannelMembershipService
+        )
         notification_service: NotificationService = await container.get(NotificationService)
 
         settings = await settings_service.get()
@@ -57,27 +53,29 @@ class ChannelMiddleware(EventTypedMiddleware):
             )
             return await handler(event, data)
 
-        member = await self._get_chat_member_safe(
-            bot=bot,
+        member_status = await self._get_member_status_safe(
+            channel_membership_service=channel_membership_service,
             user=user,
             chat_id=chat_id,
             channel_link=channel_link,
+            # The user says they just joined, so a cached "left" must not be trusted.
+            force_recheck=self._is_click_confirm(event),
         )
-        if member is None:
+        if member_status is None:
             return await handler(event, data)
 
-        if member.status in ALLOWED_STATUSES:
+        if channel_membership_service.is_allowed(member_status):
             if self._is_click_confirm(event):
                 await self._delete_channel_message(event)
 
-            logger.debug(f"User '{user.telegram_id}' passed channel check. Status: {member.status}")
+            logger.debug(f"User '{user.telegram_id}' passed channel check. Status: {member_status}")
             # TODO: Auto confirming
             return await handler(event, data)
 
         await self._handle_unsubscribed_user(
             event=event,
             user=user,
-            member_status=member.status,
+            member_status=member_status,
             notification_service=notification_service,
             channel_url=settings.get_url_channel_link,
         )
@@ -92,17 +90,19 @@ class ChannelMiddleware(EventTypedMiddleware):
             return settings.channel_id, channel_link
         return None, channel_link
 
-    async def _get_chat_member_safe(
+    async def _get_member_status_safe(
         self,
-        bot: Bot,
+        channel_membership_service: ChannelMembershipService,
         user: UserDto,
         chat_id: Union[str, int],
         channel_link: str,
-    ) -> Any:
+        force_recheck: bool,
+    ) -> Optional[ChatMemberStatus]:
         try:
-            return await bot.get_chat_member(
-                chat_id=chat_id,
-                user_id=user.telegram_id,
+            return await channel_membership_service.get_status(
+                chat_id,
+                user.telegram_id,
+                force_recheck=force_recheck,
             )
         except Exception as exception:
             traceback_str = traceback.format_exc()
@@ -1,24 +1,34 @@
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Final, Mapping, Optional
 
-from aiogram.types import TelegramObject
-from cachetools import TTLCache
+from aiogram.types import CallbackQuery, TelegramObject
 from dishka import AsyncContainer
 from loguru import logger
 
 from src.core.constants import CONTAINER_KEY, USER_KEY
 from src.core.enums import MiddlewareEventType
+from src.core.storage.keys import ThrottlingKey
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import UserDto
+from src.infrastructure.redis import RedisRateLimiter
 from src.services.notification import NotificationService
 
 from .base import EventTypedMiddleware
 
+# Hits allowed per sliding window (seconds), per user and event type
+DEFAULT_THROTTLING_LIMITS: Final[Mapping[MiddlewareEventType, tuple[int, float]]] = {
+    MiddlewareEventType.MESSAGE: (1, 0.5),
+    MiddlewareEventType.CALLBACK_QUERY: (1, 0.5),
+}
+
 
 class ThrottlingMiddleware(EventTypedMiddleware):
     __event_types__ = [MiddlewareEventType.MESSAGE, MiddlewareEventType.CALLBACK_QUERY]
 
-    def __init__(self, ttl: float = 0.5) -> None:
-        self.cache: TTLCache[int, Any] = TTLCache(maxsize=10_000, ttl=ttl)
+    def __init__(
+        self,
+        limits: Optional[Mapping[MiddlewareEventType, tuple[int, float]]] = None,
+    ) -> None:
+        self.limits = {**DEFAULT_THROTTLING_LIMITS, **(limits or {})}
 
     async def middleware_logic(
         self,
@@ -29,9 +39,23 @@ class ThrottlingMiddleware(EventTypedMiddleware):
         container: AsyncContainer = data[CONTAINER_KEY]
         user: UserDto = data[USER_KEY]
 
-        notification_service: NotificationService = await container.get(NotificationService)
+        event_type = (
+            MiddlewareEventType.CALLBACK_QUERY
+            if isinstance(event, CallbackQuery)
+            else MiddlewareEventType.MESSAGE
+        )
+        limit, window = self.limits[event_type]
+        rate_limiter: RedisRateLimiter = await container.get(RedisRateLimiter)
+        key = ThrottlingKey(event_type=event_type.value, telegram_id=user.telegram_id).pack()
+
+        try:
+            decision = await rate_limiter.hit(key, limit=limit, window=window)
+        except Exception as exception:
+            logger.warning(f"Throttling check failed for user '{user.telegram_id}': {exception}")
+            return await handler(event, data)
 
-        if user.telegram_id in self.cache:
+        if not decision.allowed:
+            notification_service: NotificationService = await container.get(NotificationService)
             await notification_service.notify_user(
                 user=user,
                 payload=MessagePayload(i18n_key="ntf-throttling-many-requests"),
@@ -39,5 +63,4 @@ class ThrottlingMiddleware(EventTypedMiddleware):
             logger.warning(f"User '{user.telegram_id}' throttled")
             return
 
-        self.cache[user.telegram_id] = None
         return await handler(event, data)
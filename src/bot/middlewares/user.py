@@ -48,7 +48,8 @@ class UserMiddleware(EventTypedMiddleware):
         user_service: UserService = await container.get(UserService)
         referral_service: ReferralService = await container.get(ReferralService)
         partner_service: PartnerService = await container.get(PartnerService)
-        user: Optional[UserDto] = await user_service.get(telegram_id=aiogram_user.id)
+        # One Redis round trip for the common case: cached user plus activity bookkeeping.
+        user: Optional[UserDto] = await user_service.get_and_record_activity(aiogram_user.id)
         is_new_user = user is None
 
         if user is None:
@@ -102,7 +103,6 @@ class UserMiddleware(EventTypedMiddleware):
         elif not isinstance(aiogram_user, FakeUser):
             await user_service.compare_and_update(user, aiogram_user)
 
-        await user_service.update_recent_activity(telegram_id=user.telegram_id)
         data[USER_KEY] = user
         data[IS_SUPER_DEV_KEY] = user.telegram_id in config.bot.dev_id
         data[IS_NEW_USER] = is_new_user
@@ -81,7 +81,7 @@ async def list_getter(
     promocodes_data = []
     for promo in promocodes:
         status = "🟢" if promo.is_active else "🔴"
-        activations = len(promo.activations)
+        activations = promo.activations_count
         max_act = promo.max_activations if promo.max_activations != -1 else "∞"
         display_name = f"{status} {promo.code} ({activations}/{max_act})"
 
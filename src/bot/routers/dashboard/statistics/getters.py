@@ -350,8 +350,8 @@ def get_plans_statistics(
 
 
 def get_promocodes_statistics(promocodes: list[PromocodeDto]) -> dict[str, Any]:
-    total_promo_activations = sum(len(p.activations) for p in promocodes)
-    most_popular_promo = max(promocodes, key=lambda p: len(p.activations), default=None)
+    total_promo_activations = sum(p.activations_count for p in promocodes)
+    most_popular_promo = max(promocodes, key=lambda p: p.activations_count, default=None)
 
     total_promo_days = 0
     total_promo_traffic = 0
@@ -360,7 +360,7 @@ def get_promocodes_statistics(promocodes: list[PromocodeDto]) -> dict[str, Any]:
     total_promo_purchase_discounts = 0
 
     for p in promocodes:
-        times_used = len(p.activations)
+        times_used = p.activations_count
         reward_value = p.reward or 0
 
         if p.reward_type == PromocodeRewardType.DURATION:
@@ -16,7 +16,7 @@ from .getters import (
     referrals_getter,
     search_results_getter,
 )
-from .handlers import on_unblock_all, on_user_search, on_user_select
+from .handlers import on_unblock_all, on_user_search, on_user_search_more, on_user_select
 
 users = Window(
     Banner(BannerName.DASHBOARD),
@@ -159,6 +159,14 @@ search_results = Window(
         height=7,
         hide_on_single_page=True,
     ),
+    Row(
+        Button(
+            text=I18nFormat("btn-users-search-more"),
+            id="search_more",
+            on_click=on_user_search_more,
+            when=F["has_more"],
+        ),
+    ),
     Row(
         SwitchTo(
             text=I18nFormat("btn-back"),
@@ -5,6 +5,7 @@ from dishka import FromDishka
 from dishka.integrations.aiogram_dialog import inject
 from fluentogram import TranslatorRunner
 
+from src.core.constants import USER_SEARCH_LIMIT
 from src.core.utils.formatters import format_percent
 from src.infrastructure.database.models.dto import UserDto
 from src.services.referral import ReferralService
@@ -63,10 +64,17 @@ async def search_results_getter(
     **kwargs: Any,
 ) -> dict[str, Any]:
     start_data = cast(dict[str, Any], dialog_manager.start_data)
-    found_users_data: list[str] = start_data["found_users"]
+    first_page_data: list[str] = start_data["found_users"]
+    found_users_data = first_page_data + dialog_manager.dialog_data.get("more_found_users", [])
     found_users: list[UserDto] = [
         UserDto.model_validate_json(json_string) for json_string in found_users_data
     ]
+    # A full first page means the ranked search may have more matches to page through.
+    has_more = (
+        bool(start_data.get("search_query"))
+        and len(first_page_data) >= USER_SEARCH_LIMIT
+        and not dialog_manager.dialog_data.get("search_exhausted", False)
+    )
 
     return {
         "found_users": await _build_user_rows(
@@ -75,6 +83,7 @@ async def search_results_getter(
             i18n=i18n,
         ),
         "count": len(found_users),
+        "has_more": has_more,
     }
 
 
@@ -1,3 +1,5 @@
+from typing import Any, cast
+
 from aiogram.types import CallbackQuery, Message
 from aiogram_dialog import DialogManager, ShowMode, StartMode
 from aiogram_dialog.widgets.input import MessageInput
@@ -7,7 +9,7 @@ from dishka.integrations.aiogram_dialog import inject
 from loguru import logger
 
 from src.bot.states import DashboardUsers
-from src.core.constants import USER_KEY
+from src.core.constants import USER_KEY, USER_SEARCH_LIMIT
 from src.core.utils.formatters import format_user_log as log
 from src.core.utils.message_payload import MessagePayload
 from src.core.utils.validators import is_double_click
@@ -52,10 +54,36 @@ async def on_user_search(
         )
         await dialog_manager.start(
             state=DashboardUsers.SEARCH_RESULTS,
-            data={"found_users": [found_user.model_dump_json() for found_user in found_users]},
+            data={
+                "found_users": [found_user.model_dump_json() for found_user in found_users],
+                "search_query": search_query,
+            },
         )
 
 
+@inject
+async def on_user_search_more(
+    callback: CallbackQuery,
+    widget: Button,
+    dialog_manager: DialogManager,
+    user_service: FromDishka[UserService],
+) -> None:
+    user: UserDto = dialog_manager.middleware_data[USER_KEY]
+    start_data = cast(dict[str, Any], dialog_manager.start_data)
+    search_query: str = start_data["search_query"]
+    more_users: list[str] = dialog_manager.dialog_data.setdefault("more_found_users", [])
+
+    next_users = await user_service.search_more_users(
+        search_query,
+        offset=len(start_data["found_users"]) + len(more_users),
+    )
+    more_users.extend(found_user.model_dump_json() for found_user in next_users)
+    if len(next_users) < USER_SEARCH_LIMIT:
+        dialog_manager.dialog_data["search_exhausted"] = True
+
+    logger.info(f"{log(user)} Search for '{search_query}' loaded '{len(next_users)}' more results")
+
+
 async def on_user_select(
     callback: CallbackQuery,
     widget: Select[int],
@@ -7,6 +7,7 @@ from loguru import logger
 
 from src.core.utils.formatters import format_user_log as log
 from src.infrastructure.database.models.dto import UserDto
+from src.services.channel_membership import ChannelMembershipService
 from src.services.user import UserService
 
 # For only ChatType.PRIVATE (app/bot/filters/private.py)
@@ -33,3 +34,13 @@ async def on_blocked(
 ) -> None:
     logger.info(f"{log(user)} Bot blocked")
     await user_service.set_bot_blocked(user=user, blocked=True)
+
+
+@router.chat_member()
+@aiogram_inject
+async def on_channel_member_updated(
+    member: ChatMemberUpdated,
+    channel_membership_service: FromDishka[ChannelMembershipService],
+) -> None:
+    # Delivered only for chats where the bot is an admin; keeps the membership cache warm.
+    await channel_membership_service.record_update(member)
@@ -137,7 +137,7 @@ async def menu_getter(
     )
 
     # Get subscriptions count
-    all_subscriptions = await subscription_service.get_all_by_user(user.telegram_id)
+    all_subscriptions = await subscription_service.load_all_by_user(user.telegram_id)
     active_subscriptions = [
         s
         for s in all_subscriptions
@@ -254,7 +254,7 @@ async def connect_device_getter(
     **kwargs: Any,
 ) -> dict[str, Any]:
     """Get connectable subscriptions with normalized device labels."""
-    all_subscriptions = await subscription_service.get_all_by_user(user.telegram_id)
+    all_subscriptions = await subscription_service.load_all_by_user(user.telegram_id)
     connectable_subscriptions = [
         s
         for s in all_subscriptions
@@ -293,7 +293,7 @@ async def devices_getter(
     **kwargs: Any,
 ) -> dict[str, Any]:
     """Return purchased subscriptions as device entries with normalized labels."""
-    all_subscriptions = await subscription_service.get_all_by_user(user.telegram_id)
+    all_subscriptions = await subscription_service.load_all_by_user(user.telegram_id)
     active_subscriptions = [s for s in all_subscriptions if s.status != SubscriptionStatus.DELETED]
 
     formatted_devices = []
@@ -550,7 +550,7 @@ async def exchange_getter(
     payments = await referral_service.get_reward_count(user.telegram_id)
 
     # Keep checks aligned with exchange service eligibility.
-    all_subscriptions = await subscription_service.get_all_by_user(user.telegram_id)
+    all_subscriptions = await subscription_service.load_all_by_user(user.telegram_id)
     active_subscriptions = [
         s
         for s in all_subscriptions
@@ -795,7 +795,7 @@ async def exchange_traffic_getter(
     traffic_option = _exchange_option_map(options).get(PointsExchangeType.TRAFFIC)
     traffic_gb = traffic_option.computed_value if traffic_option else 0
 
-    all_subscriptions = await subscription_service.get_all_by_user(user.telegram_id)
+    all_subscriptions = await subscription_service.load_all_by_user(user.telegram_id)
     active_subscriptions = [
         s
         for s in all_subscriptions
@@ -885,7 +885,7 @@ async def exchange_points_getter(
     options = await referral_exchange_service.get_options(user_telegram_id=user.telegram_id)
     days_option = _exchange_option_map(options).get(PointsExchangeType.SUBSCRIPTION_DAYS)
 
-    all_subscriptions = await subscription_service.get_all_by_user(user.telegram_id)
+    all_subscriptions = await subscription_service.load_all_by_user(user.telegram_id)
     active_subscriptions = [
         s
         for s in all_subscriptions
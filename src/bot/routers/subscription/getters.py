@@ -36,12 +36,14 @@ from src.core.utils.formatters import (
 from src.infrastructure.database.models.dto import (
     PlanDto,
     PlanDurationDto,
+    SubscriptionDto,
     UserDto,
 )
 from src.services.payment_gateway import PaymentGatewayService
 from src.services.plan import PlanService
 from src.services.pricing import PricingService
 from src.services.purchase_gateway_policy import filter_gateways_by_channel
+from src.services.request_loader import RequestDataLoader
 from src.services.settings import SettingsService
 from src.services.subscription import SubscriptionService
 from src.services.subscription_purchase import SubscriptionPurchaseService
@@ -416,6 +418,7 @@ async def confirm_renew_selection_getter(
     plan_service: FromDishka[PlanService],
     settings_service: FromDishka[SettingsService],
     pricing_service: FromDishka[PricingService],
+    request_loader: FromDishka[RequestDataLoader],
     **kwargs: Any,
 ) -> dict[str, Any]:
     """Getter for confirming selected subscriptions for renewal."""
@@ -425,9 +428,17 @@ async def confirm_renew_selection_getter(
     selected_duration = dialog_manager.dialog_data.get("selected_duration", 30)
     currency = await settings_service.get_default_currency()
 
+    async def load_subscriptions(ids: list[int]) -> dict[int, SubscriptionDto]:
+        subscriptions = await subscription_service.get_by_ids(ids)
+        return {subscription.id: subscription for subscription in subscriptions if subscription.id}
+
+    selected_subscriptions = await request_loader.load_many(
+        "subscriptions",
+        selected_subscription_ids,
+        load_subscriptions,
+    )
     selected_subscription_entries = []
-    for sub_id in selected_subscription_ids:
-        subscription = await subscription_service.get(sub_id)
+    for subscription in selected_subscriptions:
         if not subscription:
             continue
         matched_plan = await resolve_subscription_renewable_plan(
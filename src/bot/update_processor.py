@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, Union
+
+from aiogram import Bot
+from aiogram.dispatcher.middlewares.user_context import UserContextMiddleware
+from aiogram.types import Update
+from loguru import logger
+
+from src.core.observability import emit_counter, emit_timing
+
+UpdateHandler = Callable[[Bot, Update], Awaitable[None]]
+DoneCallback = Callable[[], Awaitable[None]]
+LaneKey = Union[int, str]
+
+
+@dataclass(slots=True, frozen=True)
+class _QueuedUpdate:
+    bot: Bot
+    update: Update
+    queued_at: float
+    on_done: Optional[DoneCallback]
+
+
+def update_lane_key(update: Update) -> LaneKey:
+    """Chat (or user) an update belongs to; updates with neither never wait on others."""
+    context = UserContextMiddleware.resolve_event_context(event=update)
+    if context.chat is not None:
+        return context.chat.id
+    if context.user is not None:
+        return context.user.id
+    return f"update:{update.update_id}"
+
+
+class UpdateProcessor:
+    """Bounded worker pool for Telegram updates with per-chat ordering.
+
+    Updates are queued in one lane per chat. A lane is handled by at most one worker at a
+    time, so updates of the same chat run in arrival order while different chats run in
+    parallel, up to ``concurrency`` at once. ``submit`` refuses an update when
+    ``max_pending`` updates are queued or its chat already has ``max_pending_per_chat``
+    waiting, so a burst cannot exhaust database and Redis connections. ``close`` stops
+    accepting updates and finishes the queued ones within ``drain_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        handler: UpdateHandler,
+        *,
+        concurrency: int,
+        max_pending: int,
+        max_pending_per_chat: int,
+        drain_timeout: float,
+    ) -> None:
+        self.handler = handler
+        self.concurrency = concurrency
+        self.max_pending = max_pending
+        self.max_pending_per_chat = max_pending_per_chat
+        self.drain_timeout = drain_timeout
+        self._lanes: dict[LaneKey, deque[_QueuedUpdate]] = {}
+        self._ready: asyncio.Queue[LaneKey] = asyncio.Queue()
+        self._workers: list[asyncio.Task[None]] = []
+        self._pending = 0
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._accepting = False
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._accepting = True
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"telegram-update-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+
+    def submit(
+        self,
+        bot: Bot,
+        update: Update,
+        *,
+        on_done: Optional[DoneCallback] = None,
+    ) -> bool:
+        """Queue an update; ``on_done`` is awaited once it was handled, even if that failed."""
+        if not self._accepting:
+            return self._shed(update, reason="stopping")
+        if self._pending >= self.max_pending:
+            return self._shed(update, reason="queue_full")
+
+        key = update_lane_key(update)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = deque()
+            self._ready.put_nowait(key)
+        elif len(lane) >= self.max_pending_per_chat:
+            return self._shed(update, reason="chat_backlog")
+
+        lane.append(
+            _QueuedUpdate(bot=bot, update=update, queued_at=time.monotonic(), on_done=on_done)
+        )
+        self._pending += 1
+        self._drained.clear()
+        return True
+
+    async def close(self) -> None:
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout=self.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Telegram update queue not drained in {self.drain_timeout}s, "
+                f"dropping '{self._pending}' updates"
+            )
+            emit_counter("telegram_updates_dropped_total", count=self._pending)
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._lanes.clear()
+        self._ready = asyncio.Queue()
+        self._pending = 0
+        self._drained.set()
+
+    def _shed(self, update: Update, *, reason: str) -> bool:
+        logger.warning(f"Telegram update '{update.update_id}' rejected: {reason}")
+        emit_counter("telegram_updates_shed_total", reason=reason)
+        return False
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._ready.get()
+            lane = self._lanes[key]
+            queued = lane.popleft()
+            emit_timing("telegram_update_queue_wait_seconds", time.monotonic() - queued.queued_at)
+            try:
+                try:
+                    await self.handler(queued.bot, queued.update)
+                except Exception as exception:
+                    logger.exception(
+                        f"Failed to process Telegram update '{queued.update.update_id}': "
+                        f"{exception}"
+                    )
+                if queued.on_done is not None:
+                    await self._complete(queued.update, queued.on_done)
+            finally:
+                self._release(key, lane)
+
+    async def _complete(self, update: Update, on_done: DoneCallback) -> None:
+        try:
+            await on_done()
+        except Exception as exception:
+            logger.warning(
+                f"Completion callback failed for Telegram update '{update.update_id}': {exception}"
+            )
+
+    def _release(self, key: LaneKey, lane: deque[_QueuedUpdate]) -> None:
+        # Re-queue a lane behind other chats instead of draining it in one go.
+        if lane:
+            self._ready.put_nowait(key)
+        else:
+            del self._lanes[key]
+
+        self._pending -= 1
+        if self._pending == 0:
+            self._drained.set()
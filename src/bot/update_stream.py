@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import math
+import os
+import random
+import socket
+import zlib
+from typing import Any, Awaitable, Final, Optional, cast
+
+from aiogram import Bot
+from aiogram.types import Update
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from src.core.constants import (
+    BOT_UPDATE_LEASE_RENEW_SECONDS,
+    BOT_UPDATE_LEASE_TTL_SECONDS,
+    BOT_UPDATE_STREAM_GROUP,
+)
+from src.core.observability import emit_counter
+from src.core.storage.keys import (
+    BotUpdatePartitionLeaseKey,
+    BotUpdateStreamKey,
+    BotUpdateWorkersKey,
+)
+from src.infrastructure.redis.leader import RELEASE_LEASE_SCRIPT, RENEW_LEASE_SCRIPT
+
+from .update_processor import UpdateHandler, UpdateProcessor, update_lane_key
+
+UPDATE_FIELD: Final[str] = "update"
+
+
+def update_partition(update: Update, partitions: int) -> int:
+    # crc32 rather than hash(): string hashes differ between processes.
+    return zlib.crc32(str(update_lane_key(update)).encode()) % partitions
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class UpdateStreamPublisher:
+    """Appends webhook updates to Redis stream partitions, one partition per chat."""
+
+    def __init__(self, client: Redis, *, partitions: int, max_length: int) -> None:
+        self.client = client
+        self.partitions = partitions
+        self.max_length = max_length
+
+    async def publish(self, update: Update) -> None:
+        partition = update_partition(update, self.partitions)
+        await self.client.xadd(
+            BotUpdateStreamKey(partition=partition).pack(),
+            {UPDATE_FIELD: update.model_dump_json(exclude_unset=True, by_alias=True)},
+            maxlen=self.max_length,
+            approximate=True,
+        )
+
+
+class UpdateStreamConsumer:
+    """Bot worker side of stream mode: handles updates from the partitions it owns.
+
+    Every partition is owned by at most one worker at a time through a Redis lease, so a
+    chat's updates are read by a single process and its ``UpdateProcessor`` keeps them
+    in order. Workers heartbeat into a shared set and each takes about its fair share of
+    partitions, giving extras back when more workers join.
+
+    A partition taken over is not read until no other consumer holds unacknowledged
+    updates from it: a previous owner that gave it back finishes and acknowledges its
+    in-flight updates, and updates of a crashed owner are claimed once idle for the lease
+    TTL, so they are handled before newer ones. Updates are acknowledged once handled,
+    so a crash means redelivery (at least once).
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        bot: Bot,
+        handler: UpdateHandler,
+        *,
+        partitions: int,
+        concurrency: int,
+        max_pending: int,
+        drain_timeout: float,
+        consumer_name: Optional[str] = None,
+        lease_ttl: float = BOT_UPDATE_LEASE_TTL_SECONDS,
+        renew_interval: float = BOT_UPDATE_LEASE_RENEW_SECONDS,
+        block_ms: int = 1000,
+    ) -> None:
+        self.client = client
+        self.bot = bot
+        self.partitions = partitions
+        self.consumer_name = consumer_name or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_ttl = lease_ttl
+        self.renew_interval = renew_interval
+        self.block_ms = block_ms
+        self.max_pending = max_pending
+        # Ordering within a partition matters more than shedding: the read loop only asks
+        # for as many updates as there is room for, so the per-chat limit is the total.
+        self.processor = UpdateProcessor(
+            handler,
+            concurrency=concurrency,
+            max_pending=max_pending,
+            max_pending_per_chat=max_pending,
+            drain_timeout=drain_timeout,
+        )
+        self.owned: set[int] = set()
+        self.settling: set[int] = set()
+        self._workers_key = BotUpdateWorkersKey().pack()
+
+    async def run(self, stop: asyncio.Event) -> None:
+        await self._ensure_groups()
+        self.processor.start()
+        logger.info(f"Bot update consumer '{self.consumer_name}' started")
+        loop = asyncio.get_running_loop()
+        next_rebalance = 0.0
+        try:
+            while not stop.is_set():
+                if loop.time() >= next_rebalance:
+                    await self.rebalance()
+                    next_rebalance = loop.time() + self.renew_interval
+                await self._read_once(stop)
+        finally:
+            await self.processor.close()
+            await self._release_all()
+            logger.info(f"Bot update consumer '{self.consumer_name}' stopped")
+
+    async def rebalance(self) -> None:
+        now_ms = await self._server_time_ms()
+        ttl_ms = int(self.lease_ttl * 1000)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zadd(self._workers_key, {self.consumer_name: now_ms})
+            pipe.zremrangebyscore(self._workers_key, "-inf", now_ms - ttl_ms)
+            pipe.zcard(self._workers_key)
+            *_, workers = await pipe.execute()
+        fair_share = math.ceil(self.partitions / max(int(workers), 1))
+
+        for partition in sorted(self.owned):
+            renewed = await cast(
+                Awaitable[int],
+                self.client.eval(
+                    RENEW_LEASE_SCRIPT,
+                    1,
+                    self._lease_key(partition),
+                    self.consumer_name,
+                    ttl_ms,
+                ),
+            )
+            if not int(renewed):
+                logger.warning(f"Lost bot update partition '{partition}'")
+                self.owned.discard(partition)
+                self.settling.discard(partition)
+
+        while len(self.owned) > fair_share:
+            await self._release(max(self.owned))
+
+        free = [partition for partition in range(self.partitions) if partition not in self.owned]
+        random.shuffle(free)
+        for partition in free:
+            if len(self.owned) >= fair_share:
+                break
+            acquired = await self.client.set(
+                self._lease_key(partition),
+                self.consumer_name,
+                nx=True,
+                px=ttl_ms,
+            )
+            if acquired:
+                self.owned.add(partition)
+                self.settling.add(partition)
+                emit_counter("bot_update_partition_acquired_total")
+
+        for partition in sorted(self.settling):
+            if await self._settle(partition):
+                self.settling.discard(partition)
+
+    async def _read_once(self, stop: asyncio.Event) -> None:
+        readable = self.owned - self.settling
+        capacity = self.max_pending - self.processor.pending
+        # At least one update per stream, or a read could overshoot the processor queue.
+        if not readable or capacity < len(readable):
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=0.1 if readable else 1.0)
+            except asyncio.TimeoutError:
+                pass
+            return
+
+        streams = {self._stream_key(partition): ">" for partition in readable}
+        response = await self.client.xreadgroup(
+            BOT_UPDATE_STREAM_GROUP,
+            self.consumer_name,
+            streams,  # type: ignore[arg-type]
+            count=max(capacity // len(streams), 1),
+            block=self.block_ms,
+        )
+        for stream, entries in response or []:
+            await self._submit(_decode(stream), entries)
+
+    async def _settle(self, partition: int) -> bool:
+        """Claim stale updates of a taken-over partition; ``True`` once no one else holds any."""
+        stream = self._stream_key(partition)
+        start_id = "0-0"
+        while True:
+            capacity = self.max_pending - self.processor.pending
+            if capacity <= 0:
+                return False
+
+            response = await self.client.xautoclaim(
+                stream,
+                BOT_UPDATE_STREAM_GROUP,
+                self.consumer_name,
+                min_idle_time=int(self.lease_ttl * 1000),
+                start_id=start_id,
+                count=min(capacity, 100),
+            )
+            next_id, entries = response[0], response[1]
+            if entries:
+                emit_counter("bot_update_claimed_total", count=len(entries))
+                await self._submit(stream, entries)
+            start_id = _decode(next_id)
+            if start_id == "0-0":
+                break
+
+        summary = await self.client.xpending(stream, BOT_UPDATE_STREAM_GROUP)
+        return not any(
+            _decode(consumer["name"]) != self.consumer_name and int(consumer["pending"])
+            for consumer in summary.get("consumers") or []
+        )
+
+    async def _submit(self, stream: str, entries: list[Any]) -> None:
+        for raw_entry_id, fields in entries:
+            entry_id = _decode(raw_entry_id)
+            raw = (fields or {}).get(UPDATE_FIELD.encode())
+            if raw is None:
+                # Trimmed while pending; nothing left to handle.
+                await self._ack(stream, entry_id)
+                continue
+
+            try:
+                update = Update.model_validate_json(raw, context={"bot": self.bot})
+            except ValueError as exception:
+                logger.error(f"Dropping malformed bot update '{entry_id}': {exception}")
+                await self._ack(stream, entry_id)
+                continue
+
+            self.processor.submit(
+                self.bot,
+                update,
+                on_done=functools.partial(self._ack, stream, entry_id),
+            )
+
+    async def _ack(self, stream: str, entry_id: str) -> None:
+        await self.client.xack(stream, BOT_UPDATE_STREAM_GROUP, entry_id)
+
+    async def _ensure_groups(self) -> None:
+        for partition in range(self.partitions):
+            try:
+                await self.client.xgroup_create(
+                    self._stream_key(partition),
+                    BOT_UPDATE_STREAM_GROUP,
+                    id="0",
+                    mkstream=True,
+                )
+            except ResponseError:
+                pass  # BUSYGROUP: already declared
+
+    async def _release(self, partition: int) -> None:
+        self.owned.discard(partition)
+        self.settling.discard(partition)
+        await cast(
+            Awaitable[int],
+            self.client.eval(
+                RELEASE_LEASE_SCRIPT,
+                1,
+                self._lease_key(partition),
+                self.consumer_name,
+            ),
+        )
+
+    async def _release_all(self) -> None:
+        try:
+            for partition in list(self.owned):
+                await self._release(partition)
+            await self.client.zrem(self._workers_key, self.consumer_name)
+        except Exception as exception:
+            logger.warning(f"Failed to release bot update partitions: {exception}")
+
+    async def _server_time_ms(self) -> int:
+        seconds, microseconds = await self.client.time()
+        return int(seconds) * 1000 + int(microseconds) // 1000
+
+    @staticmethod
+    def _stream_key(partition: int) -> str:
+        return BotUpdateStreamKey(partition=partition).pack()
+
+    @staticmethod
+    def _lease_key(partition: int) -> str:
+        return BotUpdatePartitionLeaseKey(partition=partition).pack()
@@ -0,0 +1,62 @@
+import asyncio
+import signal
+from functools import partial
+
+from aiogram import Bot
+from dishka.integrations.aiogram import setup_dishka as setup_aiogram_dishka
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.bot.dispatcher import (
+    create_bg_manager_factory,
+    create_dispatcher,
+    feed_update,
+    setup_dispatcher,
+)
+from src.bot.update_stream import UpdateStreamConsumer
+from src.core.config import AppConfig
+from src.core.enums import BotUpdateMode
+from src.core.logger import setup_logger
+from src.infrastructure.di import create_container
+
+
+async def run_worker() -> None:
+    """Handle Telegram updates queued by the webhook in stream mode (`BOT_UPDATE_MODE=stream`)."""
+    setup_logger()
+
+    config = AppConfig.get()
+    if config.bot.update_mode != BotUpdateMode.STREAM:
+        logger.warning("BOT_UPDATE_MODE is not 'stream'; the webhook does not queue updates")
+
+    dispatcher = create_dispatcher(config=config)
+    bg_manager_factory = create_bg_manager_factory(dispatcher=dispatcher)
+    setup_dispatcher(dispatcher)
+    container = create_container(config=config, bg_manager_factory=bg_manager_factory)
+    setup_aiogram_dishka(container=container, router=dispatcher)
+
+    bot: Bot = await container.get(Bot)
+    consumer = UpdateStreamConsumer(
+        await container.get(Redis),
+        bot,
+        partial(feed_update, dispatcher),
+        partitions=config.bot.update_stream_partitions,
+        concurrency=config.bot.update_concurrency,
+        max_pending=config.bot.update_queue_size,
+        drain_timeout=config.bot.update_drain_timeout,
+    )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    await dispatcher.emit_startup(**dispatcher.workflow_data)
+    try:
+        await consumer.run(stop)
+    finally:
+        await dispatcher.emit_shutdown(**dispatcher.workflow_data)
+        await container.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_worker())
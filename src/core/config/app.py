@@ -13,8 +13,10 @@ from .base import BaseConfig
 from .bot import BotConfig
 from .database import DatabaseConfig
 from .email import EmailConfig
+from .http import HttpConfig
 from .redis import RedisConfig
 from .remnawave import RemnawaveConfig
+from .taskiq import TaskiqConfig
 from .validators import validate_not_change_me
 from .web_app import WebAppConfig
 
@@ -23,6 +25,7 @@ class AppConfig(BaseConfig, env_prefix="APP_"):
     domain: SecretStr
     host: str = "0.0.0.0"
     port: int = 5000
+    workers: int = 1
     release_notify_secret: SecretStr | None = None
 
     locales: LocaleList = LocaleList([Locale.EN])
@@ -40,6 +43,8 @@ class AppConfig(BaseConfig, env_prefix="APP_"):
     backup: BackupConfig = Field(default_factory=BackupConfig)
     web_app: WebAppConfig = Field(default_factory=WebAppConfig)
     email: EmailConfig = Field(default_factory=EmailConfig)
+    http: HttpConfig = Field(default_factory=HttpConfig)
+    taskiq: TaskiqConfig = Field(default_factory=TaskiqConfig)
 
     @property
     def banners_dir(self) -> Path:
@@ -84,6 +89,13 @@ class AppConfig(BaseConfig, env_prefix="APP_"):
 
         return field
 
+    @field_validator("workers")
+    @classmethod
+    def validate_workers(cls, field: int) -> int:
+        if field < 1:
+            raise ValueError("APP_WORKERS must be a positive integer")
+        return field
+
     @field_validator("trusted_proxy_ips", mode="before")
     @classmethod
     def validate_trusted_proxy_ips(cls, field: Any) -> list[str]:
@@ -3,6 +3,7 @@ from typing import Union
 from pydantic import SecretStr, ValidationInfo, field_validator
 
 from src.core.constants import API_V1, BOT_WEBHOOK_PATH, URL_PATTERN
+from src.core.enums import BotUpdateMode
 
 from .base import BaseConfig
 from .validators import validate_not_change_me, validate_username
@@ -20,6 +21,19 @@ class BotConfig(BaseConfig, env_prefix="BOT_"):
     setup_commands: bool = True
     use_banners: bool = True
 
+    # Webhook update processing: concurrent handlers, queued updates in total and per
+    # chat, and how long shutdown waits for queued updates to finish.
+    update_concurrency: int = 32
+    update_queue_size: int = 1000
+    update_chat_queue_size: int = 20
+    update_drain_timeout: float = 8.0
+
+    # In stream mode the webhook only appends updates to one of the Redis stream
+    # partitions (by chat) and `python -m src.bot.worker` processes handle them.
+    update_mode: BotUpdateMode = BotUpdateMode.INLINE
+    update_stream_partitions: int = 16
+    update_stream_max_length: int = 100_000
+
     @property
     def webhook_path(self) -> str:
         return f"{API_V1}{BOT_WEBHOOK_PATH}"
@@ -58,6 +72,19 @@ class BotConfig(BaseConfig, env_prefix="BOT_"):
             return [int(x) for x in field]
         raise ValueError("dev_id must be an integer or comma-separated list of integers")
 
+    @field_validator(
+        "update_concurrency",
+        "update_queue_size",
+        "update_chat_queue_size",
+        "update_stream_partitions",
+        "update_stream_max_length",
+    )
+    @classmethod
+    def validate_positive_int(cls, field: int, info: ValidationInfo) -> int:
+        if field <= 0:
+            raise ValueError(f"BOT_{str(info.field_name).upper()} must be a positive integer")
+        return field
+
     @field_validator("token", "secret_token", "support_username")
     @classmethod
     def validate_bot_fields(cls, field: object, info: ValidationInfo) -> object:
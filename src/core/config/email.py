@@ -17,6 +17,12 @@ class EmailConfig(BaseConfig, env_prefix="EMAIL_"):
     from_name: str = "AltShop"
     use_tls: bool = True
     use_ssl: bool = False
+    timeout: float = 15.0
+    pool_size: int = 2
+    connection_idle_seconds: float = 60.0
+    batch_size: int = 20
+    max_attempts: int = 5
+    retry_delay_seconds: float = 10.0
 
     @field_validator("port")
     @classmethod
@@ -25,6 +31,13 @@ class EmailConfig(BaseConfig, env_prefix="EMAIL_"):
             raise ValueError("EMAIL_PORT must be a positive integer")
         return field
 
+    @field_validator("pool_size", "batch_size", "max_attempts")
+    @classmethod
+    def validate_positive_int(cls, field: int, info: ValidationInfo) -> int:
+        if field <= 0:
+            raise ValueError(f"EMAIL_{str(info.field_name).upper()} must be a positive integer")
+        return field
+
     @field_validator("host", "from_address")
     @classmethod
     def strip_text_fields(cls, field: str, info: ValidationInfo) -> str:
@@ -0,0 +1,19 @@
+from pydantic import ValidationInfo, field_validator
+
+from .base import BaseConfig
+
+
+class HttpConfig(BaseConfig, env_prefix="HTTP_"):
+    """Connection pool settings for outbound HTTP clients (gateways, Remnawave API)."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+    @field_validator("max_connections", "max_keepalive_connections")
+    @classmethod
+    def validate_positive(cls, field: int, info: ValidationInfo) -> int:
+        if field <= 0:
+            raise ValueError(f"HTTP_{str(info.field_name).upper()} must be a positive integer")
+        return field
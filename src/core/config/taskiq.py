@@ -0,0 +1,19 @@
+from pydantic import ValidationInfo, field_validator
+
+from src.core.enums import TaskQueue
+from src.core.utils.types import TaskQueueList
+
+from .base import BaseConfig
+
+
+class TaskiqConfig(BaseConfig, env_prefix="TASKIQ_"):
+    """Queues a worker process consumes, highest priority first; producers ignore it."""
+
+    queues: TaskQueueList = TaskQueueList([TaskQueue.CRITICAL, TaskQueue.DEFAULT, TaskQueue.BULK])
+
+    @field_validator("queues")
+    @classmethod
+    def validate_queues(cls, field: list[TaskQueue], info: ValidationInfo) -> list[TaskQueue]:
+        if not field:
+            raise ValueError(f"TASKIQ_{str(info.field_name).upper()} must list at least one queue")
+        return list(dict.fromkeys(field))
@@ -48,9 +48,21 @@ IS_NEW_USER: Final[str] = "is_new_user"
 TIME_1M: Final[int] = 60
 TIME_5M: Final[int] = TIME_1M * 5
 TIME_10M: Final[int] = TIME_1M * 10
+TIME_1H: Final[int] = TIME_1M * 60
+
+# redis_cache: TTLs are stretched by up to this ratio; concurrent misses wait on a lock
+CACHE_TTL_JITTER_RATIO: Final[float] = 0.1
+CACHE_LOCK_TIMEOUT_SECONDS: Final[int] = 5
+CACHE_LOCK_POLL_SECONDS: Final[float] = 0.05
+USER_LIST_CACHE_TAG: Final[str] = "user_lists"
 
 RECENT_REGISTERED_MAX_COUNT: Final[int] = 25
 RECENT_ACTIVITY_MAX_COUNT: Final[int] = 25
+# Admin search by name, login or email returns at most this many best-ranked users per page
+USER_SEARCH_LIMIT: Final[int] = 50
+# Per-process: a user's activity timestamp is written at most once per window (0 disables)
+RECENT_ACTIVITY_DEBOUNCE_SECONDS: Final[int] = 30
+RECENT_ACTIVITY_DEBOUNCE_MAX_USERS: Final[int] = 50_000
 
 BATCH_SIZE: Final[int] = 20
 BATCH_DELAY: Final[int] = 1
@@ -60,3 +72,66 @@ MAX_SUBSCRIPTIONS_PER_USER: Final[int] = 5
 
 # Number of days after subscription expiration before user is deleted from panel
 EXPIRED_SUBSCRIPTION_CLEANUP_DAYS: Final[int] = 3
+EXPIRED_SUBSCRIPTION_CLEANUP_BATCH_SIZE: Final[int] = 200
+EXPIRED_SUBSCRIPTION_CLEANUP_CONCURRENCY: Final[int] = 10
+EXPIRED_SUBSCRIPTION_CLEANUP_MAX_ATTEMPTS: Final[int] = 3
+
+# Web analytics ingestion buffer: events are flushed every N events or T seconds
+WEB_ANALYTICS_BUFFER_MAX_SIZE: Final[int] = 10_000
+WEB_ANALYTICS_FLUSH_BATCH_SIZE: Final[int] = 500
+WEB_ANALYTICS_FLUSH_INTERVAL_SECONDS: Final[float] = 0.5
+
+# Event tables are range-partitioned by month; retention drops whole partitions
+USER_NOTIFICATION_EVENTS_RETENTION_DAYS: Final[int] = 30
+USER_NOTIFICATION_COUNTERS_TTL_SECONDS: Final[int] = TIME_1H
+WEB_ANALYTICS_EVENTS_RETENTION_DAYS: Final[int] = 180
+EVENT_PARTITIONS_PRECREATE_MONTHS: Final[int] = 3
+
+# Server-sent event stream of per-user change notifications for the web cabinet
+USER_EVENT_STREAM_QUEUE_SIZE: Final[int] = 32
+USER_EVENT_STREAM_HEARTBEAT_SECONDS: Final[int] = 15
+USER_EVENT_STREAM_MAX_SECONDS: Final[int] = TIME_10M
+USER_EVENT_STREAM_RETRY_MS: Final[int] = 5_000
+
+# Channel membership cache shared by the bot gate and the web access guard; kept fresh
+# by chat_member updates where the bot is a channel admin
+CHANNEL_MEMBER_CACHE_TTL_SECONDS: Final[int] = TIME_1H
+CHANNEL_NON_MEMBER_CACHE_TTL_SECONDS: Final[int] = TIME_1M
+
+# Ready payment gateway instances are kept per process and dropped on settings changes
+# through pub/sub; the max age bounds staleness if an invalidation message is missed
+PAYMENT_GATEWAY_REGISTRY_MAX_AGE_SECONDS: Final[int] = TIME_5M
+
+# API workers elect one leader for cluster-wide lifespan jobs (webhook and command setup,
+# startup notifications, auto-backups); a dead leader is replaced within the TTL
+API_LEADER_TTL_SECONDS: Final[int] = 30
+API_LEADER_RENEW_SECONDS: Final[int] = 10
+
+# Payment webhook inbox: a claimed row is leased to one worker; failed rows are retried with
+# exponential backoff by the per-minute sweep until the attempt limit
+PAYMENT_WEBHOOK_LEASE_SECONDS: Final[int] = TIME_5M
+PAYMENT_WEBHOOK_RETRY_BASE_SECONDS: Final[int] = 30
+PAYMENT_WEBHOOK_MAX_ATTEMPTS: Final[int] = 8
+PAYMENT_WEBHOOK_RETRY_BATCH_SIZE: Final[int] = 100
+
+# Stream update mode: bot workers share one consumer group and own partitions through
+# leases renewed every interval; a worker missing for the TTL loses its partitions and
+# its unacknowledged updates are claimed by the next owner
+BOT_UPDATE_STREAM_GROUP: Final[str] = "bot-workers"
+BOT_UPDATE_LEASE_TTL_SECONDS: Final[int] = 15
+BOT_UPDATE_LEASE_RENEW_SECONDS: Final[int] = 5
+
+# Remnawave webhooks are queued per user or node and applied after the coalescing window,
+# so a burst of events for one entity collapses to the latest state of each event type.
+# Claimed entities are leased until acknowledged; duplicate deliveries are dropped by body
+# digest for the dedup TTL.
+REMNAWAVE_WEBHOOK_COALESCE_SECONDS: Final[float] = 2.0
+REMNAWAVE_WEBHOOK_LEASE_SECONDS: Final[int] = TIME_5M
+REMNAWAVE_WEBHOOK_DEDUP_TTL_SECONDS: Final[int] = TIME_1H
+REMNAWAVE_WEBHOOK_CLAIM_BATCH_SIZE: Final[int] = 100
+# An entity whose events keep failing is redelivered after each lease, then dropped
+REMNAWAVE_WEBHOOK_MAX_ATTEMPTS: Final[int] = 5
+# One drainer at a time holds a renewed lock; it hands over to a fresh task before the
+# per-minute cron drain so it never pins a worker slot for long.
+REMNAWAVE_WEBHOOK_DRAIN_LOCK_SECONDS: Final[int] = 30
+REMNAWAVE_WEBHOOK_DRAIN_MAX_SECONDS: Final[int] = 50
@@ -496,6 +496,30 @@ class MiddlewareEventType(StrEnum):
     ERROR = auto()
 
 
+class TaskQueue(StrEnum):
+    CRITICAL = auto()  # Payments and provisioning the user is waiting on
+    DEFAULT = auto()
+    BULK = auto()  # Broadcasts, imports, panel syncs and maintenance
+
+
+class RemnawaveWebhookEnqueueResult(StrEnum):
+    QUEUED = auto()
+    COALESCED = auto()  # Merged into events of the same entity that are still queued
+    DUPLICATE = auto()  # Same body delivered again
+
+
+class BotUpdateMode(StrEnum):
+    INLINE = auto()  # Handled in the process that receives the webhook
+    STREAM = auto()  # Appended to Redis streams and handled by bot worker processes
+
+
+class UserStreamEventType(StrEnum):
+    NOTIFICATION_CREATED = auto()
+    SUBSCRIPTION_RUNTIME_UPDATED = auto()
+    DEVICE_CHANGED = auto()
+    PAYMENT_COMPLETED = auto()
+
+
 class RemnaUserEvent(StrEnum):
     CREATED = "user.created"
     MODIFIED = "user.modified"
@@ -10,3 +10,12 @@ def emit_counter(metric_name: str, /, **labels: object) -> None:
         return
 
     logger.info("counter {}", metric_name)
+
+
+def emit_timing(metric_name: str, seconds: float, /, **labels: object) -> None:
+    if labels:
+        rendered_labels = ", ".join(f"{name}={labels[name]!r}" for name in sorted(labels))
+        logger.info("timing {} {:.6f}s {}", metric_name, seconds, rendered_labels)
+        return
+
+    logger.info("timing {} {:.6f}s", metric_name, seconds)
@@ -1,19 +1,37 @@
 """Password hashing utilities using bcrypt."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Callable, Final, Optional, TypeVar
+
 import bcrypt
 
+from src.core.observability import emit_counter, emit_timing
+
+PASSWORD_HASH_ROUNDS: Final[int] = 12
+PASSWORD_HASH_MAX_WORKERS: Final[int] = 4
+PASSWORD_HASH_MAX_PENDING: Final[int] = 64
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Raised when the password hashing queue is full."""
+
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, rounds: int = PASSWORD_HASH_ROUNDS) -> str:
     """
     Hash a password using bcrypt.
 
     Args:
         password: Plain text password
+        rounds: bcrypt cost factor
 
     Returns:
         Hashed password as string
     """
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=rounds)
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
@@ -36,3 +54,136 @@ def verify_password(password: str, password_hash: str) -> bool:
         )
     except (ValueError, TypeError):
         return False
+
+
+def needs_rehash(password_hash: str, rounds: int = PASSWORD_HASH_ROUNDS) -> bool:
+    """
+    Check whether a bcrypt hash was produced with outdated parameters.
+
+    Args:
+        password_hash: Stored bcrypt hash (``$2b$<cost>$<salt+digest>``)
+        rounds: Currently configured bcrypt cost factor
+
+    Returns:
+        True if the hash should be regenerated, False otherwise
+    """
+    parts = password_hash.split("$")
+    if len(parts) != 4 or parts[1] != "2b":
+        return True
+
+    try:
+        return int(parts[2]) != rounds
+    except ValueError:
+        return True
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop on a dedicated bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so a small thread pool gives real
+    parallelism without blocking request handlers. Jobs beyond ``max_pending``
+    are rejected with ``PasswordHasherBusyError`` instead of queueing forever.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = PASSWORD_HASH_MAX_WORKERS,
+        max_pending: int = PASSWORD_HASH_MAX_PENDING,
+        rounds: int = PASSWORD_HASH_ROUNDS,
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.rounds = rounds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password without blocking the event loop.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            Hashed password as string
+        """
+        return await self._run("hash", hash_password, password, self.rounds)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """
+        Verify a password against a hash without blocking the event loop.
+
+        Args:
+            password: Plain text password to verify
+            password_hash: Hashed password to compare against
+
+        Returns:
+            True if password matches, False otherwise
+        """
+        return await self._run("verify", verify_password, password, password_hash)
+
+    async def verify_and_upgrade(
+        self,
+        password: str,
+        password_hash: str,
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if the stored parameters are outdated.
+
+        Args:
+            password: Plain text password to verify
+            password_hash: Hashed password to compare against
+
+        Returns:
+            Tuple of the verification result and a new hash to persist, if any
+        """
+        if not await self.verify(password, password_hash):
+            return False, None
+
+        if not needs_rehash(password_hash, self.rounds):
+            return True, None
+
+        emit_counter("password_hash_upgrades_total", rounds=self.rounds)
+        return True, await self.hash(password)
+
+    def shutdown(self) -> None:
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hasher",
+            )
+        return self._executor
+
+    async def _run(self, operation: str, func: Callable[..., T], *args: object) -> T:
+        if self._pending >= self.max_pending:
+            emit_counter("password_hash_rejected_total", operation=operation)
+            raise PasswordHasherBusyError("Password hashing queue is full")
+
+        self._pending += 1
+        started_at = perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._pending -= 1
+            emit_timing(
+                "password_hash_duration_seconds",
+                perf_counter() - started_at,
+                operation=operation,
+            )
+
+
+password_hasher = PasswordHasher()
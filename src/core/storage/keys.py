@@ -18,7 +18,82 @@ class AccessWaitListKey(StorageKey, prefix="access_wait_list"): ...
 class RecentRegisteredUsersKey(StorageKey, prefix="recent_registered_users"): ...
 
 
-class RecentActivityUsersKey(StorageKey, prefix="recent_activity_users"): ...
+# Sorted set scored by last activity time (the former list lived under "recent_activity_users")
+class RecentActivityUsersKey(StorageKey, prefix="recent_active_users"): ...
+
+
+class ExpiredSubscriptionCleanupCheckpointKey(
+    StorageKey,
+    prefix="expired_subscription_cleanup_checkpoint",
+): ...
+
+
+class EmailOutboxKey(StorageKey, prefix="email_outbox"): ...
+
+
+class UserNotificationUnreadCountKey(StorageKey, prefix="user_notification_unread_count"):
+    user_telegram_id: int
+
+
+class UserNotificationTotalCountKey(StorageKey, prefix="user_notification_total_count"):
+    user_telegram_id: int
+
+
+class UserEventChannelKey(StorageKey, prefix="user_events"):
+    user_telegram_id: int
+
+
+class PaymentGatewayRegistryChannelKey(StorageKey, prefix="payment_gateway_registry"): ...
+
+
+class BotUpdateStreamKey(StorageKey, prefix="bot_updates"):
+    partition: int
+
+
+class BotUpdatePartitionLeaseKey(StorageKey, prefix="bot_update_partition_lease"):
+    partition: int
+
+
+# Sorted set of bot worker consumers scored by their last heartbeat
+class BotUpdateWorkersKey(StorageKey, prefix="bot_update_workers"): ...
+
+
+# Remnawave webhook queue: due/lease times per entity (sorted set), queued and claimed
+# events per entity (hashes), an event sequence, receipt digests, failed attempts per
+# entity, the drain kick flag and the lock held by the single running drainer
+class RemnawaveWebhookQueueKey(StorageKey, prefix="remnawave_webhook_queue"): ...
+
+
+class RemnawaveWebhookPendingKey(StorageKey, prefix="remnawave_webhook_pending"): ...
+
+
+class RemnawaveWebhookInflightKey(StorageKey, prefix="remnawave_webhook_inflight"): ...
+
+
+class RemnawaveWebhookSequenceKey(StorageKey, prefix="remnawave_webhook_sequence"): ...
+
+
+class RemnawaveWebhookSeenKey(StorageKey, prefix="remnawave_webhook_seen"):
+    digest: str
+
+
+class RemnawaveWebhookAttemptsKey(StorageKey, prefix="remnawave_webhook_attempts"): ...
+
+
+class RemnawaveWebhookDrainKey(StorageKey, prefix="remnawave_webhook_drain"): ...
+
+
+class RemnawaveWebhookDrainLockKey(StorageKey, prefix="remnawave_webhook_drain_lock"): ...
+
+
+class ChannelMemberStatusKey(StorageKey, prefix="channel_member_status"):
+    chat: str
+    user_id: int
+
+
+class ThrottlingKey(StorageKey, prefix="throttling"):
+    event_type: str
+    telegram_id: int
 
 
 class SubscriptionRuntimeSnapshotKey(StorageKey, prefix="subscription_runtime_snapshot"):
@@ -38,3 +113,7 @@ class MarketAssetUsdQuoteKey(StorageKey, prefix="market_asset_usd_quote"):
 
 
 class MarketUsdRubQuoteKey(StorageKey, prefix="market_usd_rub_quote"): ...
+
+
+# Lease held by the API process that runs cluster-wide lifespan jobs
+class ApiLeaderKey(StorageKey, prefix="api_leader"): ...
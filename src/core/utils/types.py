@@ -12,14 +12,16 @@ from pydantic import PlainValidator
 from remnawave.models import UserResponseDto
 from remnawave.models.webhook import UserDto as UserWebhookDto
 
-from src.core.enums import Locale, SystemNotificationType, UserNotificationType
+from src.core.enums import Locale, SystemNotificationType, TaskQueue, UserNotificationType
 
 if TYPE_CHECKING:
     ListStr: TypeAlias = list[str]
     ListLocale: TypeAlias = list[Locale]
+    ListTaskQueue: TypeAlias = list[TaskQueue]
 else:
     ListStr = NewType("ListStr", list[str])
     ListLocale = NewType("ListLocale", list[Locale])
+    ListTaskQueue = NewType("ListTaskQueue", list[TaskQueue])
 
 AnyInputFile: TypeAlias = Union[BufferedInputFile, FSInputFile]
 
@@ -40,3 +42,11 @@ StringList: TypeAlias = Annotated[
 LocaleList: TypeAlias = Annotated[
     ListLocale, PlainValidator(func=lambda x: [Locale(loc.strip()) for loc in x.split(",")])
 ]
+TaskQueueList: TypeAlias = Annotated[
+    ListTaskQueue,
+    PlainValidator(
+        func=lambda x: [
+            TaskQueue(str(queue).strip()) for queue in (x.split(",") if isinstance(x, str) else x)
+        ]
+    ),
+]
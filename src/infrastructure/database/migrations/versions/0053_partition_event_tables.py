@@ -0,0 +1,110 @@
+"""Partition user_notification_events and web_analytics_events by month.
+
+Revision ID: 0053
+Revises: 0052
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0053"
+down_revision: Union[str, None] = "0052"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created up front beyond the current month; the maintenance task keeps this window.
+PARTITIONS_AHEAD_MONTHS = 3
+
+TABLE_INDEXES: dict[str, list[tuple[str, str]]] = {
+    "user_notification_events": [
+        ("ix_user_notification_events_user_created", "user_telegram_id, created_at"),
+        (
+            "ix_user_notification_events_user_read_created",
+            "user_telegram_id, is_read, created_at",
+        ),
+    ],
+    "web_analytics_events": [
+        ("ix_web_analytics_events_created_at", "created_at"),
+        ("ix_web_analytics_events_event_name_created_at", "event_name, created_at"),
+        ("ix_web_analytics_events_session_id_created_at", "session_id, created_at"),
+        (
+            "ix_web_analytics_events_user_telegram_id_created_at",
+            "user_telegram_id, created_at",
+        ),
+    ],
+}
+
+TABLE_FOREIGN_KEYS: dict[str, list[str]] = {
+    "user_notification_events": [
+        "ADD CONSTRAINT user_notification_events_user_telegram_id_fkey "
+        "FOREIGN KEY (user_telegram_id) REFERENCES users (telegram_id) ON DELETE CASCADE",
+    ],
+    "web_analytics_events": [],
+}
+
+
+def _create_monthly_partitions(table: str, parent: str) -> None:
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month_start timestamp := date_trunc(
+                'month',
+                COALESCE((SELECT min(created_at) FROM {table}), now()) AT TIME ZONE 'UTC'
+            );
+            last_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC')
+                + interval '{PARTITIONS_AHEAD_MONTHS} months';
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                    '{table}_p' || to_char(month_start, 'YYYYMM'),
+                    '{parent}',
+                    month_start AT TIME ZONE 'UTC',
+                    (month_start + interval '1 month') AT TIME ZONE 'UTC'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$;
+    """)
+
+
+def _create_constraints_and_indexes(table: str, primary_key: str) -> None:
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({primary_key})")
+    for foreign_key in TABLE_FOREIGN_KEYS[table]:
+        op.execute(f"ALTER TABLE {table} {foreign_key}")
+    for index_name, columns in TABLE_INDEXES[table]:
+        op.execute(f"CREATE INDEX {index_name} ON {table} ({columns})")
+
+
+def _swap_table(table: str, replacement: str, primary_key: str) -> None:
+    op.execute(f"INSERT INTO {replacement} SELECT * FROM {table}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+    op.execute(f"DROP TABLE {table}")
+    op.execute(f"ALTER TABLE {replacement} RENAME TO {table}")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    _create_constraints_and_indexes(table, primary_key)
+
+
+def upgrade() -> None:
+    for table in TABLE_INDEXES:
+        partitioned = f"{table}_partitioned"
+        op.execute(f"""
+            CREATE TABLE {partitioned}
+            (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+            PARTITION BY RANGE (created_at)
+        """)
+        # No DEFAULT partition: it would block DETACH PARTITION ... CONCURRENTLY and make
+        # attaching a month fail once stray rows land in it. Maintenance keeps
+        # PARTITIONS_AHEAD_MONTHS pre-created instead.
+        _create_monthly_partitions(table, partitioned)
+        # The partition key must be part of every unique constraint on a partitioned table.
+        _swap_table(table, partitioned, "id, created_at")
+
+
+def downgrade() -> None:
+    for table in TABLE_INDEXES:
+        plain = f"{table}_plain"
+        op.execute(f"CREATE TABLE {plain} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        _swap_table(table, plain, "id")
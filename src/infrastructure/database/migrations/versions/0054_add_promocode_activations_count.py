@@ -0,0 +1,63 @@
+"""Add promocode activation counters and one activation per user and promocode.
+
+Revision ID: 0054
+Revises: 0053
+Create Date: 2026-10-19 15:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0054"
+down_revision: Union[str, None] = "0053"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "promocodes",
+        sa.Column("activations_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Counted before de-duplication: duplicate redemptions did consume their slots.
+    op.execute(
+        """
+        UPDATE promocodes p
+        SET activations_count = counts.total
+        FROM (
+            SELECT promocode_id, COUNT(*) AS total
+            FROM promocode_activations
+            GROUP BY promocode_id
+        ) AS counts
+        WHERE counts.promocode_id = p.id
+        """
+    )
+
+    # Concurrent redemptions could previously record the same user twice; keep the first.
+    op.execute(
+        """
+        DELETE FROM promocode_activations pa
+        USING promocode_activations earlier
+        WHERE earlier.promocode_id = pa.promocode_id
+          AND earlier.user_telegram_id = pa.user_telegram_id
+          AND earlier.id < pa.id
+        """
+    )
+
+    op.create_unique_constraint(
+        "uq_promocode_activations_promocode_user",
+        "promocode_activations",
+        ["promocode_id", "user_telegram_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_promocode_activations_promocode_user",
+        "promocode_activations",
+        type_="unique",
+    )
+    op.drop_column("promocodes", "activations_count")
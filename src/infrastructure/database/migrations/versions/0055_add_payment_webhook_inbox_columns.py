@@ -0,0 +1,49 @@
+"""Store the verified payment status and retry schedule on payment webhook inbox rows.
+
+Revision ID: 0055
+Revises: 0054
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0055"
+down_revision: Union[str, None] = "0054"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "payment_webhook_events",
+        sa.Column("payment_status", sa.String(length=32), nullable=True),
+    )
+    op.add_column(
+        "payment_webhook_events",
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_payment_webhook_events_next_attempt_at",
+        "payment_webhook_events",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("next_attempt_at IS NOT NULL"),
+    )
+    # Rows claimed before this revision have no lease; give them one that has already
+    # expired so a worker can reclaim them. The sweep redispatches them once a newer
+    # webhook has stored their payment status.
+    op.execute(
+        "UPDATE payment_webhook_events SET next_attempt_at = now() "
+        "WHERE status = 'PROCESSING' AND next_attempt_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_payment_webhook_events_next_attempt_at",
+        table_name="payment_webhook_events",
+    )
+    op.drop_column("payment_webhook_events", "next_attempt_at")
+    op.drop_column("payment_webhook_events", "payment_status")
@@ -0,0 +1,49 @@
+"""Index user names, usernames, web logins and emails for trigram search.
+
+Revision ID: 0056
+Revises: 0055
+Create Date: 2026-10-19 20:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0056"
+down_revision: Union[str, None] = "0055"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = (
+    ("ix_users_name_trgm", "users", "lower(name)"),
+    ("ix_users_username_trgm", "users", "lower(username)"),
+    ("ix_web_accounts_username_trgm", "web_accounts", "lower(username)"),
+    ("ix_web_accounts_email_normalized_trgm", "web_accounts", "email_normalized"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY keeps users and web_accounts writable while the GIN indexes build,
+    # and it cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for index_name, table_name, expression in TRIGRAM_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                [sa.text(f"{expression} gin_trgm_ops")],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in reversed(TRIGRAM_INDEXES):
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+            )
+    # The extension stays: other objects may have come to depend on it.
@@ -1,8 +1,14 @@
+import types
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from typing import Any, Iterable, Optional, Type, TypeVar
+from enum import Enum
+from typing import Any, Iterable, Optional, Type, TypeVar, Union, cast, get_args, get_origin
+from uuid import UUID
 
 from pydantic import BaseModel as _BaseModel
 from pydantic import ConfigDict, PrivateAttr, SecretStr
+from pydantic.fields import FieldInfo
 
 from src.core.security.crypto import deep_decrypt
 from src.core.security.crypto import encrypt as encrypt_func
@@ -11,6 +17,42 @@ from src.infrastructure.database.models.sql import BaseSql
 SqlModel = TypeVar("SqlModel", bound=BaseSql)
 DtoModel = TypeVar("DtoModel", bound="BaseDto")
 
+# Scalar types a database row already holds in their final form; values of exactly these
+# types are stored as-is, anything else goes through the field's pydantic validator.
+_TRUSTED_SCALARS: tuple[type, ...] = (
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    Decimal,
+    datetime,
+    date,
+    time,
+    timedelta,
+    UUID,
+)
+_MISSING = object()
+_strict_materialization = False
+_materialization_plans: dict[type, Optional[tuple["_FieldPlan", ...]]] = {}
+
+
+def set_strict_materialization(enabled: bool) -> None:
+    """Materialize every row with full ``model_validate`` (e.g. in tests)."""
+    global _strict_materialization
+    _strict_materialization = enabled
+
+
+@dataclass(slots=True, frozen=True)
+class _FieldPlan:
+    name: str
+    required: bool
+    frozen: bool
+    trusted_types: frozenset[type]
+    trust_any: bool
+    nested: Optional[Type["BaseDto"]]
+    nested_list: bool
+
 
 class BaseDto(_BaseModel):
     model_config = ConfigDict(
@@ -33,7 +75,72 @@ class BaseDto(_BaseModel):
         if decrypt:
             data = deep_decrypt(data)
 
-        return cls.model_validate(data)
+        return cls._from_row(data)
+
+    @classmethod
+    def _from_row(cls: Type[DtoModel], data: dict[str, Any]) -> DtoModel:
+        """Build the DTO from a database row without re-validating trusted values.
+
+        Values whose runtime type already matches the field are stored as-is, loaded
+        relationships are converted the same way, and only the remaining fields go
+        through their validators. Rows that cannot take this path (a missing required
+        field, a frozen field needing conversion, model validators) and strict mode use
+        full ``model_validate``.
+        """
+        plans = None if _strict_materialization else cls._materialization_plan()
+        if plans is None:
+            return cls.model_validate(data)
+
+        values: dict[str, Any] = {}
+        pending: list[tuple[str, Any]] = []
+        for plan in plans:
+            value = data.get(plan.name, _MISSING)
+            if value is _MISSING:
+                if plan.required:
+                    return cls.model_validate(data)
+                continue
+
+            if plan.trust_any or type(value) in plan.trusted_types:
+                values[plan.name] = value
+            elif plan.nested is not None and (converted := _convert_nested(plan, value)):
+                values[plan.name] = converted[0]
+            elif plan.frozen:
+                return cls.model_validate(data)
+            else:
+                pending.append((plan.name, value))
+
+        dto = cast(DtoModel, cls.model_construct(**values))
+        for name, value in pending:
+            cls.__pydantic_validator__.validate_assignment(dto, name, value)
+        return dto
+
+    @classmethod
+    def _materialization_plan(cls) -> Optional[tuple[_FieldPlan, ...]]:
+        if cls in _materialization_plans:
+            return _materialization_plans[cls]
+        if not cls.__pydantic_complete__:
+            return None  # Forward references not resolved yet; model_validate rebuilds.
+
+        decorators = cls.__pydantic_decorators__
+        if decorators.model_validators or decorators.root_validators:
+            plan = None
+        else:
+            validated_fields = {
+                field
+                for decorator in decorators.field_validators.values()
+                for field in decorator.info.fields
+            }
+            validated_fields.update(
+                field
+                for legacy_decorator in decorators.validators.values()
+                for field in legacy_decorator.info.fields
+            )
+            plan = tuple(
+                _build_field_plan(name, field, trusted=name not in validated_fields)
+                for name, field in cls.model_fields.items()
+            )
+        _materialization_plans[cls] = plan
+        return plan
 
     @classmethod
     def from_model_list(
@@ -49,6 +156,57 @@ class BaseDto(_BaseModel):
         ]
 
 
+def _build_field_plan(name: str, field: FieldInfo, *, trusted: bool) -> _FieldPlan:
+    annotation = field.annotation
+    trusted_types: set[type] = set()
+    trust_any = False
+    nested: Optional[Type[BaseDto]] = None
+    nested_list = False
+
+    if trusted and not field.metadata:
+        trust_any = annotation is Any
+        options = get_args(annotation) if _is_union(annotation) else (annotation,)
+        for option in options:
+            if option is type(None):
+                trusted_types.add(type(None))
+            elif isinstance(option, type) and issubclass(option, Enum):
+                trusted_types.add(option)
+            elif option in _TRUSTED_SCALARS:
+                trusted_types.add(option)
+            elif isinstance(option, type) and issubclass(option, BaseDto):
+                nested = option
+            elif get_origin(option) is list:
+                (item,) = get_args(option) or (Any,)
+                if isinstance(item, type) and issubclass(item, BaseDto):
+                    nested, nested_list = item, True
+
+    return _FieldPlan(
+        name=name,
+        required=field.is_required(),
+        frozen=bool(field.frozen),
+        trusted_types=frozenset(trusted_types),
+        trust_any=trust_any,
+        nested=nested,
+        nested_list=nested_list,
+    )
+
+
+def _is_union(annotation: Any) -> bool:
+    return get_origin(annotation) in (Union, types.UnionType)
+
+
+def _convert_nested(plan: _FieldPlan, value: Any) -> Optional[tuple[Any]]:
+    """Convert loaded relationship rows; ``None`` when the value is not ORM rows."""
+    assert plan.nested is not None
+    if plan.nested_list:
+        if not isinstance(value, list) or not all(isinstance(item, BaseSql) for item in value):
+            return None
+        return ([plan.nested._from_row(item.__dict__) for item in value],)
+    if isinstance(value, BaseSql):
+        return (plan.nested._from_row(value.__dict__),)
+    return None
+
+
 class TrackableDto(BaseDto):
     __changed_data: dict[str, Any] = PrivateAttr(default_factory=dict)
 
@@ -48,6 +48,7 @@ class PromocodeDto(TrackableDto):
 
     lifetime: int = -1  # -1 означает бессрочный промокод
     max_activations: int = -1  # -1 означает безлимитный промокод
+    activations_count: int = Field(default=0, frozen=True)
     allowed_user_ids: list[int] = Field(default_factory=list)
     allowed_plan_ids: list[int] = Field(default_factory=list)  # Empty list means all plans
 
@@ -77,7 +78,7 @@ class PromocodeDto(TrackableDto):
                 activations_data.append(activation_dict)
             data["activations"] = activations_data
 
-        return cls.model_validate(data)
+        return cls._from_row(data)
 
     created_at: Optional[datetime] = Field(default=None, frozen=True)
     updated_at: Optional[datetime] = Field(default=None, frozen=True)
@@ -104,7 +105,7 @@ class PromocodeDto(TrackableDto):
         if self.max_activations == -1 or self.max_activations is None:
             return False
 
-        return len(self.activations) >= self.max_activations
+        return self.activations_count >= self.max_activations
 
     @property
     def is_available(self) -> bool:
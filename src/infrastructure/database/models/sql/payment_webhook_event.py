@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import UUID as PG_UUID
-from sqlalchemy import DateTime, Integer, String, Text, UniqueConstraint
+from sqlalchemy import DateTime, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import BaseSql
@@ -19,12 +19,18 @@ class PaymentWebhookEvent(BaseSql, TimestampMixin):
             "payment_id",
             name="uq_payment_webhook_events_gateway_payment",
         ),
+        Index(
+            "ix_payment_webhook_events_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=text("next_attempt_at IS NOT NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     gateway_type: Mapped[str] = mapped_column(String(32), nullable=False)
     payment_id: Mapped[UUID] = mapped_column(PG_UUID, nullable=False)
     status: Mapped[str] = mapped_column(String(32), nullable=False)
+    payment_status: Mapped[str | None] = mapped_column(String(32), nullable=True)
     payload_hash: Mapped[str] = mapped_column(String(64), nullable=False)
     attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -34,3 +40,7 @@ class PaymentWebhookEvent(BaseSql, TimestampMixin):
         nullable=False,
     )
     processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    next_attempt_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
@@ -8,7 +8,18 @@ if TYPE_CHECKING:
 
 from datetime import datetime
 
-from sqlalchemy import ARRAY, JSON, BigInteger, Boolean, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import (
+    ARRAY,
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.enums import PromocodeAvailability, PromocodeRewardType
@@ -51,6 +62,10 @@ class Promocode(BaseSql, TimestampMixin):
 
     lifetime: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=-1)
     max_activations: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, default=-1)
+    # Maintained by the conditional UPDATE that claims an activation slot.
+    activations_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     allowed_user_ids: Mapped[list[int]] = mapped_column(
         ARRAY(BigInteger), nullable=True, default=[]
     )
@@ -62,12 +77,19 @@ class Promocode(BaseSql, TimestampMixin):
         "PromocodeActivation",
         back_populates="promocode",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="select",
     )
 
 
 class PromocodeActivation(BaseSql):
     __tablename__ = "promocode_activations"
+    __table_args__ = (
+        UniqueConstraint(
+            "promocode_id",
+            "user_telegram_id",
+            name="uq_promocode_activations_promocode_user",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from .subscription import Subscription
     from .web_account import WebAccount
 
-from sqlalchemy import JSON, BigInteger, Boolean, Enum, ForeignKey, Integer, String
+from sqlalchemy import JSON, BigInteger, Boolean, Enum, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.enums import Currency, Locale, UserRole
@@ -19,6 +19,14 @@ from .timestamp import TimestampMixin
 
 class User(BaseSql, TimestampMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_name_trgm", text("lower(name) gin_trgm_ops"), postgresql_using="gin"),
+        Index(
+            "ix_users_username_trgm",
+            text("lower(username) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     telegram_id: Mapped[int] = mapped_column(BigInteger, nullable=False, unique=True)
@@ -13,6 +13,9 @@ from .timestamp import TimestampMixin
 
 class UserNotificationEvent(BaseSql, TimestampMixin):
     __tablename__ = "user_notification_events"
+    # Monthly range partitions (see EventPartitionService); the database primary key is
+    # (id, created_at) because the partition key must be part of it, ids stay unique.
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_telegram_id: Mapped[int] = mapped_column(
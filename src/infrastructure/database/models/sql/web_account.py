@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import JSON, BigInteger, DateTime, ForeignKey, Integer, String
+from sqlalchemy import JSON, BigInteger, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -17,6 +17,18 @@ if TYPE_CHECKING:
 
 class WebAccount(BaseSql, TimestampMixin):
     __tablename__ = "web_accounts"
+    __table_args__ = (
+        Index(
+            "ix_web_accounts_username_trgm",
+            text("lower(username) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_web_accounts_email_normalized_trgm",
+            text("email_normalized gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_telegram_id: Mapped[int] = mapped_column(
@@ -13,6 +13,9 @@ from .timestamp import NOW_FUNC
 
 class WebAnalyticsEvent(BaseSql):
     __tablename__ = "web_analytics_events"
+    # Monthly range partitions (see EventPartitionService); the database primary key is
+    # (id, created_at) because the partition key must be part of it, ids stay unique.
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     created_at: Mapped[datetime] = mapped_column(
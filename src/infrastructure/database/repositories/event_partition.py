@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from typing import Final
+
+from sqlalchemy import text
+
+from .base import BaseRepository
+
+_IDENTIFIER_PATTERN: Final[re.Pattern[str]] = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def _quote_identifier(name: str) -> str:
+    if not _IDENTIFIER_PATTERN.match(name):
+        raise ValueError(f"Unsafe SQL identifier '{name}'")
+    return f'"{name}"'
+
+
+class EventPartitionRepository(BaseRepository):
+    async def list_partitions(self, table: str) -> list[str]:
+        result = await self.session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+                "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": table},
+        )
+        return [str(name) for name in result.scalars().all()]
+
+    async def create_range_partition(
+        self,
+        *,
+        table: str,
+        partition: str,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        # ATTACH PARTITION needs only SHARE UPDATE EXCLUSIVE on the parent, whereas
+        # CREATE TABLE ... PARTITION OF takes ACCESS EXCLUSIVE and blocks event writes.
+        await self.session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {_quote_identifier(partition)} "
+                f"(LIKE {_quote_identifier(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        await self.session.execute(
+            text(
+                f"ALTER TABLE {_quote_identifier(table)} "
+                f"ATTACH PARTITION {_quote_identifier(partition)} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+
+    async def drop_partition(self, *, table: str, partition: str) -> None:
+        # DETACH ... CONCURRENTLY keeps event writes flowing but cannot run inside a
+        # transaction block, so this must be the first statement of a fresh session.
+        connection = await self.session.connection(
+            execution_options={"isolation_level": "AUTOCOMMIT"}
+        )
+        result = await connection.execute(
+            text(
+                "SELECT pg_inherits.inhdetachpending FROM pg_inherits "
+                "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+                "WHERE child.relname = :partition"
+            ),
+            {"partition": partition},
+        )
+        # An interrupted concurrent detach leaves the partition pending; only FINALIZE
+        # can complete it.
+        mode = "FINALIZE" if result.scalar_one_or_none() else "CONCURRENTLY"
+        await connection.execute(
+            text(
+                f"ALTER TABLE {_quote_identifier(table)} "
+                f"DETACH PARTITION {_quote_identifier(partition)} {mode}"
+            )
+        )
+        await connection.execute(text(f"DROP TABLE {_quote_identifier(partition)}"))
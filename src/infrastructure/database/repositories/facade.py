@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .broadcast import BroadcastRepository
+from .event_partition import EventPartitionRepository
 from .partner import PartnerRepository
 from .payment_gateway import PaymentGatewayRepository
 from .payment_webhook_event import PaymentWebhookEventRepository
@@ -36,6 +37,7 @@ class RepositoriesFacade:
     web_analytics_events: WebAnalyticsEventRepository
     web_accounts: WebAccountRepository
     auth_challenges: AuthChallengeRepository
+    event_partitions: EventPartitionRepository
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
@@ -56,3 +58,4 @@ class RepositoriesFacade:
         self.web_analytics_events = WebAnalyticsEventRepository(session)
         self.web_accounts = WebAccountRepository(session)
         self.auth_challenges = AuthChallengeRepository(session)
+        self.event_partitions = EventPartitionRepository(session)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select, update
 
 from src.core.enums import PaymentGatewayType
 from src.infrastructure.database.models.sql import PaymentWebhookEvent
@@ -33,6 +34,86 @@ class PaymentWebhookEventRepository(BaseRepository):
     async def update(self, event_id: int, **data: Any) -> Optional[PaymentWebhookEvent]:
         return await self._update(PaymentWebhookEvent, PaymentWebhookEvent.id == event_id, **data)
 
+    async def claim(
+        self,
+        gateway_type: str,
+        payment_id: UUID,
+        *,
+        claimable_statuses: Sequence[str],
+        processing_status: str,
+        payment_status: str,
+        now: datetime,
+        lease_until: datetime,
+    ) -> Optional[PaymentWebhookEvent]:
+        """Take the event for processing unless another worker holds an unexpired lease."""
+        query = (
+            update(PaymentWebhookEvent)
+            .where(
+                PaymentWebhookEvent.gateway_type == gateway_type,
+                PaymentWebhookEvent.payment_id == payment_id,
+                or_(
+                    PaymentWebhookEvent.status.in_(claimable_statuses),
+                    and_(
+                        PaymentWebhookEvent.status == processing_status,
+                        PaymentWebhookEvent.next_attempt_at <= now,
+                    ),
+                ),
+            )
+            .values(
+                status=processing_status,
+                payment_status=func.coalesce(PaymentWebhookEvent.payment_status, payment_status),
+                next_attempt_at=lease_until,
+                attempts=PaymentWebhookEvent.attempts + 1,
+                last_error=None,
+            )
+            .returning(PaymentWebhookEvent)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().first()
+
+    async def finish(self, event_id: int, payload_hash: str, **data: Any) -> bool:
+        """Settle a claimed event unless a newer webhook replaced its payload meanwhile."""
+        query = (
+            update(PaymentWebhookEvent)
+            .where(
+                PaymentWebhookEvent.id == event_id,
+                PaymentWebhookEvent.payload_hash == payload_hash,
+            )
+            .values(**data)
+            .returning(PaymentWebhookEvent.id)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def take_due(
+        self,
+        *,
+        enqueued_status: str,
+        now: datetime,
+        lease_until: datetime,
+        limit: int,
+    ) -> list[PaymentWebhookEvent]:
+        """Mark due events enqueued until the lease ends and return them for dispatch."""
+        due_ids = (
+            select(PaymentWebhookEvent.id)
+            .where(
+                PaymentWebhookEvent.next_attempt_at <= now,
+                PaymentWebhookEvent.payment_status.is_not(None),
+            )
+            .order_by(PaymentWebhookEvent.next_attempt_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        query = (
+            update(PaymentWebhookEvent)
+            .where(PaymentWebhookEvent.id.in_(due_ids))
+            .values(status=enqueued_status, next_attempt_at=lease_until)
+            .returning(PaymentWebhookEvent)
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def get_platega_orphan_events(
         self,
         *,
@@ -1,6 +1,7 @@
 from typing import Any, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 
 from src.core.enums import PromocodeRewardType
 from src.infrastructure.database.models.sql import Promocode, PromocodeActivation
@@ -34,6 +35,49 @@ class PromocodeRepository(BaseRepository):
     async def filter_active(self, is_active: bool) -> list[Promocode]:
         return await self._get_many(Promocode, Promocode.is_active == is_active)
 
+    async def has_user_activation(self, promocode_id: int, user_telegram_id: int) -> bool:
+        query = select(
+            exists().where(
+                PromocodeActivation.promocode_id == promocode_id,
+                PromocodeActivation.user_telegram_id == user_telegram_id,
+            )
+        )
+        return bool(await self.session.scalar(query))
+
+    async def create_activation(self, **data: Any) -> Optional[int]:
+        """Insert an activation; ``None`` if the user already activated this promocode."""
+        query = (
+            insert(PromocodeActivation)
+            .values(**data)
+            .on_conflict_do_nothing(
+                index_elements=[
+                    PromocodeActivation.promocode_id,
+                    PromocodeActivation.user_telegram_id,
+                ]
+            )
+            .returning(PromocodeActivation.id)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def claim_activation(self, promocode_id: int) -> bool:
+        """Atomically take one activation slot; ``False`` once the limit is reached."""
+        query = (
+            update(Promocode)
+            .where(
+                Promocode.id == promocode_id,
+                or_(
+                    Promocode.max_activations.is_(None),
+                    Promocode.max_activations < 0,
+                    Promocode.activations_count < Promocode.max_activations,
+                ),
+            )
+            .values(activations_count=Promocode.activations_count + 1)
+            .returning(Promocode.activations_count)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none() is not None
+
     async def get_activations_by_user(
         self,
         user_telegram_id: int,
@@ -1,8 +1,10 @@
+from datetime import datetime
 from typing import Any, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
+from src.core.enums import SubscriptionStatus
 from src.infrastructure.database.models.sql import Subscription
 
 from .base import BaseRepository
@@ -41,6 +43,41 @@ class SubscriptionRepository(BaseRepository):
     async def get_all(self) -> list[Subscription]:
         return await self._get_many(Subscription)
 
+    async def get_expired_refs_page(
+        self,
+        *,
+        expired_before: datetime,
+        after_id: int,
+        limit: int,
+    ) -> list[tuple[int, UUID]]:
+        """Keyset page of (id, user_remna_id) for expired subscriptions, ordered by ID."""
+        result = await self.session.execute(
+            select(Subscription.id, Subscription.user_remna_id)
+            .where(
+                Subscription.status == SubscriptionStatus.EXPIRED,
+                Subscription.expire_at < expired_before,
+                Subscription.id > after_id,
+            )
+            .order_by(Subscription.id)
+            .limit(limit)
+        )
+        return [(row.id, row.user_remna_id) for row in result.all()]
+
+    async def update_status_by_ids(
+        self,
+        subscription_ids: Sequence[int],
+        status: SubscriptionStatus,
+    ) -> int:
+        if not subscription_ids:
+            return 0
+
+        result = await self.session.execute(
+            update(Subscription)
+            .where(Subscription.id.in_(subscription_ids))
+            .values(status=status)
+        )
+        return self._rowcount(result)
+
     async def update(self, subscription_id: int, **data: Any) -> Optional[Subscription]:
         return await self._update(Subscription, Subscription.id == subscription_id, **data)
 
@@ -2,10 +2,10 @@ import secrets
 import string
 from typing import Any, Optional
 
-from sqlalchemy import func, or_, select, text, update
+from sqlalchemy import func, or_, select, text, union_all, update
 
 from src.core.enums import UserRole
-from src.infrastructure.database.models.sql import User
+from src.infrastructure.database.models.sql import User, WebAccount
 
 from .base import BaseRepository
 
@@ -25,13 +25,56 @@ class UserRepository(BaseRepository):
     async def get_by_ids(self, telegram_ids: list[int]) -> list[User]:
         return await self._get_many(User, User.telegram_id.in_(telegram_ids))
 
-    async def get_by_partial_name(self, query: str) -> list[User]:
-        search_pattern = f"%{query.lower()}%"
-        conditions = [
-            func.lower(User.name).like(search_pattern),
-            func.lower(User.username).like(search_pattern),
-        ]
-        return await self._get_many(User, or_(*conditions))
+    async def search_by_login_or_name(
+        self,
+        query: str,
+        *,
+        limit: int,
+        offset: int = 0,
+    ) -> list[User]:
+        """Users whose name, username, web login or email contains ``query``.
+
+        Each substring match is served by a pg_trgm GIN index, so the cost follows the
+        number of matches rather than the table size. Results are ranked by the best
+        trigram similarity of any matched field.
+        """
+        normalized_query = query.lower()
+        escaped_query = (
+            normalized_query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        search_pattern = f"%{escaped_query}%"
+
+        def matches(*fields: Any) -> Any:
+            return or_(*(field.like(search_pattern, escape="\\") for field in fields))
+
+        def score(*fields: Any) -> Any:
+            return func.greatest(*(func.similarity(field, normalized_query) for field in fields))
+
+        user_fields = (func.lower(User.name), func.lower(User.username))
+        account_fields = (func.lower(WebAccount.username), WebAccount.email_normalized)
+        user_matches = select(
+            User.telegram_id.label("telegram_id"),
+            score(*user_fields).label("score"),
+        ).where(matches(*user_fields))
+        account_matches = select(
+            WebAccount.user_telegram_id,
+            score(*account_fields),
+        ).where(matches(*account_fields))
+        candidates = union_all(user_matches, account_matches).subquery()
+        ranked = (
+            select(candidates.c.telegram_id, func.max(candidates.c.score).label("score"))
+            .group_by(candidates.c.telegram_id)
+            .subquery()
+        )
+
+        result = await self.session.execute(
+            select(User)
+            .join(ranked, ranked.c.telegram_id == User.telegram_id)
+            .order_by(ranked.c.score.desc(), User.telegram_id)
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(result.unique().scalars().all())
 
     async def get_by_referral_code(self, referral_code: str) -> Optional[User]:
         return await self._get_one(User, User.referral_code == referral_code)
@@ -139,6 +182,14 @@ class UserRepository(BaseRepository):
                 "UPDATE transactions "
                 "SET user_telegram_id = :target WHERE user_telegram_id = :source"
             ),
+            # One activation per promocode and user: drop the source's duplicates first.
+            (
+                "DELETE FROM promocode_activations AS source_pa "
+                "WHERE source_pa.user_telegram_id = :source AND EXISTS ("
+                "SELECT 1 FROM promocode_activations AS target_pa "
+                "WHERE target_pa.user_telegram_id = :target "
+                "AND target_pa.promocode_id = source_pa.promocode_id)"
+            ),
             (
                 "UPDATE promocode_activations "
                 "SET user_telegram_id = :target WHERE user_telegram_id = :source"
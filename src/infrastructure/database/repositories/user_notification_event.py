@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, update
 
 from src.infrastructure.database.models.sql import UserNotificationEvent
 
@@ -30,29 +30,38 @@ class UserNotificationEventRepository(BaseRepository):
         self,
         *,
         user_telegram_id: int,
+        created_after: datetime,
         limit: int,
         offset: int,
     ) -> list[UserNotificationEvent]:
         return await self._get_many(
             UserNotificationEvent,
             UserNotificationEvent.user_telegram_id == user_telegram_id,
+            UserNotificationEvent.created_at >= created_after,
             order_by=[UserNotificationEvent.created_at.desc(), UserNotificationEvent.id.desc()],
             limit=limit,
             offset=offset,
         )
 
-    async def count_by_user(self, *, user_telegram_id: int) -> int:
+    async def count_by_user(self, *, user_telegram_id: int, created_after: datetime) -> int:
         return await self._count(
             UserNotificationEvent,
             UserNotificationEvent.user_telegram_id == user_telegram_id,
+            UserNotificationEvent.created_at >= created_after,
         )
 
-    async def count_unread_by_user(self, *, user_telegram_id: int) -> int:
+    async def count_unread_by_user(
+        self,
+        *,
+        user_telegram_id: int,
+        created_after: datetime,
+    ) -> int:
         return await self._count(
             UserNotificationEvent,
             and_(
                 UserNotificationEvent.user_telegram_id == user_telegram_id,
                 UserNotificationEvent.is_read.is_(False),
+                UserNotificationEvent.created_at >= created_after,
             ),
         )
 
@@ -84,6 +93,7 @@ class UserNotificationEventRepository(BaseRepository):
         self,
         *,
         user_telegram_id: int,
+        created_after: datetime,
         read_source: str,
         read_at: datetime,
     ) -> int:
@@ -92,6 +102,7 @@ class UserNotificationEventRepository(BaseRepository):
             .where(
                 UserNotificationEvent.user_telegram_id == user_telegram_id,
                 UserNotificationEvent.is_read.is_(False),
+                UserNotificationEvent.created_at >= created_after,
             )
             .values(
                 is_read=True,
@@ -108,7 +119,7 @@ class UserNotificationEventRepository(BaseRepository):
         notification_id: int,
         read_source: str,
         read_at: datetime,
-    ) -> bool:
+    ) -> Optional[int]:
         query = (
             update(UserNotificationEvent)
             .where(
@@ -120,9 +131,10 @@ class UserNotificationEventRepository(BaseRepository):
                 read_at=read_at,
                 read_source=read_source,
             )
+            .returning(UserNotificationEvent.user_telegram_id)
         )
         result = await self.session.execute(query)
-        return self._rowcount(result) > 0
+        return result.scalars().first()
 
     async def set_bot_delivery_meta(
         self,
@@ -141,16 +153,3 @@ class UserNotificationEventRepository(BaseRepository):
         )
         result = await self.session.execute(query)
         return self._rowcount(result) > 0
-
-    async def cleanup_older_than(self, *, threshold: datetime) -> int:
-        query = (
-            select(func.count())
-            .select_from(UserNotificationEvent)
-            .where(UserNotificationEvent.created_at < threshold)
-        )
-        to_delete = int((await self.session.scalar(query)) or 0)
-        if to_delete == 0:
-            return 0
-
-        await self._delete(UserNotificationEvent, UserNotificationEvent.created_at < threshold)
-        return to_delete
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+from typing import Any
+
+from sqlalchemy import insert
+
 from src.infrastructure.database.models.sql import WebAnalyticsEvent
 
 from .base import BaseRepository
 
 
 class WebAnalyticsEventRepository(BaseRepository):
-    async def create(self, event: WebAnalyticsEvent) -> WebAnalyticsEvent:
-        return await self.create_instance(event)
+    async def create_many(self, rows: list[dict[str, Any]]) -> int:
+        if not rows:
+            return 0
+
+        await self.session.execute(insert(WebAnalyticsEvent), rows)
+        return len(rows)
@@ -1,5 +1,5 @@
 from types import TracebackType
-from typing import AsyncContextManager, Optional, Self, Type
+from typing import AsyncContextManager, Awaitable, Callable, Optional, Self, Type
 
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -17,6 +17,7 @@ class UnitOfWork:
         self.session_pool = session_pool
         self._session_ctx: Optional[AsyncContextManager[AsyncSession]] = None
         self._context_depth = 0
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
 
     async def __aenter__(self) -> Self:
         if self.session is not None:
@@ -51,11 +52,20 @@ class UnitOfWork:
         finally:
             await self._close_session(exc_type, exc_val, exc_tb)
 
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run ``callback`` once the work done so far is committed, whoever commits it."""
+        self._after_commit.append(callback)
+
     async def commit(self) -> None:
         if self.session:
             await self.session.commit()
 
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            await callback()
+
     async def rollback(self) -> None:
+        self._after_commit.clear()
         if self.session:
             await self.session.rollback()
             logger.debug("Session rolled back")
@@ -73,3 +83,4 @@ class UnitOfWork:
 
         self.session = None
         self._session_ctx = None
+        self._after_commit.clear()
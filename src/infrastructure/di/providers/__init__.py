@@ -2,26 +2,32 @@ from dishka import Provider
 from dishka.integrations.aiogram import AiogramProvider
 from dishka.integrations.fastapi import FastapiProvider
 
+from .analytics import AnalyticsProvider
 from .bot import BotProvider
 from .config import ConfigProvider
 from .database import DatabaseProvider
+from .http import HttpProvider
 from .i18n import I18nProvider
 from .payment_gateways import PaymentGatewaysProvider
 from .redis import RedisProvider
 from .remnawave import RemnawaveProvider
 from .services import ServicesProvider
+from .smtp import SmtpProvider
 
 
 def get_providers() -> list[Provider]:
     return [
         AiogramProvider(),
+        AnalyticsProvider(),
         BotProvider(),
         ConfigProvider(),
         DatabaseProvider(),
         FastapiProvider(),
+        HttpProvider(),
         I18nProvider(),
         RedisProvider(),
         RemnawaveProvider(),
         ServicesProvider(),
+        SmtpProvider(),
         PaymentGatewaysProvider(),
     ]
@@ -0,0 +1,23 @@
+from collections.abc import AsyncGenerator
+
+from dishka import Provider, Scope, provide
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.services.web_analytics_buffer import WebAnalyticsEventBuffer
+
+
+class AnalyticsProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def get_web_analytics_event_buffer(
+        self,
+        session_pool: async_sessionmaker[AsyncSession],
+    ) -> AsyncGenerator[WebAnalyticsEventBuffer, None]:
+        buffer = WebAnalyticsEventBuffer(session_pool)
+
+        yield buffer
+
+        logger.debug(f"Flushing '{buffer.pending}' buffered analytics event(s)")
+        await buffer.close()
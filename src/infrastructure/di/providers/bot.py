@@ -6,7 +6,9 @@ from aiogram.enums import ParseMode
 from aiogram_dialog import BgManagerFactory
 from dishka import Provider, Scope, from_context, provide
 from loguru import logger
+from redis.asyncio import Redis
 
+from src.bot.update_stream import UpdateStreamPublisher
 from src.core.config import AppConfig
 
 
@@ -27,3 +29,15 @@ class BotProvider(Provider):
 
         logger.debug("Closing Bot session")
         await bot.session.close()
+
+    @provide
+    def get_update_stream_publisher(
+        self,
+        client: Redis,
+        config: AppConfig,
+    ) -> UpdateStreamPublisher:
+        return UpdateStreamPublisher(
+            client,
+            partitions=config.bot.update_stream_partitions,
+            max_length=config.bot.update_stream_max_length,
+        )
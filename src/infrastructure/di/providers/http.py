@@ -0,0 +1,24 @@
+from collections.abc import AsyncGenerator
+
+from dishka import Provider, Scope, provide
+from loguru import logger
+
+from src.core.config import AppConfig
+from src.infrastructure.http import HttpClientRegistry
+
+
+class HttpProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def get_http_client_registry(
+        self,
+        config: AppConfig,
+    ) -> AsyncGenerator[HttpClientRegistry, None]:
+        logger.debug("Initializing pooled HTTP client registry")
+        registry = HttpClientRegistry(config.http)
+
+        yield registry
+
+        logger.debug("Closing pooled HTTP client registry")
+        await registry.close()
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
 from typing import Type
 
 from aiogram import Bot
 from dishka import Provider, Scope, provide
 from loguru import logger
+from redis.asyncio import Redis
 
 from src.core.config import AppConfig
 from src.core.enums import PaymentGatewayType
 from src.infrastructure.database.models.dto import PaymentGatewayDto
+from src.infrastructure.http import HttpClientRegistry
 from src.infrastructure.payment_gateways import (
     BasePaymentGateway,
     CloudPaymentsGateway,
@@ -18,6 +21,7 @@ from src.infrastructure.payment_gateways import (
     MulenpayGateway,
     Pal24Gateway,
     PaymentGatewayFactory,
+    PaymentGatewayRegistry,
     PlategaGateway,
     RobokassaGateway,
     StripeGateway,
@@ -27,6 +31,7 @@ from src.infrastructure.payment_gateways import (
     YookassaGateway,
     YoomoneyGateway,
 )
+from src.infrastructure.redis import RedisChannelFanout
 
 GATEWAY_MAP: dict[PaymentGatewayType, Type[BasePaymentGateway]] = {
     PaymentGatewayType.TELEGRAM_STARS: TelegramStarsGateway,
@@ -51,7 +56,12 @@ class PaymentGatewaysProvider(Provider):
     _cached_gateways: dict[PaymentGatewayType, BasePaymentGateway] = {}
 
     @provide()
-    def get_gateway_factory(self, bot: Bot, config: AppConfig) -> PaymentGatewayFactory:
+    def get_gateway_factory(
+        self,
+        bot: Bot,
+        config: AppConfig,
+        http_clients: HttpClientRegistry,
+    ) -> PaymentGatewayFactory:
         def create_gateway(gateway: PaymentGatewayDto) -> BasePaymentGateway:
             gateway_type = gateway.type
 
@@ -74,9 +84,21 @@ class PaymentGatewaysProvider(Provider):
                     gateway=gateway,
                     bot=bot,
                     config=config,
+                    http_clients=http_clients,
                 )
                 logger.debug(f"Initialized new gateway '{gateway_type}' instance")
 
             return self._cached_gateways[gateway_type]
 
         return create_gateway
+
+    @provide()
+    async def get_gateway_registry(
+        self,
+        factory: PaymentGatewayFactory,
+        redis_client: Redis,
+        fanout: RedisChannelFanout,
+    ) -> AsyncGenerator[PaymentGatewayRegistry, None]:
+        registry = PaymentGatewayRegistry(factory, redis_client, fanout)
+        yield registry
+        await registry.close()
@@ -6,7 +6,8 @@ from loguru import logger
 from redis.asyncio import ConnectionPool, Redis
 
 from src.core.config import AppConfig
-from src.infrastructure.redis import RedisRepository
+from src.core.constants import USER_EVENT_STREAM_QUEUE_SIZE
+from src.infrastructure.redis import RedisChannelFanout, RedisRateLimiter, RedisRepository
 
 
 class RedisProvider(Provider):
@@ -33,4 +34,14 @@ class RedisProvider(Provider):
         await client.close()
         await connection_pool.disconnect()
 
+    @provide
+    async def get_channel_fanout(self, client: Redis) -> AsyncGenerator[RedisChannelFanout, None]:
+        fanout = RedisChannelFanout(client, queue_size=USER_EVENT_STREAM_QUEUE_SIZE)
+        yield fanout
+        await fanout.close()
+
     redis_repository = provide(source=RedisRepository)
+
+    @provide
+    def get_rate_limiter(self, client: Redis) -> RedisRateLimiter:
+        return RedisRateLimiter(client)
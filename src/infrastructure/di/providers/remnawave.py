@@ -1,16 +1,17 @@
 from dishka import Provider, Scope, provide
-from httpx import AsyncClient, Timeout
+from httpx import Timeout
 from loguru import logger
 from remnawave import RemnawaveSDK
 
 from src.core.config import AppConfig
+from src.infrastructure.http import HttpClientRegistry
 
 
 class RemnawaveProvider(Provider):
     scope = Scope.APP
 
     @provide
-    def get_remnawave(self, config: AppConfig) -> RemnawaveSDK:
+    def get_remnawave(self, config: AppConfig, http_clients: HttpClientRegistry) -> RemnawaveSDK:
         logger.debug("Initializing RemnawaveSDK")
 
         headers = {}
@@ -21,8 +22,8 @@ class RemnawaveProvider(Provider):
             headers["x-forwarded-proto"] = "https"
             headers["x-forwarded-for"] = "127.0.0.1"
 
-        client = AsyncClient(
-            base_url=f"{config.remnawave.url.get_secret_value()}/api",
+        client = http_clients.client(
+            f"{config.remnawave.url.get_secret_value()}/api",
             headers=headers,
             cookies=config.remnawave.cookies,
             verify=True,
@@ -5,9 +5,11 @@ from src.services.access_policy import AccessModePolicyService
 from src.services.auth_challenge import AuthChallengeService
 from src.services.backup import BackupService
 from src.services.broadcast import BroadcastService
+from src.services.channel_membership import ChannelMembershipService
 from src.services.command import CommandService
 from src.services.email_recovery import EmailRecoveryService
 from src.services.email_sender import EmailSenderService
+from src.services.event_partition import EventPartitionService
 from src.services.importer import ImporterService
 from src.services.market_quote import MarketQuoteService
 from src.services.notification import NotificationService
@@ -25,6 +27,8 @@ from src.services.referral import ReferralService
 from src.services.referral_exchange import ReferralExchangeService
 from src.services.referral_portal import ReferralPortalService
 from src.services.remnawave import RemnawaveService
+from src.services.remnawave_webhook_queue import RemnawaveWebhookQueueService
+from src.services.request_loader import RequestDataLoader
 from src.services.settings import SettingsService
 from src.services.subscription import SubscriptionService
 from src.services.subscription_device import SubscriptionDeviceService
@@ -37,6 +41,7 @@ from src.services.telegram_link import TelegramLinkService
 from src.services.transaction import TransactionService
 from src.services.user import UserService
 from src.services.user_activity_portal import UserActivityPortalService
+from src.services.user_event_stream import UserEventStreamService
 from src.services.user_notification_event import UserNotificationEventService
 from src.services.user_profile import UserProfileService
 from src.services.web_access_guard import WebAccessGuardService
@@ -49,10 +54,12 @@ from src.services.webhook import WebhookService
 class ServicesProvider(Provider):
     scope = Scope.APP
 
+    request_data_loader = provide(source=RequestDataLoader, scope=Scope.REQUEST)
     command_service = provide(source=CommandService)
     access_mode_policy_service = provide(source=AccessModePolicyService)
     access_service = provide(source=AccessService, scope=Scope.REQUEST)
     backup_service = provide(source=BackupService)
+    channel_membership_service = provide(source=ChannelMembershipService)
     notification_service = provide(source=NotificationService, scope=Scope.REQUEST)
     gateway_service = provide(source=PaymentGatewayService, scope=Scope.REQUEST)
     payment_webhook_event_service = provide(source=PaymentWebhookEventService, scope=Scope.REQUEST)
@@ -64,6 +71,7 @@ class ServicesProvider(Provider):
     promocode_portal_service = provide(source=PromocodePortalService, scope=Scope.REQUEST)
     purchase_access_service = provide(source=PurchaseAccessService, scope=Scope.REQUEST)
     remnawave_service = provide(source=RemnawaveService, scope=Scope.REQUEST)
+    remnawave_webhook_queue_service = provide(source=RemnawaveWebhookQueueService)
     subscription_service = provide(source=SubscriptionService, scope=Scope.REQUEST)
     subscription_device_service = provide(source=SubscriptionDeviceService, scope=Scope.REQUEST)
     subscription_portal_service = provide(source=SubscriptionPortalService, scope=Scope.REQUEST)
@@ -82,6 +90,7 @@ class ServicesProvider(Provider):
     auth_challenge_service = provide(source=AuthChallengeService, scope=Scope.REQUEST)
     telegram_link_service = provide(source=TelegramLinkService, scope=Scope.REQUEST)
     email_sender_service = provide(source=EmailSenderService)
+    event_partition_service = provide(source=EventPartitionService, scope=Scope.REQUEST)
     email_recovery_service = provide(source=EmailRecoveryService, scope=Scope.REQUEST)
     webhook_service = provide(source=WebhookService)
     settings_service = provide(source=SettingsService, scope=Scope.REQUEST)
@@ -95,5 +104,6 @@ class ServicesProvider(Provider):
     user_notification_event_service = provide(
         source=UserNotificationEventService, scope=Scope.REQUEST
     )
+    user_event_stream_service = provide(source=UserEventStreamService)
     web_analytics_event_service = provide(source=WebAnalyticsEventService, scope=Scope.REQUEST)
     web_cabinet_admin_service = provide(source=WebCabinetAdminService, scope=Scope.REQUEST)
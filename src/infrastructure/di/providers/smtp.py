@@ -0,0 +1,23 @@
+from collections.abc import AsyncGenerator
+
+from dishka import Provider, Scope, provide
+from loguru import logger
+
+from src.core.config import AppConfig
+from src.infrastructure.smtp import SmtpConnectionPool
+
+
+class SmtpProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    async def get_smtp_connection_pool(
+        self,
+        config: AppConfig,
+    ) -> AsyncGenerator[SmtpConnectionPool, None]:
+        pool = SmtpConnectionPool(config.email)
+
+        yield pool
+
+        logger.debug("Closing pooled SMTP connections")
+        pool.close()
@@ -0,0 +1,5 @@
+from .registry import HttpClientRegistry
+
+__all__ = [
+    "HttpClientRegistry",
+]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from importlib.util import find_spec
+from typing import Optional
+from urllib.parse import urlsplit
+
+from httpx import AsyncClient, AsyncHTTPTransport, Cookies, Limits, Timeout
+from loguru import logger
+
+from src.core.config.http import HttpConfig
+
+TransportKey = tuple[str, str, int, bool]
+
+
+class HttpClientRegistry:
+    """App-scoped keep-alive connection pools, one transport per upstream host.
+
+    Clients returned by :meth:`client` are thin wrappers over the shared transport
+    and must not be closed individually; the registry closes every pool on shutdown.
+    """
+
+    config: HttpConfig
+
+    def __init__(self, config: HttpConfig) -> None:
+        self.config = config
+        self._transports: dict[TransportKey, AsyncHTTPTransport] = {}
+        self._http2 = config.http2 and self._is_http2_available()
+
+    def client(
+        self,
+        base_url: str,
+        *,
+        auth: Optional[tuple[str, str]] = None,
+        headers: Optional[dict[str, str]] = None,
+        cookies: Cookies | dict[str, str] | None = None,
+        timeout: Timeout | float = 30.0,
+        verify: bool = True,
+    ) -> AsyncClient:
+        return AsyncClient(
+            base_url=base_url,
+            auth=auth,
+            headers=headers,
+            cookies=cookies,
+            timeout=timeout if isinstance(timeout, Timeout) else Timeout(timeout),
+            transport=self.transport(base_url, verify=verify),
+        )
+
+    def transport(self, base_url: str, *, verify: bool = True) -> AsyncHTTPTransport:
+        key = self._build_transport_key(base_url, verify=verify)
+        transport = self._transports.get(key)
+        if transport is None:
+            transport = AsyncHTTPTransport(
+                verify=verify,
+                http2=self._http2,
+                limits=Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
+            )
+            self._transports[key] = transport
+            logger.debug(f"Created pooled HTTP transport for '{key[0]}://{key[1]}:{key[2]}'")
+        return transport
+
+    async def close(self) -> None:
+        transports = list(self._transports.values())
+        self._transports.clear()
+        for transport in transports:
+            try:
+                await transport.aclose()
+            except Exception as exception:
+                logger.warning(f"Failed to close pooled HTTP transport: {exception}")
+
+    @staticmethod
+    def _build_transport_key(base_url: str, *, verify: bool) -> TransportKey:
+        parts = urlsplit(base_url)
+        scheme = (parts.scheme or "https").lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        return scheme, (parts.hostname or "").lower(), port, verify
+
+    @staticmethod
+    def _is_http2_available() -> bool:
+        if find_spec("h2") is not None:
+            return True
+
+        logger.warning("HTTP_HTTP2 is enabled but the 'h2' package is missing, using HTTP/1.1")
+        return False
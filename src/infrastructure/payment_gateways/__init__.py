@@ -6,6 +6,7 @@ from .heleket import HeleketGateway
 from .mulenpay import MulenpayGateway
 from .pal24 import Pal24Gateway
 from .platega import PlategaGateway
+from .registry import PaymentGatewayRegistry
 from .robokassa import RobokassaGateway
 from .stripe import StripeGateway
 from .tbank import TbankGateway
@@ -19,6 +20,7 @@ __all__ = [
     "CloudPaymentsGateway",
     "CryptomusGateway",
     "PaymentGatewayFactory",
+    "PaymentGatewayRegistry",
     "CryptopayGateway",
     "HeleketGateway",
     "MulenpayGateway",
@@ -13,6 +13,7 @@ from src.core.config import AppConfig
 from src.core.constants import T_ME
 from src.core.enums import CryptoAsset, TransactionStatus
 from src.infrastructure.database.models.dto import PaymentGatewayDto, PaymentResult
+from src.infrastructure.http import HttpClientRegistry
 
 
 class PaymentGatewayFactory(Protocol):
@@ -23,6 +24,7 @@ class BasePaymentGateway(ABC):
     gateway: PaymentGatewayDto
     bot: Bot
     config: AppConfig | None
+    http_clients: HttpClientRegistry | None
 
     _bot_username: Optional[str]
 
@@ -33,10 +35,12 @@ class BasePaymentGateway(ABC):
         gateway: PaymentGatewayDto,
         bot: Bot,
         config: AppConfig | None = None,
+        http_clients: HttpClientRegistry | None = None,
     ) -> None:
         self.gateway = gateway
         self.bot = bot
         self.config = config
+        self.http_clients = http_clients
         self._bot_username: Optional[str] = None
 
         logger.debug(f"{self.__class__.__name__} Initialized")
@@ -70,6 +74,13 @@ class BasePaymentGateway(ABC):
         headers: Optional[dict[str, str]] = None,
         timeout: float = 30.0,
     ) -> AsyncClient:
+        if self.http_clients is not None:
+            return self.http_clients.client(
+                base_url,
+                auth=auth,
+                headers=headers,
+                timeout=timeout,
+            )
         return AsyncClient(base_url=base_url, auth=auth, headers=headers, timeout=Timeout(timeout))
 
     def _is_test_payment(self, payment_id: str) -> bool:
@@ -17,6 +17,7 @@ from src.infrastructure.database.models.dto import (
     PaymentGatewayDto,
     PaymentResult,
 )
+from src.infrastructure.http import HttpClientRegistry
 
 from .base import BasePaymentGateway
 
@@ -34,8 +35,9 @@ class MulenpayGateway(BasePaymentGateway):
         gateway: PaymentGatewayDto,
         bot: Bot,
         config: AppConfig | None = None,
+        http_clients: HttpClientRegistry | None = None,
     ) -> None:
-        super().__init__(gateway, bot, config=config)
+        super().__init__(gateway, bot, config=config, http_clients=http_clients)
 
         if not isinstance(self.gateway.settings, MulenpayGatewaySettingsDto):
             raise TypeError("MulenpayGateway requires MulenpayGatewaySettingsDto")
@@ -20,6 +20,7 @@ from src.infrastructure.database.models.dto import (
     PlategaGatewaySettingsDto,
     normalize_platega_payment_method,
 )
+from src.infrastructure.http import HttpClientRegistry
 
 from .base import BasePaymentGateway
 
@@ -51,8 +52,9 @@ class PlategaGateway(BasePaymentGateway):
         gateway: PaymentGatewayDto,
         bot: Bot,
         config: AppConfig | None = None,
+        http_clients: HttpClientRegistry | None = None,
     ) -> None:
-        super().__init__(gateway, bot, config=config)
+        super().__init__(gateway, bot, config=config, http_clients=http_clients)
 
         if not isinstance(self.gateway.settings, PlategaGatewaySettingsDto):
             raise TypeError("PlategaGateway requires PlategaGatewaySettingsDto")
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Final, Optional
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.constants import PAYMENT_GATEWAY_REGISTRY_MAX_AGE_SECONDS
+from src.core.enums import PaymentGatewayType
+from src.core.observability import emit_counter
+from src.core.storage.keys import PaymentGatewayRegistryChannelKey
+from src.infrastructure.database.models.dto import PaymentGatewayDto
+from src.infrastructure.redis import RedisChannelFanout
+
+from .base import BasePaymentGateway, PaymentGatewayFactory
+
+INVALIDATE_ALL: Final[str] = "*"
+
+GatewayLoader = Callable[[], Awaitable[Optional[PaymentGatewayDto]]]
+
+
+@dataclass(slots=True, frozen=True)
+class _RegistryEntry:
+    instance: BasePaymentGateway
+    gateway_id: Optional[int]
+    version: int
+    loaded_at: float
+
+
+class PaymentGatewayRegistry:
+    """Per-process registry of ready payment gateway instances.
+
+    A gateway row is loaded, decrypted and turned into an instance once, then reused by
+    every checkout and webhook. ``invalidate`` drops entries in this process and
+    publishes the change so every other process drops them too. Each invalidation bumps
+    the registry version, and a load that raced one is returned but not kept. Pub/sub
+    delivery is not guaranteed, so entries are also rebuilt after ``max_age`` seconds.
+    """
+
+    def __init__(
+        self,
+        factory: PaymentGatewayFactory,
+        redis_client: Redis,
+        fanout: RedisChannelFanout,
+        *,
+        max_age: float = PAYMENT_GATEWAY_REGISTRY_MAX_AGE_SECONDS,
+    ) -> None:
+        self.factory = factory
+        self.redis_client = redis_client
+        self.fanout = fanout
+        self.max_age = max_age
+        self.channel = PaymentGatewayRegistryChannelKey().pack()
+        self._entries: dict[PaymentGatewayType, _RegistryEntry] = {}
+        self._locks: dict[PaymentGatewayType, asyncio.Lock] = {}
+        self._version = 0
+        self._listener: Optional[asyncio.Task[None]] = None
+
+    async def get(
+        self,
+        gateway_type: PaymentGatewayType,
+        load: GatewayLoader,
+    ) -> Optional[BasePaymentGateway]:
+        self._ensure_listening()
+
+        entry = self._fresh_entry(gateway_type)
+        if entry is not None:
+            emit_counter("payment_gateway_registry_requests_total", result="hit")
+            return entry.instance
+
+        async with self._locks.setdefault(gateway_type, asyncio.Lock()):
+            entry = self._fresh_entry(gateway_type)
+            if entry is not None:
+                emit_counter("payment_gateway_registry_requests_total", result="wait")
+                return entry.instance
+
+            emit_counter("payment_gateway_registry_requests_total", result="miss")
+            version = self._version
+            gateway = await load()
+            if gateway is None:
+                return None
+
+            instance = self.factory(gateway)
+            logger.debug(f"Loaded payment gateway '{gateway_type}' (ID: '{gateway.id}')")
+            if version == self._version:
+                self._entries[gateway_type] = _RegistryEntry(
+                    instance=instance,
+                    gateway_id=gateway.id,
+                    version=version,
+                    loaded_at=time.monotonic(),
+                )
+            return instance
+
+    async def invalidate(self, gateway_type: Optional[PaymentGatewayType] = None) -> None:
+        message = gateway_type.value if gateway_type is not None else INVALIDATE_ALL
+        self._drop(message)
+        try:
+            await self.redis_client.publish(self.channel, message)
+        except Exception as exception:
+            logger.warning(f"Failed to publish payment gateway invalidation: {exception}")
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        self._entries.clear()
+
+    def _fresh_entry(self, gateway_type: PaymentGatewayType) -> Optional[_RegistryEntry]:
+        entry = self._entries.get(gateway_type)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.loaded_at >= self.max_age:
+            del self._entries[gateway_type]
+            return None
+        return entry
+
+    def _drop(self, message: str) -> None:
+        if message == INVALIDATE_ALL:
+            self._entries.clear()
+        else:
+            self._entries.pop(PaymentGatewayType(message), None)
+        self._version += 1
+        logger.debug(f"Payment gateway registry invalidated: '{message}'")
+
+    def _ensure_listening(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(
+                self._listen(),
+                name="payment-gateway-registry",
+            )
+
+    async def _listen(self) -> None:
+        try:
+            queue = await self.fanout.subscribe(self.channel)
+        except Exception as exception:
+            # Retried on the next lookup; until then entries still expire by age.
+            logger.warning(f"Payment gateway registry subscription failed: {exception}")
+            return
+
+        try:
+            while True:
+                message = await queue.get()
+                try:
+                    self._drop(message)
+                except ValueError:
+                    logger.warning(f"Ignoring unknown payment gateway invalidation '{message}'")
+        finally:
+            await self.fanout.unsubscribe(self.channel, queue)
@@ -22,6 +22,7 @@ from src.infrastructure.database.models.dto import (
     PaymentResult,
     TbankGatewaySettingsDto,
 )
+from src.infrastructure.http import HttpClientRegistry
 
 from .base import BasePaymentGateway
 
@@ -39,8 +40,9 @@ class TbankGateway(BasePaymentGateway):
         gateway: PaymentGatewayDto,
         bot: Bot,
         config: AppConfig | None = None,
+        http_clients: HttpClientRegistry | None = None,
     ) -> None:
-        super().__init__(gateway, bot, config=config)
+        super().__init__(gateway, bot, config=config, http_clients=http_clients)
 
         if not isinstance(self.gateway.settings, TbankGatewaySettingsDto):
             raise TypeError("TbankGateway requires TbankGatewaySettingsDto")
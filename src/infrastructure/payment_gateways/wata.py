@@ -23,6 +23,7 @@ from src.infrastructure.database.models.dto import (
     PaymentResult,
     WataGatewaySettingsDto,
 )
+from src.infrastructure.http import HttpClientRegistry
 
 from .base import BasePaymentGateway
 
@@ -44,8 +45,9 @@ class WataGateway(BasePaymentGateway):
         gateway: PaymentGatewayDto,
         bot: Bot,
         config: AppConfig | None = None,
+        http_clients: HttpClientRegistry | None = None,
     ) -> None:
-        super().__init__(gateway, bot, config=config)
+        super().__init__(gateway, bot, config=config, http_clients=http_clients)
 
         if not isinstance(self.gateway.settings, WataGatewaySettingsDto):
             raise TypeError("WataGateway requires WataGatewaySettingsDto")
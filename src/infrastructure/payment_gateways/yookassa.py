@@ -16,6 +16,7 @@ from src.infrastructure.database.models.dto import (
     PaymentResult,
     YookassaGatewaySettingsDto,
 )
+from src.infrastructure.http import HttpClientRegistry
 
 from .base import BasePaymentGateway
 
@@ -47,8 +48,9 @@ class YookassaGateway(BasePaymentGateway):
         gateway: PaymentGatewayDto,
         bot: Bot,
         config: AppConfig | None = None,
+        http_clients: HttpClientRegistry | None = None,
     ) -> None:
-        super().__init__(gateway, bot, config=config)
+        super().__init__(gateway, bot, config=config, http_clients=http_clients)
 
         if not isinstance(self.gateway.settings, YookassaGatewaySettingsDto):
             raise TypeError("YookassaGateway requires YookassaGatewaySettingsDto")
@@ -24,6 +24,7 @@ from src.infrastructure.database.models.dto import (
     PaymentResult,
     YoomoneyGatewaySettingsDto,
 )
+from src.infrastructure.http import HttpClientRegistry
 
 from .base import BasePaymentGateway
 
@@ -101,8 +102,9 @@ class YoomoneyGateway(BasePaymentGateway):
         gateway: PaymentGatewayDto,
         bot: Bot,
         config: AppConfig | None = None,
+        http_clients: HttpClientRegistry | None = None,
     ) -> None:
-        super().__init__(gateway, bot, config=config)
+        super().__init__(gateway, bot, config=config, http_clients=http_clients)
 
         if not isinstance(self.gateway.settings, YoomoneyGatewaySettingsDto):
             raise TypeError("YoomoneyGateway requires YoomoneyGatewaySettingsDto")
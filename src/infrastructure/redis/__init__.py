@@ -1,7 +1,16 @@
-from .cache import redis_cache
+from .cache import get_cache_spec, invalidate_cache_tags, redis_cache
+from .fanout import RedisChannelFanout
+from .leader import RedisLeaderElection
+from .rate_limiter import RateLimitDecision, RedisRateLimiter
 from .repository import RedisRepository
 
 __all__ = [
+    "get_cache_spec",
+    "invalidate_cache_tags",
     "redis_cache",
+    "RateLimitDecision",
+    "RedisChannelFanout",
+    "RedisLeaderElection",
+    "RedisRateLimiter",
     "RedisRepository",
 ]
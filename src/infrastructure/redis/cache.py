@@ -1,17 +1,58 @@
+import asyncio
+import copy
+import inspect
+import random
+import secrets
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import Enum
 from functools import wraps
-from typing import Any, Awaitable, Callable, Optional, ParamSpec, TypeVar, get_type_hints
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Final,
+    Generic,
+    Optional,
+    ParamSpec,
+    Sequence,
+    TypeVar,
+    cast,
+    get_type_hints,
+)
 
 from loguru import logger
 from pydantic import SecretStr, TypeAdapter
 from redis.asyncio import Redis
 from redis.typing import ExpiryT
 
-from src.core.constants import TIME_1M
+from src.core.constants import (
+    CACHE_LOCK_POLL_SECONDS,
+    CACHE_LOCK_TIMEOUT_SECONDS,
+    CACHE_TTL_JITTER_RATIO,
+    TIME_1M,
+)
+from src.core.observability import emit_counter
+from src.core.storage.key_builder import build_key
 from src.core.utils import json_utils
 
 T = TypeVar("T", bound=Any)
 P = ParamSpec("P")
 
+CACHE_ENVELOPE_MARKER: Final[str] = "__cache__"
+
+# Deletes the lock only while it still holds our token, so a slow loader whose lock
+# expired cannot release the lock of the caller that took over.
+RELEASE_LOCK_SCRIPT: Final[str] = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_inflight_loads: dict[str, asyncio.Future[Any]] = {}
+
 
 def prepare_for_cache(obj: Any) -> Any:
     if isinstance(obj, SecretStr):
@@ -23,49 +64,302 @@ def prepare_for_cache(obj: Any) -> Any:
     return obj
 
 
+def cache_generation_key(tag: str) -> str:
+    return build_key("cache_generation", tag)
+
+
+async def invalidate_cache_tags(redis: Redis, *tags: str) -> None:
+    """Invalidate every entry cached under the given tags in O(1) per tag.
+
+    Each decorated function is implicitly tagged with its own prefix.
+    """
+    async with redis.pipeline(transaction=False) as pipe:
+        for tag in tags:
+            pipe.incr(cache_generation_key(tag))
+        await pipe.execute()
+    logger.debug(f"Cache tags invalidated: {', '.join(tags)}")
+
+
+@dataclass(slots=True, frozen=True)
+class CacheEntry(Generic[T]):
+    value: T
+    is_fresh: bool
+
+
+@dataclass(slots=True, frozen=True)
+class RedisCacheSpec(Generic[T]):
+    """Key layout and envelope format of one ``redis_cache``-decorated function."""
+
+    prefix: str
+    tags: tuple[str, ...]
+    signature: inspect.Signature
+    type_adapter: TypeAdapter[T]
+
+    def build_key(self, *args: Any, **kwargs: Any) -> str:
+        """Build the entry key from the call arguments, excluding ``self``.
+
+        Arguments are bound to the signature, so positional and keyword calls share a key.
+        """
+        bound = self.signature.bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        parts = [_key_part(value) for value in list(bound.arguments.values())[1:]]
+        return build_key("cache", self.prefix, *parts)
+
+    def lookup_keys(self, key: str) -> list[str]:
+        return [key, *map(cache_generation_key, self.tags)]
+
+    def decode(self, values: Sequence[Optional[bytes]]) -> Optional[CacheEntry[T]]:
+        """Decode an ``MGET`` of ``lookup_keys``; ``None`` when missing or invalidated."""
+        raw_entry, *raw_generations = values
+        if raw_entry is None:
+            return None
+
+        try:
+            envelope = json_utils.decode(raw_entry)
+        except ValueError:
+            return None  # Written by an older release; overwritten by the next load.
+        if envelope.get(CACHE_ENVELOPE_MARKER) != 1:
+            return None
+        if envelope["generations"] != [_generation(value) for value in raw_generations]:
+            return None
+
+        return CacheEntry(
+            value=self.type_adapter.validate_python(envelope["value"]),
+            is_fresh=time.time() < envelope["fresh_until"],
+        )
+
+    def encode(self, value: T, generations: Sequence[int], fresh_seconds: float) -> str:
+        return json_utils.encode(
+            {
+                CACHE_ENVELOPE_MARKER: 1,
+                "generations": list(generations),
+                "fresh_until": time.time() + fresh_seconds,
+                "value": prepare_for_cache(self.type_adapter.dump_python(value)),
+            }
+        )
+
+
+def get_cache_spec(func: Callable[..., Any]) -> RedisCacheSpec[Any]:
+    return cast(RedisCacheSpec[Any], getattr(func, "cache_spec"))
+
+
+class _CachedCall(Generic[T]):
+    def __init__(
+        self,
+        func: Callable[..., Awaitable[T]],
+        spec: RedisCacheSpec[T],
+        *,
+        ttl_seconds: int,
+        negative_ttl_seconds: int,
+        stale_seconds: int,
+        jitter: float,
+    ) -> None:
+        self.func = func
+        self.spec = spec
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.jitter = jitter
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> T:
+        redis: Redis = args[0].redis_client
+        key = self.spec.build_key(*args[1:], **kwargs)
+
+        try:
+            entry = await self._read(redis, key)
+        except Exception as exception:
+            logger.warning(f"Cache read failed for key '{key}': {exception}")
+            return await self.func(*args, **kwargs)
+
+        if entry is not None and entry.is_fresh:
+            self._count("hit")
+            return entry.value
+        stale = entry if self.stale_seconds else None
+
+        inflight = _inflight_loads.get(key)
+        if inflight is not None:
+            self._count("wait")
+            try:
+                # Results may be mutable DTOs; every caller gets its own copy, as on a hit.
+                return cast(T, copy.deepcopy(await asyncio.shield(inflight)))
+            except (Exception, asyncio.CancelledError):
+                if not inflight.done():
+                    raise  # We were cancelled ourselves.
+                # The sharing caller failed; load on our own below.
+
+        self._count("miss")
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_exception)
+        _inflight_loads[key] = future
+        try:
+            result = await self._load_once(redis, key, stale, args, kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exception:
+            future.set_exception(exception)
+            raise
+        else:
+            future.set_result(copy.deepcopy(result))
+            return result
+        finally:
+            if _inflight_loads.get(key) is future:
+                del _inflight_loads[key]
+
+    async def _read(self, redis: Redis, key: str) -> Optional[CacheEntry[T]]:
+        values = await cast(
+            Awaitable[list[Optional[bytes]]],
+            redis.mget(self.spec.lookup_keys(key)),
+        )
+        return self.spec.decode(values)
+
+    async def _load_once(
+        self,
+        redis: Redis,
+        key: str,
+        stale: Optional[CacheEntry[T]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> T:
+        lock_key = build_key("cache_lock", key)
+        token = secrets.token_hex(8)
+        deadline = time.monotonic() + CACHE_LOCK_TIMEOUT_SECONDS
+
+        while not await _try_lock(redis, lock_key, token):
+            if stale is not None:
+                self._count("stale")
+                return stale.value
+            if time.monotonic() >= deadline:
+                logger.warning(f"Cache lock wait timed out for key '{key}'")
+                return await self._load(redis, key, args, kwargs)
+
+            await asyncio.sleep(CACHE_LOCK_POLL_SECONDS)
+            entry = await self._read(redis, key)
+            if entry is not None and entry.is_fresh:
+                self._count("wait")
+                return entry.value
+
+        try:
+            return await self._load(redis, key, args, kwargs)
+        finally:
+            try:
+                await redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)  # type: ignore[misc]
+            except Exception as exception:
+                logger.warning(f"Cache lock release failed for key '{key}': {exception}")
+
+    async def _load(
+        self,
+        redis: Redis,
+        key: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> T:
+        # Generations are read before loading so an invalidation racing the load wins.
+        generations: Optional[list[int]] = None
+        try:
+            raw_generations = await cast(
+                Awaitable[list[Optional[bytes]]],
+                redis.mget(self.spec.lookup_keys(key)[1:]),
+            )
+            generations = [_generation(value) for value in raw_generations]
+        except Exception as exception:
+            logger.warning(f"Cache generation read failed for key '{key}': {exception}")
+
+        result = await self.func(*args, **kwargs)
+
+        base_seconds = self.negative_ttl_seconds if result is None else self.ttl_seconds
+        if generations is None or base_seconds <= 0:
+            return result
+
+        # Jitter spreads the expiry of entries written together, e.g. after a deploy.
+        fresh_seconds = base_seconds * (1 + random.uniform(0, self.jitter))
+        try:
+            await redis.set(
+                key,
+                self.spec.encode(result, generations, fresh_seconds),
+                ex=max(1, int(fresh_seconds + self.stale_seconds)),
+            )
+            logger.debug(f"Result cached: '{key}' (ttl={int(fresh_seconds)})")
+        except Exception as exception:
+            logger.warning(f"Cache write failed for key '{key}': {exception}")
+        return result
+
+    def _count(self, result: str) -> None:
+        emit_counter("redis_cache_requests_total", prefix=self.spec.prefix, result=result)
+
+
 def redis_cache(
     prefix: Optional[str] = None,
     ttl: ExpiryT = TIME_1M,
+    *,
+    tags: Sequence[str] = (),
+    negative_ttl: Optional[ExpiryT] = None,
+    stale_ttl: Optional[ExpiryT] = None,
+    jitter: float = CACHE_TTL_JITTER_RATIO,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Cache the result of an async service method in Redis.
+
+    Concurrent misses of one key are collapsed: in-process callers share a single load,
+    and across processes a short Redis lock lets one caller load while the others wait
+    for its result. ``None`` results are cached for ``negative_ttl`` (defaults to ``ttl``,
+    ``0`` disables it). With ``stale_ttl`` an expired entry is kept that much longer and
+    served to everyone except the caller refreshing it. ``tags`` name invalidation families
+    bumped by ``invalidate_cache_tags``.
+    """
+
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
-        return_type: Any = get_type_hints(func)["return"]
-        type_adapter: TypeAdapter[T] = TypeAdapter(return_type)
+        key_prefix = prefix or func.__name__
+        spec: RedisCacheSpec[T] = RedisCacheSpec(
+            prefix=key_prefix,
+            tags=(key_prefix, *tags),
+            signature=inspect.signature(func),
+            type_adapter=TypeAdapter(get_type_hints(func)["return"]),
+        )
+        ttl_seconds = _seconds(ttl)
+        cached_call = _CachedCall(
+            func,
+            spec,
+            ttl_seconds=ttl_seconds,
+            negative_ttl_seconds=ttl_seconds if negative_ttl is None else _seconds(negative_ttl),
+            stale_seconds=_seconds(stale_ttl) if stale_ttl is not None else 0,
+            jitter=jitter,
+        )
 
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            self: Any = args[0]
-            redis: Redis = self.redis_client
-
-            # Build cache key
-            key_parts = [
-                "cache",
-                prefix or func.__name__,
-                *map(str, args[1:]),
-                *map(str, kwargs.values()),
-            ]
-            key: str = ":".join(key_parts)
+            return await cached_call(*args, **kwargs)
 
-            try:
-                cached_value: Optional[bytes] = await redis.get(key)
-                if cached_value is not None:
-                    logger.debug(f"Cache hit: '{key}'")
-                    parsed = json_utils.decode(cached_value.decode())
-                    return type_adapter.validate_python(parsed)
-            except Exception as exception:
-                logger.warning(f"Cache read failed for key '{key}': {exception}")
+        setattr(wrapper, "cache_spec", spec)
+        return wrapper
 
-            logger.debug(f"Cache miss: '{key}'. Executing function")
-            result: T = await func(*args, **kwargs)
+    return decorator
 
-            try:
-                safe_result = prepare_for_cache(type_adapter.dump_python(result))
-                await redis.setex(key, ttl, json_utils.encode(safe_result))
-                logger.debug(f"Result cached: '{key}' (ttl={ttl})")
-            except Exception as exception:
-                logger.warning(f"Cache write failed for key '{key}': {exception}")
 
-            return result
+async def _try_lock(redis: Redis, lock_key: str, token: str) -> bool:
+    try:
+        return bool(await redis.set(lock_key, token, nx=True, ex=CACHE_LOCK_TIMEOUT_SECONDS))
+    except Exception as exception:
+        # Without Redis there is nothing to coordinate on; load directly.
+        logger.warning(f"Cache lock failed for key '{lock_key}': {exception}")
+        return True
 
-        return wrapper
 
-    return decorator
+def _key_part(value: Any) -> str:
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+def _generation(value: Optional[bytes]) -> int:
+    return int(value) if value is not None else 0
+
+
+def _seconds(value: ExpiryT) -> int:
+    if isinstance(value, timedelta):
+        return int(value.total_seconds())
+    return int(value)
+
+
+def _consume_exception(future: asyncio.Future[Any]) -> None:
+    if not future.cancelled():
+        future.exception()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from src.core.observability import emit_counter
+
+
+class RedisChannelFanout:
+    """Shares a single pub/sub connection between every local listener of Redis channels."""
+
+    def __init__(self, client: Redis, *, queue_size: int, poll_timeout: float = 1.0) -> None:
+        self.client = client
+        self.queue_size = queue_size
+        self.poll_timeout = poll_timeout
+        self._pubsub: Optional[PubSub] = None
+        self._listeners: dict[str, set[asyncio.Queue[str]]] = {}
+        self._reader: Optional[asyncio.Task[None]] = None
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, channel: str) -> asyncio.Queue[str]:
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self.queue_size)
+        async with self._lock:
+            listeners = self._listeners.setdefault(channel, set())
+            if not listeners:
+                await self._get_pubsub().subscribe(channel)
+            listeners.add(queue)
+
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read(), name="redis-channel-fanout")
+        return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue[str]) -> None:
+        async with self._lock:
+            listeners = self._listeners.get(channel)
+            if listeners is None:
+                return
+
+            listeners.discard(queue)
+            if listeners:
+                return
+
+            del self._listeners[channel]
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(channel)
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+
+        if self._pubsub is not None:
+            await self._pubsub.aclose()  # type: ignore[no-untyped-call]
+            self._pubsub = None
+        self._listeners.clear()
+
+    def _get_pubsub(self) -> PubSub:
+        if self._pubsub is None:
+            self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        return self._pubsub
+
+    async def _read(self) -> None:
+        pubsub = self._get_pubsub()
+        while True:
+            try:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=self.poll_timeout,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exception:
+                # redis-py reconnects and re-subscribes on the next read.
+                logger.warning(f"Redis pub/sub read failed: {exception}")
+                await asyncio.sleep(self.poll_timeout)
+                continue
+
+            if message is None or message.get("type") != "message":
+                continue
+            self._dispatch(_decode(message["channel"]), _decode(message["data"]))
+
+    def _dispatch(self, channel: str, data: str) -> None:
+        for queue in tuple(self._listeners.get(channel, ())):
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                emit_counter("redis_channel_fanout_dropped_total")
+
+
+def _decode(value: Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode()
+    return str(value)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import uuid
+from typing import Awaitable, Callable, Final, Optional, cast
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.observability import emit_counter
+
+# Extends or deletes a lease only while it still holds the caller's token.
+RENEW_LEASE_SCRIPT: Final[str] = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+RELEASE_LEASE_SCRIPT: Final[str] = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+LeadershipCallback = Callable[[], Awaitable[None]]
+
+
+class RedisLeaderElection:
+    """One leader among the processes sharing a Redis lease key.
+
+    The leader renews the lease every ``renew_interval``; the others retry taking it on
+    the same interval, so leadership moves to a surviving process at most ``ttl`` after
+    the leader dies. Callbacks start and stop work that must run in exactly one process;
+    ``on_elected`` runs in its own task so slow startup work never delays renewals.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        key: str,
+        *,
+        ttl: float,
+        renew_interval: float,
+        name: Optional[str] = None,
+    ) -> None:
+        self.client = client
+        self.key = key
+        self.ttl = ttl
+        self.renew_interval = renew_interval
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._on_elected: Optional[LeadershipCallback] = None
+        self._on_demoted: Optional[LeadershipCallback] = None
+        self._campaign: Optional[asyncio.Task[None]] = None
+        self._elected: Optional[asyncio.Task[None]] = None
+
+    async def acquire(self) -> bool:
+        """Take the lease if it is free; a single attempt."""
+        if self.is_leader:
+            return True
+        acquired = await self.client.set(self.key, self.name, nx=True, px=self._ttl_ms)
+        self.is_leader = bool(acquired)
+        if self.is_leader:
+            logger.info(f"Process '{self.name}' is the leader for '{self.key}'")
+            emit_counter("leader_elections_total", key=self.key)
+        return self.is_leader
+
+    async def start(
+        self,
+        *,
+        on_elected: Optional[LeadershipCallback] = None,
+        on_demoted: Optional[LeadershipCallback] = None,
+    ) -> None:
+        """Keep campaigning in the background; callbacks fire on later leadership changes."""
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        if self._campaign is None:
+            self._campaign = asyncio.create_task(self._run(), name="redis-leader-election")
+
+    async def stop(self) -> None:
+        """Stop campaigning and hand the lease over right away if this process holds it."""
+        if self._campaign is not None:
+            self._campaign.cancel()
+            try:
+                await self._campaign
+            except asyncio.CancelledError:
+                pass
+            self._campaign = None
+        if self._elected is not None:
+            self._elected.cancel()
+            try:
+                await self._elected
+            except asyncio.CancelledError:
+                pass
+            self._elected = None
+
+        if not self.is_leader:
+            return
+        await self._demote()
+        try:
+            await cast(
+                Awaitable[int],
+                self.client.eval(RELEASE_LEASE_SCRIPT, 1, self.key, self.name),
+            )
+        except Exception as exception:
+            logger.warning(f"Failed to release leader lease '{self.key}': {exception}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.renew_interval)
+            try:
+                if self.is_leader:
+                    if not await self._renew():
+                        logger.warning(f"Process '{self.name}' lost leadership of '{self.key}'")
+                        await self._demote()
+                elif await self.acquire() and self._on_elected is not None:
+                    self._elected = asyncio.create_task(
+                        self._notify(self._on_elected),
+                        name="redis-leader-elected",
+                    )
+            except Exception as exception:
+                # Keep the lease until Redis says otherwise; a blip must not stop the jobs.
+                logger.warning(f"Leader election for '{self.key}' failed: {exception}")
+
+    async def _renew(self) -> bool:
+        renewed = await cast(
+            Awaitable[int],
+            self.client.eval(RENEW_LEASE_SCRIPT, 1, self.key, self.name, self._ttl_ms),
+        )
+        return bool(int(renewed))
+
+    async def _demote(self) -> None:
+        self.is_leader = False
+        await self._notify(self._on_demoted)
+
+    async def _notify(self, callback: Optional[LeadershipCallback]) -> None:
+        if callback is None:
+            return
+        try:
+            await callback()
+        except Exception as exception:
+            logger.exception(f"Leadership callback for '{self.key}' failed: {exception}")
+
+    @property
+    def _ttl_ms(self) -> int:
+        return int(self.ttl * 1000)
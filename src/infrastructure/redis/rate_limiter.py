@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import secrets
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Final, cast
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.observability import emit_counter
+
+# Sliding-window log: one ZSET member per admitted hit, scored by Redis server time in
+# microseconds, so replicas with skewed clocks still share one window. Returns
+# {allowed, hits in window, microseconds until a slot frees up}.
+SLIDING_WINDOW_SCRIPT: Final[str] = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000000 + tonumber(now_parts[2])
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local hits = redis.call('ZCARD', KEYS[1])
+if hits >= limit then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    return {0, hits, window - (now - tonumber(oldest[2]))}
+end
+
+redis.call('ZADD', KEYS[1], now, now .. ':' .. ARGV[3])
+redis.call('PEXPIRE', KEYS[1], math.ceil(window / 1000))
+return {1, hits + 1, 0}
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    retry_after: float = 0.0
+
+
+class RedisRateLimiter:
+    """Sliding-window rate limiter shared by every process through Redis.
+
+    Each check is a single atomic script call. Keys known to be over their limit are
+    remembered locally until their window frees up, so repeated hits from a throttled
+    client are rejected without a Redis round trip.
+    """
+
+    def __init__(self, client: Redis, *, local_max_keys: int = 10_000) -> None:
+        self.client = client
+        self.local_max_keys = local_max_keys
+        self._blocked_until: dict[str, float] = {}
+
+    async def hit(self, key: str, *, limit: int, window: float) -> RateLimitDecision:
+        now = time.monotonic()
+        blocked_until = self._blocked_until.get(key)
+        if blocked_until is not None:
+            if now < blocked_until:
+                emit_counter("rate_limit_local_rejections_total")
+                return RateLimitDecision(allowed=False, retry_after=blocked_until - now)
+            del self._blocked_until[key]
+
+        allowed, _hits, retry_after_us = await cast(
+            Awaitable[list[Any]],
+            self.client.eval(
+                SLIDING_WINDOW_SCRIPT,
+                1,
+                key,
+                max(limit, 1),
+                int(window * 1_000_000),
+                secrets.token_hex(4),
+            ),
+        )
+        if int(allowed):
+            return RateLimitDecision(allowed=True)
+
+        retry_after = max(int(retry_after_us), 0) / 1_000_000
+        self._remember_blocked(key, now + retry_after)
+        emit_counter("rate_limit_rejections_total")
+        return RateLimitDecision(allowed=False, retry_after=retry_after)
+
+    def _remember_blocked(self, key: str, until: float) -> None:
+        if len(self._blocked_until) >= self.local_max_keys:
+            now = time.monotonic()
+            self._blocked_until = {
+                blocked_key: blocked_until
+                for blocked_key, blocked_until in self._blocked_until.items()
+                if blocked_until > now
+            }
+            if len(self._blocked_until) >= self.local_max_keys:
+                logger.debug("Rate limiter local cache is full; skipping local admission")
+                return
+        self._blocked_until[key] = until
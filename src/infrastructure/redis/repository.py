@@ -12,6 +12,20 @@ T = TypeVar("T", bound=Any)
 
 TX_QUEUE_KEY: Final[str] = "tx_queue"
 
+# INCRBY only when the key exists, never going below zero; a missing key stays missing
+# so the next reader rebuilds it from the source of truth.
+INCREMENT_EXISTING_SCRIPT: Final[str] = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+    return 0
+end
+return value
+"""
+
 
 class RedisRepository:
     config: AppConfig
@@ -33,11 +47,49 @@ class RedisRepository:
         value = json_utils.decode(value)
         return cast(T, TypeAdapter(validator).validate_python(value))
 
+    async def get_many(
+        self,
+        keys: list[StorageKey],
+        validator: type[T],
+    ) -> list[Optional[T]]:
+        if not keys:
+            return []
+
+        values: list[Optional[Any]] = await self.client.mget([key.pack() for key in keys])
+        adapter = TypeAdapter(validator)
+        return [
+            None if value is None else cast(T, adapter.validate_python(json_utils.decode(value)))
+            for value in values
+        ]
+
+    async def increment_existing(self, key: StorageKey, amount: int = 1) -> Optional[int]:
+        result = await cast(
+            Awaitable[Optional[int]],
+            self.client.eval(INCREMENT_EXISTING_SCRIPT, 1, key.pack(), amount),
+        )
+        return None if result is None else int(result)
+
     async def set(self, key: StorageKey, value: Any, ex: Optional[ExpiryT] = None) -> None:
         if isinstance(value, BaseModel):
             value = value.model_dump(exclude_defaults=True)
         await self.client.set(name=key.pack(), value=json_utils.encode(value), ex=ex)
 
+    async def set_many(
+        self,
+        items: list[tuple[StorageKey, Any]],
+        ex: Optional[ExpiryT] = None,
+    ) -> None:
+        """Write several keys in one pipelined round trip (not atomic)."""
+        if not items:
+            return
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in items:
+                if isinstance(value, BaseModel):
+                    value = value.model_dump(exclude_defaults=True)
+                pipe.set(name=key.pack(), value=json_utils.encode(value), ex=ex)
+            await pipe.execute()
+
     async def exists(self, key: StorageKey) -> bool:
         return cast(bool, await self.client.exists(key.pack()))
 
@@ -109,6 +161,26 @@ class RedisRepository:
         )
         return [item.decode() for item in items_bytes]
 
+    async def sorted_collection_range_by_score(
+        self,
+        key: StorageKey,
+        min_score: float,
+        max_score: float,
+        *,
+        count: Optional[int] = None,
+    ) -> list[str]:
+        items_bytes = await cast(
+            Awaitable[list[bytes]],
+            self.client.zrangebyscore(
+                key.pack(),
+                min_score,
+                max_score,
+                start=0 if count is not None else None,
+                num=count,
+            ),
+        )
+        return [item.decode() for item in items_bytes]
+
     async def sorted_collection_remove(self, key: StorageKey, *values: Any) -> int:
         str_values = [str(v) for v in values]
         return await cast(Awaitable[int], self.client.zrem(key.pack(), *str_values))
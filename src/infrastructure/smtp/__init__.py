@@ -0,0 +1,5 @@
+from .pool import SmtpConnectionPool
+
+__all__ = [
+    "SmtpConnectionPool",
+]
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import smtplib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from email.message import EmailMessage
+from queue import Empty, LifoQueue
+from time import monotonic
+from typing import Optional, Sequence
+
+from loguru import logger
+
+from src.core.config.email import EmailConfig
+
+
+@dataclass(slots=True)
+class _PooledConnection:
+    smtp: smtplib.SMTP
+    last_used_at: float
+
+
+class SmtpConnectionPool:
+    """Persistent SMTP connections served by a dedicated bounded thread pool.
+
+    Each batch is sent over a single authenticated connection, which is returned
+    to the pool afterwards. Idle or dead connections are reopened transparently.
+    """
+
+    config: EmailConfig
+
+    def __init__(self, config: EmailConfig) -> None:
+        self.config = config
+        self._idle: LifoQueue[_PooledConnection] = LifoQueue()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def send_batch(self, messages: Sequence[EmailMessage]) -> list[Optional[Exception]]:
+        """Send messages and return the delivery error per message (``None`` on success)."""
+        if not messages:
+            return []
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            self._send_batch_sync,
+            list(messages),
+        )
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except Empty:
+                return
+            self._quit(connection)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.pool_size,
+                thread_name_prefix="smtp-sender",
+            )
+        return self._executor
+
+    def _send_batch_sync(self, messages: list[EmailMessage]) -> list[Optional[Exception]]:
+        errors: list[Optional[Exception]] = []
+        connection: Optional[_PooledConnection] = None
+
+        for message in messages:
+            try:
+                if connection is None:
+                    connection = self._acquire()
+                connection.smtp.send_message(message)
+                errors.append(None)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException) as exc:
+                # Rejected by the server for this message only; the session is still usable.
+                errors.append(exc)
+            except Exception as exc:
+                errors.append(exc)
+                if connection is not None:
+                    self._quit(connection)
+                    connection = None
+
+        if connection is not None:
+            connection.last_used_at = monotonic()
+            self._idle.put(connection)
+
+        return errors
+
+    def _acquire(self) -> _PooledConnection:
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except Empty:
+                return _PooledConnection(smtp=self._connect(), last_used_at=monotonic())
+
+            if monotonic() - connection.last_used_at > self.config.connection_idle_seconds:
+                self._quit(connection)
+                continue
+
+            try:
+                status, _ = connection.smtp.noop()
+            except Exception:
+                status = 0
+            if status == 250:
+                return connection
+
+            self._quit(connection)
+
+    def _connect(self) -> smtplib.SMTP:
+        config = self.config
+        username = config.username.get_secret_value() if config.username else None
+        password = config.password.get_secret_value() if config.password else None
+
+        smtp: smtplib.SMTP
+        if config.use_ssl:
+            smtp = smtplib.SMTP_SSL(host=config.host, port=config.port, timeout=config.timeout)
+        else:
+            smtp = smtplib.SMTP(host=config.host, port=config.port, timeout=config.timeout)
+            smtp.ehlo()
+            if config.use_tls:
+                smtp.starttls()
+                smtp.ehlo()
+
+        if username and password:
+            smtp.login(username, password)
+
+        logger.debug(f"Opened SMTP connection to '{config.host}:{config.port}'")
+        return smtp
+
+    @staticmethod
+    def _quit(connection: _PooledConnection) -> None:
+        try:
+            connection.smtp.quit()
+        except Exception:
+            connection.smtp.close()
@@ -1,15 +1,74 @@
-from typing import Any
+from typing import Any, Final, Sequence
 
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
 from taskiq import AsyncResultBackend
+from taskiq.message import BrokerMessage
 from taskiq_redis import RedisAsyncResultBackend, RedisStreamBroker
 
 from src.core.config import AppConfig
+from src.core.enums import TaskQueue
 from src.infrastructure.taskiq.middlewares import ErrorMiddleware
 
+QUEUE_NAME_LABEL: Final[str] = "queue_name"
+
+# The default queue keeps the original stream so messages queued before the split survive.
+TASK_QUEUE_STREAMS: Final[dict[TaskQueue, str]] = {
+    TaskQueue.CRITICAL: "taskiq:critical",
+    TaskQueue.DEFAULT: "taskiq",
+    TaskQueue.BULK: "taskiq:bulk",
+}
+
+
+def queue_stream(queue: TaskQueue) -> str:
+    """Stream name for ``@broker.task(queue_name=...)``; unlabeled tasks use the default."""
+    return TASK_QUEUE_STREAMS[queue]
+
+
+class QueueRoutedStreamBroker(RedisStreamBroker):
+    """Redis stream broker with one stream (and consumer group) per task queue.
+
+    Producers route each message by its ``queue_name`` label. A worker consumes only
+    ``consume_queues``, read in the given order, so payments can get their own worker
+    pool and concurrency limit instead of queueing behind broadcasts and imports.
+    """
+
+    def __init__(self, url: str, *, consume_queues: Sequence[TaskQueue], **kwargs: Any) -> None:
+        streams = [TASK_QUEUE_STREAMS[queue] for queue in consume_queues]
+        super().__init__(
+            url,
+            queue_name=streams[0],
+            additional_streams=dict.fromkeys(streams[1:], ">"),
+            **kwargs,
+        )
+
+    async def kick(self, message: BrokerMessage) -> None:
+        if not message.labels.get(QUEUE_NAME_LABEL):
+            message.labels[QUEUE_NAME_LABEL] = TASK_QUEUE_STREAMS[TaskQueue.DEFAULT]
+        await super().kick(message)
+
+    async def _declare_consumer_group(self) -> None:
+        # Groups start at "$", so declare every queue's group from any worker: messages
+        # sent before the first consumer of a queue starts must not be skipped.
+        async with Redis(connection_pool=self.connection_pool) as redis_conn:
+            for stream_name in TASK_QUEUE_STREAMS.values():
+                try:
+                    await redis_conn.xgroup_create(
+                        stream_name,
+                        self.consumer_group_name,
+                        id=self.consumer_id,
+                        mkstream=self.mkstream,
+                    )
+                except ResponseError:
+                    pass  # BUSYGROUP: already declared
+
 
 def create_broker(config: AppConfig) -> RedisStreamBroker:
     result_backend: AsyncResultBackend[Any] = RedisAsyncResultBackend(redis_url=config.redis.dsn)
-    broker = RedisStreamBroker(url=config.redis.dsn).with_result_backend(result_backend)
+    broker = QueueRoutedStreamBroker(
+        url=config.redis.dsn,
+        consume_queues=config.taskiq.queues,
+    ).with_result_backend(result_backend)
     return broker
 
 
@@ -6,11 +6,13 @@ from typing import Final
 
 TASK_MODULES: Final[tuple[str, ...]] = (
     "src.infrastructure.taskiq.tasks.broadcast",
+    "src.infrastructure.taskiq.tasks.emails",
     "src.infrastructure.taskiq.tasks.importer",
     "src.infrastructure.taskiq.tasks.notifications",
     "src.infrastructure.taskiq.tasks.payments",
     "src.infrastructure.taskiq.tasks.redirects",
     "src.infrastructure.taskiq.tasks.referrals",
+    "src.infrastructure.taskiq.tasks.remnawave",
     "src.infrastructure.taskiq.tasks.subscriptions",
     "src.infrastructure.taskiq.tasks.updates",
 )
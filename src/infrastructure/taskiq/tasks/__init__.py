@@ -6,6 +6,7 @@ That avoids accidental import cycles between services and unrelated task modules
 
 __all__ = [
     "broadcast",
+    "emails",
     "importer",
     "notifications",
     "payments",
@@ -6,16 +6,16 @@ from dishka.integrations.taskiq import FromDishka, inject
 from loguru import logger
 
 from src.core.constants import BATCH_DELAY, BATCH_SIZE
-from src.core.enums import BroadcastMessageStatus, BroadcastStatus
+from src.core.enums import BroadcastMessageStatus, BroadcastStatus, TaskQueue
 from src.core.utils.iterables import chunked
 from src.core.utils.message_payload import MessagePayload
 from src.infrastructure.database.models.dto import BroadcastDto, BroadcastMessageDto, UserDto
-from src.infrastructure.taskiq.broker import broker
+from src.infrastructure.taskiq.broker import broker, queue_stream
 from src.services.broadcast import BroadcastService
 from src.services.notification import NotificationService
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.BULK))
 @inject(patch_module=True)
 async def send_broadcast_task(
     broadcast: BroadcastDto,
@@ -127,7 +127,7 @@ async def send_broadcast_task(
         await broadcast_service.update(broadcast)
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.BULK))
 @inject(patch_module=True)
 async def delete_broadcast_task(
     broadcast: BroadcastDto,
@@ -195,7 +195,7 @@ async def delete_broadcast_task(
     return total_messages, deleted_count, failed_count
 
 
-@broker.task(schedule=[{"cron": "0 0 */7 * *"}])
+@broker.task(queue_name=queue_stream(TaskQueue.BULK), schedule=[{"cron": "0 0 */7 * *"}])
 @inject(patch_module=True)
 async def delete_broadcasts_task(broadcast_service: FromDishka[BroadcastService]) -> None:
     broadcasts = await broadcast_service.get_all()
@@ -0,0 +1,16 @@
+from dishka.integrations.taskiq import FromDishka, inject
+from loguru import logger
+
+from src.infrastructure.taskiq.broker import broker
+from src.services.email_sender import EmailSenderService
+
+
+# The cron run picks up retries whose backoff has elapsed and leases left by crashed workers.
+@broker.task(schedule=[{"cron": "* * * * *"}])
+@inject(patch_module=True)
+async def deliver_email_outbox_task(
+    email_sender_service: FromDishka[EmailSenderService],
+) -> None:
+    delivered = await email_sender_service.deliver_outbox()
+    if delivered:
+        logger.info("Delivered '{}' queued email(s)", delivered)
@@ -7,10 +7,10 @@ from remnawave.exceptions import BadRequestError
 from remnawave.models import CreateUserRequestDto, GetAllUsersResponseDto, UserResponseDto
 
 from src.core.constants import IMPORTED_TAG
-from src.core.enums import SubscriptionStatus
+from src.core.enums import SubscriptionStatus, TaskQueue
 from src.infrastructure.database.models.dto import PlanDto, SubscriptionDto
 from src.infrastructure.database.models.dto.plan import PlanSnapshotDto
-from src.infrastructure.taskiq.broker import broker
+from src.infrastructure.taskiq.broker import broker, queue_stream
 from src.services.plan import PlanService
 from src.services.remnawave import RemnawaveService
 from src.services.subscription import SubscriptionService
@@ -116,7 +116,7 @@ async def _assign_plan_for_user(
     return user_updated, 0, user_skipped_deleted, user_skipped_already_assigned, user_errors
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.BULK))
 @inject(patch_module=True)
 async def import_exported_users_task(
     imported_users: list[dict],
@@ -147,7 +147,7 @@ async def import_exported_users_task(
     return success_count, failed_count
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.BULK))
 @inject(patch_module=True)
 async def sync_all_users_from_panel_task(
     remnawave: FromDishka[RemnawaveSDK],
@@ -167,10 +167,11 @@ async def sync_all_users_from_panel_task(
         f"from '{len(all_remna_users)}' panel profile(s)"
     )
 
-    added_users, added_subscription, updated, errors = await _sync_grouped_profiles(
-        grouped_remna_users=grouped_remna_users,
-        remnawave_service=remnawave_service,
-    )
+    async with remnawave_service.plan_resolution_scope():
+        added_users, added_subscription, updated, errors = await _sync_grouped_profiles(
+            grouped_remna_users=grouped_remna_users,
+            remnawave_service=remnawave_service,
+        )
 
     result: dict[str, int | list[int]] = {
         "total_panel_users": len(all_remna_users),
@@ -272,7 +273,7 @@ async def _sync_grouped_profiles(
     return added_users, added_subscription, updated, errors
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.BULK))
 @inject(patch_module=True)
 async def assign_plan_to_synced_users_task(
     plan_id: int,
@@ -11,7 +11,7 @@ from dishka.integrations.taskiq import FromDishka, inject
 from src.api.utils.web_app_urls import build_web_app_route_url
 from src.bot.keyboards import get_renew_keyboard
 from src.core.constants import BATCH_DELAY, BATCH_SIZE, DATETIME_FORMAT
-from src.core.enums import MediaType, SystemNotificationType, UserNotificationType
+from src.core.enums import MediaType, SystemNotificationType, TaskQueue, UserNotificationType
 from src.core.utils.bot_menu import (
     BOT_MENU_URL_KIND_URL,
     BOT_MENU_URL_KIND_WEB_APP,
@@ -22,7 +22,8 @@ from src.core.utils.message_payload import MessagePayload
 from src.core.utils.system_events import build_system_event_payload, normalize_system_event_kwargs
 from src.core.utils.types import RemnaUserDto
 from src.infrastructure.database.models.dto import SubscriptionDto, UserDto
-from src.infrastructure.taskiq.broker import broker
+from src.infrastructure.taskiq.broker import broker, queue_stream
+from src.services.event_partition import EventPartitionService
 from src.services.notification import NotificationService
 from src.services.remnawave import RemnawaveService
 from src.services.remnawave_profile_lookup import (
@@ -32,7 +33,6 @@ from src.services.remnawave_profile_lookup import (
 from src.services.settings import SettingsService
 from src.services.subscription import SubscriptionService
 from src.services.user import UserService
-from src.services.user_notification_event import UserNotificationEventService
 
 
 def _build_expiry_summary_key(
@@ -249,7 +249,7 @@ async def send_access_denied_notification_task(
     )
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.BULK))
 @inject(patch_module=True)
 async def send_access_opened_notifications_task(
     waiting_user_ids: list[int],
@@ -375,9 +375,13 @@ async def send_test_transaction_notification_task(
     )
 
 
-@broker.task(schedule=[{"cron": "0 4 * * *"}])  # Run daily at 4:00 AM
+@broker.task(
+    queue_name=queue_stream(TaskQueue.BULK),
+    schedule=[{"cron": "0 4 * * *"}],  # Run daily at 4:00 AM
+)
 @inject(patch_module=True)
-async def cleanup_user_notification_events_task(
-    user_notification_event_service: FromDishka[UserNotificationEventService],
+async def maintain_event_partitions_task(
+    event_partition_service: FromDishka[EventPartitionService],
 ) -> None:
-    await user_notification_event_service.cleanup_older_than(days=30)
+    # Pre-creates upcoming monthly partitions and drops the ones past retention.
+    await event_partition_service.maintain()
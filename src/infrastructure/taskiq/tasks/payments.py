@@ -3,10 +3,15 @@ from uuid import UUID
 from dishka.integrations.taskiq import FromDishka, inject
 from loguru import logger
 
-from src.core.enums import PaymentGatewayType, TransactionStatus
-from src.infrastructure.taskiq.broker import broker
+from src.core.enums import PaymentGatewayType, TaskQueue, TransactionStatus
+from src.core.observability import emit_counter
+from src.infrastructure.taskiq.broker import broker, queue_stream
 from src.services.payment_gateway import PaymentGatewayService
-from src.services.payment_webhook_event import PaymentWebhookEventService
+from src.services.payment_webhook_event import (
+    PAYMENT_WEBHOOK_STATUS_ENQUEUED,
+    PAYMENT_WEBHOOK_STATUS_PROCESSED,
+    PaymentWebhookEventService,
+)
 from src.services.transaction import TransactionService
 
 
@@ -23,7 +28,7 @@ def _build_stale_payment_diagnostic(exc: LookupError) -> str:
     return f"stale_after_restore: {str(exc)[:256]}"
 
 
-@broker.task()
+@broker.task(queue_name=queue_stream(TaskQueue.CRITICAL))
 @inject(patch_module=True)
 async def handle_payment_transaction_task(
     payment_id: str,
@@ -33,13 +38,24 @@ async def handle_payment_transaction_task(
     payment_webhook_event_service: FromDishka[PaymentWebhookEventService],
 ) -> None:
     payment_uuid = UUID(payment_id)
-    payment_status_enum = TransactionStatus(payment_status)
     gateway_enum = PaymentGatewayType(gateway_type)
 
-    await payment_webhook_event_service.mark_processing(
+    claim = await payment_webhook_event_service.claim(
         gateway_type=gateway_enum.value,
         payment_id=payment_uuid,
+        payment_status=payment_status,
     )
+    if claim is None:
+        logger.debug(
+            "Payment webhook for gateway='{}' payment_id='{}' is done or held by another worker",
+            gateway_enum.value,
+            payment_uuid,
+        )
+        return
+
+    # The inbox keeps the latest verified status, which may be newer than the kicked one.
+    payment_status_enum = TransactionStatus(claim.payment_status)
+    settled_status = PAYMENT_WEBHOOK_STATUS_PROCESSED
 
     try:
         match payment_status_enum:
@@ -53,22 +69,10 @@ async def handle_payment_transaction_task(
                     payment_uuid,
                     gateway_enum.value,
                 )
-                await payment_webhook_event_service.mark_enqueued(
-                    gateway_type=gateway_enum.value,
-                    payment_id=payment_uuid,
-                )
-                return
-        await payment_webhook_event_service.mark_processed(
-            gateway_type=gateway_enum.value,
-            payment_id=payment_uuid,
-        )
+                settled_status = PAYMENT_WEBHOOK_STATUS_ENQUEUED
     except LookupError as exc:
         if not _is_stale_payment_lookup_error(exc):
-            await payment_webhook_event_service.mark_failed(
-                gateway_type=gateway_enum.value,
-                payment_id=payment_uuid,
-                error_message=str(exc),
-            )
+            await payment_webhook_event_service.fail(claim, error_message=str(exc), retry=True)
             raise
 
         logger.warning(
@@ -81,20 +85,40 @@ async def handle_payment_transaction_task(
             payment_status_enum.value,
             exc,
         )
-        await payment_webhook_event_service.mark_failed(
-            gateway_type=gateway_enum.value,
-            payment_id=payment_uuid,
+        await payment_webhook_event_service.fail(
+            claim,
             error_message=_build_stale_payment_diagnostic(exc),
+            retry=False,
         )
         return
     except Exception as exc:
-        await payment_webhook_event_service.mark_failed(
-            gateway_type=gateway_enum.value,
-            payment_id=payment_uuid,
-            error_message=str(exc),
-        )
+        await payment_webhook_event_service.fail(claim, error_message=str(exc), retry=True)
         raise
 
+    if not await payment_webhook_event_service.finish(claim, status=settled_status):
+        # A newer webhook for this payment arrived while it was being applied.
+        await handle_payment_transaction_task.kiq(payment_id, payment_status, gateway_type)
+
+
+# The sweep dispatches webhooks whose kick was lost, retries whose backoff has elapsed and
+# rows abandoned by a crashed worker once their lease runs out.
+@broker.task(queue_name=queue_stream(TaskQueue.CRITICAL), schedule=[{"cron": "* * * * *"}])
+@inject(patch_module=True)
+async def retry_payment_webhooks_task(
+    payment_webhook_event_service: FromDishka[PaymentWebhookEventService],
+) -> None:
+    events = await payment_webhook_event_service.take_due()
+    for event in events:
+        await handle_payment_transaction_task.kiq(
+            str(event.payment_id),
+            event.payment_status,
+            event.gateway_type,
+        )
+        emit_counter("payment_webhook_redispatched_total", gateway_type=event.gateway_type)
+
+    if events:
+        logger.info("Redispatched '{}' payment webhook(s) from the inbox", len(events))
+
 
 @broker.task(schedule=[{"cron": "*/30 * * * *"}])
 @inject(patch_module=True)
@@ -6,9 +6,9 @@ from dishka.integrations.taskiq import FromDishka, inject
 from loguru import logger
 
 from src.bot.states import MainMenu, Subscription
-from src.core.enums import PurchaseType
+from src.core.enums import PurchaseType, TaskQueue
 from src.infrastructure.database.models.dto import UserDto
-from src.infrastructure.taskiq.broker import broker
+from src.infrastructure.taskiq.broker import broker, queue_stream
 from src.services.user import UserService
 
 
@@ -102,7 +102,7 @@ async def redirect_to_main_menu_task(
     )
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.CRITICAL))
 @inject(patch_module=True)
 async def redirect_to_successed_trial_task(
     user: UserDto,
@@ -119,7 +119,7 @@ async def redirect_to_successed_trial_task(
     )
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.CRITICAL))
 @inject(patch_module=True)
 async def redirect_to_successed_payment_task(
     user: UserDto,
@@ -138,7 +138,7 @@ async def redirect_to_successed_payment_task(
     )
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.CRITICAL))
 @inject(patch_module=True)
 async def redirect_to_failed_subscription_task(
     user: UserDto,
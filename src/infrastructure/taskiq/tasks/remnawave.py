@@ -0,0 +1,130 @@
+import json
+import traceback
+import uuid
+from typing import Optional, cast
+
+from aiogram.utils.formatting import Text
+from dishka.integrations.taskiq import FromDishka, inject
+from loguru import logger
+from remnawave.controllers import WebhookUtility
+from remnawave.models.webhook import NodeDto, UserDto, UserHwidDeviceEventDto, WebhookPayloadDto
+
+from src.core.utils.system_events import build_system_event_payload
+from src.infrastructure.taskiq.broker import broker
+from src.infrastructure.taskiq.tasks.notifications import send_error_notification_task
+from src.services.remnawave import RemnawaveService
+from src.services.remnawave_webhook_queue import RemnawaveWebhookQueueService
+from src.services.subscription_device import SubscriptionDeviceService
+from src.services.subscription_runtime import SubscriptionRuntimeService
+
+
+# The cron run picks up entities left behind by a missed drain kick or a crashed worker.
+@broker.task(schedule=[{"cron": "* * * * *"}])
+@inject(patch_module=True)
+async def drain_remnawave_webhooks_task(
+    remnawave_webhook_queue_service: FromDishka[RemnawaveWebhookQueueService],
+) -> None:
+    dispatched = await remnawave_webhook_queue_service.drain()
+    if dispatched:
+        logger.debug(f"Dispatched Remnawave webhook events for '{dispatched}' entities")
+
+
+@broker.task
+@inject(patch_module=True)
+async def process_remnawave_webhook_task(
+    entity: str,
+    payloads: list[str],
+    remnawave_service: FromDishka[RemnawaveService],
+    subscription_device_service: FromDishka[SubscriptionDeviceService],
+    subscription_runtime_service: FromDishka[SubscriptionRuntimeService],
+    remnawave_webhook_queue_service: FromDishka[RemnawaveWebhookQueueService],
+) -> None:
+    for raw_payload in payloads:
+        payload = WebhookPayloadDto.from_dict(json.loads(raw_payload))
+        error = await _apply_webhook_event(
+            payload,
+            remnawave_service=remnawave_service,
+            subscription_device_service=subscription_device_service,
+            subscription_runtime_service=subscription_runtime_service,
+        )
+        if error is not None:
+            # Later events must not overtake the failed one; the whole entity is redelivered.
+            # Retries are only logged, developers are alerted once the events are dropped.
+            if not await remnawave_webhook_queue_service.fail(entity):
+                await _notify_dropped_webhook_event(payload, error)
+            return
+
+    await remnawave_webhook_queue_service.ack(entity)
+
+
+async def _apply_webhook_event(
+    payload: WebhookPayloadDto,
+    *,
+    remnawave_service: RemnawaveService,
+    subscription_device_service: SubscriptionDeviceService,
+    subscription_runtime_service: SubscriptionRuntimeService,
+) -> Optional[Exception]:
+    """Apply one event; the error it failed with, or ``None`` once applied."""
+    try:
+        if WebhookUtility.is_user_event(payload.event):
+            user = cast(UserDto, WebhookUtility.get_typed_data(payload))
+            await remnawave_service.handle_user_event(payload.event, user)
+
+        elif WebhookUtility.is_user_hwid_devices_event(payload.event):
+            event = cast(UserHwidDeviceEventDto, WebhookUtility.get_typed_data(payload))
+            await remnawave_service.handle_device_event(
+                payload.event,
+                event.user,
+                event.hwid_user_device,
+            )
+            await subscription_device_service.apply_device_event_to_cached_list(
+                user_remna_id=event.user.uuid,
+                event=payload.event,
+                hwid_device=event.hwid_user_device,
+            )
+            await subscription_runtime_service.apply_device_event_to_cached_runtime(
+                user_remna_id=event.user.uuid,
+                event=payload.event,
+            )
+
+        elif WebhookUtility.is_node_event(payload.event):
+            node = cast(NodeDto, WebhookUtility.get_typed_data(payload))
+            await remnawave_service.handle_node_event(payload.event, node)
+
+        else:
+            logger.warning(f"Unhandled Remnawave event type: '{payload.event}'")
+
+        return None
+
+    except Exception as exception:
+        logger.warning(f"Error processing Remnawave webhook '{payload.event}': {exception}")
+        return exception
+
+
+async def _notify_dropped_webhook_event(payload: WebhookPayloadDto, error: Exception) -> None:
+    traceback_str = "".join(traceback.format_exception(error))
+    error_type_name = type(error).__name__
+    error_message = Text(str(error)[:512])
+
+    await send_error_notification_task.kiq(
+        error_id=str(uuid.uuid4()),
+        traceback_str=traceback_str,
+        payload=build_system_event_payload(
+            i18n_key="ntf-event-error",
+            i18n_kwargs={
+                "user": False,
+                "error": f"{error_type_name}: {error_message.as_html()}",
+            },
+            severity="ERROR",
+            event_source="api.remnawave",
+            entry_surface="WEBHOOK",
+            operation=f"remnawave_webhook:{payload.event}",
+            impact=(
+                "Panel-originated sync events may be skipped until webhook processing is restored."
+            ),
+            operator_hint=(
+                "Check the Remnawave payload, event type, and "
+                "downstream service health before replaying."
+            ),
+        ),
+    )
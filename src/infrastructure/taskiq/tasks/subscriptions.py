@@ -4,11 +4,13 @@ from typing import Optional
 from uuid import UUID
 
 from dishka.integrations.taskiq import FromDishka, inject
+from redis.asyncio import Redis
 from remnawave import RemnawaveSDK
 
-from src.core.enums import SubscriptionStatus
+from src.core.enums import SubscriptionStatus, TaskQueue
 from src.infrastructure.database.models.dto import SubscriptionDto, TransactionDto, UserDto
-from src.infrastructure.taskiq.broker import broker
+from src.infrastructure.redis import RedisRepository
+from src.infrastructure.taskiq.broker import broker, queue_stream
 from src.services.plan import PlanService
 from src.services.remnawave import RemnawaveService
 from src.services.settings import SettingsService
@@ -34,7 +36,7 @@ from .subscriptions_purchase import _purchase_subscription_task as _purchase_sub
 from .subscriptions_purchase import _trial_subscription_task as _trial_subscription_task_impl
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.CRITICAL))
 @inject(patch_module=True)
 async def trial_subscription_task(
     user: UserDto,
@@ -46,7 +48,7 @@ async def trial_subscription_task(
     )
 
 
-@broker.task
+@broker.task(queue_name=queue_stream(TaskQueue.CRITICAL))
 @inject(patch_module=True)
 async def purchase_subscription_task(
     transaction: TransactionDto,
@@ -56,6 +58,7 @@ async def purchase_subscription_task(
     settings_service: FromDishka[SettingsService],
     transaction_service: FromDishka[TransactionService],
     plan_service: FromDishka[PlanService],
+    redis_client: FromDishka[Redis],
     subscriptions_to_renew: Optional[list[SubscriptionDto]] = None,
 ) -> None:
     return await _purchase_subscription_task_impl(
@@ -67,6 +70,7 @@ async def purchase_subscription_task(
         transaction_service=transaction_service,
         plan_service=plan_service,
         subscriptions_to_renew=subscriptions_to_renew,
+        redis_client=redis_client,
     )
 
 
@@ -116,13 +120,15 @@ async def update_status_current_subscription_task(
     )
 
 
-@broker.task(schedule=[{"cron": "0 3 * * *"}])
+@broker.task(queue_name=queue_stream(TaskQueue.BULK), schedule=[{"cron": "0 3 * * *"}])
 @inject(patch_module=True)
 async def cleanup_expired_subscriptions_task(
     subscription_service: FromDishka[SubscriptionService],
     remnawave: FromDishka[RemnawaveSDK],
+    redis_repository: FromDishka[RedisRepository],
 ) -> None:
     return await _cleanup_expired_subscriptions_task_impl(
         subscription_service=subscription_service,
         remnawave=remnawave,
+        redis_repository=redis_repository,
     )
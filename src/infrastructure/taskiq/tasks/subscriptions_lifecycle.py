@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Optional
 from uuid import UUID
 
 from loguru import logger
 from remnawave import RemnawaveSDK
+from remnawave.exceptions import NotFoundError
 
-from src.core.constants import EXPIRED_SUBSCRIPTION_CLEANUP_DAYS
+from src.core.constants import (
+    EXPIRED_SUBSCRIPTION_CLEANUP_BATCH_SIZE,
+    EXPIRED_SUBSCRIPTION_CLEANUP_CONCURRENCY,
+    EXPIRED_SUBSCRIPTION_CLEANUP_DAYS,
+    EXPIRED_SUBSCRIPTION_CLEANUP_MAX_ATTEMPTS,
+    TIME_1H,
+)
 from src.core.enums import SubscriptionStatus
+from src.core.storage.keys import ExpiredSubscriptionCleanupCheckpointKey
 from src.infrastructure.database.models.dto import SubscriptionDto, UserDto
+from src.infrastructure.redis import RedisRepository
 from src.services.subscription import SubscriptionService
 from src.services.subscription_runtime import SubscriptionRuntimeService
 from src.services.user import UserService
 
+EXPIRED_SUBSCRIPTION_CLEANUP_RETRY_DELAY_SECONDS = 1.0
+EXPIRED_SUBSCRIPTION_CLEANUP_CHECKPOINT_TTL_SECONDS = TIME_1H * 12
+
 
 async def _refresh_user_subscriptions_runtime_task(
     *,
@@ -125,41 +138,120 @@ async def _cleanup_expired_subscriptions_task(
     *,
     subscription_service: SubscriptionService,
     remnawave: RemnawaveSDK,
+    redis_repository: RedisRepository,
 ) -> None:
     logger.info(
         f"Starting cleanup of subscriptions expired more than "
         f"{EXPIRED_SUBSCRIPTION_CLEANUP_DAYS} days ago"
     )
 
-    expired_subscriptions = await subscription_service.get_expired_subscriptions_older_than(
-        days=EXPIRED_SUBSCRIPTION_CLEANUP_DAYS
-    )
+    checkpoint_key = ExpiredSubscriptionCleanupCheckpointKey()
+    after_id = await redis_repository.get(checkpoint_key, int, default=0) or 0
+    if after_id:
+        logger.info(f"Resuming expired subscription cleanup after subscription '{after_id}'")
+
+    semaphore = asyncio.Semaphore(EXPIRED_SUBSCRIPTION_CLEANUP_CONCURRENCY)
+    deleted_count = 0
+    failed_count = 0
+
+    while True:
+        page = await subscription_service.get_expired_subscription_refs_page(
+            days=EXPIRED_SUBSCRIPTION_CLEANUP_DAYS,
+            after_id=after_id,
+            limit=EXPIRED_SUBSCRIPTION_CLEANUP_BATCH_SIZE,
+        )
+        if not page:
+            break
+
+        results = await asyncio.gather(
+            *(
+                _delete_panel_user_with_retry(
+                    remnawave=remnawave,
+                    semaphore=semaphore,
+                    subscription_id=subscription_id,
+                    remna_user_uuid=remna_user_uuid,
+                )
+                for subscription_id, remna_user_uuid in page
+            )
+        )
+        cleaned_ids = [
+            subscription_id
+            for (subscription_id, _), panel_cleaned in zip(page, results)
+            if panel_cleaned
+        ]
+        failed_count += len(page) - len(cleaned_ids)
+
+        try:
+            deleted_count += await subscription_service.delete_subscriptions(cleaned_ids)
+        except Exception as exception:
+            logger.error(
+                f"Error marking '{len(cleaned_ids)}' cleaned up subscription(s) as deleted: "
+                f"{exception}"
+            )
+            failed_count += len(cleaned_ids)
+
+        after_id = page[-1][0]
+        await redis_repository.set(
+            checkpoint_key,
+            after_id,
+            ex=EXPIRED_SUBSCRIPTION_CLEANUP_CHECKPOINT_TTL_SECONDS,
+        )
 
-    if not expired_subscriptions:
+        if len(page) < EXPIRED_SUBSCRIPTION_CLEANUP_BATCH_SIZE:
+            break
+
+    await redis_repository.delete(checkpoint_key)
+
+    if not deleted_count and not failed_count:
         logger.info("No expired subscriptions to cleanup")
         return
 
-    deleted_count = 0
-    failed_count = 0
+    logger.info(f"Cleanup completed: {deleted_count} subscriptions deleted, {failed_count} failed")
+
+
+async def _delete_panel_user_with_retry(
+    *,
+    remnawave: RemnawaveSDK,
+    semaphore: asyncio.Semaphore,
+    subscription_id: int,
+    remna_user_uuid: UUID | None,
+) -> bool:
+    if not remna_user_uuid:
+        return True
 
-    for subscription in expired_subscriptions:
+    for attempt in range(1, EXPIRED_SUBSCRIPTION_CLEANUP_MAX_ATTEMPTS + 1):
         try:
-            remna_user_uuid = subscription.user_remna_id
-            if remna_user_uuid:
+            async with semaphore:
                 result = await remnawave.users.delete_user(uuid=str(remna_user_uuid))
-                if result and hasattr(result, "is_deleted") and result.is_deleted:
-                    logger.info(
-                        f"Deleted RemnaUser '{remna_user_uuid}' from panel "
-                        f"(subscription '{subscription.id}')"
-                    )
-                else:
-                    logger.warning(f"Failed to delete RemnaUser '{remna_user_uuid}' from panel")
+        except NotFoundError:
+            logger.info(
+                f"RemnaUser '{remna_user_uuid}' is already missing from panel "
+                f"(subscription '{subscription_id}')"
+            )
+            return True
+        except Exception as exception:
+            if attempt >= EXPIRED_SUBSCRIPTION_CLEANUP_MAX_ATTEMPTS:
+                logger.error(
+                    f"Error cleaning up subscription '{subscription_id}' after "
+                    f"{attempt} attempt(s): {exception}"
+                )
+                return False
 
-            await subscription_service.delete_subscription(subscription.id)  # type: ignore[arg-type]
-            deleted_count += 1
+            delay = EXPIRED_SUBSCRIPTION_CLEANUP_RETRY_DELAY_SECONDS * 2 ** (attempt - 1)
+            logger.warning(
+                f"Retrying panel cleanup for subscription '{subscription_id}' in {delay}s "
+                f"(attempt {attempt}): {exception}"
+            )
+            await asyncio.sleep(delay)
+            continue
 
-        except Exception as exception:
-            logger.error(f"Error cleaning up subscription '{subscription.id}': {exception}")
-            failed_count += 1
+        if result and getattr(result, "is_deleted", False):
+            logger.info(
+                f"Deleted RemnaUser '{remna_user_uuid}' from panel "
+                f"(subscription '{subscription_id}')"
+            )
+        else:
+            logger.warning(f"Failed to delete RemnaUser '{remna_user_uuid}' from panel")
+        return True
 
-    logger.info(f"Cleanup completed: {deleted_count} subscriptions deleted, {failed_count} failed")
+    return False
@@ -6,6 +6,7 @@ from typing import Any, Optional, cast
 
 from aiogram.utils.formatting import Text
 from loguru import logger
+from redis.asyncio import Redis
 
 from src.bot.keyboards import get_user_keyboard
 from src.core.enums import (
@@ -15,6 +16,7 @@ from src.core.enums import (
     SubscriptionStatus,
     SystemNotificationType,
     TransactionStatus,
+    UserStreamEventType,
 )
 from src.core.utils.formatters import (
     i18n_format_days,
@@ -38,6 +40,7 @@ from src.services.settings import SettingsService
 from src.services.subscription import SubscriptionService
 from src.services.subscription_trial import SubscriptionTrialService
 from src.services.transaction import TransactionService
+from src.services.user_event_stream import publish_user_event
 
 from .redirects import (
     redirect_to_failed_subscription_task,
@@ -638,6 +641,7 @@ async def _purchase_subscription_task(
     transaction_service: TransactionService,
     plan_service: PlanService,
     subscriptions_to_renew: Optional[list[SubscriptionDto]] = None,
+    redis_client: Optional[Redis] = None,
 ) -> None:
     purchase_type = transaction.purchase_type
     user = cast(UserDto, transaction.user)
@@ -709,6 +713,13 @@ async def _purchase_subscription_task(
             plan_service=plan_service,
         )
 
+        if redis_client is not None:
+            await publish_user_event(
+                redis_client,
+                user.telegram_id,
+                UserStreamEventType.PAYMENT_COMPLETED,
+                payment_id=str(transaction.payment_id),
+            )
         await redirect_to_successed_payment_task.kiq(user, purchase_type)
         if purchase_type == PurchaseType.ADDITIONAL:
             logger.info(f"Additional subscription task completed for user '{user.telegram_id}'")
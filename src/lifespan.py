@@ -10,12 +10,18 @@ from aiogram.utils.formatting import Text
 from dishka import AsyncContainer, Scope
 from fastapi import FastAPI
 from loguru import logger
+from redis.asyncio import Redis
 
 from src.__version__ import __version__
 from src.api.endpoints import TelegramWebhookEndpoint
-from src.core.enums import SystemNotificationType
+from src.core.config import AppConfig
+from src.core.constants import API_LEADER_RENEW_SECONDS, API_LEADER_TTL_SECONDS
+from src.core.enums import AccessMode, SystemNotificationType
+from src.core.security.password import password_hasher
+from src.core.storage.keys import ApiLeaderKey
 from src.core.utils.message_payload import MessagePayload
 from src.core.utils.system_events import build_system_event_payload
+from src.infrastructure.redis import RedisLeaderElection
 from src.infrastructure.taskiq.tasks.notifications import (
     send_error_notification_task,
     send_remnashop_notification_task,
@@ -36,51 +42,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     dispatcher: Dispatcher = app.state.dispatcher
     telegram_webhook_endpoint: TelegramWebhookEndpoint = app.state.telegram_webhook_endpoint
     container: AsyncContainer = app.state.dishka_container
+    config: AppConfig = await container.get(AppConfig)
 
     async with container(scope=Scope.REQUEST) as startup_container:
-        webhook_service: WebhookService = await startup_container.get(WebhookService)
-        command_service: CommandService = await startup_container.get(CommandService)
         settings_service: SettingsService = await startup_container.get(SettingsService)
-        gateway_service: PaymentGatewayService = await startup_container.get(PaymentGatewayService)
-        remnawave_service: RemnawaveService = await startup_container.get(RemnawaveService)
-
-        await gateway_service.create_default()
-        await gateway_service.normalize_gateway_settings()
         access_mode = await settings_service.get_access_mode()
 
     await startup_container.close()
 
-    # Запуск автоматических бэкапов
+    # With several API workers only the leader runs cluster-wide jobs; the others serve
+    # requests and one of them takes over if the leader goes away.
+    leader = RedisLeaderElection(
+        await container.get(Redis),
+        ApiLeaderKey().pack(),
+        ttl=API_LEADER_TTL_SECONDS,
+        renew_interval=API_LEADER_RENEW_SECONDS,
+    )
     backup_service: BackupService = await container.get(BackupService)
-    await backup_service.start_auto_backup()
+    cluster_started = False
 
-    allowed_updates = dispatcher.resolve_used_update_types()
+    async def start_cluster_jobs() -> None:
+        nonlocal cluster_started
+        if not cluster_started:
+            await _start_cluster(dispatcher, container, access_mode)
+            cluster_started = True
 
-    webhook_info: WebhookInfo = await webhook_service.setup(allowed_updates)
+        # Запуск автоматических бэкапов, если лидерство не ушло во время запуска
+        if leader.is_leader:
+            await backup_service.start_auto_backup()
 
-    if webhook_service.has_error(webhook_info):
-        logger.critical(f"Webhook has a last error message: '{webhook_info.last_error_message}'")
-        await send_system_notification_task.kiq(
-            ntf_type=SystemNotificationType.BOT_LIFETIME,
-            payload=build_system_event_payload(
-                i18n_key="ntf-event-error-webhook",
-                i18n_kwargs={"error": webhook_info.last_error_message or "Unknown webhook error"},
-                severity="ERROR",
-                event_source="lifespan.webhook",
-                entry_surface="WEBHOOK",
-                operation="webhook_setup",
-                impact=(
-                    "Telegram updates may stop reaching the bot "
-                    "until webhook health is restored."
-                ),
-                operator_hint=(
-                    "Check the webhook URL, HTTPS availability, "
-                    "and the last Telegram webhook error."
-                ),
-            ),
-        )
-
-    await command_service.setup()
     await telegram_webhook_endpoint.startup()
 
     bot: Bot = await container.get(Bot)
@@ -108,60 +98,127 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         <yellow>Bot in access mode: '{access_mode}'</>
         """  # noqa: W605
     )
-    await check_bot_update.kiq()
-    await recover_platega_webhooks_task.kiq()
-    await send_remnashop_notification_task.kiq()
-    await asyncio.sleep(2)
-    await send_system_notification_task.kiq(
-        ntf_type=SystemNotificationType.BOT_LIFETIME,
-        payload=MessagePayload.not_deleted(
-            i18n_key="ntf-event-bot-startup",
-            i18n_kwargs={"access_mode": access_mode},
-        ),
-    )
 
-    try:
-        await remnawave_service.try_connection()
-    except Exception as exception:
-        logger.exception(f"Remnawave connection failed: {exception}")
-        error_type_name = type(exception).__name__
-        error_message = Text(str(exception)[:512])
-
-        await send_error_notification_task.kiq(
-            error_id=str(uuid.uuid4()),
-            traceback_str=traceback.format_exc(),
-            payload=build_system_event_payload(
-                i18n_key="ntf-event-error-remnawave",
-                i18n_kwargs={
-                    "error": f"{error_type_name}: {error_message.as_html()}",
-                },
-                severity="ERROR",
-                event_source="lifespan.remnawave",
-                entry_surface="BACKGROUND",
-                operation="startup_connection_check",
-                impact=(
-                    "Without a healthy Remnawave connection, bot and "
-                    "panel synchronization can degrade or stop."
-                ),
-                operator_hint=(
-                    "Verify Remnawave availability, credentials, "
-                    "cookies, and reverse-proxy connectivity."
-                ),
-            ),
-        )
+    is_leader = await leader.acquire()
+    # Renewal runs in the background, so slow startup jobs cannot outlive the lease.
+    await leader.start(
+        on_elected=start_cluster_jobs,
+        on_demoted=backup_service.stop_auto_backup,
+    )
+    if is_leader:
+        await start_cluster_jobs()
 
     yield
 
-    # Остановка автоматических бэкапов
-    await backup_service.stop_auto_backup()
+    is_leader = leader.is_leader
+    # Останавливает автоматические бэкапы вместе с лидерством
+    await leader.stop()
 
-    await send_system_notification_task.kiq(
-        ntf_type=SystemNotificationType.BOT_LIFETIME,
-        payload=MessagePayload.not_deleted(i18n_key="ntf-event-bot-shutdown"),
-    )
+    if is_leader:
+        await send_system_notification_task.kiq(
+            ntf_type=SystemNotificationType.BOT_LIFETIME,
+            payload=MessagePayload.not_deleted(i18n_key="ntf-event-bot-shutdown"),
+        )
 
     await telegram_webhook_endpoint.shutdown()
-    await command_service.delete()
-    await webhook_service.delete()
 
+    # Other workers keep serving after this one exits (restart, worker cycling) and a new
+    # leader does not set the webhook up again, so it is only removed by a lone worker.
+    if is_leader and config.workers == 1:
+        async with container(scope=Scope.REQUEST) as shutdown_container:
+            command_service: CommandService = await shutdown_container.get(CommandService)
+            webhook_service: WebhookService = await shutdown_container.get(WebhookService)
+            await command_service.delete()
+            await webhook_service.delete()
+
+    password_hasher.shutdown()
     await container.close()
+
+
+async def _start_cluster(
+    dispatcher: Dispatcher,
+    container: AsyncContainer,
+    access_mode: AccessMode,
+) -> None:
+    async with container(scope=Scope.REQUEST) as startup_container:
+        webhook_service: WebhookService = await startup_container.get(WebhookService)
+        command_service: CommandService = await startup_container.get(CommandService)
+        gateway_service: PaymentGatewayService = await startup_container.get(PaymentGatewayService)
+        remnawave_service: RemnawaveService = await startup_container.get(RemnawaveService)
+
+        await gateway_service.create_default()
+        await gateway_service.normalize_gateway_settings()
+
+        allowed_updates = dispatcher.resolve_used_update_types()
+
+        webhook_info: WebhookInfo = await webhook_service.setup(allowed_updates)
+
+        if webhook_service.has_error(webhook_info):
+            logger.critical(
+                f"Webhook has a last error message: '{webhook_info.last_error_message}'"
+            )
+            await send_system_notification_task.kiq(
+                ntf_type=SystemNotificationType.BOT_LIFETIME,
+                payload=build_system_event_payload(
+                    i18n_key="ntf-event-error-webhook",
+                    i18n_kwargs={
+                        "error": webhook_info.last_error_message or "Unknown webhook error"
+                    },
+                    severity="ERROR",
+                    event_source="lifespan.webhook",
+                    entry_surface="WEBHOOK",
+                    operation="webhook_setup",
+                    impact=(
+                        "Telegram updates may stop reaching the bot "
+                        "until webhook health is restored."
+                    ),
+                    operator_hint=(
+                        "Check the webhook URL, HTTPS availability, "
+                        "and the last Telegram webhook error."
+                    ),
+                ),
+            )
+
+        await command_service.setup()
+
+        await check_bot_update.kiq()
+        await recover_platega_webhooks_task.kiq()
+        await send_remnashop_notification_task.kiq()
+        await asyncio.sleep(2)
+        await send_system_notification_task.kiq(
+            ntf_type=SystemNotificationType.BOT_LIFETIME,
+            payload=MessagePayload.not_deleted(
+                i18n_key="ntf-event-bot-startup",
+                i18n_kwargs={"access_mode": access_mode},
+            ),
+        )
+
+        try:
+            await remnawave_service.try_connection()
+        except Exception as exception:
+            logger.exception(f"Remnawave connection failed: {exception}")
+            error_type_name = type(exception).__name__
+            error_message = Text(str(exception)[:512])
+
+            await send_error_notification_task.kiq(
+                error_id=str(uuid.uuid4()),
+                traceback_str=traceback.format_exc(),
+                payload=build_system_event_payload(
+                    i18n_key="ntf-event-error-remnawave",
+                    i18n_kwargs={
+                        "error": f"{error_type_name}: {error_message.as_html()}",
+                    },
+                    severity="ERROR",
+                    event_source="lifespan.remnawave",
+                    entry_surface="BACKGROUND",
+                    operation="startup_connection_check",
+                    impact=(
+                        "Without a healthy Remnawave connection, bot and "
+                        "panel synchronization can degrade or stop."
+                    ),
+                    operator_hint=(
+                        "Verify Remnawave availability, credentials, "
+                        "cookies, and reverse-proxy connectivity."
+                    ),
+                ),
+            )
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Optional, Union
+
+from aiogram.enums import ChatMemberStatus
+from aiogram.types import ChatMemberUpdated
+from loguru import logger
+
+from src.core.constants import (
+    CHANNEL_MEMBER_CACHE_TTL_SECONDS,
+    CHANNEL_NON_MEMBER_CACHE_TTL_SECONDS,
+)
+from src.core.observability import emit_counter
+from src.core.storage.keys import ChannelMemberStatusKey
+
+from .base import BaseService
+
+ChatId = Union[int, str]
+
+ALLOWED_CHANNEL_MEMBER_STATUSES = frozenset(
+    {
+        ChatMemberStatus.CREATOR,
+        ChatMemberStatus.ADMINISTRATOR,
+        ChatMemberStatus.MEMBER,
+    }
+)
+
+
+class ChannelMembershipService(BaseService):
+    """Channel membership lookups cached in Redis per ``(chat, user)``.
+
+    Entries are written on every ``getChatMember`` call and by ``chat_member`` updates,
+    under both the numeric chat id and ``@username`` so either way of configuring the
+    channel finds them.
+    """
+
+    async def get_status(
+        self,
+        chat_id: ChatId,
+        user_id: int,
+        *,
+        force_recheck: bool = False,
+    ) -> ChatMemberStatus:
+        """Return the member status; Telegram API errors propagate to the caller."""
+        if not force_recheck:
+            cached_status = await self._read(chat_id, user_id)
+            if cached_status is not None:
+                emit_counter("channel_member_cache_total", result="hit")
+                return cached_status
+
+        emit_counter("channel_member_cache_total", result="miss")
+        member = await self.bot.get_chat_member(chat_id=chat_id, user_id=user_id)
+        status = ChatMemberStatus(member.status)
+        await self._write([chat_id], user_id, status)
+        return status
+
+    async def record_update(self, update: ChatMemberUpdated) -> None:
+        chat_ids: list[ChatId] = [update.chat.id]
+        if update.chat.username:
+            chat_ids.append(f"@{update.chat.username}")
+
+        status = ChatMemberStatus(update.new_chat_member.status)
+        await self._write(chat_ids, update.new_chat_member.user.id, status)
+        logger.debug(
+            f"Channel '{update.chat.id}' member '{update.new_chat_member.user.id}' "
+            f"status updated to '{status}'"
+        )
+
+    @staticmethod
+    def is_allowed(status: ChatMemberStatus) -> bool:
+        return status in ALLOWED_CHANNEL_MEMBER_STATUSES
+
+    async def _read(self, chat_id: ChatId, user_id: int) -> Optional[ChatMemberStatus]:
+        key = self._key(chat_id, user_id)
+        try:
+            cached_value = await self.redis_client.get(key)
+        except Exception as exception:
+            logger.warning(f"Failed to read channel membership cache '{key}': {exception}")
+            return None
+
+        if cached_value is None:
+            return None
+        try:
+            return ChatMemberStatus(cached_value.decode())
+        except ValueError:
+            return None
+
+    async def _write(self, chat_ids: list[ChatId], user_id: int, status: ChatMemberStatus) -> None:
+        ttl = (
+            CHANNEL_MEMBER_CACHE_TTL_SECONDS
+            if self.is_allowed(status)
+            else CHANNEL_NON_MEMBER_CACHE_TTL_SECONDS
+        )
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for chat_id in chat_ids:
+                    pipe.setex(self._key(chat_id, user_id), ttl, status.value)
+                await pipe.execute()
+        except Exception as exception:
+            logger.warning(f"Failed to write channel membership cache for '{user_id}': {exception}")
+
+    @staticmethod
+    def _key(chat_id: ChatId, user_id: int) -> str:
+        chat = str(chat_id).strip().lower().replace(":", "_")
+        return ChannelMemberStatusKey(chat=chat, user_id=user_id).pack()
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 from loguru import logger
 
-from src.core.security.password import hash_password, verify_password
+from src.core.security.password import password_hasher
 from src.core.utils.branding import resolve_project_name
 from src.core.utils.time import datetime_now
 from src.infrastructure.database.models.dto import WebAccountDto
@@ -29,7 +29,7 @@ async def change_password(
 
     if not account:
         raise ValueError("Web account not found")
-    if not verify_password(current_password, account.password_hash):
+    if not await password_hasher.verify(current_password, account.password_hash):
         raise ValueError("Invalid current password")
 
     return await service._update_password(
@@ -49,6 +49,7 @@ async def issue_temporary_password_for_dev(
 
     temp_password = f"Tmp{secrets.randbelow(1_000_000):06d}"
     expires_at = datetime_now() + timedelta(seconds=ttl_seconds)
+    password_hash = await password_hasher.hash(temp_password)
 
     async with service.uow:
         account = await service.uow.repository.web_accounts.get_by_user_telegram_id(
@@ -59,7 +60,7 @@ async def issue_temporary_password_for_dev(
 
         updated_account = await service.uow.repository.web_accounts.update(
             account.id,
-            password_hash=hash_password(temp_password),
+            password_hash=password_hash,
             token_version=account.token_version + 1,
             requires_password_change=True,
             temporary_password_expires_at=expires_at,
@@ -83,6 +84,8 @@ async def update_password(
     web_account_id: int,
     new_password: str,
 ) -> WebAccountDto:
+    password_hash = await password_hasher.hash(new_password)
+
     async with service.uow:
         account = await service.uow.repository.web_accounts.get(web_account_id)
         if not account:
@@ -90,7 +93,7 @@ async def update_password(
 
         updated_account = await service.uow.repository.web_accounts.update(
             web_account_id,
-            password_hash=hash_password(new_password),
+            password_hash=password_hash,
             token_version=account.token_version + 1,
             requires_password_change=False,
             temporary_password_expires_at=None,
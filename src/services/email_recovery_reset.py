@@ -212,7 +212,7 @@ async def send_password_reset(
     )
     if not sent:
         logger.warning(
-            "Password reset email was not delivered to '{}'",
+            "Password reset email was not queued for '{}'",
             account.email_normalized,
         )
 
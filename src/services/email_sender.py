@@ -1,18 +1,53 @@
 from __future__ import annotations
 
-import asyncio
-import smtplib
 from email.message import EmailMessage
-from typing import Optional
+from time import time
+from typing import Any, Awaitable, Final, Optional, cast
+from uuid import uuid4
 
 from loguru import logger
 
 from src.core.config import AppConfig
+from src.core.observability import emit_counter
+from src.core.storage.keys import EmailOutboxKey
+from src.core.utils import json_utils
+from src.infrastructure.redis import RedisRepository
+from src.infrastructure.smtp import SmtpConnectionPool
+
+# A claimed entry stays in the outbox under a lease covering a whole batch sent at the SMTP
+# timeout per message plus this margin, so a crashed worker's batch becomes due again
+# instead of being lost, and an entry still being sent is never claimed twice.
+EMAIL_OUTBOX_LEASE_MARGIN_SECONDS: Final[float] = 60.0
+
+# Re-scores due entries under the lease in one step; returns the claimed entries.
+CLAIM_SCRIPT: Final[str] = """
+local entries = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, entry in ipairs(entries) do
+    redis.call('ZADD', KEYS[1], 'XX', ARGV[3], entry)
+end
+return entries
+"""
+
+# Replaces a claimed entry with its next attempt, unless it already left the outbox.
+RESCHEDULE_SCRIPT: Final[str] = """
+if redis.call('ZREM', KEYS[1], ARGV[1]) == 1 then
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[2])
+    return 1
+end
+return 0
+"""
 
 
 class EmailSenderService:
-    def __init__(self, config: AppConfig) -> None:
+    def __init__(
+        self,
+        config: AppConfig,
+        redis_repository: RedisRepository,
+        smtp_pool: SmtpConnectionPool,
+    ) -> None:
         self.config = config
+        self.redis_repository = redis_repository
+        self.smtp_pool = smtp_pool
 
     async def send(
         self,
@@ -22,6 +57,7 @@ class EmailSenderService:
         text_body: str,
         html_body: Optional[str] = None,
     ) -> bool:
+        """Queue an email in the Redis outbox; delivery happens in the taskiq worker."""
         email_cfg = self.config.email
         if (
             not email_cfg.enabled
@@ -34,42 +70,117 @@ class EmailSenderService:
             )
             return False
 
+        entry = {
+            "id": uuid4().hex,
+            "to_email": to_email,
+            "subject": subject,
+            "text_body": text_body,
+            "html_body": html_body,
+            "attempt": 1,
+        }
+        await self.redis_repository.sorted_collection_add(
+            EmailOutboxKey(),
+            {json_utils.encode(entry): time()},
+        )
+
+        from src.infrastructure.taskiq.tasks.emails import (  # noqa: PLC0415
+            deliver_email_outbox_task,
+        )
+
+        await cast(Any, deliver_email_outbox_task).kiq()
+        return True
+
+    async def deliver_outbox(self) -> int:
+        """Send due outbox entries in batches over pooled SMTP connections."""
+        delivered = 0
+
+        while True:
+            claimed = await self._claim_due_entries()
+            if not claimed:
+                return delivered
+
+            errors = await self.smtp_pool.send_batch(
+                [self._build_message(entry) for _, entry in claimed]
+            )
+            batch_delivered = 0
+            for (raw_entry, entry), error in zip(claimed, errors):
+                if error is None:
+                    await self.redis_repository.sorted_collection_remove(
+                        EmailOutboxKey(), raw_entry
+                    )
+                    batch_delivered += 1
+                    continue
+                await self._reschedule(raw_entry, entry, error)
+
+            delivered += batch_delivered
+            emit_counter(
+                "email_outbox_batches_total",
+                sent=batch_delivered,
+                failed=len(claimed) - batch_delivered,
+            )
+
+    async def _claim_due_entries(self) -> list[tuple[str, dict[str, Any]]]:
+        now = time()
+        email_cfg = self.config.email
+        lease_seconds = (
+            email_cfg.batch_size * email_cfg.timeout + EMAIL_OUTBOX_LEASE_MARGIN_SECONDS
+        )
+        raw_entries = await cast(
+            Awaitable[list[bytes]],
+            self.redis_repository.client.eval(
+                CLAIM_SCRIPT,
+                1,
+                EmailOutboxKey().pack(),
+                now,
+                email_cfg.batch_size,
+                now + lease_seconds,
+            ),
+        )
+        return [
+            (raw_entry.decode(), json_utils.decode(raw_entry.decode()))
+            for raw_entry in raw_entries
+        ]
+
+    async def _reschedule(self, raw_entry: str, entry: dict[str, Any], error: Exception) -> None:
+        attempt = int(entry.get("attempt", 1))
+        email_cfg = self.config.email
+
+        if attempt >= email_cfg.max_attempts:
+            logger.error(
+                f"Failed to send email to '{entry['to_email']}' after {attempt} attempt(s): {error}"
+            )
+            await self.redis_repository.sorted_collection_remove(EmailOutboxKey(), raw_entry)
+            emit_counter("email_outbox_dropped_total")
+            return
+
+        delay = email_cfg.retry_delay_seconds * 2 ** (attempt - 1)
+        logger.warning(
+            f"Failed to send email to '{entry['to_email']}' (attempt {attempt}), "
+            f"retrying in {delay}s: {error}"
+        )
+        await cast(
+            Awaitable[int],
+            self.redis_repository.client.eval(
+                RESCHEDULE_SCRIPT,
+                1,
+                EmailOutboxKey().pack(),
+                raw_entry,
+                json_utils.encode({**entry, "attempt": attempt + 1}),
+                time() + delay,
+            ),
+        )
+
+    def _build_message(self, entry: dict[str, Any]) -> EmailMessage:
+        email_cfg = self.config.email
         message = EmailMessage()
         sender_name = email_cfg.from_name.strip() if email_cfg.from_name else ""
         from_address = (
             f"{sender_name} <{email_cfg.from_address}>" if sender_name else email_cfg.from_address
         )
         message["From"] = from_address
-        message["To"] = to_email
-        message["Subject"] = subject
-        message.set_content(text_body)
-        if html_body:
-            message.add_alternative(html_body, subtype="html")
-
-        try:
-            await asyncio.to_thread(self._send_sync, message)
-            return True
-        except Exception as exc:
-            logger.error(f"Failed to send email to '{to_email}': {exc}")
-            return False
-
-    def _send_sync(self, message: EmailMessage) -> None:
-        email_cfg = self.config.email
-        username = email_cfg.username.get_secret_value() if email_cfg.username else None
-        password = email_cfg.password.get_secret_value() if email_cfg.password else None
-
-        if email_cfg.use_ssl:
-            with smtplib.SMTP_SSL(host=email_cfg.host, port=email_cfg.port, timeout=15) as smtp:
-                if username and password:
-                    smtp.login(username, password)
-                smtp.send_message(message)
-            return
-
-        with smtplib.SMTP(host=email_cfg.host, port=email_cfg.port, timeout=15) as smtp:
-            smtp.ehlo()
-            if email_cfg.use_tls:
-                smtp.starttls()
-                smtp.ehlo()
-            if username and password:
-                smtp.login(username, password)
-            smtp.send_message(message)
+        message["To"] = entry["to_email"]
+        message["Subject"] = entry["subject"]
+        message.set_content(entry["text_body"])
+        if entry.get("html_body"):
+            message.add_alternative(entry["html_body"], subtype="html")
+        return message
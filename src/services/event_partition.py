@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Final, Iterable, Optional
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.constants import (
+    EVENT_PARTITIONS_PRECREATE_MONTHS,
+    USER_NOTIFICATION_EVENTS_RETENTION_DAYS,
+    WEB_ANALYTICS_EVENTS_RETENTION_DAYS,
+)
+from src.core.observability import emit_counter
+from src.core.utils.time import datetime_now
+from src.infrastructure.database import UnitOfWork
+from src.infrastructure.database.repositories import RepositoriesFacade
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionedEventTable:
+    name: str
+    retention_days: int
+
+
+@dataclass(slots=True)
+class PartitionPlan:
+    to_create: list[datetime]
+    to_drop: list[str]
+
+
+PARTITIONED_EVENT_TABLES: Final[tuple[PartitionedEventTable, ...]] = (
+    PartitionedEventTable("user_notification_events", USER_NOTIFICATION_EVENTS_RETENTION_DAYS),
+    PartitionedEventTable("web_analytics_events", WEB_ANALYTICS_EVENTS_RETENTION_DAYS),
+)
+
+
+def month_start(value: datetime) -> datetime:
+    value = value.astimezone(timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def next_month_start(value: datetime) -> datetime:
+    start = month_start(value)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def partition_name(table: str, start: datetime) -> str:
+    return f"{table}_p{start:%Y%m}"
+
+
+def parse_partition_month(table: str, partition: str) -> Optional[datetime]:
+    prefix = f"{table}_p"
+    if not partition.startswith(prefix):
+        return None
+
+    suffix = partition.removeprefix(prefix)
+    if len(suffix) != 6 or not suffix.isdigit():
+        return None
+
+    try:
+        return datetime(int(suffix[:4]), int(suffix[4:]), 1, tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def retention_cutoff(retention_days: int, *, now: Optional[datetime] = None) -> datetime:
+    return (now or datetime_now()) - timedelta(days=retention_days)
+
+
+def plan_partitions(
+    table: PartitionedEventTable,
+    existing: Iterable[str],
+    *,
+    now: datetime,
+    months_ahead: int = EVENT_PARTITIONS_PRECREATE_MONTHS,
+) -> PartitionPlan:
+    existing_months = {
+        month
+        for month in (parse_partition_month(table.name, name) for name in existing)
+        if month is not None
+    }
+
+    to_create: list[datetime] = []
+    start = month_start(now)
+    for _ in range(months_ahead + 1):
+        if start not in existing_months:
+            to_create.append(start)
+        start = next_month_start(start)
+
+    # A partition is dropped only once every row it can hold is past retention.
+    cutoff = retention_cutoff(table.retention_days, now=now)
+    to_drop = [
+        partition_name(table.name, month)
+        for month in sorted(existing_months)
+        if next_month_start(month) <= cutoff
+    ]
+    return PartitionPlan(to_create=to_create, to_drop=to_drop)
+
+
+class EventPartitionService:
+    def __init__(
+        self,
+        uow: UnitOfWork,
+        session_pool: async_sessionmaker[AsyncSession],
+    ) -> None:
+        self.uow = uow
+        self.session_pool = session_pool
+
+    async def maintain(self) -> tuple[int, int]:
+        created_total = 0
+        dropped_total = 0
+        now = datetime_now()
+
+        for table in PARTITIONED_EVENT_TABLES:
+            async with self.uow:
+                repository = self.uow.repository.event_partitions
+                partitions = await repository.list_partitions(table.name)
+                plan = plan_partitions(table, partitions, now=now)
+
+                for start in plan.to_create:
+                    await repository.create_range_partition(
+                        table=table.name,
+                        partition=partition_name(table.name, start),
+                        start=start,
+                        end=next_month_start(start),
+                    )
+                await self.uow.commit()
+
+            for partition in plan.to_drop:
+                await self._detach_and_drop(table.name, partition)
+
+            if plan.to_create or plan.to_drop:
+                logger.info(
+                    f"Partitions of '{table.name}': created {len(plan.to_create)}, "
+                    f"dropped {plan.to_drop or 'none'}"
+                )
+            emit_counter(
+                "event_partitions_maintained_total",
+                table=table.name,
+                created=len(plan.to_create),
+                dropped=len(plan.to_drop),
+            )
+            created_total += len(plan.to_create)
+            dropped_total += len(plan.to_drop)
+
+        return created_total, dropped_total
+
+    async def _detach_and_drop(self, table: str, partition: str) -> None:
+        # DETACH ... CONCURRENTLY refuses to run inside a transaction block. The injected
+        # UoW may already hold an open session, so the detach gets a fresh one whose
+        # connection is switched to autocommit before its first statement.
+        async with self.session_pool() as session:
+            await RepositoriesFacade(session).event_partitions.drop_partition(
+                table=table,
+                partition=partition,
+            )
@@ -26,7 +26,11 @@ from src.infrastructure.database.models.dto import (
 )
 from src.infrastructure.database.models.dto.user import BaseUserDto
 from src.infrastructure.database.models.sql import PaymentWebhookEvent
-from src.infrastructure.payment_gateways import BasePaymentGateway, PaymentGatewayFactory
+from src.infrastructure.payment_gateways import (
+    BasePaymentGateway,
+    PaymentGatewayFactory,
+    PaymentGatewayRegistry,
+)
 from src.infrastructure.payment_gateways.platega import PlategaGateway
 from src.infrastructure.redis import RedisRepository
 from src.services.partner import PartnerService
@@ -102,6 +106,7 @@ class PaymentGatewayService(BaseService):
     transaction_service: TransactionService
     subscription_service: SubscriptionService
     payment_gateway_factory: PaymentGatewayFactory
+    payment_gateway_registry: PaymentGatewayRegistry
     payment_webhook_event_service: PaymentWebhookEventService
     referral_service: ReferralService
     partner_service: PartnerService
@@ -120,6 +125,7 @@ class PaymentGatewayService(BaseService):
         transaction_service: TransactionService,
         subscription_service: SubscriptionService,
         payment_gateway_factory: PaymentGatewayFactory,
+        payment_gateway_registry: PaymentGatewayRegistry,
         payment_webhook_event_service: PaymentWebhookEventService,
         referral_service: ReferralService,
         partner_service: PartnerService,
@@ -131,6 +137,7 @@ class PaymentGatewayService(BaseService):
         self.transaction_service = transaction_service
         self.subscription_service = subscription_service
         self.payment_gateway_factory = payment_gateway_factory
+        self.payment_gateway_registry = payment_gateway_registry
         self.payment_webhook_event_service = payment_webhook_event_service
         self.referral_service = referral_service
         self.partner_service = partner_service
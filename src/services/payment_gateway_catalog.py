@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from loguru import logger
@@ -84,6 +85,7 @@ async def create_default(service: PaymentGatewayService) -> None:
 
         db_payment_gateway = PaymentGateway(**payment_gateway.model_dump())
         db_payment_gateway = await service.uow.repository.gateways.create(db_payment_gateway)
+        service.uow.after_commit(partial(service.payment_gateway_registry.invalidate, gateway_type))
 
         logger.info(f"Payment gateway '{gateway_type}' created")
 
@@ -102,6 +104,9 @@ async def normalize_gateway_settings(service: PaymentGatewayService) -> None:
                     gateway_id=db_gateway.id,
                     currency=Currency.USD,
                 )
+                service.uow.after_commit(
+                    partial(service.payment_gateway_registry.invalidate, db_gateway.type)
+                )
                 logger.warning(
                     "Normalized CRYPTOPAY currency for gateway_id='{}'. '{}' -> '{}'",
                     db_gateway.id,
@@ -131,6 +136,9 @@ async def normalize_gateway_settings(service: PaymentGatewayService) -> None:
             gateway_id=db_gateway.id,
             settings=settings_data,
         )
+        service.uow.after_commit(
+            partial(service.payment_gateway_registry.invalidate, db_gateway.type)
+        )
         logger.warning(
             "Normalized PLATEGA settings for gateway_id='{}'. payment_method: '{}' -> '{}'",
             db_gateway.id,
@@ -134,6 +134,7 @@ async def _recover_single_platega_event(  # noqa: C901
         gateway_type=PaymentGatewayType.PLATEGA.value,
         payment_id=internal_payment_id,
         payload_hash=payload_hash,
+        payment_status=resolved_status.value,
     )
 
     if receive_result.already_processed:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional
 
 from loguru import logger
@@ -65,6 +66,8 @@ async def update(
     )
 
     if db_updated_gateway:
+        # Invalidated only once the caller commits, so no process can reload the old row.
+        service.uow.after_commit(partial(service.payment_gateway_registry.invalidate, gateway.type))
         logger.info(f"Payment gateway '{gateway.type}' updated successfully")
     else:
         logger.warning(
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
 from uuid import UUID
 
 from loguru import logger
 from sqlalchemy.exc import IntegrityError
 
+from src.core.constants import (
+    PAYMENT_WEBHOOK_LEASE_SECONDS,
+    PAYMENT_WEBHOOK_MAX_ATTEMPTS,
+    PAYMENT_WEBHOOK_RETRY_BASE_SECONDS,
+    PAYMENT_WEBHOOK_RETRY_BATCH_SIZE,
+)
 from src.core.utils.time import datetime_now
 from src.infrastructure.database.models.sql import PaymentWebhookEvent
 from src.infrastructure.database.uow import UnitOfWork
@@ -19,13 +27,46 @@ PAYMENT_WEBHOOK_STATUS_RECONCILED = "RECONCILED"
 PAYMENT_WEBHOOK_STATUS_RECONCILE_FAILED = "RECONCILE_FAILED"
 
 
+# A row is claimable in these states; PROCESSING rows only once their lease has expired.
+PAYMENT_WEBHOOK_CLAIMABLE_STATUSES = (
+    PAYMENT_WEBHOOK_STATUS_RECEIVED,
+    PAYMENT_WEBHOOK_STATUS_ENQUEUED,
+    PAYMENT_WEBHOOK_STATUS_FAILED,
+)
+
+
+def _dispatch_backstop() -> datetime:
+    # The endpoint kicks the worker right away; the sweep only steps in if that kick is lost.
+    return datetime_now() + timedelta(seconds=PAYMENT_WEBHOOK_RETRY_BASE_SECONDS)
+
+
 @dataclass(slots=True)
 class PaymentWebhookReceiveResult:
     event: PaymentWebhookEvent
     already_processed: bool
+    # False when a worker is processing the payment: it picks up the new payload itself.
+    needs_dispatch: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class PaymentWebhookClaim:
+    event_id: int
+    gateway_type: str
+    payment_id: UUID
+    payment_status: str
+    payload_hash: str
+    attempts: int
 
 
 class PaymentWebhookEventService:
+    """Inbox of verified payment webhooks, one row per gateway payment.
+
+    The endpoint only records the verified status and hands the payment to a worker.
+    A worker claims the row under a lease, so webhooks of one payment are never applied
+    concurrently; a webhook arriving meanwhile replaces the stored status and the claim
+    holder applies it next. Failed and abandoned rows are redispatched by the sweep.
+    """
+
     def __init__(self, uow: UnitOfWork) -> None:
         self.uow = uow
 
@@ -35,6 +76,7 @@ class PaymentWebhookEventService:
         gateway_type: str,
         payment_id: UUID,
         payload_hash: str,
+        payment_status: Optional[str] = None,
     ) -> PaymentWebhookReceiveResult:
         async with self.uow:
             existing = (
@@ -47,15 +89,33 @@ class PaymentWebhookEventService:
             if existing and existing.status == PAYMENT_WEBHOOK_STATUS_PROCESSED:
                 return PaymentWebhookReceiveResult(event=existing, already_processed=True)
 
+            if existing and existing.status == PAYMENT_WEBHOOK_STATUS_PROCESSING:
+                # Keep the claim and its lease; the new hash tells the worker to go again.
+                updated = await self.uow.repository.payment_webhook_events.update(
+                    existing.id,
+                    payload_hash=payload_hash,
+                    payment_status=payment_status or existing.payment_status,
+                    received_at=datetime_now(),
+                )
+                if updated is None:
+                    raise RuntimeError("Failed to update payment webhook inbox event")
+                await self.uow.commit()
+                return PaymentWebhookReceiveResult(
+                    event=updated,
+                    already_processed=False,
+                    needs_dispatch=False,
+                )
+
             if existing:
                 updated = await self.uow.repository.payment_webhook_events.update(
                     existing.id,
                     status=PAYMENT_WEBHOOK_STATUS_RECEIVED,
+                    payment_status=payment_status or existing.payment_status,
                     payload_hash=payload_hash,
-                    attempts=max(existing.attempts, 0) + 1,
                     last_error=None,
                     received_at=datetime_now(),
                     processed_at=None,
+                    next_attempt_at=_dispatch_backstop(),
                 )
                 if updated is None:
                     raise RuntimeError("Failed to update payment webhook inbox event")
@@ -66,10 +126,13 @@ class PaymentWebhookEventService:
                 gateway_type=gateway_type,
                 payment_id=payment_id,
                 status=PAYMENT_WEBHOOK_STATUS_RECEIVED,
+                payment_status=payment_status,
                 payload_hash=payload_hash,
-                attempts=1,
+                # Attempts are counted when a worker claims the row, not on receipt.
+                attempts=0,
                 last_error=None,
                 received_at=datetime_now(),
+                next_attempt_at=_dispatch_backstop(),
             )
 
             try:
@@ -87,11 +150,108 @@ class PaymentWebhookEventService:
                 return PaymentWebhookReceiveResult(
                     event=existing,
                     already_processed=existing.status == PAYMENT_WEBHOOK_STATUS_PROCESSED,
+                    needs_dispatch=existing.status != PAYMENT_WEBHOOK_STATUS_PROCESSING,
                 )
 
             await self.uow.commit()
             return PaymentWebhookReceiveResult(event=created, already_processed=False)
 
+    async def claim(
+        self,
+        *,
+        gateway_type: str,
+        payment_id: UUID,
+        payment_status: str,
+    ) -> Optional[PaymentWebhookClaim]:
+        """Lease the payment's row to this worker; ``None`` if it is done or held elsewhere.
+
+        ``payment_status`` only fills rows recorded before the inbox stored statuses; the
+        row's own status is newer than the one the task was kicked with.
+        """
+        now = datetime_now()
+        async with self.uow:
+            event = await self.uow.repository.payment_webhook_events.claim(
+                gateway_type,
+                payment_id,
+                claimable_statuses=PAYMENT_WEBHOOK_CLAIMABLE_STATUSES,
+                processing_status=PAYMENT_WEBHOOK_STATUS_PROCESSING,
+                payment_status=payment_status,
+                now=now,
+                lease_until=now + timedelta(seconds=PAYMENT_WEBHOOK_LEASE_SECONDS),
+            )
+            if event is None:
+                return None
+            await self.uow.commit()
+
+        return PaymentWebhookClaim(
+            event_id=event.id,
+            gateway_type=event.gateway_type,
+            payment_id=event.payment_id,
+            payment_status=event.payment_status or payment_status,
+            payload_hash=event.payload_hash,
+            attempts=event.attempts,
+        )
+
+    async def finish(self, claim: PaymentWebhookClaim, *, status: str) -> bool:
+        """Settle a claimed row; ``False`` if a newer webhook arrived and needs a dispatch."""
+        now = datetime_now()
+        async with self.uow:
+            finished = await self.uow.repository.payment_webhook_events.finish(
+                claim.event_id,
+                claim.payload_hash,
+                status=status,
+                next_attempt_at=None,
+                last_error=None,
+                processed_at=now if status == PAYMENT_WEBHOOK_STATUS_PROCESSED else None,
+            )
+            if not finished:
+                await self.uow.repository.payment_webhook_events.update(
+                    claim.event_id,
+                    status=PAYMENT_WEBHOOK_STATUS_RECEIVED,
+                    next_attempt_at=now,
+                )
+            await self.uow.commit()
+        return finished
+
+    async def fail(
+        self,
+        claim: PaymentWebhookClaim,
+        *,
+        error_message: str,
+        retry: bool,
+    ) -> None:
+        """Record a failed attempt, scheduling a retry with backoff while attempts remain."""
+        next_attempt_at = None
+        if retry and claim.attempts < PAYMENT_WEBHOOK_MAX_ATTEMPTS:
+            delay = PAYMENT_WEBHOOK_RETRY_BASE_SECONDS * 2 ** (claim.attempts - 1)
+            next_attempt_at = datetime_now() + timedelta(seconds=delay)
+
+        async with self.uow:
+            await self.uow.repository.payment_webhook_events.update(
+                claim.event_id,
+                status=PAYMENT_WEBHOOK_STATUS_FAILED,
+                last_error=error_message[:2048],
+                next_attempt_at=next_attempt_at,
+            )
+            await self.uow.commit()
+
+    async def take_due(
+        self,
+        *,
+        limit: int = PAYMENT_WEBHOOK_RETRY_BATCH_SIZE,
+    ) -> list[PaymentWebhookEvent]:
+        """Rows due for a dispatch: never dispatched, retries and expired leases."""
+        now = datetime_now()
+        async with self.uow:
+            events = await self.uow.repository.payment_webhook_events.take_due(
+                enqueued_status=PAYMENT_WEBHOOK_STATUS_ENQUEUED,
+                now=now,
+                lease_until=now + timedelta(seconds=PAYMENT_WEBHOOK_LEASE_SECONDS),
+                limit=limit,
+            )
+            await self.uow.commit()
+        return events
+
     async def mark_enqueued(self, *, gateway_type: str, payment_id: UUID) -> None:
         await self._mark_status(
             gateway_type=gateway_type,
@@ -106,6 +266,7 @@ class PaymentWebhookEventService:
             payment_id=payment_id,
             status=PAYMENT_WEBHOOK_STATUS_PROCESSING,
             last_error=None,
+            next_attempt_at=datetime_now() + timedelta(seconds=PAYMENT_WEBHOOK_LEASE_SECONDS),
         )
 
     async def mark_processed(self, *, gateway_type: str, payment_id: UUID) -> None:
@@ -175,6 +336,7 @@ class PaymentWebhookEventService:
         status: str,
         processed_at: object | None = None,
         last_error: str | None,
+        next_attempt_at: object | None = None,
     ) -> None:
         async with self.uow:
             event = await self.uow.repository.payment_webhook_events.get_by_gateway_and_payment_id(
@@ -193,9 +355,11 @@ class PaymentWebhookEventService:
                 )
                 return
 
+            # Rows marked outside a claim are settled or leased; the sweep leaves them alone.
             update_data: dict[str, object | None] = {
                 "status": status,
                 "last_error": last_error,
+                "next_attempt_at": next_attempt_at,
             }
             if processed_at is not None or status == PAYMENT_WEBHOOK_STATUS_PROCESSED:
                 update_data["processed_at"] = processed_at
@@ -7,7 +7,7 @@ from loguru import logger
 from src.core.enums import PromocodeRewardType
 from src.infrastructure.database.models.dto import PromocodeDto
 from src.infrastructure.database.models.dto.promocode import PromocodeActivationBaseDto
-from src.infrastructure.database.models.sql import Promocode, PromocodeActivation
+from src.infrastructure.database.models.sql import Promocode
 
 from .promocode_validation import ActivationError, ActivationResult
 
@@ -35,7 +35,9 @@ async def create(
     if existing_promocode:
         raise ValueError(f"Promocode with code '{promocode.code}' already exists")
 
-    data = promocode.model_dump(exclude={"id", "activations", "created_at", "updated_at"})
+    data = promocode.model_dump(
+        exclude={"id", "activations", "activations_count", "created_at", "updated_at"}
+    )
 
     if promocode.plan:
         data["plan"] = promocode.plan.model_dump(mode="json")
@@ -163,7 +165,7 @@ async def activate(
         return validation_result
 
     promocode = validation_result.promocode
-    if not promocode:
+    if not promocode or promocode.id is None:
         return ActivationResult(
             success=False,
             error=ActivationError.NOT_FOUND,
@@ -180,7 +182,9 @@ async def activate(
         ):
             reward_value = promocode.plan.duration
 
-        activation = PromocodeActivation(
+        # The unique (promocode, user) insert and the conditional counter update keep
+        # concurrent redemptions correct without loading the activation history.
+        activation_id = await service.uow.repository.promocodes.create_activation(
             promocode_id=promocode.id,
             user_telegram_id=user.telegram_id,
             promocode_code=promocode.code,
@@ -188,8 +192,21 @@ async def activate(
             reward_value=reward_value,
             target_subscription_id=target_subscription_id,
         )
-        service.uow.repository.promocodes.session.add(activation)
-        await service.uow.repository.promocodes.session.flush()
+        if activation_id is None:
+            await service.uow.rollback()
+            return ActivationResult(
+                success=False,
+                error=ActivationError.ALREADY_ACTIVATED,
+                message_key="ntf-promocode-already-activated",
+            )
+
+        if not await service.uow.repository.promocodes.claim_activation(promocode.id):
+            await service.uow.rollback()
+            return ActivationResult(
+                success=False,
+                error=ActivationError.DEPLETED,
+                message_key="ntf-promocode-depleted",
+            )
 
         reward_applied = await service._apply_reward(
             promocode=promocode,
@@ -243,7 +260,7 @@ async def get_activations_count(
     """Получение количества активаций промокода."""
     promocode = await service.get(promocode_id)
     if promocode:
-        return len(promocode.activations)
+        return promocode.activations_count
     return 0
 
 
@@ -42,14 +42,10 @@ async def check_user_activation(
     user_telegram_id: int,
 ) -> bool:
     """Return whether user has already activated this promocode."""
-    db_promocode = await service.uow.repository.promocodes.get(promocode_id)
-    if not db_promocode:
-        return False
-
-    for activation in db_promocode.activations:
-        if activation.user_telegram_id == user_telegram_id:
-            return True
-    return False
+    return await service.uow.repository.promocodes.has_user_activation(
+        promocode_id,
+        user_telegram_id,
+    )
 
 
 async def check_availability(
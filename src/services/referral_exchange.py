@@ -57,10 +57,13 @@ from .referral_exchange_values import (
     get_effective_points as _get_effective_points_impl,
 )
 from .remnawave import RemnawaveService
+from .request_loader import RequestDataLoader
 from .settings import SettingsService
 from .subscription import SubscriptionService
 from .user import UserService
 
+REFERRAL_EXCHANGE_OPTIONS_LOAD_NAMESPACE = "referral_exchange_options"
+
 
 class ReferralExchangeError(ValueError):
     def __init__(self, *, code: str, message: str) -> None:
@@ -125,6 +128,7 @@ class ReferralExchangeService(BaseService):
     plan_service: PlanService
     promocode_service: PromocodeService
     remnawave_service: RemnawaveService
+    request_loader: RequestDataLoader
 
     def __init__(
         self,
@@ -141,6 +145,7 @@ class ReferralExchangeService(BaseService):
         plan_service: PlanService,
         promocode_service: PromocodeService,
         remnawave_service: RemnawaveService,
+        request_loader: RequestDataLoader,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.uow = uow
@@ -150,6 +155,7 @@ class ReferralExchangeService(BaseService):
         self.plan_service = plan_service
         self.promocode_service = promocode_service
         self.remnawave_service = remnawave_service
+        self.request_loader = request_loader
 
     @staticmethod
     def _user_dto_from_model(model: Any) -> UserDto | None:
@@ -246,7 +252,10 @@ class ReferralExchangeService(BaseService):
         )
 
     async def get_options(self, *, user_telegram_id: int) -> ReferralExchangeOptions:
-        return await _get_options_impl(self, user_telegram_id=user_telegram_id)
+        return await self.request_loader.load(
+            (REFERRAL_EXCHANGE_OPTIONS_LOAD_NAMESPACE, user_telegram_id),
+            lambda: _get_options_impl(self, user_telegram_id=user_telegram_id),
+        )
 
     @staticmethod
     def _resolve_availability_reason(
@@ -281,13 +290,19 @@ class ReferralExchangeService(BaseService):
         subscription_id: int | None = None,
         gift_plan_id: int | None = None,
     ) -> ReferralExchangeExecutionResult:
-        return await _execute_impl(
-            self,
-            user_telegram_id=user_telegram_id,
-            exchange_type=exchange_type,
-            subscription_id=subscription_id,
-            gift_plan_id=gift_plan_id,
-        )
+        try:
+            return await _execute_impl(
+                self,
+                user_telegram_id=user_telegram_id,
+                exchange_type=exchange_type,
+                subscription_id=subscription_id,
+                gift_plan_id=gift_plan_id,
+            )
+        finally:
+            # Points and subscriptions changed, so later renders must rebuild the options.
+            self.request_loader.forget(
+                (REFERRAL_EXCHANGE_OPTIONS_LOAD_NAMESPACE, user_telegram_id)
+            )
 
     async def _execute_subscription_days(
         self,
@@ -116,7 +116,7 @@ async def get_exchangeable_subscriptions(
     service: ReferralExchangeService,
     user_telegram_id: int,
 ) -> list[SubscriptionDto]:
-    subscriptions = await service.subscription_service.get_all_by_user(user_telegram_id)
+    subscriptions = await service.subscription_service.load_all_by_user(user_telegram_id)
     return [
         subscription
         for subscription in subscriptions
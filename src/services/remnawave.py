@@ -6,6 +6,7 @@ from redis.asyncio import Redis
 from remnawave import RemnawaveSDK
 
 from src.core.config import AppConfig
+from src.infrastructure.http import HttpClientRegistry
 from src.infrastructure.redis import RedisRepository
 from src.services.plan import PlanService
 from src.services.remnawave_client import RemnawaveClientMixin
@@ -35,6 +36,7 @@ class RemnawaveService(
     BaseService,
 ):
     remnawave: RemnawaveSDK
+    http_clients: HttpClientRegistry
     user_service: UserService
     subscription_service: SubscriptionService
     plan_service: PlanService
@@ -49,6 +51,7 @@ class RemnawaveService(
         translator_hub: TranslatorHub,
         *,
         remnawave: RemnawaveSDK,
+        http_clients: HttpClientRegistry,
         user_service: UserService,
         subscription_service: SubscriptionService,
         plan_service: PlanService,
@@ -56,6 +59,7 @@ class RemnawaveService(
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.remnawave = remnawave
+        self.http_clients = http_clients
         self.user_service = user_service
         self.subscription_service = subscription_service
         self.plan_service = plan_service
@@ -38,12 +38,15 @@ def build_raw_api_client(
     *,
     timeout: Timeout | None = None,
 ) -> AsyncClient:
-    return AsyncClient(
-        base_url=service._build_raw_api_base_url(),
-        headers=service._build_raw_api_headers(),
-        cookies=service.config.remnawave.cookies,
-        verify=True,
-        timeout=timeout or service._build_raw_api_timeout(),
+    return cast(
+        AsyncClient,
+        service.http_clients.client(
+            service._build_raw_api_base_url(),
+            headers=service._build_raw_api_headers(),
+            cookies=service.config.remnawave.cookies,
+            verify=True,
+            timeout=timeout or service._build_raw_api_timeout(),
+        ),
     )
 
 
@@ -53,10 +56,11 @@ async def request_raw_api_response(
     *,
     timeout: Timeout | None = None,
 ) -> Response:
-    async with service._build_raw_api_client(timeout=timeout) as client:
-        response = await client.get(path)
-        response.raise_for_status()
-        return cast(Response, response)
+    # The client shares the registry's pooled transport, so it is not closed per call.
+    client = service._build_raw_api_client(timeout=timeout)
+    response = await client.get(path)
+    response.raise_for_status()
+    return cast(Response, response)
 
 
 async def request_raw_api_json(
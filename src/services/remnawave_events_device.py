@@ -5,9 +5,16 @@ from typing import Any, cast
 from loguru import logger
 
 from src.bot.keyboards import get_user_keyboard
-from src.core.enums import DeviceType, RemnaUserHwidDevicesEvent, SystemNotificationType
+from src.core.enums import (
+    DeviceType,
+    RemnaUserHwidDevicesEvent,
+    SystemNotificationType,
+    UserStreamEventType,
+)
 from src.core.utils.message_payload import MessagePayload
 
+from .user_event_stream import publish_user_event
+
 
 def normalize_platform_to_device_type(platform: str | None) -> DeviceType:
     platform_upper = (platform or "").upper()
@@ -46,6 +53,13 @@ async def handle_device_event(
         logger.warning("No local user found for telegram_id '{}'", remna_user.telegram_id)
         return
 
+    await publish_user_event(
+        service.redis_client,
+        user.telegram_id,
+        UserStreamEventType.DEVICE_CHANGED,
+        event=event,
+    )
+
     if event == RemnaUserHwidDevicesEvent.ADDED:
         logger.debug("Device '{}' added for RemnaUser '{}'", device.hwid, remna_user.telegram_id)
         i18n_key = "ntf-event-user-hwid-added"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import AbstractAsyncContextManager
 from typing import TYPE_CHECKING, Any, Optional, Sequence
 from uuid import UUID
 
@@ -12,12 +13,20 @@ from src.infrastructure.database.models.dto import (
 )
 
 from . import remnawave_sync_crud, remnawave_sync_group, remnawave_sync_plan_resolution
+from .remnawave_sync_plan_resolution import PlanResolutionIndex
 
 if TYPE_CHECKING:
     from .remnawave import PanelSyncStats
 
 
 class RemnawaveSyncMixin:
+    _plan_resolution_index: Optional[PlanResolutionIndex] = None
+
+    def plan_resolution_scope(
+        self,
+    ) -> AbstractAsyncContextManager[Optional[PlanResolutionIndex]]:
+        return remnawave_sync_plan_resolution.plan_resolution_scope(self)
+
     async def create_user(
         self,
         user: UserDto,
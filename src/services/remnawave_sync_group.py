@@ -219,18 +219,19 @@ async def sync_profiles_by_telegram_id(
         f"with '{len(remna_users)}' profile(s)"
     )
 
-    for remna_user in remna_users:
-        if not service._validate_group_sync_profile_telegram_id(
-            remna_user=remna_user,
-            telegram_id=telegram_id,
-        ):
-            continue
-
-        await service._sync_group_profile(
-            remna_user=remna_user,
-            telegram_id=telegram_id,
-            stats=stats,
-        )
+    async with service.plan_resolution_scope():
+        for remna_user in remna_users:
+            if not service._validate_group_sync_profile_telegram_id(
+                remna_user=remna_user,
+                telegram_id=telegram_id,
+            ):
+                continue
+
+            await service._sync_group_profile(
+                remna_user=remna_user,
+                telegram_id=telegram_id,
+                stats=stats,
+            )
 
     await service._restore_group_sync_current_subscription(
         telegram_id=telegram_id,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Optional, cast
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Optional, Sequence, cast
 from uuid import UUID
 
 from loguru import logger
@@ -12,6 +14,94 @@ from src.infrastructure.database.models.dto import (
     SubscriptionDto,
 )
 
+PlanLimitsKey = tuple[int, int, tuple[str, ...], Optional[UUID]]
+
+
+@dataclass(slots=True)
+class PlanResolutionIndex:
+    by_tag: dict[str, PlanDto] = field(default_factory=dict)
+    by_limits: dict[PlanLimitsKey, list[PlanDto]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, plans: Sequence[PlanDto]) -> PlanResolutionIndex:
+        index = cls()
+        ordered_plans = sorted(plans, key=lambda plan: (plan.order_index, plan.id or 0))
+
+        for plan in ordered_plans:
+            if plan.tag:
+                index.by_tag.setdefault(plan.tag, plan)
+
+            if not plan.is_active:
+                continue
+
+            key = _build_limits_key(
+                traffic_limit=plan.traffic_limit,
+                device_limit=plan.device_limit,
+                internal_squads=plan.internal_squads,
+                external_squad=plan.external_squad,
+            )
+            index.by_limits.setdefault(key, []).append(plan)
+
+        return index
+
+    def get_by_tag(self, tag: str) -> Optional[PlanDto]:
+        return self.by_tag.get(tag)
+
+    def find_by_limits(self, remna_subscription: RemnaSubscriptionDto) -> list[PlanDto]:
+        key = _build_limits_key(
+            traffic_limit=remna_subscription.traffic_limit,
+            device_limit=remna_subscription.device_limit,
+            internal_squads=remna_subscription.internal_squads,
+            external_squad=remna_subscription.external_squad,
+        )
+        candidates = self.by_limits.get(key, [])
+        strategy = remna_subscription.traffic_limit_strategy
+        if strategy is None:
+            return list(candidates)
+
+        return [plan for plan in candidates if plan.traffic_limit_strategy == strategy]
+
+
+def _build_limits_key(
+    *,
+    traffic_limit: int,
+    device_limit: int,
+    internal_squads: list[UUID],
+    external_squad: Optional[UUID],
+) -> PlanLimitsKey:
+    return (
+        traffic_limit,
+        device_limit,
+        tuple(_normalize_squads(internal_squads)),
+        external_squad,
+    )
+
+
+@asynccontextmanager
+async def plan_resolution_scope(service: Any) -> AsyncIterator[Optional[PlanResolutionIndex]]:
+    existing_index = cast(Optional[PlanResolutionIndex], service._plan_resolution_index)
+    if existing_index is not None:
+        yield existing_index
+        return
+
+    try:
+        plans = cast(list[PlanDto], await service.plan_service.get_all())
+    except Exception as exception:
+        logger.exception(f"Error loading plans for sync plan resolution index: {exception}")
+        yield None
+        return
+
+    index = PlanResolutionIndex.build(plans)
+    logger.debug(
+        f"Built sync plan resolution index: '{len(plans)}' plan(s), "
+        f"'{len(index.by_tag)}' tag(s), '{len(index.by_limits)}' limits key(s)"
+    )
+    service._plan_resolution_index = index
+    try:
+        yield index
+    finally:
+        service._plan_resolution_index = None
+
 
 async def _resolve_plan_by_tag(
     service: Any,
@@ -24,8 +114,12 @@ async def _resolve_plan_by_tag(
         )
         return None
 
+    index = cast(Optional[PlanResolutionIndex], service._plan_resolution_index)
     try:
-        plan = cast(Optional[PlanDto], await service.plan_service.get_by_tag(plan_tag))
+        if index is not None:
+            plan = index.get_by_tag(plan_tag)
+        else:
+            plan = cast(Optional[PlanDto], await service.plan_service.get_by_tag(plan_tag))
     except Exception as exception:
         logger.exception(
             f"Error getting plan by tag '{plan_tag}' for user '{telegram_id}': {exception}"
@@ -48,21 +142,24 @@ async def _resolve_plan_by_limits(
     remna_subscription: RemnaSubscriptionDto,
     telegram_id: int,
 ) -> Optional[PlanDto]:
-    try:
-        plans = cast(list[PlanDto], await service.plan_service.get_all())
-    except Exception as exception:
-        logger.exception(
-            f"Error loading plans for limits-based sync match for user '{telegram_id}': "
-            f"{exception}"
-        )
-        return None
-
-    active_plans = [plan for plan in plans if plan.is_active]
-    matches = [
-        plan
-        for plan in active_plans
-        if _plan_matches_subscription_limits(plan, remna_subscription)
-    ]
+    index = cast(Optional[PlanResolutionIndex], service._plan_resolution_index)
+    if index is not None:
+        matches = index.find_by_limits(remna_subscription)
+    else:
+        try:
+            plans = cast(list[PlanDto], await service.plan_service.get_all())
+        except Exception as exception:
+            logger.exception(
+                f"Error loading plans for limits-based sync match for user '{telegram_id}': "
+                f"{exception}"
+            )
+            return None
+
+        matches = [
+            plan
+            for plan in plans
+            if plan.is_active and _plan_matches_subscription_limits(plan, remna_subscription)
+        ]
 
     if not matches:
         logger.debug(
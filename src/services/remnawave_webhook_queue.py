@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Final, Optional, cast
+
+from loguru import logger
+from redis.asyncio import Redis
+from remnawave.controllers import WebhookUtility
+from remnawave.models.webhook import NodeDto, UserDto, UserHwidDeviceEventDto, WebhookPayloadDto
+
+from src.core.constants import (
+    REMNAWAVE_WEBHOOK_CLAIM_BATCH_SIZE,
+    REMNAWAVE_WEBHOOK_COALESCE_SECONDS,
+    REMNAWAVE_WEBHOOK_DEDUP_TTL_SECONDS,
+    REMNAWAVE_WEBHOOK_DRAIN_LOCK_SECONDS,
+    REMNAWAVE_WEBHOOK_DRAIN_MAX_SECONDS,
+    REMNAWAVE_WEBHOOK_LEASE_SECONDS,
+    REMNAWAVE_WEBHOOK_MAX_ATTEMPTS,
+)
+from src.core.enums import RemnawaveWebhookEnqueueResult
+from src.core.observability import emit_counter
+from src.core.storage.keys import (
+    RemnawaveWebhookAttemptsKey,
+    RemnawaveWebhookDrainKey,
+    RemnawaveWebhookDrainLockKey,
+    RemnawaveWebhookInflightKey,
+    RemnawaveWebhookPendingKey,
+    RemnawaveWebhookQueueKey,
+    RemnawaveWebhookSeenKey,
+    RemnawaveWebhookSequenceKey,
+)
+from src.infrastructure.redis.leader import RELEASE_LEASE_SCRIPT, RENEW_LEASE_SCRIPT
+
+# Stores the event in its entity's slot map (one slot per event type, or per device for
+# device events) and schedules the entity unless it is already queued or claimed.
+# Returns -1 for a duplicate delivery, 1 when the entity was scheduled, 0 when coalesced.
+ENQUEUE_SCRIPT: Final[str] = """
+if not redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[5]) then
+    return -1
+end
+local raw = redis.call('HGET', KEYS[2], ARGV[1])
+local slots = raw and cjson.decode(raw) or {}
+slots[ARGV[2]] = {redis.call('INCR', KEYS[4]), ARGV[3]}
+redis.call('HSET', KEYS[2], ARGV[1], cjson.encode(slots))
+return redis.call('ZADD', KEYS[3], 'NX', ARGV[4], ARGV[1])
+"""
+
+# Moves due entities' events to the in-flight hash and leases them. A due entity that still
+# has in-flight events was never acknowledged (its lease expired) and is retried, merged
+# with anything queued since.
+CLAIM_SCRIPT: Final[str] = """
+local entities = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[3])
+local claimed = {}
+for _, entity in ipairs(entities) do
+    local pending = redis.call('HGET', KEYS[2], entity)
+    local inflight = redis.call('HGET', KEYS[3], entity)
+    local slots = pending
+    if inflight and pending then
+        local merged = cjson.decode(inflight)
+        for slot, value in pairs(cjson.decode(pending)) do
+            merged[slot] = value
+        end
+        slots = cjson.encode(merged)
+    elseif inflight then
+        slots = inflight
+    end
+
+    if slots then
+        redis.call('HDEL', KEYS[2], entity)
+        redis.call('HSET', KEYS[3], entity, slots)
+        redis.call('ZADD', KEYS[1], ARGV[2], entity)
+        table.insert(claimed, entity)
+        table.insert(claimed, slots)
+    else
+        redis.call('ZREM', KEYS[1], entity)
+    end
+end
+return claimed
+"""
+
+# Drops the acknowledged events and the entity's failed attempts; events queued meanwhile
+# get a fresh coalescing window. Returns 1 when the entity was rescheduled.
+ACK_SCRIPT: Final[str] = """
+redis.call('HDEL', KEYS[3], ARGV[1])
+redis.call('HDEL', KEYS[4], ARGV[1])
+if redis.call('HEXISTS', KEYS[2], ARGV[1]) == 1 then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+    return 1
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+return 0
+"""
+
+
+@dataclass(slots=True, frozen=True)
+class ClaimedWebhookEvents:
+    entity: str
+    payloads: list[str]  # Raw webhook bodies in arrival order
+
+
+def webhook_entity_and_slot(payload: WebhookPayloadDto) -> Optional[tuple[str, str]]:
+    """Entity whose events are applied in order, and the slot later events overwrite."""
+    event = payload.event
+    data = WebhookUtility.get_typed_data(payload)
+    if WebhookUtility.is_user_event(event):
+        return f"user:{cast(UserDto, data).uuid}", event
+    if WebhookUtility.is_user_hwid_devices_event(event):
+        device_event = cast(UserHwidDeviceEventDto, data)
+        return (
+            f"user:{device_event.user.uuid}",
+            f"{event}:{device_event.hwid_user_device.hwid}",
+        )
+    if WebhookUtility.is_node_event(event):
+        return f"node:{cast(NodeDto, data).uuid}", event
+    return None
+
+
+class RemnawaveWebhookQueueService:
+    """Durable Redis queue between the Remnawave webhook endpoint and the taskiq worker.
+
+    Receipt only verifies, deduplicates and stores the event. Events are grouped per user
+    or node and applied after a short coalescing window, so a burst of events for one
+    entity is applied once with the latest payload of each event type. An entity is
+    claimed by one worker at a time under a lease and its events are applied in arrival
+    order; a crashed worker's claim becomes due again when the lease runs out. A single
+    drainer at a time hands due entities to processing tasks.
+    """
+
+    def __init__(self, redis_client: Redis) -> None:
+        self.redis_client = redis_client
+        self.queue_key = RemnawaveWebhookQueueKey().pack()
+        self.pending_key = RemnawaveWebhookPendingKey().pack()
+        self.inflight_key = RemnawaveWebhookInflightKey().pack()
+        self.attempts_key = RemnawaveWebhookAttemptsKey().pack()
+        self.drain_key = RemnawaveWebhookDrainKey().pack()
+        self.drain_lock_key = RemnawaveWebhookDrainLockKey().pack()
+
+    async def enqueue(
+        self,
+        payload: WebhookPayloadDto,
+        raw_body: bytes,
+    ) -> RemnawaveWebhookEnqueueResult:
+        digest = hashlib.sha256(raw_body).hexdigest()
+        # Events of other kinds have nothing to coalesce with; each is its own entity.
+        entity, slot = webhook_entity_and_slot(payload) or (f"event:{digest}", payload.event)
+        now = await self._server_time()
+
+        scheduled = await cast(
+            Awaitable[int],
+            self.redis_client.eval(
+                ENQUEUE_SCRIPT,
+                4,
+                RemnawaveWebhookSeenKey(digest=digest).pack(),
+                self.pending_key,
+                self.queue_key,
+                RemnawaveWebhookSequenceKey().pack(),
+                entity,
+                slot,
+                raw_body.decode("utf-8"),
+                now + REMNAWAVE_WEBHOOK_COALESCE_SECONDS,
+                REMNAWAVE_WEBHOOK_DEDUP_TTL_SECONDS,
+            ),
+        )
+        result = {
+            -1: RemnawaveWebhookEnqueueResult.DUPLICATE,
+            0: RemnawaveWebhookEnqueueResult.COALESCED,
+        }.get(int(scheduled), RemnawaveWebhookEnqueueResult.QUEUED)
+        emit_counter("remnawave_webhook_enqueued_total", result=result.value)
+
+        if result == RemnawaveWebhookEnqueueResult.QUEUED:
+            await self._schedule_drain()
+        return result
+
+    async def drain(self) -> int:
+        """Hand due entities to processing tasks until nothing is due within the window.
+
+        Returns right away when another drainer holds the lock; that drainer picks up
+        whatever this kick was for.
+        """
+        from src.infrastructure.taskiq.tasks.remnawave import (  # noqa: PLC0415
+            process_remnawave_webhook_task,
+        )
+
+        token = uuid.uuid4().hex
+        if not await self.redis_client.set(
+            self.drain_lock_key,
+            token,
+            nx=True,
+            ex=REMNAWAVE_WEBHOOK_DRAIN_LOCK_SECONDS,
+        ):
+            return 0
+
+        dispatched = 0
+        deadline = time.monotonic() + REMNAWAVE_WEBHOOK_DRAIN_MAX_SECONDS
+        try:
+            while time.monotonic() < deadline:
+                claimed = await self.claim_due()
+                for events in claimed:
+                    await cast(Any, process_remnawave_webhook_task).kiq(
+                        entity=events.entity,
+                        payloads=events.payloads,
+                    )
+                dispatched += len(claimed)
+                if not await self._renew_drain_lock(token):
+                    logger.warning("Remnawave webhook drain lock expired, stopping this drainer")
+                    return dispatched
+                if claimed:
+                    continue
+
+                delay = await self._next_due_in()
+                if delay is None or delay > REMNAWAVE_WEBHOOK_COALESCE_SECONDS:
+                    break
+                await asyncio.sleep(max(delay, 0.05))
+        finally:
+            await self._release_drain_lock(token)
+
+        # Receipts that saw the lock still held kicked no drain; hand their entities (and
+        # anything left at the deadline) to a fresh drainer.
+        delay = await self._next_due_in()
+        if delay is not None and delay <= REMNAWAVE_WEBHOOK_COALESCE_SECONDS:
+            await self._schedule_drain()
+        return dispatched
+
+    async def claim_due(self) -> list[ClaimedWebhookEvents]:
+        now = await self._server_time()
+        raw = await cast(
+            Awaitable[list[Any]],
+            self.redis_client.eval(
+                CLAIM_SCRIPT,
+                3,
+                self.queue_key,
+                self.pending_key,
+                self.inflight_key,
+                now,
+                now + REMNAWAVE_WEBHOOK_LEASE_SECONDS,
+                REMNAWAVE_WEBHOOK_CLAIM_BATCH_SIZE,
+            ),
+        )
+
+        claimed: list[ClaimedWebhookEvents] = []
+        for entity, slots in zip(raw[::2], raw[1::2]):
+            ordered = sorted(json.loads(slots).values(), key=lambda slot: slot[0])
+            claimed.append(
+                ClaimedWebhookEvents(
+                    entity=entity.decode() if isinstance(entity, bytes) else entity,
+                    payloads=[body for _, body in ordered],
+                )
+            )
+        return claimed
+
+    async def ack(self, entity: str) -> None:
+        now = await self._server_time()
+        rescheduled = await cast(
+            Awaitable[int],
+            self.redis_client.eval(
+                ACK_SCRIPT,
+                4,
+                self.queue_key,
+                self.pending_key,
+                self.inflight_key,
+                self.attempts_key,
+                entity,
+                now + REMNAWAVE_WEBHOOK_COALESCE_SECONDS,
+            ),
+        )
+        if int(rescheduled):
+            # Events that arrived while the entity was claimed need a drain of their own.
+            await self._schedule_drain()
+
+    async def fail(self, entity: str) -> bool:
+        """Leave a claimed entity's events for redelivery once its lease runs out.
+
+        Returns False when the entity has failed too often; its events are dropped then.
+        """
+        attempts = await cast(
+            Awaitable[int],
+            self.redis_client.hincrby(self.attempts_key, entity, 1),
+        )
+        if attempts < REMNAWAVE_WEBHOOK_MAX_ATTEMPTS:
+            emit_counter("remnawave_webhook_retried_total")
+            return True
+
+        logger.error(f"Dropping Remnawave webhook events for '{entity}' after {attempts} attempts")
+        emit_counter("remnawave_webhook_dropped_total")
+        await self.ack(entity)
+        return False
+
+    async def _schedule_drain(self) -> None:
+        # The running drainer picks up new entities itself. Otherwise at most one drain is
+        # kicked per window; the cron run covers anything left behind.
+        if await self.redis_client.exists(self.drain_lock_key):
+            return
+        scheduled = await self.redis_client.set(
+            self.drain_key,
+            "1",
+            nx=True,
+            px=int(REMNAWAVE_WEBHOOK_COALESCE_SECONDS * 1000),
+        )
+        if not scheduled:
+            return
+
+        from src.infrastructure.taskiq.tasks.remnawave import (  # noqa: PLC0415
+            drain_remnawave_webhooks_task,
+        )
+
+        try:
+            await cast(Any, drain_remnawave_webhooks_task).kiq()
+        except Exception as exception:
+            logger.warning(f"Failed to schedule Remnawave webhook drain: {exception}")
+
+    async def _renew_drain_lock(self, token: str) -> bool:
+        renewed = await cast(
+            Awaitable[int],
+            self.redis_client.eval(
+                RENEW_LEASE_SCRIPT,
+                1,
+                self.drain_lock_key,
+                token,
+                REMNAWAVE_WEBHOOK_DRAIN_LOCK_SECONDS * 1000,
+            ),
+        )
+        return bool(int(renewed))
+
+    async def _release_drain_lock(self, token: str) -> None:
+        try:
+            await cast(
+                Awaitable[int],
+                self.redis_client.eval(RELEASE_LEASE_SCRIPT, 1, self.drain_lock_key, token),
+            )
+            # Let the next receipt kick a drain without waiting out the kick window.
+            await self.redis_client.delete(self.drain_key)
+        except Exception as exception:
+            logger.warning(f"Failed to release Remnawave webhook drain lock: {exception}")
+
+    async def _next_due_in(self) -> Optional[float]:
+        head = await self.redis_client.zrange(self.queue_key, 0, 0, withscores=True)
+        if not head:
+            return None
+        return float(head[0][1]) - await self._server_time()
+
+    async def _server_time(self) -> float:
+        seconds, microseconds = await self.redis_client.time()
+        return int(seconds) + int(microseconds) / 1_000_000
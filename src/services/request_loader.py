@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping, Sequence
+from typing import Any, Optional, TypeVar
+
+from src.core.observability import emit_counter
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchLoadFn = Callable[[list[K]], Awaitable[Mapping[K, V]]]
+
+
+class RequestDataLoader:
+    """Per-request memoization and batching of read loads.
+
+    Lives in the Dishka REQUEST scope, i.e. one instance per bot update or API request.
+    Identical loads share a single in-flight call, and ``load_by_id`` lookups issued
+    in the same event-loop tick are coalesced into one batch call. Writers must call
+    ``forget`` for the keys they invalidate.
+    """
+
+    def __init__(self) -> None:
+        self._loads: dict[Hashable, asyncio.Future[Any]] = {}
+        self._pending_batches: dict[str, dict[Hashable, asyncio.Future[Any]]] = {}
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        future = self._loads.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            future.add_done_callback(lambda done: self._evict_failed(key, done))
+            self._loads[key] = future
+        else:
+            emit_counter("request_loader_hits_total", kind="load")
+        # Shielded so one cancelled waiter does not cancel the load for the others.
+        return await asyncio.shield(future)
+
+    async def load_by_id(
+        self,
+        namespace: str,
+        item_id: K,
+        batch: BatchLoadFn[K, V],
+    ) -> Optional[V]:
+        key = (namespace, item_id)
+        future = self._loads.get(key)
+        if future is not None:
+            emit_counter("request_loader_hits_total", kind="batch")
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda done: self._evict_failed(key, done))
+        self._loads[key] = future
+
+        pending = self._pending_batches.get(namespace)
+        if pending is None:
+            pending = {}
+            self._pending_batches[namespace] = pending
+            asyncio.get_running_loop().call_soon(self._dispatch_batch, namespace, batch)
+        pending[item_id] = future
+        return await asyncio.shield(future)
+
+    async def load_many(
+        self,
+        namespace: str,
+        item_ids: Sequence[K],
+        batch: BatchLoadFn[K, V],
+    ) -> list[Optional[V]]:
+        return list(
+            await asyncio.gather(
+                *(self.load_by_id(namespace, item_id, batch) for item_id in item_ids)
+            )
+        )
+
+    def forget(self, key: Hashable) -> None:
+        self._loads.pop(key, None)
+
+    def forget_namespace(self, namespace: str) -> None:
+        stale_keys = [
+            key for key in self._loads if isinstance(key, tuple) and key[:1] == (namespace,)
+        ]
+        for key in stale_keys:
+            del self._loads[key]
+
+    def _dispatch_batch(self, namespace: str, batch: BatchLoadFn[Any, Any]) -> None:
+        pending = self._pending_batches.pop(namespace, {})
+        if pending:
+            task = asyncio.ensure_future(self._run_batch(pending, batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self,
+        pending: dict[Hashable, asyncio.Future[Any]],
+        batch: BatchLoadFn[Any, Any],
+    ) -> None:
+        emit_counter("request_loader_batches_total", size=len(pending))
+        try:
+            results = await batch(list(pending))
+        except Exception as exception:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(exception)
+            return
+
+        for item_id, future in pending.items():
+            if not future.done():
+                future.set_result(results.get(item_id))
+
+    def _evict_failed(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            if self._loads.get(key) is future:
+                del self._loads[key]
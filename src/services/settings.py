@@ -6,7 +6,7 @@ from loguru import logger
 from redis.asyncio import Redis
 
 from src.core.config import AppConfig
-from src.core.constants import MAX_SUBSCRIPTIONS_PER_USER, TIME_10M
+from src.core.constants import MAX_SUBSCRIPTIONS_PER_USER, TIME_1M, TIME_10M
 from src.core.enums import (
     AccessMode,
     Currency,
@@ -42,15 +42,19 @@ from src.infrastructure.redis import RedisRepository
 from src.infrastructure.redis.cache import redis_cache
 
 from .base import BaseService
+from .request_loader import RequestDataLoader
 from .settings_helpers import (
     normalize_settings_for_update,
     resolve_effective_max_subscriptions,
     resolve_partner_balance_currency,
 )
 
+SETTINGS_LOAD_KEY = "settings"
+
 
 class SettingsService(BaseService):
     uow: UnitOfWork
+    request_loader: RequestDataLoader
 
     def __init__(
         self,
@@ -61,9 +65,11 @@ class SettingsService(BaseService):
         translator_hub: TranslatorHub,
         #
         uow: UnitOfWork,
+        request_loader: RequestDataLoader,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.uow = uow
+        self.request_loader = request_loader
 
     async def create(self) -> SettingsDto:
         settings = SettingsDto()
@@ -74,8 +80,13 @@ class SettingsService(BaseService):
         logger.info("Default settings created in DB")
         return cast(SettingsDto, SettingsDto.from_model(db_settings))
 
-    @redis_cache(prefix="get_settings", ttl=TIME_10M)
     async def get(self) -> SettingsDto:
+        settings = await self.request_loader.load(SETTINGS_LOAD_KEY, self._load)
+        # Callers mutate and track changes on the returned DTO, so each gets its own copy.
+        return settings.model_copy(deep=True)
+
+    @redis_cache(prefix="get_settings", ttl=TIME_10M, stale_ttl=TIME_1M)
+    async def _load(self) -> SettingsDto:
         db_settings = await self.uow.repository.settings.get()
         if not db_settings:
             return await self.create()
@@ -288,6 +299,7 @@ class SettingsService(BaseService):
 
     #
     async def _clear_cache(self) -> None:
+        self.request_loader.forget(SETTINGS_LOAD_KEY)
         settings_cache_key: str = build_key("cache", "get_settings")
         logger.debug(f"Cache '{settings_cache_key}' cleared")
         await self.redis_client.delete(settings_cache_key)
@@ -15,12 +15,16 @@ from src.infrastructure.redis import RedisRepository
 from src.services.user import UserService
 
 from .base import BaseService
+from .request_loader import RequestDataLoader
 from .subscription_core import (
     create as _create_impl,
 )
 from .subscription_core import (
     delete_subscription as _delete_subscription_impl,
 )
+from .subscription_core import (
+    delete_subscriptions as _delete_subscriptions_impl,
+)
 from .subscription_core import (
     get as _get_impl,
 )
@@ -48,7 +52,7 @@ from .subscription_queries import (
     get_current as _get_current_impl,
 )
 from .subscription_queries import (
-    get_expired_subscriptions_older_than as _get_expired_subscriptions_older_than_impl,
+    get_expired_subscription_refs_page as _get_expired_subscription_refs_page_impl,
 )
 from .subscription_queries import (
     get_expired_users as _get_expired_users_impl,
@@ -72,10 +76,13 @@ from .subscription_queries import (
     has_used_trial as _has_used_trial_impl,
 )
 
+USER_SUBSCRIPTIONS_LOAD_NAMESPACE = "user_subscriptions"
+
 
 class SubscriptionService(BaseService):
     uow: UnitOfWork
     user_service: UserService
+    request_loader: RequestDataLoader
     _CREATE_EXCLUDE_FIELDS = {
         "id",
         "user",
@@ -108,10 +115,12 @@ class SubscriptionService(BaseService):
         #
         uow: UnitOfWork,
         user_service: UserService,
+        request_loader: RequestDataLoader,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.uow = uow
         self.user_service = user_service
+        self.request_loader = request_loader
 
     @staticmethod
     def _deleted_status() -> SubscriptionStatus:
@@ -132,7 +141,9 @@ class SubscriptionService(BaseService):
         *,
         auto_commit: bool = True,
     ) -> SubscriptionDto:
-        return await _create_impl(self, user, subscription, auto_commit=auto_commit)
+        created = await _create_impl(self, user, subscription, auto_commit=auto_commit)
+        self.request_loader.forget_namespace(USER_SUBSCRIPTIONS_LOAD_NAMESPACE)
+        return created
 
     async def get(self, subscription_id: int) -> Optional[SubscriptionDto]:
         return await _get_impl(self, subscription_id)
@@ -146,6 +157,15 @@ class SubscriptionService(BaseService):
     async def get_all_by_user(self, telegram_id: int) -> list[SubscriptionDto]:
         return await _get_all_by_user_impl(self, telegram_id)
 
+    async def load_all_by_user(self, telegram_id: int) -> list[SubscriptionDto]:
+        """``get_all_by_user`` loaded once per request, for getters and read-only checks."""
+        subscriptions = await self.request_loader.load(
+            (USER_SUBSCRIPTIONS_LOAD_NAMESPACE, telegram_id),
+            lambda: self.get_all_by_user(telegram_id),
+        )
+        # Callers may mutate the DTOs, so each gets its own copies.
+        return [subscription.model_copy(deep=True) for subscription in subscriptions]
+
     async def get_all(self) -> list[SubscriptionDto]:
         return await _get_all_impl(self)
 
@@ -158,7 +178,9 @@ class SubscriptionService(BaseService):
         *,
         auto_commit: bool = True,
     ) -> Optional[SubscriptionDto]:
-        return await _update_impl(self, subscription, auto_commit=auto_commit)
+        updated = await _update_impl(self, subscription, auto_commit=auto_commit)
+        self.request_loader.forget_namespace(USER_SUBSCRIPTIONS_LOAD_NAMESPACE)
+        return updated
 
     async def rebind_user(
         self,
@@ -168,13 +190,15 @@ class SubscriptionService(BaseService):
         previous_user_telegram_id: int | None = None,
         auto_commit: bool = True,
     ) -> Optional[SubscriptionDto]:
-        return await _rebind_user_impl(
+        rebound = await _rebind_user_impl(
             self,
             subscription_id=subscription_id,
             user_telegram_id=user_telegram_id,
             previous_user_telegram_id=previous_user_telegram_id,
             auto_commit=auto_commit,
         )
+        self.request_loader.forget_namespace(USER_SUBSCRIPTIONS_LOAD_NAMESPACE)
+        return rebound
 
     async def sync_plan_snapshot_metadata(self, plan: PlanDto) -> int:
         return await _sync_plan_snapshot_metadata_impl(self, plan)
@@ -200,11 +224,29 @@ class SubscriptionService(BaseService):
     async def has_used_trial(self, user: UserDto) -> bool:
         return await _has_used_trial_impl(self, user)
 
-    async def get_expired_subscriptions_older_than(self, days: int) -> list[SubscriptionDto]:
-        return await _get_expired_subscriptions_older_than_impl(self, days)
+    async def get_expired_subscription_refs_page(
+        self,
+        *,
+        days: int,
+        after_id: int,
+        limit: int,
+    ) -> list[tuple[int, UUID]]:
+        return await _get_expired_subscription_refs_page_impl(
+            self,
+            days=days,
+            after_id=after_id,
+            limit=limit,
+        )
 
     async def delete_subscription(self, subscription_id: int) -> bool:
-        return await _delete_subscription_impl(self, subscription_id)
+        deleted = await _delete_subscription_impl(self, subscription_id)
+        self.request_loader.forget_namespace(USER_SUBSCRIPTIONS_LOAD_NAMESPACE)
+        return deleted
+
+    async def delete_subscriptions(self, subscription_ids: Sequence[int]) -> int:
+        deleted = await _delete_subscriptions_impl(self, subscription_ids)
+        self.request_loader.forget_namespace(USER_SUBSCRIPTIONS_LOAD_NAMESPACE)
+        return deleted
 
     @staticmethod
     def get_traffic_reset_delta(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 from uuid import UUID
 
 from loguru import logger
@@ -153,3 +153,20 @@ async def delete_subscription(service: SubscriptionService, subscription_id: int
 
     logger.warning("Failed to mark subscription '{}' as deleted", subscription_id)
     return False
+
+
+async def delete_subscriptions(
+    service: SubscriptionService,
+    subscription_ids: Sequence[int],
+) -> int:
+    if not subscription_ids:
+        return 0
+
+    deleted_count = await service.uow.repository.subscriptions.update_status_by_ids(
+        subscription_ids,
+        service._deleted_status(),
+    )
+    await service.uow.commit()
+
+    logger.info("Marked '{}' subscription(s) as deleted", deleted_count)
+    return deleted_count
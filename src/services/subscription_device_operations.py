@@ -5,6 +5,10 @@ from typing import TYPE_CHECKING
 
 from loguru import logger
 
+from src.core.enums import UserStreamEventType
+
+from .user_event_stream import publish_user_event
+
 if TYPE_CHECKING:
     from src.core.enums import DeviceType
     from src.infrastructure.database.models.dto import SubscriptionDto
@@ -180,6 +184,12 @@ async def revoke_device(
             devices_count=len(cached_devices_snapshot.devices),
         )
 
+    await publish_user_event(
+        service.redis_repository.client,
+        user_telegram_id,
+        UserStreamEventType.DEVICE_CHANGED,
+        event=service._deleted_device_event(),
+    )
     return service._revoked_device(
         success=True,
         message=f"Device {hwid} revoked successfully",
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 from typing import TYPE_CHECKING, Sequence
+from uuid import UUID
 
 from loguru import logger
 from sqlalchemy import and_
@@ -146,24 +147,16 @@ async def has_used_trial(service: SubscriptionService, user: UserDto) -> bool:
     return count > 0
 
 
-async def get_expired_subscriptions_older_than(
+async def get_expired_subscription_refs_page(
     service: SubscriptionService,
+    *,
     days: int,
-) -> list[SubscriptionDto]:
+    after_id: int,
+    limit: int,
+) -> list[tuple[int, UUID]]:
     cutoff_date = datetime_now() - timedelta(days=days)
-    conditions = and_(
-        Subscription.status == service._expired_status(),
-        Subscription.expire_at < cutoff_date,
-    )
-
-    db_subscriptions = await service.uow.repository.subscriptions._get_many(
-        Subscription,
-        conditions,
+    return await service.uow.repository.subscriptions.get_expired_refs_page(
+        expired_before=cutoff_date,
+        after_id=after_id,
+        limit=limit,
     )
-
-    logger.debug(
-        "Retrieved '{}' subscriptions expired more than {} days ago",
-        len(db_subscriptions),
-        days,
-    )
-    return SubscriptionDto.from_model_list(db_subscriptions)
@@ -115,6 +115,13 @@ class SubscriptionRuntimeService(BaseService):
     ) -> SubscriptionRuntimeSnapshot | None:
         return await _cache_impl.get_cached_runtime(self, user_remna_id)
 
+    async def get_cached_runtimes(
+        self,
+        user_remna_ids: Sequence[UUID],
+    ) -> dict[UUID, SubscriptionRuntimeSnapshot]:
+        """Cached snapshots for several users in one MGET; misses are left out."""
+        return await _cache_impl.get_cached_runtimes(self, user_remna_ids)
+
     async def apply_observed_devices_count_to_cached_runtime(
         self,
         *,
@@ -244,6 +251,38 @@ class SubscriptionRuntimeService(BaseService):
             remna_user=remna_user,
         )
 
+    async def _fetch_runtime_snapshot(
+        self,
+        subscription: SubscriptionDto,
+        *,
+        remna_user: object | None = None,
+    ) -> SubscriptionRuntimeSnapshot | None:
+        return await _refresh_impl.fetch_runtime_snapshot(
+            self,
+            subscription,
+            remna_user=remna_user,
+        )
+
+    async def _apply_refreshed_snapshot(
+        self,
+        subscription: SubscriptionDto,
+        snapshot: SubscriptionRuntimeSnapshot,
+        *,
+        previous: SubscriptionRuntimeSnapshot | None = None,
+    ) -> None:
+        await _refresh_impl.apply_refreshed_snapshot(
+            self,
+            subscription,
+            snapshot,
+            previous=previous,
+        )
+
+    async def _store_runtime_snapshots(
+        self,
+        snapshots: Sequence[SubscriptionRuntimeSnapshot],
+    ) -> None:
+        await _cache_impl.store_runtime_snapshots(self, snapshots)
+
     async def _store_runtime_snapshot(
         self,
         snapshot: SubscriptionRuntimeSnapshot,
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 from uuid import UUID
 
 from src.core.enums import RemnaUserHwidDevicesEvent
@@ -26,6 +26,25 @@ async def get_cached_runtime(
     )
 
 
+async def get_cached_runtimes(
+    service: SubscriptionRuntimeService,
+    user_remna_ids: Sequence[UUID],
+) -> dict[UUID, SubscriptionRuntimeSnapshot]:
+    unique_remna_ids = list(dict.fromkeys(user_remna_ids))
+    snapshots = await service.redis_repository.get_many(
+        [
+            SubscriptionRuntimeSnapshotKey(user_remna_id=str(user_remna_id))
+            for user_remna_id in unique_remna_ids
+        ],
+        service._runtime_snapshot_type(),
+    )
+    return {
+        user_remna_id: snapshot
+        for user_remna_id, snapshot in zip(unique_remna_ids, snapshots, strict=True)
+        if snapshot is not None
+    }
+
+
 async def apply_observed_devices_count_to_cached_runtime(
     service: SubscriptionRuntimeService,
     *,
@@ -142,3 +161,16 @@ async def store_runtime_snapshot(
         snapshot,
         ex=ttl_seconds,
     )
+
+
+async def store_runtime_snapshots(
+    service: SubscriptionRuntimeService,
+    snapshots: Sequence[SubscriptionRuntimeSnapshot],
+) -> None:
+    await service.redis_repository.set_many(
+        [
+            (SubscriptionRuntimeSnapshotKey(user_remna_id=str(snapshot.user_remna_id)), snapshot)
+            for snapshot in snapshots
+        ],
+        ex=service._runtime_cache_ttl_seconds(),
+    )
@@ -7,10 +7,13 @@ from uuid import UUID
 
 from loguru import logger
 
+from src.core.enums import UserStreamEventType
 from src.core.observability import emit_counter
 from src.core.storage.keys import SubscriptionRuntimeRefreshLockKey
 from src.core.utils.formatters import format_bytes_to_gb, format_device_count
 
+from .user_event_stream import publish_user_event
+
 if TYPE_CHECKING:
     from src.infrastructure.database.models.dto import SubscriptionDto
 
@@ -26,6 +29,14 @@ async def prepare_for_list(
     subscription: SubscriptionDto,
 ) -> tuple[SubscriptionDto, bool]:
     snapshot = await service.get_cached_runtime(subscription.user_remna_id)
+    return apply_cached_runtime(service, subscription, snapshot)
+
+
+def apply_cached_runtime(
+    service: SubscriptionRuntimeService,
+    subscription: SubscriptionDto,
+    snapshot: SubscriptionRuntimeSnapshot | None,
+) -> tuple[SubscriptionDto, bool]:
     if snapshot and service.is_core_fresh(snapshot):
         emit_counter("subscription_runtime_cache_hits_total")
         return service.apply_runtime_snapshot(subscription, snapshot), False
@@ -45,24 +56,26 @@ async def prepare_for_list_batch(
     user_telegram_id: int,
     enqueue_runtime_refresh: SubscriptionRuntimeRefreshEnqueuer,
 ) -> list[SubscriptionDto]:
-    prepared_results = await asyncio.gather(
-        *(service.prepare_for_list(subscription) for subscription in subscriptions)
+    # One MGET for the whole page instead of a GET per subscription.
+    snapshots = await service.get_cached_runtimes(
+        [subscription.user_remna_id for subscription in subscriptions]
     )
     prepared_subscriptions: list[SubscriptionDto] = []
-    subscription_ids_to_refresh: list[int] = []
+    subscription_ids_to_refresh: dict[int, None] = {}
 
-    for subscription, (prepared_subscription, should_refresh) in zip(
-        subscriptions,
-        prepared_results,
-        strict=False,
-    ):
+    for subscription in subscriptions:
+        prepared_subscription, should_refresh = apply_cached_runtime(
+            service,
+            subscription,
+            snapshots.get(subscription.user_remna_id),
+        )
         prepared_subscriptions.append(prepared_subscription)
         if should_refresh and subscription.id is not None:
-            subscription_ids_to_refresh.append(subscription.id)
+            subscription_ids_to_refresh[subscription.id] = None
 
     await service._enqueue_runtime_refresh_if_needed(
         user_telegram_id=user_telegram_id,
-        subscription_ids=subscription_ids_to_refresh,
+        subscription_ids=list(subscription_ids_to_refresh),
         enqueue_runtime_refresh=enqueue_runtime_refresh,
     )
     return prepared_subscriptions
@@ -169,13 +182,12 @@ async def refresh_runtime_snapshots_for_user(
     prefetched_users = await service._get_prefetched_remna_users_by_uuid(user_telegram_id)
     semaphore = asyncio.Semaphore(service._refresh_concurrency())
 
-    async def refresh_with_limit(subscription: SubscriptionDto) -> None:
+    async def fetch_with_limit(subscription: SubscriptionDto) -> SubscriptionRuntimeSnapshot | None:
         async with semaphore:
             try:
-                prefetched_user = prefetched_users.get(subscription.user_remna_id)
-                await service._refresh_runtime_snapshot_for_subscription(
+                return await service._fetch_runtime_snapshot(
                     subscription,
-                    remna_user=prefetched_user,
+                    remna_user=prefetched_users.get(subscription.user_remna_id),
                 )
             except Exception as exception:
                 emit_counter("subscription_runtime_refresh_failures_total", stage="batch")
@@ -184,8 +196,53 @@ async def refresh_runtime_snapshots_for_user(
                     subscription.id,
                     exception,
                 )
+                return None
+
+    snapshots = await asyncio.gather(
+        *(fetch_with_limit(subscription) for subscription in subscriptions)
+    )
+    refreshed = [
+        (subscription, snapshot)
+        for subscription, snapshot in zip(subscriptions, snapshots, strict=True)
+        if snapshot is not None
+    ]
+    if not refreshed:
+        return
+
+    previous_snapshots = await get_previous_snapshots(
+        service,
+        [snapshot.user_remna_id for _, snapshot in refreshed],
+    )
+
+    # All snapshots of the user are written in one pipelined round trip.
+    try:
+        await service._store_runtime_snapshots([snapshot for _, snapshot in refreshed])
+    except Exception as exception:
+        emit_counter("subscription_runtime_refresh_failures_total", stage="store")
+        logger.warning(
+            "Failed to store runtime snapshots for user '{}': {}",
+            user_telegram_id,
+            exception,
+        )
+        return
+
+    for subscription, snapshot in refreshed:
+        await service._apply_refreshed_snapshot(
+            subscription,
+            snapshot,
+            previous=previous_snapshots.get(snapshot.user_remna_id),
+        )
+
 
-    await asyncio.gather(*(refresh_with_limit(subscription) for subscription in subscriptions))
+async def get_previous_snapshots(
+    service: SubscriptionRuntimeService,
+    user_remna_ids: Sequence[UUID],
+) -> dict[UUID, SubscriptionRuntimeSnapshot]:
+    try:
+        return await service.get_cached_runtimes(user_remna_ids)
+    except Exception as exception:
+        logger.warning("Failed to read previous runtime snapshots: {}", exception)
+        return {}
 
 
 async def get_prefetched_remna_users_by_uuid(
@@ -214,6 +271,38 @@ async def refresh_runtime_snapshot_for_subscription(
     subscription: SubscriptionDto,
     *,
     remna_user: object | None = None,
+) -> SubscriptionRuntimeSnapshot | None:
+    snapshot = await service._fetch_runtime_snapshot(subscription, remna_user=remna_user)
+    if snapshot is None:
+        return None
+
+    previous_snapshots = await get_previous_snapshots(service, [snapshot.user_remna_id])
+
+    try:
+        await service._store_runtime_snapshot(snapshot)
+    except Exception as exception:
+        emit_counter("subscription_runtime_refresh_failures_total", stage="refresh")
+        logger.warning(
+            "Failed to store runtime snapshot for subscription '{}' (remna_id='{}'): {}",
+            subscription.id,
+            subscription.user_remna_id,
+            exception,
+        )
+        return None
+
+    await service._apply_refreshed_snapshot(
+        subscription,
+        snapshot,
+        previous=previous_snapshots.get(snapshot.user_remna_id),
+    )
+    return snapshot
+
+
+async def fetch_runtime_snapshot(
+    service: SubscriptionRuntimeService,
+    subscription: SubscriptionDto,
+    *,
+    remna_user: object | None = None,
 ) -> SubscriptionRuntimeSnapshot | None:
     try:
         panel_user = remna_user or await service.remnawave_service.get_user(
@@ -224,12 +313,11 @@ async def refresh_runtime_snapshot_for_subscription(
         devices = await service.remnawave_service.get_devices_by_subscription_uuid(
             subscription.user_remna_id
         )
-        snapshot = service._build_snapshot(
+        return service._build_snapshot(
             subscription=subscription,
             remna_user=panel_user,
             devices_count=len(devices),
         )
-        await service._store_runtime_snapshot(snapshot)
     except Exception as exception:
         emit_counter("subscription_runtime_refresh_failures_total", stage="refresh")
         logger.warning(
@@ -240,8 +328,46 @@ async def refresh_runtime_snapshot_for_subscription(
         )
         return None
 
+
+async def apply_refreshed_snapshot(
+    service: SubscriptionRuntimeService,
+    subscription: SubscriptionDto,
+    snapshot: SubscriptionRuntimeSnapshot,
+    *,
+    previous: SubscriptionRuntimeSnapshot | None = None,
+) -> None:
     await service._persist_url_if_changed(subscription, snapshot.url)
-    return snapshot
+    if not runtime_values_changed(previous, snapshot):
+        return
+
+    await publish_user_event(
+        service.redis_client,
+        subscription.user_telegram_id,
+        UserStreamEventType.SUBSCRIPTION_RUNTIME_UPDATED,
+        subscription_id=subscription.id,
+    )
+
+
+def runtime_values_changed(
+    previous: SubscriptionRuntimeSnapshot | None,
+    snapshot: SubscriptionRuntimeSnapshot,
+) -> bool:
+    # Timestamps move on every refresh; only user-visible values warrant a client refetch.
+    if previous is None:
+        return True
+    return (
+        previous.url,
+        previous.traffic_used,
+        previous.traffic_limit,
+        previous.device_limit,
+        previous.devices_count,
+    ) != (
+        snapshot.url,
+        snapshot.traffic_used,
+        snapshot.traffic_limit,
+        snapshot.device_limit,
+        snapshot.devices_count,
+    )
 
 
 def build_snapshot(
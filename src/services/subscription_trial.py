@@ -192,7 +192,7 @@ class SubscriptionTrialService:
                 "Trial subscription already used",
             )
 
-        existing_subscriptions = await self.subscription_service.get_all_by_user(
+        existing_subscriptions = await self.subscription_service.load_all_by_user(
             current_user.telegram_id
         )
         if any(
@@ -7,7 +7,7 @@ from fluentogram import TranslatorHub
 from redis.asyncio import Redis
 
 from src.core.config import AppConfig
-from src.core.constants import TIME_1M, TIME_10M
+from src.core.constants import TIME_1M, TIME_10M, USER_LIST_CACHE_TAG, USER_SEARCH_LIMIT
 from src.core.enums import Currency, UserRole
 from src.core.storage.key_builder import StorageKey
 from src.core.utils.types import RemnaUserDto
@@ -47,9 +47,6 @@ from .user_lifecycle import (
 from .user_lifecycle import (
     get_blocked_users as _get_blocked_users_impl,
 )
-from .user_lifecycle import (
-    get_by_partial_name as _get_by_partial_name_impl,
-)
 from .user_lifecycle import (
     get_by_referral_code as _get_by_referral_code_impl,
 )
@@ -98,6 +95,9 @@ from .user_recent import (
 from .user_recent import (
     clear_user_cache as _clear_user_cache_impl,
 )
+from .user_recent import (
+    get_and_record_activity as _get_and_record_activity_impl,
+)
 from .user_recent import (
     get_recent_activity as _get_recent_activity_impl,
 )
@@ -155,10 +155,6 @@ class UserService(BaseService):
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.uow = uow
 
-    @staticmethod
-    def _user_roles() -> tuple[UserRole, ...]:
-        return tuple(UserRole)
-
     async def create(self, aiogram_user: AiogramUser) -> UserDto:
         return await _create_impl(self, aiogram_user)
 
@@ -199,25 +195,22 @@ class UserService(BaseService):
     async def delete(self, user: UserDto) -> bool:
         return await _delete_impl(self, user)
 
-    async def get_by_partial_name(self, query: str) -> list[UserDto]:
-        return await _get_by_partial_name_impl(self, query)
-
     async def get_by_referral_code(self, referral_code: str) -> Optional[UserDto]:
         return await _get_by_referral_code_impl(self, referral_code)
 
-    @redis_cache(prefix="users_count", ttl=TIME_10M)
+    @redis_cache(prefix="users_count", ttl=TIME_10M, tags=(USER_LIST_CACHE_TAG,))
     async def count(self) -> int:
         return await _count_impl(self)
 
-    @redis_cache(prefix="get_by_role", ttl=TIME_10M)
+    @redis_cache(prefix="get_by_role", ttl=TIME_10M, tags=(USER_LIST_CACHE_TAG,))
     async def get_by_role(self, role: UserRole) -> list[UserDto]:
         return await _get_by_role_impl(self, role)
 
-    @redis_cache(prefix="get_blocked_users", ttl=TIME_10M)
+    @redis_cache(prefix="get_blocked_users", ttl=TIME_10M, tags=(USER_LIST_CACHE_TAG,))
     async def get_blocked_users(self) -> list[UserDto]:
         return await _get_blocked_users_impl(self)
 
-    @redis_cache(prefix="get_all", ttl=TIME_10M)
+    @redis_cache(prefix="get_all", ttl=TIME_10M, tags=(USER_LIST_CACHE_TAG,))
     async def get_all(self) -> list[UserDto]:
         return await _get_all_impl(self)
 
@@ -246,6 +239,9 @@ class UserService(BaseService):
     async def update_recent_activity(self, telegram_id: int) -> None:
         await _update_recent_activity_impl(self, telegram_id)
 
+    async def get_and_record_activity(self, telegram_id: int) -> Optional[UserDto]:
+        return await _get_and_record_activity_impl(self, telegram_id)
+
     async def get_recent_registered_users(self) -> list[UserDto]:
         return await _get_recent_registered_users_impl(self)
 
@@ -255,6 +251,9 @@ class UserService(BaseService):
     async def search_users(self, message: Message) -> list[UserDto]:
         return await _search_users_impl(self, message)
 
+    async def search_more_users(self, search_query: str, *, offset: int) -> list[UserDto]:
+        return await self._search_users_by_login_or_name(search_query, offset=offset)
+
     async def _search_users_by_forward(self, message: Message) -> list[UserDto]:
         return await _search_users_by_forward_impl(self, message)
 
@@ -267,8 +266,19 @@ class UserService(BaseService):
     async def _search_users_by_remnashop_id(self, search_query: str) -> list[UserDto]:
         return await _search_users_by_remnashop_id_impl(self, search_query)
 
-    async def _search_users_by_login_or_name(self, search_query: str) -> list[UserDto]:
-        return await _search_users_by_login_or_name_impl(self, search_query)
+    async def _search_users_by_login_or_name(
+        self,
+        search_query: str,
+        *,
+        limit: int = USER_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> list[UserDto]:
+        return await _search_users_by_login_or_name_impl(
+            self,
+            search_query,
+            limit=limit,
+            offset=offset,
+        )
 
     async def set_current_subscription(self, telegram_id: int, subscription_id: int) -> None:
         await _set_current_subscription_impl(self, telegram_id, subscription_id)
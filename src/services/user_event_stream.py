@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from typing import Any, Optional
+
+from loguru import logger
+from pydantic import BaseModel, Field
+from redis.asyncio import Redis
+
+from src.core.constants import USER_EVENT_STREAM_HEARTBEAT_SECONDS, USER_EVENT_STREAM_MAX_SECONDS
+from src.core.enums import UserStreamEventType
+from src.core.observability import emit_counter
+from src.core.storage.keys import UserEventChannelKey
+from src.infrastructure.redis import RedisChannelFanout
+
+
+class UserStreamEvent(BaseModel):
+    type: UserStreamEventType
+    payload: dict[str, Any] = Field(default_factory=dict)
+
+
+async def publish_user_event(
+    redis_client: Redis,
+    user_telegram_id: int,
+    event_type: UserStreamEventType,
+    **payload: Any,
+) -> None:
+    # Change signals are best effort: clients also refetch on reconnect and focus.
+    event = UserStreamEvent(type=event_type, payload=payload)
+    channel = UserEventChannelKey(user_telegram_id=user_telegram_id).pack()
+    try:
+        await redis_client.publish(channel, event.model_dump_json())
+    except Exception as exception:
+        logger.warning(
+            "Failed to publish '{}' event for user '{}': {}",
+            event_type,
+            user_telegram_id,
+            exception,
+        )
+        return
+    emit_counter("user_stream_events_published_total", type=event_type.value)
+
+
+class UserEventStreamService:
+    def __init__(self, fanout: RedisChannelFanout) -> None:
+        self.fanout = fanout
+
+    async def listen(
+        self,
+        *,
+        user_telegram_id: int,
+        heartbeat_seconds: float = USER_EVENT_STREAM_HEARTBEAT_SECONDS,
+        max_seconds: float = USER_EVENT_STREAM_MAX_SECONDS,
+    ) -> AsyncGenerator[Optional[UserStreamEvent], None]:
+        """Yield events for the user, or ``None`` when a heartbeat is due.
+
+        The stream ends after ``max_seconds`` so clients reconnect and re-authenticate.
+        """
+        channel = UserEventChannelKey(user_telegram_id=user_telegram_id).pack()
+        queue = await self.fanout.subscribe(channel)
+        deadline = time.monotonic() + max_seconds
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    raw_event = await asyncio.wait_for(
+                        queue.get(),
+                        timeout=min(heartbeat_seconds, remaining),
+                    )
+                except TimeoutError:
+                    yield None
+                    continue
+
+                try:
+                    yield UserStreamEvent.model_validate_json(raw_event)
+                except ValueError as exception:
+                    logger.warning(f"Skipping malformed user stream event: {exception}")
+        finally:
+            await self.fanout.unsubscribe(channel, queue)
@@ -250,12 +250,6 @@ async def delete(service: UserService, user: UserDto) -> bool:
     return result
 
 
-async def get_by_partial_name(service: UserService, query: str) -> list[UserDto]:
-    db_users = await service.uow.repository.users.get_by_partial_name(query)
-    logger.debug("Retrieved '{}' users for query '{}'", len(db_users), query)
-    return UserDto.from_model_list(db_users)
-
-
 async def get_by_referral_code(service: UserService, referral_code: str) -> UserDto | None:
     user = await service.uow.repository.users.get_by_referral_code(referral_code)
     return UserDto.from_model(user)
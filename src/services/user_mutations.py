@@ -4,10 +4,11 @@ from typing import TYPE_CHECKING
 
 from loguru import logger
 
+from src.core.constants import USER_LIST_CACHE_TAG
 from src.core.enums import Currency, UserRole
-from src.core.storage.key_builder import build_key
 from src.infrastructure.database.models.dto import UserDto
 from src.infrastructure.database.models.dto.user import BaseUserDto
+from src.infrastructure.redis import invalidate_cache_tags
 
 if TYPE_CHECKING:
     from .user import UserService
@@ -112,12 +113,9 @@ async def reset_rules_acceptance_for_non_privileged(
     await service.uow.commit()
 
     try:
-        pattern = build_key("cache", "get_user", "*")
-        await service.redis_repository.delete_pattern(pattern)
+        await invalidate_cache_tags(service.redis_client, "get_user", USER_LIST_CACHE_TAG)
     except Exception as exc:
         logger.warning("Failed to invalidate user cache after rules reset: {}", exc)
-
-    await service._clear_list_caches()
     logger.info(
         "Updated rules acceptance for non-privileged users: accepted='{}', updated='{}'",
         accepted,
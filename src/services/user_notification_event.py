@@ -1,20 +1,27 @@
 from __future__ import annotations
 
-from datetime import timedelta
 from typing import Any
 
-from loguru import logger
-
-from src.core.enums import UserNotificationType
+from src.core.constants import (
+    USER_NOTIFICATION_COUNTERS_TTL_SECONDS,
+    USER_NOTIFICATION_EVENTS_RETENTION_DAYS,
+)
+from src.core.enums import UserNotificationType, UserStreamEventType
+from src.core.storage.keys import UserNotificationTotalCountKey, UserNotificationUnreadCountKey
 from src.core.utils.time import datetime_now
 from src.infrastructure.database import UnitOfWork
 from src.infrastructure.database.models.dto import UserNotificationEventDto
 from src.infrastructure.database.models.sql import UserNotificationEvent
+from src.infrastructure.redis import RedisRepository
+
+from .event_partition import retention_cutoff
+from .user_event_stream import publish_user_event
 
 
 class UserNotificationEventService:
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(self, uow: UnitOfWork, redis_repository: RedisRepository) -> None:
         self.uow = uow
+        self.redis_repository = redis_repository
 
     async def create_event(
         self,
@@ -40,7 +47,20 @@ class UserNotificationEventService:
             dto = UserNotificationEventDto.from_model(event)
             if not dto:
                 raise ValueError("Failed to create notification event")
-            return dto
+
+        await self.redis_repository.increment_existing(
+            UserNotificationTotalCountKey(user_telegram_id=user_telegram_id)
+        )
+        await self.redis_repository.increment_existing(
+            UserNotificationUnreadCountKey(user_telegram_id=user_telegram_id)
+        )
+        await publish_user_event(
+            self.redis_repository.client,
+            user_telegram_id,
+            UserStreamEventType.NOTIFICATION_CREATED,
+            notification_id=dto.id,
+        )
+        return dto
 
     async def set_bot_delivery_meta(
         self,
@@ -69,26 +89,72 @@ class UserNotificationEventService:
         safe_page = max(page, 1)
         safe_limit = min(max(limit, 1), 100)
         offset = (safe_page - 1) * safe_limit
+        created_after = retention_cutoff(USER_NOTIFICATION_EVENTS_RETENTION_DAYS)
 
         async with self.uow:
             events = await self.uow.repository.user_notification_events.list_by_user(
                 user_telegram_id=user_telegram_id,
+                created_after=created_after,
                 limit=safe_limit,
                 offset=offset,
             )
-            total = await self.uow.repository.user_notification_events.count_by_user(
-                user_telegram_id=user_telegram_id
-            )
-            unread = await self.uow.repository.user_notification_events.count_unread_by_user(
-                user_telegram_id=user_telegram_id
-            )
+        total, unread = await self.get_counters(user_telegram_id=user_telegram_id)
         return UserNotificationEventDto.from_model_list(events), total, unread
 
     async def count_unread(self, *, user_telegram_id: int) -> int:
+        unread = await self.redis_repository.get(
+            UserNotificationUnreadCountKey(user_telegram_id=user_telegram_id),
+            int,
+        )
+        if unread is not None:
+            return unread
+
+        _, unread = await self._rebuild_counters(user_telegram_id)
+        return unread
+
+    async def get_counters(self, *, user_telegram_id: int) -> tuple[int, int]:
+        total, unread = await self.redis_repository.get_many(
+            [
+                UserNotificationTotalCountKey(user_telegram_id=user_telegram_id),
+                UserNotificationUnreadCountKey(user_telegram_id=user_telegram_id),
+            ],
+            int,
+        )
+        if total is not None and unread is not None:
+            return total, unread
+
+        return await self._rebuild_counters(user_telegram_id)
+
+    async def _rebuild_counters(self, user_telegram_id: int) -> tuple[int, int]:
+        # Counters expire so events aging out of the retention window are eventually reflected.
+        created_after = retention_cutoff(USER_NOTIFICATION_EVENTS_RETENTION_DAYS)
         async with self.uow:
-            return await self.uow.repository.user_notification_events.count_unread_by_user(
-                user_telegram_id=user_telegram_id
+            total = await self.uow.repository.user_notification_events.count_by_user(
+                user_telegram_id=user_telegram_id,
+                created_after=created_after,
             )
+            unread = await self.uow.repository.user_notification_events.count_unread_by_user(
+                user_telegram_id=user_telegram_id,
+                created_after=created_after,
+            )
+
+        await self.redis_repository.set(
+            UserNotificationTotalCountKey(user_telegram_id=user_telegram_id),
+            total,
+            ex=USER_NOTIFICATION_COUNTERS_TTL_SECONDS,
+        )
+        await self.redis_repository.set(
+            UserNotificationUnreadCountKey(user_telegram_id=user_telegram_id),
+            unread,
+            ex=USER_NOTIFICATION_COUNTERS_TTL_SECONDS,
+        )
+        return total, unread
+
+    async def _decrement_unread(self, user_telegram_id: int, amount: int = 1) -> None:
+        await self.redis_repository.increment_existing(
+            UserNotificationUnreadCountKey(user_telegram_id=user_telegram_id),
+            -amount,
+        )
 
     async def mark_read(
         self,
@@ -106,7 +172,10 @@ class UserNotificationEventService:
             )
             if updated:
                 await self.uow.commit()
-            return updated
+
+        if updated:
+            await self._decrement_unread(user_telegram_id)
+        return updated
 
     async def mark_read_by_id(
         self,
@@ -115,14 +184,17 @@ class UserNotificationEventService:
         read_source: str,
     ) -> bool:
         async with self.uow:
-            updated = await self.uow.repository.user_notification_events.mark_read_by_id(
+            user_telegram_id = await self.uow.repository.user_notification_events.mark_read_by_id(
                 notification_id=notification_id,
                 read_source=read_source,
                 read_at=datetime_now(),
             )
-            if updated:
-                await self.uow.commit()
-            return updated
+            if user_telegram_id is None:
+                return False
+            await self.uow.commit()
+
+        await self._decrement_unread(user_telegram_id)
+        return True
 
     async def mark_all_read(
         self,
@@ -133,20 +205,13 @@ class UserNotificationEventService:
         async with self.uow:
             updated = await self.uow.repository.user_notification_events.mark_all_read(
                 user_telegram_id=user_telegram_id,
+                created_after=retention_cutoff(USER_NOTIFICATION_EVENTS_RETENTION_DAYS),
                 read_source=read_source,
                 read_at=datetime_now(),
             )
             if updated:
                 await self.uow.commit()
-            return updated
 
-    async def cleanup_older_than(self, *, days: int) -> int:
-        threshold = datetime_now() - timedelta(days=days)
-        async with self.uow:
-            deleted = await self.uow.repository.user_notification_events.cleanup_older_than(
-                threshold=threshold
-            )
-            if deleted:
-                await self.uow.commit()
-                logger.info(f"Cleaned up '{deleted}' notification events older than '{days}' days")
-            return deleted
+        if updated:
+            await self._decrement_unread(user_telegram_id, updated)
+        return updated
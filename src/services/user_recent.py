@@ -1,24 +1,63 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 from loguru import logger
-
-from src.core.constants import RECENT_ACTIVITY_MAX_COUNT, RECENT_REGISTERED_MAX_COUNT
-from src.core.storage.key_builder import StorageKey, build_key
+from redis.asyncio.client import Pipeline
+
+from src.core.constants import (
+    RECENT_ACTIVITY_DEBOUNCE_MAX_USERS,
+    RECENT_ACTIVITY_DEBOUNCE_SECONDS,
+    RECENT_ACTIVITY_MAX_COUNT,
+    RECENT_REGISTERED_MAX_COUNT,
+    USER_LIST_CACHE_TAG,
+)
+from src.core.storage.key_builder import StorageKey
 from src.core.storage.keys import RecentActivityUsersKey, RecentRegisteredUsersKey
 from src.infrastructure.database.models.dto import UserDto
+from src.infrastructure.redis import get_cache_spec, invalidate_cache_tags
+from src.infrastructure.redis.cache import cache_generation_key
 
 if TYPE_CHECKING:
     from .user import UserService
 
+_activity_recorded_at: dict[int, float] = {}
+
 
 async def add_to_recent_registered(service: UserService, telegram_id: int) -> None:
     await service._add_to_recent_list(RecentRegisteredUsersKey(), telegram_id)
 
 
 async def update_recent_activity(service: UserService, telegram_id: int) -> None:
-    await service._add_to_recent_list(RecentActivityUsersKey(), telegram_id)
+    async with service.redis_client.pipeline(transaction=False) as pipe:
+        _queue_recent_activity(pipe, telegram_id)
+        await pipe.execute()
+    logger.debug("User '{}' activity updated in recent cache", telegram_id)
+
+
+async def get_and_record_activity(service: UserService, telegram_id: int) -> Optional[UserDto]:
+    """Return the cached user and record their activity in one pipelined round trip.
+
+    Falls back to ``service.get`` (database plus cache fill) when the user is not cached.
+    """
+    cache_spec = get_cache_spec(type(service).get)
+    user_cache_key = cache_spec.build_key(telegram_id)
+
+    try:
+        async with service.redis_client.pipeline(transaction=False) as pipe:
+            pipe.mget(cache_spec.lookup_keys(user_cache_key))
+            if _should_record_activity(telegram_id):
+                _queue_recent_activity(pipe, telegram_id)
+            results: list[Any] = await pipe.execute()
+        entry = cache_spec.decode(results[0])
+    except Exception as exception:
+        logger.warning(f"Pipelined user lookup failed for '{telegram_id}': {exception}")
+        entry = None
+
+    if entry is not None and entry.is_fresh:
+        return cast(Optional[UserDto], entry.value)
+    return await service.get(telegram_id)
 
 
 async def get_recent_registered_users(service: UserService) -> list[UserDto]:
@@ -59,23 +98,16 @@ async def get_recent_activity_users(service: UserService) -> list[UserDto]:
 
 
 async def clear_user_cache(service: UserService, telegram_id: int) -> None:
-    user_cache_key = build_key("cache", "get_user", telegram_id)
-    await service.redis_client.delete(user_cache_key)
-    await service._clear_list_caches()
+    user_cache_key = get_cache_spec(type(service).get).build_key(telegram_id)
+    async with service.redis_client.pipeline(transaction=False) as pipe:
+        pipe.delete(user_cache_key)
+        pipe.incr(cache_generation_key(USER_LIST_CACHE_TAG))
+        await pipe.execute()
     logger.debug("User cache for '{}' invalidated", telegram_id)
 
 
 async def clear_list_caches(service: UserService) -> None:
-    list_cache_keys_to_invalidate = [
-        build_key("cache", "get_blocked_users"),
-        build_key("cache", "count"),
-    ]
-
-    for role in service._user_roles():
-        key = build_key("cache", "get_by_role", role=role)
-        list_cache_keys_to_invalidate.append(key)
-
-    await service.redis_client.delete(*list_cache_keys_to_invalidate)
+    await invalidate_cache_tags(service.redis_client, USER_LIST_CACHE_TAG)
     logger.debug("List caches invalidated")
 
 
@@ -119,16 +151,13 @@ async def get_recent_registered(service: UserService) -> list[int]:
 
 
 async def remove_from_recent_activity(service: UserService, telegram_id: int) -> None:
-    await service.redis_repository.list_remove(
-        key=RecentActivityUsersKey(),
-        value=telegram_id,
-        count=0,
-    )
+    await service.redis_repository.sorted_collection_remove(RecentActivityUsersKey(), telegram_id)
+    _activity_recorded_at.pop(telegram_id, None)
     logger.debug("User '{}' removed from recent activity cache", telegram_id)
 
 
 async def get_recent_activity(service: UserService) -> list[int]:
-    telegram_ids_str = await service.redis_repository.list_range(
+    telegram_ids_str = await service.redis_repository.sorted_collection_revrange(
         key=RecentActivityUsersKey(),
         start=0,
         end=RECENT_ACTIVITY_MAX_COUNT - 1,
@@ -136,3 +165,22 @@ async def get_recent_activity(service: UserService) -> list[int]:
     ids = [int(uid) for uid in telegram_ids_str]
     logger.debug("Retrieved '{}' recent activity user IDs from cache", len(ids))
     return ids
+
+
+def _queue_recent_activity(pipe: Pipeline, telegram_id: int) -> None:
+    # Scored by time, so re-adding a user moves them to the top without an O(N) LREM.
+    key = RecentActivityUsersKey().pack()
+    pipe.zadd(key, {str(telegram_id): time.time()})
+    pipe.zremrangebyrank(key, 0, -(RECENT_ACTIVITY_MAX_COUNT + 1))
+
+
+def _should_record_activity(telegram_id: int) -> bool:
+    now = time.monotonic()
+    recorded_at = _activity_recorded_at.get(telegram_id)
+    if recorded_at is not None and now - recorded_at < RECENT_ACTIVITY_DEBOUNCE_SECONDS:
+        return False
+
+    if len(_activity_recorded_at) >= RECENT_ACTIVITY_DEBOUNCE_MAX_USERS:
+        _activity_recorded_at.clear()
+    _activity_recorded_at[telegram_id] = now
+    return True
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from aiogram.types import Message
 from loguru import logger
 
-from src.core.constants import REMNASHOP_PREFIX
+from src.core.constants import REMNASHOP_PREFIX, USER_SEARCH_LIMIT
 from src.core.utils.validators import parse_int
 from src.infrastructure.database.models.dto import UserDto
 
@@ -87,13 +87,24 @@ async def search_users_by_remnashop_id(
 async def search_users_by_login_or_name(
     service: UserService,
     search_query: str,
+    *,
+    limit: int = USER_SEARCH_LIMIT,
+    offset: int = 0,
 ) -> list[UserDto]:
     normalized_query = search_query.lower()
-    async with service.uow:
-        web_account = await service.uow.repository.web_accounts.get_by_username(normalized_query)
-        matched_user = None
-        if web_account:
-            matched_user = await service.uow.repository.users.get(web_account.user_telegram_id)
+    matched_user = None
+    # An exact login or email only ever answers the first page; later pages are ranked matches.
+    if offset == 0:
+        async with service.uow:
+            web_account = await service.uow.repository.web_accounts.get_by_username(
+                normalized_query
+            )
+            if not web_account and "@" in normalized_query:
+                web_account = await service.uow.repository.web_accounts.get_by_email(
+                    normalized_query
+                )
+            if web_account:
+                matched_user = await service.uow.repository.users.get(web_account.user_telegram_id)
 
     if matched_user:
         user_dto = UserDto.from_model(matched_user)
@@ -102,25 +113,18 @@ async def search_users_by_login_or_name(
         logger.info("Searched users by exact web login '{}', found 1 user", normalized_query)
         return [user_dto]
 
-    found_users = await service.get_by_partial_name(query=search_query)
-
     async with service.uow:
-        partial_accounts = await service.uow.repository.web_accounts.get_by_partial_username(
-            normalized_query
+        found_users = UserDto.from_model_list(
+            await service.uow.repository.users.search_by_login_or_name(
+                search_query,
+                limit=limit,
+                offset=offset,
+            )
         )
-        partial_account_user_ids = list({account.user_telegram_id for account in partial_accounts})
-        partial_login_users = UserDto.from_model_list(
-            await service.uow.repository.users.get_by_ids(partial_account_user_ids)
-        )
-
-    deduplicated_users: dict[int, UserDto] = {}
-    for found_user in [*found_users, *partial_login_users]:
-        deduplicated_users[found_user.telegram_id] = found_user
 
-    merged_users = list(deduplicated_users.values())
     logger.info(
-        "Searched users by query '{}', found '{}' users (partial name/login)",
+        "Searched users by query '{}', found '{}' users (partial name/login/email)",
         search_query,
-        len(merged_users),
+        len(found_users),
     )
-    return merged_users
+    return found_users
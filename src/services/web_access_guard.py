@@ -5,7 +5,6 @@ from typing import Literal, Optional
 from urllib.parse import urlparse
 
 from aiogram import Bot
-from aiogram.enums import ChatMemberStatus
 from fastapi import HTTPException, status
 from fluentogram import TranslatorHub
 from loguru import logger
@@ -14,11 +13,11 @@ from redis.asyncio import Redis
 from src.core.config import AppConfig
 from src.core.constants import T_ME
 from src.core.observability import emit_counter
-from src.core.storage.key_builder import build_key
 from src.infrastructure.database.models.dto import SettingsDto, UserDto, WebAccountDto
 from src.infrastructure.redis import RedisRepository
 from src.services.access_policy import AccessModePolicyService
 from src.services.base import BaseService
+from src.services.channel_membership import ChannelMembershipService
 from src.services.settings import SettingsService
 from src.services.web_account import WebAccountService
 
@@ -43,13 +42,6 @@ UnmetRequirementCode = Literal[
 AccessLevel = Literal["full", "read_only", "blocked"]
 ChannelCheckStatus = Literal["not_required", "verified", "required_unverified", "unavailable"]
 
-_CHANNEL_MEMBER_CACHE_TTL_SECONDS = 300
-_CHANNEL_MEMBER_ALLOWED_STATUSES = {
-    ChatMemberStatus.CREATOR,
-    ChatMemberStatus.ADMINISTRATOR,
-    ChatMemberStatus.MEMBER,
-}
-
 
 @dataclass(slots=True)
 class WebAccessStatus:
@@ -94,11 +86,13 @@ class WebAccessGuardService(BaseService):
         settings_service: SettingsService,
         web_account_service: WebAccountService,
         access_mode_policy_service: AccessModePolicyService,
+        channel_membership_service: ChannelMembershipService,
     ) -> None:
         super().__init__(config, bot, redis_client, redis_repository, translator_hub)
         self.settings_service = settings_service
         self.web_account_service = web_account_service
         self.access_mode_policy_service = access_mode_policy_service
+        self.channel_membership_service = channel_membership_service
 
     async def evaluate_user_access(
         self,
@@ -274,24 +268,12 @@ class WebAccessGuardService(BaseService):
             )
             return ChannelMembershipResult(verified=False, status="unavailable")
 
-        cache_key = self._build_channel_cache_key(
-            linked_telegram_id=linked_telegram_id,
-            channel_chat_id=channel_chat_id,
-        )
-        if not force_recheck:
-            cached_value = await self._read_cached_channel_check(cache_key)
-            if cached_value is not None:
-                return ChannelMembershipResult(
-                    verified=cached_value,
-                    status="verified" if cached_value else "required_unverified",
-                )
-
         try:
-            member = await self.bot.get_chat_member(
-                chat_id=channel_chat_id,
-                user_id=linked_telegram_id,
+            member_status = await self.channel_membership_service.get_status(
+                channel_chat_id,
+                linked_telegram_id,
+                force_recheck=force_recheck,
             )
-            is_member = self._is_channel_member_status_allowed(member.status)
         except Exception as exc:
             emit_counter("channel_verification_unavailable_total", reason="telegram_api_error")
             logger.warning(
@@ -303,7 +285,7 @@ class WebAccessGuardService(BaseService):
             )
             return ChannelMembershipResult(verified=False, status="unavailable")
 
-        await self._write_cached_channel_check(cache_key, is_member)
+        is_member = self.channel_membership_service.is_allowed(member_status)
         return ChannelMembershipResult(
             verified=is_member,
             status="verified" if is_member else "required_unverified",
@@ -321,47 +303,6 @@ class WebAccessGuardService(BaseService):
             return user.telegram_id
         return None
 
-    @staticmethod
-    def _build_channel_cache_key(*, linked_telegram_id: int, channel_chat_id: str | int) -> str:
-        channel_part = str(channel_chat_id).replace(":", "_")
-        return build_key("web_access", "channel_member", linked_telegram_id, channel_part)
-
-    async def _read_cached_channel_check(self, cache_key: str) -> bool | None:
-        try:
-            cached_value = await self.redis_client.get(cache_key)
-        except Exception as exc:
-            logger.warning(f"Failed to read channel membership cache '{cache_key}': {exc}")
-            return None
-
-        if cached_value is None:
-            return None
-
-        raw = cached_value.decode("utf-8") if isinstance(cached_value, bytes) else str(cached_value)
-        if raw == "1":
-            return True
-        if raw == "0":
-            return False
-        return None
-
-    async def _write_cached_channel_check(self, cache_key: str, is_member: bool) -> None:
-        value = "1" if is_member else "0"
-        try:
-            await self.redis_client.setex(
-                cache_key,
-                _CHANNEL_MEMBER_CACHE_TTL_SECONDS,
-                value,
-            )
-        except Exception as exc:
-            logger.warning(f"Failed to write channel membership cache '{cache_key}': {exc}")
-
-    @staticmethod
-    def _is_channel_member_status_allowed(status_value: object) -> bool:
-        if status_value in _CHANNEL_MEMBER_ALLOWED_STATUSES:
-            return True
-
-        raw_value = str(getattr(status_value, "value", status_value) or "").strip().lower()
-        return raw_value in {"creator", "administrator", "admin", "member"}
-
     @staticmethod
     def _resolve_channel_chat_id(settings: SettingsDto) -> str | int | None:
         if settings.channel_id:
@@ -7,7 +7,7 @@ from loguru import logger
 from sqlalchemy.exc import IntegrityError
 
 from src.core.security.jwt_handler import create_access_token, create_refresh_token
-from src.core.security.password import hash_password, verify_password
+from src.core.security.password import password_hasher
 from src.core.utils.time import datetime_now
 from src.core.utils.validators import validate_web_login_or_raise
 from src.infrastructure.database.models.dto import UserDto, WebAccountDto
@@ -72,7 +72,7 @@ async def register(
     name: Optional[str] = None,
 ) -> WebAuthPayload:
     normalized_username = validate_web_login_or_raise(username)
-    password_hashed = hash_password(password)
+    password_hashed = await password_hasher.hash(password)
 
     async with service.uow:
         existing_account = await service.uow.repository.web_accounts.get_by_username(
@@ -167,7 +167,13 @@ async def login(
         account_model = await service.uow.repository.web_accounts.get_by_username(
             normalized_username
         )
-        if not account_model or not verify_password(password, account_model.password_hash):
+        if not account_model:
+            raise ValueError("Invalid username or password")
+        is_valid, upgraded_hash = await password_hasher.verify_and_upgrade(
+            password,
+            account_model.password_hash,
+        )
+        if not is_valid:
             raise ValueError("Invalid username or password")
         if (
             account_model.requires_password_change
@@ -182,6 +188,16 @@ async def login(
         if user_model.is_blocked:
             raise ValueError("User is blocked")
 
+        if upgraded_hash:
+            account_model = (
+                await service.uow.repository.web_accounts.update(
+                    account_model.id,
+                    password_hash=upgraded_hash,
+                )
+                or account_model
+            )
+            await service.uow.commit()
+
         account_dto = WebAccountDto.from_model(account_model)
         user_dto = UserDto.from_model(user_model)
         if not account_dto or not user_dto:
@@ -224,7 +240,7 @@ async def get_or_create_for_telegram_user(
             preferred_username=preferred_username,
             telegram_id=user.telegram_id,
         )
-        password_hash = hash_password(secrets.token_urlsafe(32))
+        password_hash = await password_hasher.hash(secrets.token_urlsafe(32))
         created_account = await service.uow.repository.web_accounts.create(
             WebAccount(
                 user_telegram_id=user.telegram_id,
@@ -274,7 +290,7 @@ async def bootstrap_credentials_for_telegram_user(
     name: Optional[str] = None,
 ) -> WebAuthPayload:
     normalized_username = validate_web_login_or_raise(username)
-    password_hashed = hash_password(password)
+    password_hashed = await password_hasher.hash(password)
 
     async with service.uow:
         user_model = await service.uow.repository.users.get(telegram_id)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.constants import (
+    WEB_ANALYTICS_BUFFER_MAX_SIZE,
+    WEB_ANALYTICS_FLUSH_BATCH_SIZE,
+    WEB_ANALYTICS_FLUSH_INTERVAL_SECONDS,
+)
+from src.core.observability import emit_counter
+from src.infrastructure.database import UnitOfWork
+
+
+class WebAnalyticsEventBuffer:
+    """Bounded in-process queue of analytics rows flushed by a background consumer.
+
+    Rows are written with one multi-row INSERT per batch, either when the batch
+    fills up or when the flush interval elapses. When the queue is full new rows
+    are rejected so the endpoint can shed load instead of piling up commits.
+    """
+
+    def __init__(
+        self,
+        session_pool: async_sessionmaker[AsyncSession],
+        *,
+        max_size: int = WEB_ANALYTICS_BUFFER_MAX_SIZE,
+        batch_size: int = WEB_ANALYTICS_FLUSH_BATCH_SIZE,
+        flush_interval: float = WEB_ANALYTICS_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        self.session_pool = session_pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # ``None`` asks the consumer to stop once the rows queued before it are flushed.
+        self._queue: asyncio.Queue[Optional[dict[str, Any]]] = asyncio.Queue(maxsize=max_size)
+        self._consumer: Optional[asyncio.Task[None]] = None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def offer(self, row: dict[str, Any]) -> bool:
+        self._ensure_consumer()
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            emit_counter("web_analytics_events_dropped_total", reason="buffer_full")
+            return False
+        return True
+
+    async def close(self) -> None:
+        if self._consumer is not None:
+            if not self._consumer.done():
+                # The consumer finishes its current batch instead of dropping it.
+                await self._queue.put(None)
+                await self._consumer
+            self._consumer = None
+
+        while not self._queue.empty():
+            batch = [
+                row
+                for row in (
+                    self._queue.get_nowait()
+                    for _ in range(min(self.batch_size, self._queue.qsize()))
+                )
+                if row is not None
+            ]
+            if batch:
+                await self._flush(batch)
+
+    def _ensure_consumer(self) -> None:
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.create_task(self._consume())
+
+    async def _consume(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = await self._collect_batch()
+            if batch:
+                await self._flush(batch)
+
+    async def _collect_batch(self) -> tuple[list[dict[str, Any]], bool]:
+        """Next batch, and whether the stop marker was reached."""
+        loop = asyncio.get_running_loop()
+        first = await self._queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = loop.time() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                row = await asyncio.wait_for(self._queue.get(), timeout)
+            except TimeoutError:
+                break
+            if row is None:
+                return batch, True
+            batch.append(row)
+
+        return batch, False
+
+    async def _flush(self, batch: list[dict[str, Any]]) -> None:
+        # One retry covers a transient database error; a batch that still fails is
+        # bisected so that only the rows the database keeps rejecting are dropped.
+        if await self._insert(batch) or await self._insert(batch):
+            emit_counter("web_analytics_events_flushed_total", count=len(batch))
+            return
+        await self._flush_split(batch)
+
+    async def _flush_split(self, batch: list[dict[str, Any]]) -> None:
+        if len(batch) == 1:
+            logger.warning(f"Dropping analytics event '{batch[0].get('event_name')}'")
+            emit_counter("web_analytics_events_dropped_total", reason="flush_failed", count=1)
+            return
+
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            if await self._insert(half):
+                emit_counter("web_analytics_events_flushed_total", count=len(half))
+            else:
+                await self._flush_split(half)
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> bool:
+        try:
+            async with UnitOfWork(self.session_pool) as uow:
+                await uow.repository.web_analytics_events.create_many(rows)
+        except Exception as exception:
+            logger.warning(f"Failed to flush '{len(rows)}' analytics event(s): {exception}")
+            return False
+        return True
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.core.enums import (
+    Currency,
+    Locale,
+    PaymentGatewayType,
+    PlanType,
+    SubscriptionStatus,
+    UserRole,
+)
+from src.core.security.crypto import encrypt
+from src.core.utils.time import datetime_now
+from src.infrastructure.database.models.dto import PaymentGatewayDto, SubscriptionDto, UserDto
+from src.infrastructure.database.models.dto import base as dto_base
+from src.infrastructure.database.models.sql import PaymentGateway, Subscription, User
+
+
+@pytest.fixture
+def strict_materialization():
+    dto_base.set_strict_materialization(True)
+    yield
+    dto_base.set_strict_materialization(False)
+
+
+def build_subscription() -> Subscription:
+    now = datetime_now()
+    return Subscription(
+        id=5,
+        user_remna_id=uuid4(),
+        user_telegram_id=100,
+        status=SubscriptionStatus.ACTIVE,
+        is_trial=False,
+        traffic_limit=100,
+        device_limit=3,
+        internal_squads=[uuid4()],
+        external_squad=None,
+        expire_at=now + timedelta(days=30),
+        url="https://example.com/sub",
+        plan={
+            "id": 1,
+            "name": "Starter",
+            "type": PlanType.BOTH.value,
+            "traffic_limit": 100,
+            "device_limit": 3,
+            "duration": 30,
+            "internal_squads": [str(uuid4())],
+        },
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def build_user() -> User:
+    return User(
+        id=1,
+        telegram_id=100,
+        username="alice",
+        referral_code="ref",
+        name="Alice",
+        role=UserRole.ADMIN,
+        language=Locale.EN,
+        personal_discount=5,
+        purchase_discount=0,
+        points=10,
+        is_blocked=False,
+        is_bot_blocked=False,
+        is_rules_accepted=True,
+        partner_balance_currency_override=Currency.USD,
+        referral_invite_settings={"slots_enabled": True, "initial_slots": 3},
+        max_subscriptions=None,
+        current_subscription=build_subscription(),
+    )
+
+
+def materialize_both(dto_cls, row, **kwargs):
+    fast = dto_cls.from_model(row, **kwargs)
+    dto_base.set_strict_materialization(True)
+    try:
+        strict = dto_cls.from_model(row, **kwargs)
+    finally:
+        dto_base.set_strict_materialization(False)
+    return fast, strict
+
+
+def test_fast_path_matches_full_validation_for_nested_rows() -> None:
+    fast, strict = materialize_both(UserDto, build_user())
+
+    assert fast == strict
+    assert fast.model_dump() == strict.model_dump()
+    assert type(fast.current_subscription) is type(strict.current_subscription)
+    assert fast.referral_invite_settings.initial_slots == 3
+    assert fast.has_any_subscription is strict.has_any_subscription
+
+
+def test_fast_path_keeps_change_tracking_empty_until_assignment() -> None:
+    subscription = SubscriptionDto.from_model(build_subscription())
+    assert subscription is not None
+    assert subscription.changed_data == {}
+
+    subscription.device_limit = 5
+
+    assert subscription.changed_data == {"device_limit": 5}
+
+
+def test_decrypted_gateway_settings_match_full_validation() -> None:
+    row = PaymentGateway(
+        id=1,
+        order_index=1,
+        type=PaymentGatewayType.CRYPTOPAY,
+        currency=Currency.USD,
+        is_active=True,
+        settings={
+            "type": PaymentGatewayType.CRYPTOPAY.value,
+            "shop_id": "shop",
+            "api_key": encrypt("api-key"),
+            "secret_key": encrypt("secret-key"),
+        },
+    )
+
+    fast, strict = materialize_both(PaymentGatewayDto, row, decrypt=True)
+
+    assert fast == strict
+    assert fast.settings.api_key.get_secret_value() == "api-key"
+
+
+def test_invalid_rows_still_fail_validation() -> None:
+    row = build_subscription()
+    row.expire_at = "not a date"  # type: ignore[assignment]
+
+    with pytest.raises(ValueError):
+        SubscriptionDto.from_model(row)
+
+
+def test_strict_mode_uses_full_validation(strict_materialization, monkeypatch) -> None:
+    monkeypatch.setattr(
+        SubscriptionDto,
+        "model_construct",
+        classmethod(lambda cls, **values: pytest.fail("fast path used in strict mode")),
+    )
+
+    assert SubscriptionDto.from_model(build_subscription()) is not None
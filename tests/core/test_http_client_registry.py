@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import asyncio
+
+from src.core.config.http import HttpConfig
+from src.infrastructure.http import HttpClientRegistry
+
+
+def run_async(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_clients_for_same_host_share_pooled_transport() -> None:
+    registry = HttpClientRegistry(HttpConfig())
+
+    first = registry.client("https://api.example.com/v1", headers={"X-Key": "a"})
+    second = registry.client("https://API.example.com:443/v2", auth=("shop", "secret"))
+    other_host = registry.client("https://pay.example.org")
+
+    assert first._transport is second._transport
+    assert first._transport is not other_host._transport
+    assert first.headers["X-Key"] == "a"
+    assert len(registry._transports) == 2
+
+    run_async(registry.close())
+    assert registry._transports == {}
+
+
+def test_http2_falls_back_when_h2_is_missing(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "src.infrastructure.http.registry.find_spec",
+        lambda name: None,
+    )
+
+    registry = HttpClientRegistry(HttpConfig(http2=True))
+
+    assert registry._http2 is False
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.core.security.password import (
+    PasswordHasher,
+    PasswordHasherBusyError,
+    hash_password,
+    needs_rehash,
+    verify_password,
+)
+
+
+def run_async(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_hasher_hashes_and_verifies_off_the_event_loop() -> None:
+    hasher = PasswordHasher(max_workers=2, rounds=4)
+
+    async def _run() -> tuple[str, bool, bool]:
+        password_hash = await hasher.hash("secret123")
+        return (
+            password_hash,
+            await hasher.verify("secret123", password_hash),
+            await hasher.verify("wrong", password_hash),
+        )
+
+    try:
+        password_hash, is_valid, is_invalid = run_async(_run())
+    finally:
+        hasher.shutdown()
+
+    assert password_hash.startswith("$2b$04$")
+    assert is_valid is True
+    assert is_invalid is False
+    assert hasher.pending == 0
+
+
+def test_verify_and_upgrade_rehashes_outdated_cost() -> None:
+    hasher = PasswordHasher(rounds=5)
+    legacy_hash = hash_password("secret123", rounds=4)
+
+    try:
+        is_valid, upgraded_hash = run_async(hasher.verify_and_upgrade("secret123", legacy_hash))
+        current_valid, no_upgrade = run_async(
+            hasher.verify_and_upgrade("secret123", upgraded_hash or "")
+        )
+        wrong_valid, wrong_upgrade = run_async(hasher.verify_and_upgrade("nope", legacy_hash))
+    finally:
+        hasher.shutdown()
+
+    assert is_valid is True
+    assert upgraded_hash is not None
+    assert verify_password("secret123", upgraded_hash)
+    assert not needs_rehash(upgraded_hash, rounds=5)
+    assert (current_valid, no_upgrade) == (True, None)
+    assert (wrong_valid, wrong_upgrade) == (False, None)
+
+
+def test_hasher_rejects_jobs_beyond_queue_depth() -> None:
+    hasher = PasswordHasher(max_workers=1, max_pending=1, rounds=4)
+
+    async def _run() -> None:
+        first = asyncio.create_task(hasher.hash("one"))
+        await asyncio.sleep(0)
+        try:
+            with pytest.raises(PasswordHasherBusyError):
+                await hasher.hash("two")
+        finally:
+            await first
+
+    try:
+        run_async(_run())
+    finally:
+        hasher.shutdown()
+
+    assert hasher.pending == 0
+
+
+def test_needs_rehash_flags_foreign_and_malformed_hashes() -> None:
+    assert needs_rehash("$2b$12$" + "a" * 53, rounds=12) is False
+    assert needs_rehash("$2b$10$" + "a" * 53, rounds=12) is True
+    assert needs_rehash("$2a$12$" + "a" * 53, rounds=12) is True
+    assert needs_rehash("plain", rounds=12) is True
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from src.core.enums import PaymentGatewayType
+from src.infrastructure.payment_gateways.registry import PaymentGatewayRegistry
+
+
+class FakeFanout:
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[str] = asyncio.Queue()
+        self.unsubscribe = AsyncMock()
+
+    async def subscribe(self, channel: str) -> asyncio.Queue[str]:
+        assert channel == "payment_gateway_registry"
+        return self.queue
+
+
+def build_registry(**kwargs) -> tuple[PaymentGatewayRegistry, MagicMock, FakeFanout]:
+    fanout = FakeFanout()
+    factory = MagicMock(side_effect=lambda gateway: f"instance-{gateway.id}")
+    registry = PaymentGatewayRegistry(
+        factory,
+        SimpleNamespace(publish=AsyncMock()),  # type: ignore[arg-type]
+        fanout,  # type: ignore[arg-type]
+        **kwargs,
+    )
+    return registry, factory, fanout
+
+
+def test_concurrent_lookups_load_and_build_once() -> None:
+    registry, factory, _fanout = build_registry()
+    load = AsyncMock(return_value=SimpleNamespace(id=1))
+
+    async def scenario() -> list[object]:
+        results = await asyncio.gather(
+            *(registry.get(PaymentGatewayType.YOOKASSA, load) for _ in range(5))
+        )
+        await registry.close()
+        return list(results)
+
+    assert asyncio.run(scenario()) == ["instance-1"] * 5
+    assert load.await_count == 1
+    assert factory.call_count == 1
+
+
+def test_invalidation_from_another_process_drops_the_entry() -> None:
+    registry, _factory, fanout = build_registry()
+    load = AsyncMock(side_effect=[SimpleNamespace(id=1), SimpleNamespace(id=2)])
+
+    async def scenario() -> tuple[object, object]:
+        first = await registry.get(PaymentGatewayType.YOOKASSA, load)
+        fanout.queue.put_nowait(PaymentGatewayType.YOOKASSA.value)
+        await asyncio.sleep(0)
+        second = await registry.get(PaymentGatewayType.YOOKASSA, load)
+        await registry.close()
+        return first, second
+
+    assert asyncio.run(scenario()) == ("instance-1", "instance-2")
+    fanout.unsubscribe.assert_awaited_once()
+
+
+def test_load_racing_an_invalidation_is_not_kept_and_publishes() -> None:
+    registry, _factory, _fanout = build_registry()
+
+    async def load() -> SimpleNamespace:
+        await registry.invalidate()
+        return SimpleNamespace(id=1)
+
+    async def scenario() -> None:
+        assert await registry.get(PaymentGatewayType.PLATEGA, load) == "instance-1"
+        await registry.close()
+
+    asyncio.run(scenario())
+
+    assert registry._entries == {}
+    registry.redis_client.publish.assert_awaited_once_with("payment_gateway_registry", "*")
+
+
+def test_entries_expire_after_max_age() -> None:
+    registry, _factory, _fanout = build_registry(max_age=0)
+    load = AsyncMock(return_value=SimpleNamespace(id=1))
+
+    async def scenario() -> None:
+        await registry.get(PaymentGatewayType.PLATEGA, load)
+        await registry.get(PaymentGatewayType.PLATEGA, load)
+        await registry.close()
+
+    asyncio.run(scenario())
+
+    assert load.await_count == 2
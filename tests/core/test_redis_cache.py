@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Optional
+
+from src.infrastructure.redis.cache import invalidate_cache_tags, redis_cache
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+
+    async def mget(self, keys: list[str]) -> list[Optional[bytes]]:
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, ex: int, nx: bool = False) -> bool:
+        del ex
+        if nx and key in self.values:
+            return False
+        self.values[key] = value.encode() if isinstance(value, str) else value
+        return True
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        del script, numkeys
+        if self.values.get(key) == token.encode():
+            del self.values[key]
+            return 1
+        return 0
+
+    def pipeline(self, transaction: bool) -> FakeRedis:
+        del transaction
+        return self
+
+    async def __aenter__(self) -> FakeRedis:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def incr(self, key: str) -> None:
+        self.values[key] = str(int(self.values.get(key, b"0")) + 1).encode()
+
+    async def execute(self) -> list[Any]:
+        return []
+
+
+class FakeService:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis_client = redis
+        self.calls: list[int] = []
+        self.missing: set[int] = set()
+
+    @redis_cache(prefix="item", ttl=60, tags=("items",), negative_ttl=0)
+    async def get_item(self, item_id: int, suffix: str = "x") -> Optional[str]:
+        self.calls.append(item_id)
+        await asyncio.sleep(0.01)
+        if item_id in self.missing:
+            return None
+        return f"{item_id}-{suffix}"
+
+    @redis_cache(prefix="profile", ttl=60)
+    async def get_profile(self, item_id: int) -> dict[str, Any]:
+        self.calls.append(item_id)
+        await asyncio.sleep(0.01)
+        return {"id": item_id, "tags": []}
+
+    @redis_cache(prefix="stale_item", ttl=60, stale_ttl=60)
+    async def get_stale_item(self, item_id: int) -> str:
+        self.calls.append(item_id)
+        return f"{item_id}-{len(self.calls)}"
+
+
+def test_concurrent_misses_share_one_load_and_keys_ignore_call_style() -> None:
+    service = FakeService(FakeRedis())
+
+    async def scenario() -> list[Optional[str]]:
+        results = await asyncio.gather(*(service.get_item(1) for _ in range(5)))
+        return [*results, await service.get_item(item_id=1, suffix="x")]
+
+    assert asyncio.run(scenario()) == ["1-x"] * 6
+    assert service.calls == [1]
+    assert "cache:item:1:x" in service.redis_client.values
+
+
+def test_callers_sharing_a_load_get_their_own_copies() -> None:
+    service = FakeService(FakeRedis())
+
+    async def scenario() -> list[dict[str, Any]]:
+        return list(await asyncio.gather(*(service.get_profile(1) for _ in range(3))))
+
+    profiles = asyncio.run(scenario())
+    profiles[0]["tags"].append("changed")
+
+    assert service.calls == [1]
+    assert profiles[1] == profiles[2] == {"id": 1, "tags": []}
+    assert len({id(profile) for profile in profiles}) == 3
+
+
+def test_generation_bump_invalidates_the_tagged_family() -> None:
+    redis = FakeRedis()
+    service = FakeService(redis)
+
+    async def scenario() -> None:
+        await service.get_item(1)
+        await service.get_item(2)
+        await invalidate_cache_tags(redis, "items")
+        await service.get_item(1)
+        await service.get_item(2)
+
+    asyncio.run(scenario())
+
+    assert service.calls == [1, 2, 1, 2]
+
+
+def test_negative_results_are_not_cached_when_negative_ttl_is_zero() -> None:
+    service = FakeService(FakeRedis())
+    service.missing.add(3)
+
+    async def scenario() -> None:
+        await service.get_item(3)
+        await service.get_item(3)
+
+    asyncio.run(scenario())
+
+    assert service.calls == [3, 3]
+
+
+def test_expired_entry_is_served_stale_while_another_caller_refreshes(monkeypatch) -> None:
+    redis = FakeRedis()
+    service = FakeService(redis)
+    now = time.time()
+
+    async def scenario() -> tuple[str, str, str]:
+        first = await service.get_stale_item(7)
+        monkeypatch.setattr("src.infrastructure.redis.cache.time.time", lambda: now + 120)
+        # Another process holds the refresh lock, so this caller gets the stale value.
+        redis.values["cache_lock:cache:stale_item:7"] = b"other"
+        stale = await service.get_stale_item(7)
+        del redis.values["cache_lock:cache:stale_item:7"]
+        refreshed = await service.get_stale_item(7)
+        return first, stale, refreshed
+
+    assert asyncio.run(scenario()) == ("7-1", "7-1", "7-2")
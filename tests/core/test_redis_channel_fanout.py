@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.infrastructure.redis.fanout import RedisChannelFanout
+
+
+class FakePubSub:
+    def __init__(self) -> None:
+        self.subscribe = AsyncMock()
+        self.unsubscribe = AsyncMock()
+        self.messages: asyncio.Queue[dict] = asyncio.Queue()
+
+    async def get_message(self, ignore_subscribe_messages: bool, timeout: float):
+        del ignore_subscribe_messages
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        return None
+
+
+def test_fanout_shares_one_subscription_per_channel_and_delivers_to_all_listeners() -> None:
+    pubsub = FakePubSub()
+    fanout = RedisChannelFanout(
+        SimpleNamespace(pubsub=lambda **_: pubsub),  # type: ignore[arg-type]
+        queue_size=1,
+        poll_timeout=0.01,
+    )
+
+    async def scenario() -> tuple[str, str]:
+        first = await fanout.subscribe("user_events:1")
+        second = await fanout.subscribe("user_events:1")
+        pubsub.subscribe.assert_awaited_once_with("user_events:1")
+
+        pubsub.messages.put_nowait({"type": "message", "channel": b"user_events:1", "data": b"one"})
+        first_value = await asyncio.wait_for(first.get(), timeout=1)
+        second_value = await asyncio.wait_for(second.get(), timeout=1)
+
+        await fanout.unsubscribe("user_events:1", first)
+        pubsub.unsubscribe.assert_not_awaited()
+        await fanout.unsubscribe("user_events:1", second)
+        pubsub.unsubscribe.assert_awaited_once_with("user_events:1")
+
+        await fanout.close()
+        return first_value, second_value
+
+    assert asyncio.run(scenario()) == ("one", "one")
+
+
+def test_fanout_drops_messages_for_slow_listeners() -> None:
+    fanout = RedisChannelFanout(SimpleNamespace(), queue_size=1)  # type: ignore[arg-type]
+    queue: asyncio.Queue[str] = asyncio.Queue(maxsize=1)
+    fanout._listeners["user_events:1"] = {queue}
+
+    fanout._dispatch("user_events:1", "one")
+    fanout._dispatch("user_events:1", "two")
+    fanout._dispatch("user_events:2", "other")
+
+    assert queue.get_nowait() == "one"
+    assert queue.empty()
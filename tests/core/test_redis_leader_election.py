@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+from unittest.mock import AsyncMock
+
+from src.infrastructure.redis.leader import (
+    RELEASE_LEASE_SCRIPT,
+    RENEW_LEASE_SCRIPT,
+    RedisLeaderElection,
+)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.renewals = 0
+
+    async def set(self, key: str, value: str, *, nx: bool, px: int) -> Optional[bool]:
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def eval(self, script: str, numkeys: int, key: str, owner: str, *args: Any) -> int:
+        if self.values.get(key) != owner:
+            return 0
+        if script == RELEASE_LEASE_SCRIPT:
+            del self.values[key]
+        else:
+            assert script == RENEW_LEASE_SCRIPT
+            self.renewals += 1
+        return 1
+
+
+def _election(redis: FakeRedis, name: str) -> RedisLeaderElection:
+    return RedisLeaderElection(
+        redis,  # type: ignore[arg-type]
+        "api_leader",
+        ttl=1.0,
+        renew_interval=0.01,
+        name=name,
+    )
+
+
+def test_only_one_process_wins_and_a_follower_takes_over_after_release() -> None:
+    redis = FakeRedis()
+    first = _election(redis, "first")
+    second = _election(redis, "second")
+    elected = AsyncMock()
+
+    async def scenario() -> None:
+        assert await first.acquire() is True
+        assert await second.acquire() is False
+
+        await second.start(on_elected=elected)
+        await first.stop()
+        await asyncio.sleep(0.05)
+        await second.stop()
+
+    asyncio.run(scenario())
+
+    elected.assert_awaited_once()
+    assert redis.values == {}
+
+
+def test_leader_is_demoted_when_its_lease_is_taken() -> None:
+    redis = FakeRedis()
+    leader = _election(redis, "leader")
+    demoted = AsyncMock()
+
+    async def scenario() -> None:
+        await leader.acquire()
+        await leader.start(on_demoted=demoted)
+        redis.values["api_leader"] = "other"  # the lease expired and another process won
+        await asyncio.sleep(0.05)
+        await leader.stop()
+
+    asyncio.run(scenario())
+
+    assert leader.is_leader is False
+    demoted.assert_awaited_once()
+    assert redis.values == {"api_leader": "other"}
+
+
+def test_lease_is_renewed_while_the_elected_callback_runs() -> None:
+    redis = FakeRedis()
+    election = _election(redis, "slow")
+    release = asyncio.Event()
+
+    async def slow_startup() -> None:
+        await release.wait()
+
+    async def scenario() -> None:
+        await election.start(on_elected=slow_startup)
+        await asyncio.sleep(0.1)
+        assert election.is_leader is True
+        assert redis.renewals > 1
+        await election.stop()
+
+    asyncio.run(scenario())
+
+    assert redis.values == {}
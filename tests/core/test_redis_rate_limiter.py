@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.infrastructure.redis.rate_limiter import RedisRateLimiter
+
+
+def test_hit_maps_script_result_to_decision() -> None:
+    client = SimpleNamespace(eval=AsyncMock(side_effect=[[1, 1, 0], [0, 1, 250_000]]))
+    limiter = RedisRateLimiter(client)  # type: ignore[arg-type]
+
+    allowed = asyncio.run(limiter.hit("throttling:message:1", limit=1, window=0.5))
+    rejected = asyncio.run(limiter.hit("throttling:message:1", limit=1, window=0.5))
+
+    assert allowed.allowed is True
+    assert rejected.allowed is False
+    assert rejected.retry_after == 0.25
+    args = client.eval.await_args.args
+    assert args[1:5] == (1, "throttling:message:1", 1, 500_000)
+
+
+def test_rejected_keys_are_answered_locally_until_their_window_frees_up() -> None:
+    client = SimpleNamespace(eval=AsyncMock(return_value=[0, 3, 60_000_000]))
+    limiter = RedisRateLimiter(client)  # type: ignore[arg-type]
+
+    async def scenario() -> list[bool]:
+        decisions = [await limiter.hit("auth:key", limit=3, window=60) for _ in range(3)]
+        return [decision.allowed for decision in decisions]
+
+    assert asyncio.run(scenario()) == [False, False, False]
+    client.eval.assert_awaited_once()
+
+
+def test_local_cache_is_bounded() -> None:
+    client = SimpleNamespace(eval=AsyncMock(return_value=[0, 1, 60_000_000]))
+    limiter = RedisRateLimiter(client, local_max_keys=2)  # type: ignore[arg-type]
+
+    async def scenario() -> None:
+        for index in range(4):
+            await limiter.hit(f"key:{index}", limit=1, window=60)
+
+    asyncio.run(scenario())
+
+    assert len(limiter._blocked_until) == 2
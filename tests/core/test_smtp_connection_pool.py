@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import smtplib
+from email.message import EmailMessage
+
+from src.core.config.email import EmailConfig
+from src.infrastructure.smtp import SmtpConnectionPool
+from src.infrastructure.smtp import pool as pool_module
+
+
+def run_async(coroutine):
+    return asyncio.run(coroutine)
+
+
+class FakeSmtp:
+    instances: list["FakeSmtp"] = []
+
+    def __init__(self, *, host: str, port: int, timeout: float) -> None:
+        del host, port, timeout
+        self.sent: list[str] = []
+        self.closed = False
+        FakeSmtp.instances.append(self)
+
+    def ehlo(self) -> None: ...
+
+    def starttls(self) -> None: ...
+
+    def login(self, username: str, password: str) -> None: ...
+
+    def noop(self) -> tuple[int, bytes]:
+        return (250, b"OK") if not self.closed else (421, b"closed")
+
+    def send_message(self, message: EmailMessage) -> None:
+        if message["To"] == "rejected@example.com":
+            raise smtplib.SMTPRecipientsRefused({message["To"]: (550, b"no such user")})
+        self.sent.append(message["To"])
+
+    def quit(self) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def build_message(to_email: str) -> EmailMessage:
+    message = EmailMessage()
+    message["To"] = to_email
+    message.set_content("Body")
+    return message
+
+
+def test_pool_reuses_connection_across_batches_and_keeps_it_on_recipient_errors(
+    monkeypatch,
+) -> None:
+    FakeSmtp.instances = []
+    monkeypatch.setattr(pool_module.smtplib, "SMTP", FakeSmtp)
+    pool = SmtpConnectionPool(EmailConfig(host="smtp.example.com", pool_size=1))
+
+    async def _run():
+        first = await pool.send_batch(
+            [build_message("a@example.com"), build_message("rejected@example.com")]
+        )
+        second = await pool.send_batch([build_message("b@example.com")])
+        return first, second
+
+    try:
+        first, second = run_async(_run())
+    finally:
+        pool.close()
+
+    assert first[0] is None
+    assert isinstance(first[1], smtplib.SMTPRecipientsRefused)
+    assert second == [None]
+    assert len(FakeSmtp.instances) == 1
+    assert FakeSmtp.instances[0].sent == ["a@example.com", "b@example.com"]
+    assert FakeSmtp.instances[0].closed is True
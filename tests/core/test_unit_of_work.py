@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.database import UnitOfWork
+
+
+def build_uow() -> tuple[UnitOfWork, SimpleNamespace]:
+    session = SimpleNamespace(commit=AsyncMock(), rollback=AsyncMock())
+
+    @asynccontextmanager
+    async def session_pool():
+        yield session
+
+    return UnitOfWork(session_pool), session  # type: ignore[arg-type]
+
+
+def test_after_commit_callbacks_run_when_the_outermost_context_commits() -> None:
+    uow, session = build_uow()
+    calls: list[str] = []
+
+    async def on_commit() -> None:
+        assert session.commit.await_count == 1
+        calls.append("committed")
+
+    async def _run() -> None:
+        async with uow:
+            async with uow:
+                uow.after_commit(on_commit)
+            assert calls == []
+
+    asyncio.run(_run())
+
+    assert calls == ["committed"]
+
+
+def test_after_commit_callbacks_are_discarded_on_rollback() -> None:
+    uow, _ = build_uow()
+    on_commit = AsyncMock()
+
+    async def _run() -> None:
+        async with uow:
+            uow.after_commit(on_commit)
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_run())
+
+    on_commit.assert_not_awaited()
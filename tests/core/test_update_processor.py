@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from aiogram.types import Update
+
+from src.bot.update_processor import UpdateProcessor, update_lane_key
+
+
+def _message_update(update_id: int, chat_id: int) -> Update:
+    return Update.model_validate(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": chat_id, "type": "private"},
+                "from": {"id": chat_id, "is_bot": False, "first_name": "User"},
+                "text": "hi",
+            },
+        }
+    )
+
+
+def _processor(handler: Any, **overrides: Any) -> UpdateProcessor:
+    options: dict[str, Any] = {
+        "concurrency": 4,
+        "max_pending": 100,
+        "max_pending_per_chat": 10,
+        "drain_timeout": 1.0,
+    }
+    options.update(overrides)
+    return UpdateProcessor(handler, **options)
+
+
+def test_updates_of_one_chat_run_in_order_while_chats_run_in_parallel() -> None:
+    running: dict[int, int] = {}
+    overlaps: list[int] = []
+    handled: list[tuple[int, int]] = []
+
+    async def handler(bot: Any, update: Update) -> None:
+        chat_id = update_lane_key(update)
+        assert isinstance(chat_id, int)
+        running[chat_id] = running.get(chat_id, 0) + 1
+        overlaps.append(len([count for count in running.values() if count]))
+        assert running[chat_id] == 1, "same chat processed concurrently"
+        await asyncio.sleep(0.01)
+        handled.append((chat_id, update.update_id))
+        running[chat_id] -= 1
+
+    async def scenario() -> None:
+        processor = _processor(handler)
+        processor.start()
+        for update_id in range(6):
+            assert processor.submit(object(), _message_update(update_id, chat_id=update_id % 2))  # type: ignore[arg-type]
+        await processor.close()
+
+    asyncio.run(scenario())
+
+    assert [update_id for chat_id, update_id in handled if chat_id == 0] == [0, 2, 4]
+    assert [update_id for chat_id, update_id in handled if chat_id == 1] == [1, 3, 5]
+    assert max(overlaps) == 2
+
+
+def test_submit_sheds_when_queue_or_chat_backlog_is_full() -> None:
+    release = asyncio.Event()
+
+    async def handler(bot: Any, update: Update) -> None:
+        await release.wait()
+
+    async def scenario() -> list[bool]:
+        processor = _processor(handler, concurrency=1, max_pending=3, max_pending_per_chat=1)
+        processor.start()
+        results = [processor.submit(object(), _message_update(1, chat_id=1))]  # type: ignore[arg-type]
+        await asyncio.sleep(0)  # let a worker pick update 1 up
+        results += [
+            processor.submit(object(), _message_update(2, chat_id=1)),  # type: ignore[arg-type]
+            processor.submit(object(), _message_update(3, chat_id=1)),  # type: ignore[arg-type]
+            processor.submit(object(), _message_update(4, chat_id=2)),  # type: ignore[arg-type]
+            processor.submit(object(), _message_update(5, chat_id=3)),  # type: ignore[arg-type]
+        ]
+        release.set()
+        await processor.close()
+        return results
+
+    # Update 1 is in flight, update 2 fills chat 1's lane, update 4 fills the queue.
+    assert asyncio.run(scenario()) == [True, True, False, True, False]
+
+
+def test_close_drains_queued_updates_and_then_rejects_new_ones() -> None:
+    handled: list[int] = []
+
+    async def handler(bot: Any, update: Update) -> None:
+        await asyncio.sleep(0.01)
+        handled.append(update.update_id)
+
+    async def scenario() -> bool:
+        processor = _processor(handler, concurrency=1)
+        processor.start()
+        for update_id in range(3):
+            processor.submit(object(), _message_update(update_id, chat_id=update_id))  # type: ignore[arg-type]
+        await processor.close()
+        return processor.submit(object(), _message_update(9, chat_id=9))  # type: ignore[arg-type]
+
+    assert asyncio.run(scenario()) is False
+    assert handled == [0, 1, 2]
+
+
+def test_handler_errors_do_not_stop_the_lane() -> None:
+    handled: list[int] = []
+
+    async def handler(bot: Any, update: Update) -> None:
+        if update.update_id == 1:
+            raise RuntimeError("boom")
+        handled.append(update.update_id)
+
+    async def scenario() -> None:
+        processor = _processor(handler, concurrency=1)
+        processor.start()
+        for update_id in (1, 2):
+            processor.submit(object(), _message_update(update_id, chat_id=7))  # type: ignore[arg-type]
+        await processor.close()
+
+    asyncio.run(scenario())
+
+    assert handled == [2]
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+from unittest.mock import AsyncMock
+
+from aiogram.types import Update
+
+from src.bot.update_stream import (
+    UpdateStreamConsumer,
+    UpdateStreamPublisher,
+    update_partition,
+)
+from src.infrastructure.redis.leader import RELEASE_LEASE_SCRIPT, RENEW_LEASE_SCRIPT
+
+
+def _message_update(update_id: int, chat_id: int) -> Update:
+    return Update.model_validate(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": chat_id, "type": "private"},
+                "from": {"id": chat_id, "is_bot": False, "first_name": "User"},
+                "text": "hi",
+            },
+        }
+    )
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        def record(*args: Any) -> None:
+            self.calls.append((name, args))
+
+        return record
+
+    async def execute(self) -> list[Any]:
+        return [getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+class FakeRedis:
+    """The lease and consumer-group calls the consumer makes, kept in memory."""
+
+    def __init__(self) -> None:
+        self.now_ms = 1_000_000
+        self.strings: dict[str, str] = {}
+        self.workers: dict[str, int] = {}
+        self.pending: dict[str, dict[str, str]] = {}  # stream -> entry id -> consumer
+        self.claimable: dict[str, list[tuple[bytes, dict[bytes, bytes]]]] = {}
+        self.acked: list[tuple[str, str]] = []
+
+    async def time(self) -> tuple[int, int]:
+        return self.now_ms // 1000, (self.now_ms % 1000) * 1000
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def zadd(self, key: str, mapping: dict[str, int]) -> int:
+        self.workers.update(mapping)
+        return 1
+
+    def zremrangebyscore(self, key: str, low: str, high: int) -> int:
+        stale = [name for name, score in self.workers.items() if score <= high]
+        for name in stale:
+            del self.workers[name]
+        return len(stale)
+
+    def zcard(self, key: str) -> int:
+        return len(self.workers)
+
+    async def zrem(self, key: str, name: str) -> int:
+        return int(self.workers.pop(name, None) is not None)
+
+    async def set(self, key: str, value: str, *, nx: bool, px: int) -> Optional[bool]:
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    async def eval(self, script: str, numkeys: int, key: str, owner: str, *args: Any) -> int:
+        if self.strings.get(key) != owner:
+            return 0
+        if script == RELEASE_LEASE_SCRIPT:
+            del self.strings[key]
+        else:
+            assert script == RENEW_LEASE_SCRIPT
+        return 1
+
+    async def xautoclaim(self, stream: str, group: str, consumer: str, **kwargs: Any) -> list[Any]:
+        entries = self.claimable.pop(stream, [])
+        for entry_id, _ in entries:
+            self.pending.setdefault(stream, {})[entry_id.decode()] = consumer
+        return [b"0-0", entries, []]
+
+    async def xpending(self, stream: str, group: str) -> dict[str, Any]:
+        counts: dict[str, int] = {}
+        for consumer in self.pending.get(stream, {}).values():
+            counts[consumer] = counts.get(consumer, 0) + 1
+        return {
+            "pending": sum(counts.values()),
+            "consumers": [
+                {"name": name.encode(), "pending": count} for name, count in counts.items()
+            ],
+        }
+
+    async def xack(self, stream: str, group: str, entry_id: str) -> int:
+        self.acked.append((stream, entry_id))
+        self.pending.get(stream, {}).pop(entry_id, None)
+        return 1
+
+
+def _consumer(redis: FakeRedis, name: str, handler: Any = None) -> UpdateStreamConsumer:
+    return UpdateStreamConsumer(
+        redis,  # type: ignore[arg-type]
+        bot=object(),  # type: ignore[arg-type]
+        handler=handler or AsyncMock(),
+        partitions=4,
+        concurrency=2,
+        max_pending=100,
+        drain_timeout=1.0,
+        consumer_name=name,
+    )
+
+
+def test_updates_of_one_chat_always_land_in_the_same_partition() -> None:
+    partitions = {update_partition(_message_update(i, chat_id=42), 16) for i in range(5)}
+
+    assert len(partitions) == 1
+    assert update_partition(_message_update(1, chat_id=42), 16) == 8
+
+
+def test_publisher_appends_a_roundtrippable_update() -> None:
+    client = AsyncMock()
+    publisher = UpdateStreamPublisher(client, partitions=16, max_length=1000)
+    update = _message_update(7, chat_id=42)
+
+    asyncio.run(publisher.publish(update))
+
+    stream, fields = client.xadd.await_args.args
+    assert stream == "bot_updates:8"
+    assert client.xadd.await_args.kwargs == {"maxlen": 1000, "approximate": True}
+    assert Update.model_validate_json(fields["update"]) == update
+
+
+def test_workers_split_partitions_and_rebalance_when_one_joins() -> None:
+    redis = FakeRedis()
+    first = _consumer(redis, "first")
+    second = _consumer(redis, "second")
+
+    async def scenario() -> None:
+        await first.rebalance()
+        assert first.owned == {0, 1, 2, 3}
+
+        await second.rebalance()  # every partition is still leased to the first worker
+        assert second.owned == set()
+        await first.rebalance()  # sees two workers and gives back half
+        await second.rebalance()
+
+    asyncio.run(scenario())
+
+    assert len(first.owned) == 2
+    assert len(second.owned) == 2
+    assert first.owned.isdisjoint(second.owned)
+
+
+def test_taken_over_partition_waits_for_the_previous_owner_and_claims_stale_updates() -> None:
+    redis = FakeRedis()
+    handled: list[int] = []
+
+    async def handler(bot: Any, update: Update) -> None:
+        handled.append(update.update_id)
+
+    consumer = _consumer(redis, "second", handler)
+    stream = "bot_updates:0"
+    # The crashed owner left one update unacknowledged and another one still in flight.
+    redis.pending[stream] = {"1-0": "first", "2-0": "first"}
+    redis.claimable[stream] = [
+        (b"1-0", {b"update": _message_update(1, 5).model_dump_json().encode()})
+    ]
+
+    async def scenario() -> None:
+        consumer.processor.start()
+        consumer.owned.add(0)
+        assert await consumer._settle(0) is False
+        await consumer.processor.close()
+
+        redis.pending[stream].pop("2-0")
+        assert await consumer._settle(0) is True
+
+    asyncio.run(scenario())
+
+    assert handled == [1]
+    assert redis.acked == [(stream, "1-0")]
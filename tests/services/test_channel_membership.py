@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.enums import ChatMemberStatus
+
+from src.services.channel_membership import ChannelMembershipService
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    def pipeline(self, transaction: bool) -> FakeRedis:
+        del transaction
+        return self
+
+    async def __aenter__(self) -> FakeRedis:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self.values[key] = value.encode()
+        self.ttls[key] = ttl
+
+    async def execute(self) -> list[object]:
+        return []
+
+
+def build_service(status: ChatMemberStatus = ChatMemberStatus.MEMBER):
+    redis = FakeRedis()
+    bot = SimpleNamespace(get_chat_member=AsyncMock(return_value=SimpleNamespace(status=status)))
+    service = ChannelMembershipService(
+        config=MagicMock(),
+        bot=bot,
+        redis_client=redis,
+        redis_repository=MagicMock(),
+        translator_hub=MagicMock(),
+    )
+    return service, bot, redis
+
+
+def test_get_status_calls_telegram_once_and_serves_cache_afterwards() -> None:
+    service, bot, redis = build_service()
+
+    async def scenario() -> list[ChatMemberStatus]:
+        return [await service.get_status("@Channel", 42) for _ in range(3)]
+
+    assert asyncio.run(scenario()) == [ChatMemberStatus.MEMBER] * 3
+    bot.get_chat_member.assert_awaited_once_with(chat_id="@Channel", user_id=42)
+    assert redis.ttls == {"channel_member_status:@channel:42": 3600}
+
+
+def test_non_members_are_cached_briefly_and_force_recheck_bypasses_cache() -> None:
+    service, bot, redis = build_service(ChatMemberStatus.LEFT)
+
+    async def scenario() -> None:
+        await service.get_status(-100123, 42)
+        await service.get_status(-100123, 42, force_recheck=True)
+
+    asyncio.run(scenario())
+
+    assert bot.get_chat_member.await_count == 2
+    assert redis.ttls == {"channel_member_status:-100123:42": 60}
+
+
+def test_chat_member_update_is_served_for_id_and_username_without_api_calls() -> None:
+    service, bot, _redis = build_service()
+    update = SimpleNamespace(
+        chat=SimpleNamespace(id=-100123, username="Channel"),
+        new_chat_member=SimpleNamespace(
+            status=ChatMemberStatus.KICKED,
+            user=SimpleNamespace(id=42),
+        ),
+    )
+
+    async def scenario() -> tuple[ChatMemberStatus, ChatMemberStatus]:
+        await service.record_update(update)  # type: ignore[arg-type]
+        return await service.get_status(-100123, 42), await service.get_status("@channel", 42)
+
+    assert asyncio.run(scenario()) == (ChatMemberStatus.KICKED, ChatMemberStatus.KICKED)
+    bot.get_chat_member.assert_not_awaited()
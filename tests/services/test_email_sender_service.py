@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import smtplib
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.core.config.email import EmailConfig
+from src.core.utils import json_utils
+from src.infrastructure.taskiq.tasks import emails as email_tasks
+from src.services.email_sender import CLAIM_SCRIPT, RESCHEDULE_SCRIPT, EmailSenderService
+
+
+def run_async(coroutine):
+    return asyncio.run(coroutine)
+
+
+class FakeOutboxRepository:
+    def __init__(self) -> None:
+        self.entries: dict[str, float] = {}
+        self.client = SimpleNamespace(eval=self._eval)
+
+    async def _eval(self, script: str, numkeys: int, key: str, *args):
+        del numkeys, key
+        if script == CLAIM_SCRIPT:
+            now, count, lease_until = args
+            claimed = await self.sorted_collection_range_by_score(
+                None, float("-inf"), now, count=count
+            )
+            self.entries.update(dict.fromkeys(claimed, lease_until))
+            return [entry.encode() for entry in claimed]
+
+        assert script == RESCHEDULE_SCRIPT
+        raw_entry, next_entry, due_at = args
+        if self.entries.pop(raw_entry, None) is None:
+            return 0
+        self.entries[next_entry] = due_at
+        return 1
+
+    async def sorted_collection_add(self, key, mapping: dict[str, float]) -> int:
+        del key
+        self.entries.update(mapping)
+        return len(mapping)
+
+    async def sorted_collection_range_by_score(self, key, min_score, max_score, *, count=None):
+        del key
+        due = sorted(
+            (score, member)
+            for member, score in self.entries.items()
+            if min_score <= score <= max_score
+        )
+        return [member for _, member in due][:count]
+
+    async def sorted_collection_remove(self, key, *values: str) -> int:
+        del key
+        return sum(1 for value in values if self.entries.pop(value, None) is not None)
+
+
+class FakeSmtpPool:
+    def __init__(self, results: list[list[Exception | None]]) -> None:
+        self.results = results
+        self.batches: list[list[str]] = []
+
+    async def send_batch(self, messages):
+        self.batches.append([message["To"] for message in messages])
+        return self.results.pop(0)
+
+
+def build_service(
+    *,
+    pool: FakeSmtpPool,
+    batch_size: int = 20,
+    max_attempts: int = 3,
+) -> tuple[EmailSenderService, FakeOutboxRepository]:
+    repository = FakeOutboxRepository()
+    config = SimpleNamespace(
+        email=EmailConfig(
+            enabled=True,
+            host="smtp.example.com",
+            from_address="no-reply@example.com",
+            batch_size=batch_size,
+            max_attempts=max_attempts,
+        )
+    )
+    return EmailSenderService(config, repository, pool), repository  # type: ignore[arg-type]
+
+
+def test_send_only_enqueues_and_kicks_delivery_task(monkeypatch) -> None:
+    task = SimpleNamespace(kiq=AsyncMock())
+    monkeypatch.setattr(email_tasks, "deliver_email_outbox_task", task)
+    pool = FakeSmtpPool([])
+    service, repository = build_service(pool=pool)
+
+    sent = run_async(service.send(to_email="a@example.com", subject="Hi", text_body="Body"))
+
+    assert sent is True
+    assert len(repository.entries) == 1
+    assert pool.batches == []
+    task.kiq.assert_awaited_once()
+
+
+def test_deliver_outbox_sends_in_batches_and_reschedules_failures() -> None:
+    pool = FakeSmtpPool(
+        [
+            [None, smtplib.SMTPServerDisconnected("gone")],
+            [None],
+        ]
+    )
+    service, repository = build_service(pool=pool, batch_size=2)
+    for index, address in enumerate(["a@example.com", "b@example.com", "c@example.com"]):
+        entry = {
+            "id": address,
+            "to_email": address,
+            "subject": "Hi",
+            "text_body": "Body",
+            "html_body": None,
+            "attempt": 1,
+        }
+        repository.entries[json_utils.encode(entry)] = float(index)
+
+    delivered = run_async(service.deliver_outbox())
+
+    assert delivered == 2
+    assert pool.batches == [["a@example.com", "b@example.com"], ["c@example.com"]]
+    assert len(repository.entries) == 1
+    (retry_entry,) = repository.entries
+    assert '"attempt":2' in retry_entry
+    assert '"to_email":"b@example.com"' in retry_entry
+
+
+def test_deliver_outbox_drops_entry_after_max_attempts() -> None:
+    pool = FakeSmtpPool([[smtplib.SMTPDataError(550, b"rejected")]])
+    service, repository = build_service(pool=pool, max_attempts=2)
+    entry = {
+        "id": "x",
+        "to_email": "a@example.com",
+        "subject": "Hi",
+        "text_body": "Body",
+        "html_body": None,
+        "attempt": 2,
+    }
+    repository.entries[json_utils.encode(entry)] = 0.0
+
+    delivered = run_async(service.deliver_outbox())
+
+    assert delivered == 0
+    assert repository.entries == {}
+
+
+def _outbox_entry(address: str, attempt: int = 1) -> str:
+    return json_utils.encode(
+        {
+            "id": address,
+            "to_email": address,
+            "subject": "Hi",
+            "text_body": "Body",
+            "html_body": None,
+            "attempt": attempt,
+        }
+    )
+
+
+def test_claim_leases_entries_for_a_whole_batch_at_the_smtp_timeout() -> None:
+    service, repository = build_service(pool=FakeSmtpPool([]), batch_size=4)
+    raw_entry = _outbox_entry("a@example.com")
+    repository.entries[raw_entry] = 0.0
+
+    claimed = run_async(service._claim_due_entries())
+
+    assert [entry for entry, _ in claimed] == [raw_entry]
+    # 4 messages at the 15 s SMTP timeout plus the 60 s margin
+    assert abs(repository.entries[raw_entry] - time.time() - 120.0) < 5
+
+
+def test_reschedule_skips_an_entry_that_already_left_the_outbox() -> None:
+    service, repository = build_service(pool=FakeSmtpPool([]))
+    raw_entry = _outbox_entry("a@example.com")
+
+    run_async(
+        service._reschedule(
+            raw_entry,
+            json_utils.decode(raw_entry),
+            smtplib.SMTPServerDisconnected("gone"),
+        )
+    )
+
+    assert repository.entries == {}
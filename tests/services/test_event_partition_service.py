@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.services.event_partition import (
+    EventPartitionService,
+    PartitionedEventTable,
+    parse_partition_month,
+    plan_partitions,
+)
+
+
+def run_async(coroutine):
+    return asyncio.run(coroutine)
+
+
+class DummyUow:
+    def __init__(self, partitions: dict[str, list[str]]) -> None:
+        self.repository = SimpleNamespace(
+            event_partitions=SimpleNamespace(
+                list_partitions=AsyncMock(side_effect=lambda table: partitions.get(table, [])),
+                create_range_partition=AsyncMock(),
+            )
+        )
+        self.commit = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        del exc_type, exc, tb
+        return False
+
+
+class DetachSession:
+    def __init__(self, *, detach_pending: bool = False) -> None:
+        self.execution_options: list[dict] = []
+        self.statements: list[str] = []
+        self._detach_pending = detach_pending
+
+    async def connection(self, execution_options=None):
+        self.execution_options.append(execution_options)
+        return self
+
+    async def execute(self, statement, params=None):
+        del params
+        self.statements.append(str(statement))
+        return SimpleNamespace(scalar_one_or_none=lambda: self._detach_pending)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        del exc_type, exc, tb
+        return False
+
+
+class DetachSessionPool:
+    def __init__(self, *, detach_pending: bool = False) -> None:
+        self.sessions: list[DetachSession] = []
+        self._detach_pending = detach_pending
+
+    def __call__(self) -> DetachSession:
+        session = DetachSession(detach_pending=self._detach_pending)
+        self.sessions.append(session)
+        return session
+
+
+def test_plan_partitions_precreates_window_and_drops_fully_expired_months() -> None:
+    table = PartitionedEventTable("user_notification_events", retention_days=30)
+    existing = [
+        "user_notification_events_default",
+        "user_notification_events_p202608",
+        "user_notification_events_p202609",
+        "user_notification_events_p202610",
+        "user_notification_events_p202611",
+    ]
+
+    plan = plan_partitions(
+        table,
+        existing,
+        now=datetime(2026, 10, 19, 4, 0, tzinfo=timezone.utc),
+        months_ahead=3,
+    )
+
+    assert plan.to_create == [
+        datetime(2026, 12, 1, tzinfo=timezone.utc),
+        datetime(2027, 1, 1, tzinfo=timezone.utc),
+    ]
+    # September still holds rows newer than the 30-day cutoff (2026-09-19).
+    assert plan.to_drop == ["user_notification_events_p202608"]
+
+
+def test_parse_partition_month_ignores_foreign_and_malformed_names() -> None:
+    assert parse_partition_month("web_analytics_events", "web_analytics_events_p202702") == (
+        datetime(2027, 2, 1, tzinfo=timezone.utc)
+    )
+    assert parse_partition_month("web_analytics_events", "web_analytics_events_default") is None
+    assert parse_partition_month("web_analytics_events", "web_analytics_events_p202713") is None
+    assert parse_partition_month("web_analytics_events", "other_p202702") is None
+
+
+def test_maintain_creates_and_drops_partitions_per_table() -> None:
+    uow = DummyUow({"web_analytics_events": ["web_analytics_events_p200001"]})
+    session_pool = DetachSessionPool()
+    service = EventPartitionService(uow=uow, session_pool=session_pool)  # type: ignore[arg-type]
+
+    created, dropped = run_async(service.maintain())
+
+    repository = uow.repository.event_partitions
+    assert created == 8
+    assert dropped == 1
+    first_partition = repository.create_range_partition.await_args_list[0].kwargs
+    assert first_partition["table"] == "user_notification_events"
+    assert first_partition["end"] > first_partition["start"]
+    assert uow.commit.await_count == 2
+
+    # The detach runs on a session of its own, switched to autocommit before any statement,
+    # so it never shares the UoW transaction that creates partitions.
+    [detach_session] = session_pool.sessions
+    assert detach_session.execution_options == [{"isolation_level": "AUTOCOMMIT"}]
+    assert detach_session.statements[1:] == [
+        'ALTER TABLE "web_analytics_events" '
+        'DETACH PARTITION "web_analytics_events_p200001" CONCURRENTLY',
+        'DROP TABLE "web_analytics_events_p200001"',
+    ]
+
+
+def test_maintain_finalizes_an_interrupted_detach() -> None:
+    uow = DummyUow({"web_analytics_events": ["web_analytics_events_p200001"]})
+    session_pool = DetachSessionPool(detach_pending=True)
+    service = EventPartitionService(uow=uow, session_pool=session_pool)  # type: ignore[arg-type]
+
+    run_async(service.maintain())
+
+    [detach_session] = session_pool.sessions
+    assert detach_session.statements[1].endswith("FINALIZE")
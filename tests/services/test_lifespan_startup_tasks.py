@@ -44,7 +44,19 @@ class _FakeContainer:
         return None
 
 
-def test_lifespan_queues_check_bot_update_on_startup(monkeypatch) -> None:
+class _FakeLeaderElection:
+    def __init__(self, *, wins: bool) -> None:
+        self.wins = wins
+        self.is_leader = False
+        self.start = AsyncMock()
+        self.stop = AsyncMock()
+
+    async def acquire(self) -> bool:
+        self.is_leader = self.wins
+        return self.wins
+
+
+def _build_lifespan(monkeypatch, *, leader: _FakeLeaderElection, workers: int = 1):
     webhook_service = SimpleNamespace(
         setup=AsyncMock(return_value=SimpleNamespace(last_error_message=None)),
         has_error=MagicMock(return_value=False),
@@ -83,6 +95,8 @@ def test_lifespan_queues_check_bot_update_on_startup(monkeypatch) -> None:
     runtime_mapping = {
         lifespan_module.BackupService: backup_service,
         lifespan_module.Bot: bot,
+        lifespan_module.Redis: SimpleNamespace(),
+        lifespan_module.AppConfig: SimpleNamespace(workers=workers),
     }
     container = _FakeContainer(startup_mapping=startup_mapping, runtime_mapping=runtime_mapping)
     app = SimpleNamespace(
@@ -114,6 +128,7 @@ def test_lifespan_queues_check_bot_update_on_startup(monkeypatch) -> None:
         "kiq",
         send_system_mock,
     )
+    monkeypatch.setattr(lifespan_module, "RedisLeaderElection", lambda *args, **kwargs: leader)
     monkeypatch.setattr(lifespan_module.asyncio, "sleep", AsyncMock())
     monkeypatch.setattr(
         lifespan_module,
@@ -125,11 +140,62 @@ def test_lifespan_queues_check_bot_update_on_startup(monkeypatch) -> None:
         ),
     )
 
+    return SimpleNamespace(
+        app=app,
+        webhook_service=webhook_service,
+        backup_service=backup_service,
+        check_bot_update=check_bot_update_mock,
+        recover_platega=recover_platega_mock,
+        send_remnashop=send_remnashop_mock,
+        command_service=command_service,
+        telegram_webhook_endpoint=telegram_webhook_endpoint,
+    )
+
+
+def test_lifespan_queues_check_bot_update_on_startup(monkeypatch) -> None:
+    harness = _build_lifespan(monkeypatch, leader=_FakeLeaderElection(wins=True))
+
+    async def _exercise_lifespan():
+        async with lifespan_module.lifespan(harness.app):
+            harness.check_bot_update.assert_awaited_once()
+
+    run_async(_exercise_lifespan())
+
+    harness.recover_platega.assert_awaited_once()
+    harness.send_remnashop.assert_awaited_once()
+    harness.backup_service.start_auto_backup.assert_awaited_once()
+    harness.webhook_service.delete.assert_awaited_once()
+
+
+def test_lifespan_leaves_cluster_jobs_to_the_leader_worker(monkeypatch) -> None:
+    leader = _FakeLeaderElection(wins=False)
+    harness = _build_lifespan(monkeypatch, leader=leader)
+
+    async def _exercise_lifespan():
+        async with lifespan_module.lifespan(harness.app):
+            pass
+
+    run_async(_exercise_lifespan())
+
+    harness.check_bot_update.assert_not_awaited()
+    harness.webhook_service.setup.assert_not_awaited()
+    harness.backup_service.start_auto_backup.assert_not_awaited()
+    harness.webhook_service.delete.assert_not_awaited()
+    # Followers still serve Telegram updates and campaign to take over auto-backups.
+    harness.telegram_webhook_endpoint.startup.assert_awaited_once()
+    assert leader.start.await_args.kwargs["on_elected"] is not None
+    leader.stop.assert_awaited_once()
+
+
+def test_lifespan_keeps_the_webhook_when_other_workers_keep_serving(monkeypatch) -> None:
+    harness = _build_lifespan(monkeypatch, leader=_FakeLeaderElection(wins=True), workers=4)
+
     async def _exercise_lifespan():
-        async with lifespan_module.lifespan(app):
-            check_bot_update_mock.assert_awaited_once()
+        async with lifespan_module.lifespan(harness.app):
+            pass
 
     run_async(_exercise_lifespan())
 
-    recover_platega_mock.assert_awaited_once()
-    send_remnashop_mock.assert_awaited_once()
+    harness.webhook_service.setup.assert_awaited_once()
+    harness.webhook_service.delete.assert_not_awaited()
+    harness.command_service.delete.assert_not_awaited()
@@ -17,6 +17,7 @@ from src.infrastructure.database.models.dto import (
     YookassaGatewaySettingsDto,
 )
 from src.infrastructure.database.models.sql import PaymentGateway
+from src.infrastructure.payment_gateways import PaymentGatewayRegistry
 from src.services.payment_gateway import PaymentGatewayService
 
 
@@ -53,7 +54,18 @@ def build_service() -> tuple[PaymentGatewayService, SimpleNamespace]:
         filter_active=AsyncMock(return_value=[]),
         get_max_index=AsyncMock(return_value=0),
     )
-    uow = SimpleNamespace(repository=SimpleNamespace(gateways=gateways_repo))
+    after_commit: list = []
+
+    async def commit() -> None:
+        for callback in after_commit:
+            await callback()
+        after_commit.clear()
+
+    uow = SimpleNamespace(
+        repository=SimpleNamespace(gateways=gateways_repo),
+        after_commit=after_commit.append,
+        commit=commit,
+    )
     service = PaymentGatewayService(
         config=MagicMock(),
         bot=MagicMock(),
@@ -64,6 +76,7 @@ def build_service() -> tuple[PaymentGatewayService, SimpleNamespace]:
         transaction_service=MagicMock(),
         subscription_service=MagicMock(),
         payment_gateway_factory=MagicMock(),
+        payment_gateway_registry=SimpleNamespace(invalidate=AsyncMock()),
         payment_webhook_event_service=MagicMock(),
         referral_service=MagicMock(),
         partner_service=MagicMock(),
@@ -121,6 +134,9 @@ def test_create_default_skips_existing_gateways() -> None:
     run_async(service.create_default())
 
     assert gateways_repo.create.await_count == len(PaymentGatewayType) - 1
+    run_async(service.uow.commit())
+    invalidate = service.payment_gateway_registry.invalidate  # type: ignore[attr-defined]
+    assert invalidate.await_count == len(PaymentGatewayType) - 1
 
 
 def test_normalize_gateway_settings_updates_only_legacy_values() -> None:
@@ -164,6 +180,13 @@ def test_normalize_gateway_settings_updates_only_legacy_values() -> None:
     assert second_call["settings"]["type"] == PaymentGatewayType.PLATEGA.value
     assert second_call["settings"]["payment_method"] == 2
 
+    run_async(service.uow.commit())
+    invalidated = service.payment_gateway_registry.invalidate.await_args_list  # type: ignore[attr-defined]
+    assert [call.args for call in invalidated] == [
+        (PaymentGatewayType.CRYPTOPAY,),
+        (PaymentGatewayType.PLATEGA,),
+    ]
+
 
 def test_get_and_get_by_type_return_none_for_missing_gateways() -> None:
     service, gateways_repo = build_service()
@@ -239,6 +262,12 @@ def test_update_encrypts_changed_settings_before_repository_call() -> None:
     assert settings_payload["shop_id"] == "shop-id"
     assert settings_payload["api_key"].startswith(ENCRYPTED_PREFIX)
     assert settings_payload["secret_key"].startswith(ENCRYPTED_PREFIX)
+    # The caller owns the commit; other processes hear about the change only after it.
+    service.payment_gateway_registry.invalidate.assert_not_awaited()  # type: ignore[attr-defined]
+    run_async(service.uow.commit())
+    service.payment_gateway_registry.invalidate.assert_awaited_once_with(  # type: ignore[attr-defined]
+        PaymentGatewayType.CRYPTOPAY
+    )
 
 
 def test_get_all_and_filter_active_preserve_repository_passthrough_semantics() -> None:
@@ -316,13 +345,19 @@ def test_get_gateway_instance_uses_factory_and_raises_when_missing() -> None:
         settings=PlategaGatewaySettingsDto(merchant_id="merchant", secret=SecretStr("secret")),
     )
     service.get_by_type = AsyncMock(return_value=gateway)  # type: ignore[method-assign]
-    service.payment_gateway_factory = MagicMock(return_value="gateway-instance")  # type: ignore[assignment]
+    factory = MagicMock(return_value="gateway-instance")
+    service.payment_gateway_registry = PaymentGatewayRegistry(
+        factory,
+        redis_client=SimpleNamespace(publish=AsyncMock()),  # type: ignore[arg-type]
+        fanout=SimpleNamespace(subscribe=AsyncMock(side_effect=ConnectionError)),  # type: ignore[arg-type]
+    )
 
     result = run_async(service._get_gateway_instance(PaymentGatewayType.PLATEGA))
 
     assert result == "gateway-instance"
-    service.payment_gateway_factory.assert_called_once_with(gateway)
+    factory.assert_called_once_with(gateway)
 
+    run_async(service.payment_gateway_registry.invalidate(PaymentGatewayType.PLATEGA))
     service.get_by_type = AsyncMock(return_value=None)  # type: ignore[method-assign]
 
     with pytest.raises(ValueError, match="Payment gateway of type 'PLATEGA' not found"):
@@ -2,19 +2,45 @@ from __future__ import annotations
 
 import asyncio
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 from dishka.integrations.taskiq import CONTAINER_NAME
 
 from src.core.enums import PaymentGatewayType, TransactionStatus
-from src.infrastructure.taskiq.tasks.payments import handle_payment_transaction_task
+from src.infrastructure.taskiq.tasks.payments import (
+    handle_payment_transaction_task,
+    retry_payment_webhooks_task,
+)
+from src.services.payment_webhook_event import (
+    PAYMENT_WEBHOOK_STATUS_PROCESSED,
+    PaymentWebhookClaim,
+)
 
 
 def run_async(coroutine):
     return asyncio.run(coroutine)
 
 
+def build_claim(payment_id, payment_status: TransactionStatus) -> PaymentWebhookClaim:
+    return PaymentWebhookClaim(
+        event_id=1,
+        gateway_type=PaymentGatewayType.PLATEGA.value,
+        payment_id=payment_id,
+        payment_status=payment_status.value,
+        payload_hash="hash",
+        attempts=1,
+    )
+
+
+def build_inbox_service(claim: PaymentWebhookClaim | None, *, finished: bool = True):
+    return SimpleNamespace(
+        claim=AsyncMock(return_value=claim),
+        finish=AsyncMock(return_value=finished),
+        fail=AsyncMock(),
+    )
+
+
 def test_handle_payment_transaction_task_skips_stale_lookup_after_restore() -> None:
     payment_id = uuid4()
     payment_gateway_service = SimpleNamespace(
@@ -23,11 +49,8 @@ def test_handle_payment_transaction_task_skips_stale_lookup_after_restore() -> N
             side_effect=LookupError(f"Transaction '{payment_id}' not found")
         ),
     )
-    payment_webhook_event_service = SimpleNamespace(
-        mark_processing=AsyncMock(),
-        mark_enqueued=AsyncMock(),
-        mark_processed=AsyncMock(),
-        mark_failed=AsyncMock(),
+    payment_webhook_event_service = build_inbox_service(
+        build_claim(payment_id, TransactionStatus.CANCELED)
     )
     container = SimpleNamespace(
         get=AsyncMock(
@@ -44,13 +67,13 @@ def test_handle_payment_transaction_task_skips_stale_lookup_after_restore() -> N
         )
     )
 
-    payment_webhook_event_service.mark_processing.assert_awaited_once()
+    payment_webhook_event_service.claim.assert_awaited_once()
     payment_gateway_service.handle_payment_canceled.assert_awaited_once_with(payment_id)
-    payment_webhook_event_service.mark_failed.assert_awaited_once()
-    assert "stale_after_restore" in payment_webhook_event_service.mark_failed.await_args.kwargs[
-        "error_message"
-    ]
-    payment_webhook_event_service.mark_processed.assert_not_awaited()
+    payment_webhook_event_service.fail.assert_awaited_once()
+    fail_kwargs = payment_webhook_event_service.fail.await_args.kwargs
+    assert "stale_after_restore" in fail_kwargs["error_message"]
+    assert fail_kwargs["retry"] is False
+    payment_webhook_event_service.finish.assert_not_awaited()
 
 
 def test_handle_payment_transaction_task_reraises_unexpected_errors() -> None:
@@ -59,12 +82,8 @@ def test_handle_payment_transaction_task_reraises_unexpected_errors() -> None:
         handle_payment_succeeded=AsyncMock(side_effect=RuntimeError("boom")),
         handle_payment_canceled=AsyncMock(),
     )
-    payment_webhook_event_service = SimpleNamespace(
-        mark_processing=AsyncMock(),
-        mark_enqueued=AsyncMock(),
-        mark_processed=AsyncMock(),
-        mark_failed=AsyncMock(),
-    )
+    claim = build_claim(payment_id, TransactionStatus.COMPLETED)
+    payment_webhook_event_service = build_inbox_service(claim)
     container = SimpleNamespace(
         get=AsyncMock(
             side_effect=[payment_gateway_service, payment_webhook_event_service]
@@ -85,8 +104,89 @@ def test_handle_payment_transaction_task_reraises_unexpected_errors() -> None:
     else:
         raise AssertionError("Expected unexpected task error to bubble up")
 
-    payment_webhook_event_service.mark_failed.assert_awaited_once_with(
-        gateway_type=PaymentGatewayType.PLATEGA.value,
-        payment_id=payment_id,
+    payment_webhook_event_service.fail.assert_awaited_once_with(
+        claim,
         error_message="boom",
+        retry=True,
+    )
+
+
+def test_handle_payment_transaction_task_applies_the_latest_recorded_status() -> None:
+    payment_id = uuid4()
+    payment_gateway_service = SimpleNamespace(
+        handle_payment_succeeded=AsyncMock(),
+        handle_payment_canceled=AsyncMock(),
+    )
+    # Kicked for a pending webhook, but the final one was recorded before the claim.
+    claim = build_claim(payment_id, TransactionStatus.COMPLETED)
+    payment_webhook_event_service = build_inbox_service(claim, finished=False)
+    container = SimpleNamespace(
+        get=AsyncMock(
+            side_effect=[payment_gateway_service, payment_webhook_event_service]
+        )
+    )
+    kiq = AsyncMock()
+
+    with patch.object(handle_payment_transaction_task, "kiq", kiq):
+        run_async(
+            handle_payment_transaction_task(
+                str(payment_id),
+                TransactionStatus.PENDING.value,
+                PaymentGatewayType.PLATEGA.value,
+                **{CONTAINER_NAME: container},
+            )
+        )
+
+    payment_gateway_service.handle_payment_succeeded.assert_awaited_once_with(payment_id)
+    payment_webhook_event_service.finish.assert_awaited_once_with(
+        claim,
+        status=PAYMENT_WEBHOOK_STATUS_PROCESSED,
+    )
+    # Another webhook arrived while processing, so the payment goes around once more.
+    kiq.assert_awaited_once()
+
+
+def test_handle_payment_transaction_task_skips_payments_it_cannot_claim() -> None:
+    payment_gateway_service = SimpleNamespace(
+        handle_payment_succeeded=AsyncMock(),
+        handle_payment_canceled=AsyncMock(),
+    )
+    payment_webhook_event_service = build_inbox_service(None)
+    container = SimpleNamespace(
+        get=AsyncMock(
+            side_effect=[payment_gateway_service, payment_webhook_event_service]
+        )
+    )
+
+    run_async(
+        handle_payment_transaction_task(
+            str(uuid4()),
+            TransactionStatus.COMPLETED.value,
+            PaymentGatewayType.PLATEGA.value,
+            **{CONTAINER_NAME: container},
+        )
+    )
+
+    payment_gateway_service.handle_payment_succeeded.assert_not_awaited()
+    payment_webhook_event_service.finish.assert_not_awaited()
+
+
+def test_retry_payment_webhooks_task_redispatches_due_inbox_rows() -> None:
+    payment_id = uuid4()
+    event = SimpleNamespace(
+        payment_id=payment_id,
+        payment_status=TransactionStatus.COMPLETED.value,
+        gateway_type=PaymentGatewayType.PLATEGA.value,
+    )
+    payment_webhook_event_service = SimpleNamespace(take_due=AsyncMock(return_value=[event]))
+    container = SimpleNamespace(get=AsyncMock(return_value=payment_webhook_event_service))
+    kiq = AsyncMock()
+
+    with patch.object(handle_payment_transaction_task, "kiq", kiq):
+        run_async(retry_payment_webhooks_task(**{CONTAINER_NAME: container}))
+
+    kiq.assert_awaited_once_with(
+        str(payment_id),
+        TransactionStatus.COMPLETED.value,
+        PaymentGatewayType.PLATEGA.value,
     )
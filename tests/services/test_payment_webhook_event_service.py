@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.services.payment_webhook_event import (
+    PAYMENT_WEBHOOK_STATUS_FAILED,
+    PAYMENT_WEBHOOK_STATUS_RECEIVED,
+    PaymentWebhookEventService,
+)
+
+
+class DummyUow:
+    def __init__(self, existing=None) -> None:
+        self.repository = SimpleNamespace(
+            payment_webhook_events=SimpleNamespace(
+                get_by_gateway_and_payment_id=AsyncMock(return_value=existing),
+                create=AsyncMock(side_effect=lambda event: event),
+                update=AsyncMock(side_effect=lambda event_id, **data: SimpleNamespace(**data)),
+            )
+        )
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        del exc_type, exc, tb
+        return False
+
+
+def test_record_received_creates_rows_without_counting_an_attempt() -> None:
+    uow = DummyUow()
+    service = PaymentWebhookEventService(uow=uow)  # type: ignore[arg-type]
+
+    result = asyncio.run(
+        service.record_received(
+            gateway_type="PLATEGA",
+            payment_id=uuid4(),
+            payload_hash="hash",
+            payment_status="COMPLETED",
+        )
+    )
+
+    assert result.event.attempts == 0
+    assert result.event.status == PAYMENT_WEBHOOK_STATUS_RECEIVED
+
+
+def test_record_received_keeps_the_attempts_of_an_existing_row() -> None:
+    existing = SimpleNamespace(
+        id=7,
+        status=PAYMENT_WEBHOOK_STATUS_FAILED,
+        payment_status="PENDING",
+        attempts=2,
+    )
+    uow = DummyUow(existing)
+    service = PaymentWebhookEventService(uow=uow)  # type: ignore[arg-type]
+
+    asyncio.run(
+        service.record_received(
+            gateway_type="PLATEGA",
+            payment_id=uuid4(),
+            payload_hash="hash",
+            payment_status="COMPLETED",
+        )
+    )
+
+    update = uow.repository.payment_webhook_events.update.await_args
+    assert update.args == (7,)
+    assert "attempts" not in update.kwargs
+    assert update.kwargs["status"] == PAYMENT_WEBHOOK_STATUS_RECEIVED
@@ -75,6 +75,7 @@ def build_payment_gateway_service(
         transaction_service=transaction_service or SimpleNamespace(),
         subscription_service=MagicMock(),
         payment_gateway_factory=MagicMock(),
+        payment_gateway_registry=MagicMock(),
         payment_webhook_event_service=payment_webhook_event_service or SimpleNamespace(),
         referral_service=MagicMock(),
         partner_service=MagicMock(),
@@ -23,7 +23,6 @@ from src.infrastructure.database.models.dto import (
     SubscriptionDto,
     UserDto,
 )
-from src.infrastructure.database.models.dto.promocode import PromocodeActivationBaseDto
 from src.services.promocode import ActivationError, ActivationResult, PromocodeService
 
 
@@ -95,7 +94,7 @@ def build_promocode(
     lifetime: int = -1,
     created_at=None,
     max_activations: int = -1,
-    activations: list[PromocodeActivationBaseDto] | None = None,
+    activations_count: int = 0,
     allowed_user_ids: list[int] | None = None,
     allowed_plan_ids: list[int] | None = None,
     plan: PlanSnapshotDto | None = None,
@@ -110,7 +109,7 @@ def build_promocode(
         lifetime=lifetime,
         created_at=created_at,
         max_activations=max_activations,
-        activations=activations or [],
+        activations_count=activations_count,
         allowed_user_ids=allowed_user_ids or [],
         allowed_plan_ids=allowed_plan_ids or [],
         plan=plan,
@@ -131,6 +130,9 @@ def build_service() -> tuple[PromocodeService, SimpleNamespace, SimpleNamespace]
         filter_active=AsyncMock(return_value=[]),
         count_activations_by_user=AsyncMock(return_value=0),
         get_activations_by_user=AsyncMock(return_value=[]),
+        has_user_activation=AsyncMock(return_value=False),
+        create_activation=AsyncMock(return_value=1),
+        claim_activation=AsyncMock(return_value=True),
     )
     uow = SimpleNamespace(
         repository=SimpleNamespace(promocodes=promocode_repo),
@@ -230,19 +232,7 @@ def test_check_availability_preserves_new_existing_invited_allowed_rules() -> No
             "ntf-promocode-expired",
         ),
         (
-            build_promocode(
-                max_activations=1,
-                activations=[
-                    PromocodeActivationBaseDto(
-                        id=1,
-                        promocode_id=1,
-                        user_telegram_id=100,
-                        promocode_code="PROMO",
-                        reward_type=PromocodeRewardType.PERSONAL_DISCOUNT,
-                        reward_value=10,
-                    )
-                ],
-            ),
+            build_promocode(max_activations=1, activations_count=1),
             False,
             True,
             ActivationError.DEPLETED,
@@ -305,8 +295,37 @@ def test_activate_creates_activation_and_rolls_back_when_reward_fails() -> None:
 
     assert result.success is False
     assert result.message_key == "ntf-promocode-reward-failed"
-    promocode_repo.session.add.assert_called_once()
-    assert promocode_repo.session.flush.await_count == 1
+    promocode_repo.create_activation.assert_awaited_once()
+    promocode_repo.claim_activation.assert_awaited_once_with(1)
+    assert uow.rollback.await_count == 1
+    assert uow.commit.await_count == 0
+
+
+@pytest.mark.parametrize(
+    ("created", "claimed", "expected_error"),
+    [
+        (False, True, ActivationError.ALREADY_ACTIVATED),
+        (True, False, ActivationError.DEPLETED),
+    ],
+)
+def test_activate_rejects_lost_races_without_applying_reward(
+    created: bool,
+    claimed: bool,
+    expected_error: ActivationError,
+) -> None:
+    service, promocode_repo, uow = build_service()
+    promocode_repo.create_activation.return_value = 1 if created else None
+    promocode_repo.claim_activation.return_value = claimed
+    service.validate_promocode = AsyncMock(  # type: ignore[method-assign]
+        return_value=ActivationResult(success=True, promocode=build_promocode())
+    )
+    service._apply_reward = AsyncMock(return_value=True)  # type: ignore[method-assign]
+
+    result = run_async(service.activate("promo", build_user(), user_service=SimpleNamespace()))
+
+    assert result.success is False
+    assert result.error == expected_error
+    service._apply_reward.assert_not_awaited()
     assert uow.rollback.await_count == 1
     assert uow.commit.await_count == 0
 
@@ -449,28 +468,7 @@ def test_apply_user_discount_reward_mutates_only_user(
 
 def test_get_activations_count_uses_service_getter() -> None:
     service, _repo, _uow = build_service()
-    service.get = AsyncMock(  # type: ignore[method-assign]
-        return_value=build_promocode(
-            activations=[
-                PromocodeActivationBaseDto(
-                    id=1,
-                    promocode_id=1,
-                    user_telegram_id=1,
-                    promocode_code="PROMO",
-                    reward_type=PromocodeRewardType.PERSONAL_DISCOUNT,
-                    reward_value=10,
-                ),
-                PromocodeActivationBaseDto(
-                    id=2,
-                    promocode_id=1,
-                    user_telegram_id=2,
-                    promocode_code="PROMO",
-                    reward_type=PromocodeRewardType.PERSONAL_DISCOUNT,
-                    reward_value=10,
-                ),
-            ]
-        )
-    )
+    service.get = AsyncMock(return_value=build_promocode(activations_count=2))  # type: ignore[method-assign]
 
     count = run_async(service.get_activations_count(1))
 
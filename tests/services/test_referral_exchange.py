@@ -19,6 +19,7 @@ from src.infrastructure.database.models.dto import (
 )
 from src.infrastructure.database.models.dto.settings import ExchangeTypeSettingsDto
 from src.services.referral_exchange import ReferralExchangeError, ReferralExchangeService
+from src.services.request_loader import RequestDataLoader
 
 
 def run_async(coroutine):
@@ -112,7 +113,7 @@ def build_service(
             clear_user_cache=AsyncMock(),
         ),
         subscription_service=SimpleNamespace(
-            get_all_by_user=AsyncMock(return_value=subscriptions or []),
+            load_all_by_user=AsyncMock(return_value=subscriptions or []),
             get=AsyncMock(return_value=target_subscription),
             update=AsyncMock(),
         ),
@@ -125,6 +126,7 @@ def build_service(
             create=AsyncMock(),
         ),
         remnawave_service=SimpleNamespace(updated_user=AsyncMock()),
+        request_loader=RequestDataLoader(),
     )
     return service, uow
 
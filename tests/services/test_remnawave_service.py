@@ -91,6 +91,7 @@ def test_try_connection_falls_back_to_raw_health_check_on_validation_error() ->
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=remnawave,
         user_service=MagicMock(),
         subscription_service=MagicMock(),
@@ -116,6 +117,7 @@ def test_get_external_squads_safe_falls_back_to_raw_http_on_validation_error() -
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=remnawave,
         user_service=MagicMock(),
         subscription_service=MagicMock(),
@@ -139,6 +141,7 @@ def test_try_connection_raw_uses_shared_request_helper() -> None:
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=MagicMock(),
         subscription_service=MagicMock(),
@@ -160,6 +163,7 @@ def test_get_external_squads_raw_uses_shared_request_helper() -> None:
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=MagicMock(),
         subscription_service=MagicMock(),
@@ -218,6 +222,7 @@ def test_try_connection_falls_back_to_raw_health_check_on_unexpected_response_ty
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=remnawave,
         user_service=MagicMock(),
         subscription_service=MagicMock(),
@@ -305,6 +310,7 @@ def test_sync_user_rebinds_existing_subscription_owner_by_remna_id() -> None:
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=remnawave,
         user_service=SimpleNamespace(get=AsyncMock(return_value=user)),
         subscription_service=SimpleNamespace(
@@ -352,6 +358,7 @@ def test_create_user_rejects_when_effective_subscription_limit_would_be_exceeded
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=SimpleNamespace(users=SimpleNamespace(create_user=AsyncMock())),
         user_service=MagicMock(),
         subscription_service=SimpleNamespace(
@@ -385,6 +392,7 @@ def test_create_user_rejects_when_hard_subscription_ceiling_would_be_exceeded()
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=SimpleNamespace(users=SimpleNamespace(create_user=AsyncMock())),
         user_service=MagicMock(),
         subscription_service=SimpleNamespace(
@@ -439,6 +447,7 @@ def test_resolve_plan_by_limits_prefers_tag_matching_candidate() -> None:
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=MagicMock(),
         subscription_service=MagicMock(),
@@ -456,6 +465,63 @@ def test_resolve_plan_by_limits_prefers_tag_matching_candidate() -> None:
     assert selected.id == matching_second.id
 
 
+def test_plan_resolution_scope_loads_catalog_once_and_matches_from_index() -> None:
+    first = build_plan(plan_id=1, tag="other", order_index=0, name="First")
+    tagged = build_plan(plan_id=2, tag="starter", order_index=9, name="Tagged")
+    other_limits = build_plan(plan_id=3, tag="big", order_index=1, name="Big")
+    other_limits.traffic_limit = 500
+    remna_subscription = RemnaSubscriptionDto(
+        uuid=UUID("00000000-0000-0000-0000-000000000011"),
+        status=SubscriptionStatus.ACTIVE,
+        expire_at=datetime.now(timezone.utc) + timedelta(days=30),
+        url="",
+        traffic_limit=100,
+        device_limit=1,
+        traffic_limit_strategy=TrafficLimitStrategy.NO_RESET,
+        tag="missing",
+        internal_squads=[],
+        external_squad=None,
+    )
+    plan_service = SimpleNamespace(
+        get_all=AsyncMock(return_value=[tagged, other_limits, first]),
+        get_by_tag=AsyncMock(),
+    )
+    service = RemnawaveService(
+        config=MagicMock(),
+        bot=MagicMock(),
+        redis_client=MagicMock(),
+        redis_repository=MagicMock(),
+        translator_hub=MagicMock(),
+        http_clients=MagicMock(),
+        remnawave=MagicMock(),
+        user_service=MagicMock(),
+        subscription_service=MagicMock(),
+        plan_service=plan_service,
+        settings_service=MagicMock(),
+    )
+
+    async def _resolve_many() -> list[PlanDto | None]:
+        async with service.plan_resolution_scope():
+            async with service.plan_resolution_scope():
+                by_tag = await service._resolve_matched_plan_for_sync(
+                    remna_subscription=remna_subscription.model_copy(update={"tag": "big"}),
+                    telegram_id=706,
+                )
+            by_limits = await service._resolve_matched_plan_for_sync(
+                remna_subscription=remna_subscription,
+                telegram_id=706,
+            )
+        return [by_tag, by_limits]
+
+    by_tag, by_limits = run_async(_resolve_many())
+
+    assert by_tag is not None and by_tag.id == other_limits.id
+    assert by_limits is not None and by_limits.id == first.id
+    plan_service.get_all.assert_awaited_once()
+    plan_service.get_by_tag.assert_not_awaited()
+    assert service._plan_resolution_index is None
+
+
 def test_sync_profiles_by_telegram_id_restores_original_current_subscription_when_still_valid(
 ) -> None:
     user = SimpleNamespace(telegram_id=704)
@@ -470,6 +536,7 @@ def test_sync_profiles_by_telegram_id_restores_original_current_subscription_whe
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=SimpleNamespace(
             get=AsyncMock(side_effect=[user, user]),
@@ -549,6 +616,7 @@ def test_sync_profiles_by_telegram_id_falls_back_to_best_remaining_active_subscr
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=SimpleNamespace(
             get=AsyncMock(side_effect=[user, user]),
@@ -581,6 +649,7 @@ def test_hydrate_panel_subscription_url_falls_back_to_existing_local_subscriptio
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=MagicMock(),
         subscription_service=MagicMock(),
@@ -624,6 +693,7 @@ def test_sync_user_with_creating_false_and_missing_subscription_does_not_create_
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=SimpleNamespace(get=AsyncMock(return_value=user)),
         subscription_service=SimpleNamespace(
@@ -668,6 +738,7 @@ def test_handle_user_event_created_with_imported_tag_triggers_sync() -> None:
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=MagicMock(),
         subscription_service=MagicMock(),
@@ -689,6 +760,7 @@ def test_handle_user_event_created_without_imported_tag_skips_sync() -> None:
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=MagicMock(),
         subscription_service=MagicMock(),
@@ -711,6 +783,7 @@ def test_handle_user_event_modified_triggers_sync_without_create() -> None:
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=SimpleNamespace(get=AsyncMock(return_value=existing_user)),
         subscription_service=MagicMock(),
@@ -744,6 +817,7 @@ def test_handle_user_event_deleted_enqueues_delete_task(monkeypatch) -> None:
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=SimpleNamespace(
             get=AsyncMock(return_value=SimpleNamespace(telegram_id=804, name="User", username="u"))
@@ -798,6 +872,7 @@ def test_handle_user_event_limited_routes_status_update_and_notification(monkeyp
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=SimpleNamespace(get=AsyncMock(return_value=user)),
         subscription_service=MagicMock(),
@@ -837,6 +912,7 @@ def test_handle_user_event_first_connected_emits_system_notification(monkeypatch
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=SimpleNamespace(get=AsyncMock(return_value=user)),
         subscription_service=MagicMock(),
@@ -880,6 +956,7 @@ def test_handle_device_event_added_auto_assigns_only_for_none_or_other(monkeypat
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=SimpleNamespace(get=AsyncMock(return_value=user)),
         subscription_service=SimpleNamespace(
@@ -925,6 +1002,7 @@ def test_handle_device_event_deleted_keeps_notification_routing(monkeypatch) ->
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=SimpleNamespace(get=AsyncMock(return_value=user)),
         subscription_service=SimpleNamespace(
@@ -970,6 +1048,7 @@ def test_handle_node_event_maps_supported_events(monkeypatch, event_name, expect
         redis_client=MagicMock(),
         redis_repository=MagicMock(),
         translator_hub=MagicMock(),
+        http_clients=MagicMock(),
         remnawave=MagicMock(),
         user_service=MagicMock(),
         subscription_service=MagicMock(),
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from dishka.integrations.taskiq import CONTAINER_NAME
+from remnawave.models.webhook import WebhookPayloadDto
+
+from src.core.enums import RemnawaveWebhookEnqueueResult
+from src.infrastructure.redis.leader import RELEASE_LEASE_SCRIPT, RENEW_LEASE_SCRIPT
+from src.infrastructure.taskiq.tasks import remnawave as remnawave_tasks
+from src.services.remnawave_webhook_queue import (
+    ACK_SCRIPT,
+    CLAIM_SCRIPT,
+    ENQUEUE_SCRIPT,
+    RemnawaveWebhookQueueService,
+    webhook_entity_and_slot,
+)
+
+
+def _payload(event: str, data: Any) -> WebhookPayloadDto:
+    return WebhookPayloadDto.model_construct(event=event, data=data, timestamp=None)
+
+
+def _client(**eval_results: Any) -> SimpleNamespace:
+    scripts = {
+        ENQUEUE_SCRIPT: "enqueue",
+        CLAIM_SCRIPT: "claim",
+        ACK_SCRIPT: "ack",
+        RENEW_LEASE_SCRIPT: "renew",
+        RELEASE_LEASE_SCRIPT: "release",
+    }
+    eval_results.setdefault("renew", 1)
+    eval_results.setdefault("release", 1)
+    calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def fake_eval(script: str, numkeys: int, *args: Any) -> Any:
+        name = scripts[script]
+        calls.append((name, args))
+        result = eval_results[name]
+        return result.pop(0) if isinstance(result, list) and name == "claim" else result
+
+    return SimpleNamespace(
+        eval=fake_eval,
+        calls=calls,
+        time=AsyncMock(return_value=(1000, 0)),
+        set=AsyncMock(return_value=True),
+        exists=AsyncMock(return_value=0),
+        delete=AsyncMock(),
+        zrange=AsyncMock(return_value=[]),
+    )
+
+
+def test_events_are_grouped_per_user_and_slotted_per_event_type_or_device() -> None:
+    user_uuid = uuid4()
+    user = SimpleNamespace(uuid=user_uuid)
+    device_event = SimpleNamespace(user=user, hwid_user_device=SimpleNamespace(hwid="abc"))
+
+    assert webhook_entity_and_slot(_payload("user.modified", user)) == (
+        f"user:{user_uuid}",
+        "user.modified",
+    )
+    assert webhook_entity_and_slot(_payload("user_hwid_devices.added", device_event)) == (
+        f"user:{user_uuid}",
+        "user_hwid_devices.added:abc",
+    )
+    assert webhook_entity_and_slot(_payload("service.panel_started", {})) is None
+
+
+def test_enqueue_maps_script_results_and_schedules_a_drain_for_new_entities(monkeypatch) -> None:
+    kicked = AsyncMock()
+    monkeypatch.setattr(remnawave_tasks.drain_remnawave_webhooks_task, "kiq", kicked)
+    payload = _payload("user.modified", SimpleNamespace(uuid="u1"))
+
+    async def enqueue(result: int) -> RemnawaveWebhookEnqueueResult:
+        client = _client(enqueue=result)
+        service = RemnawaveWebhookQueueService(client)  # type: ignore[arg-type]
+        return await service.enqueue(payload, b'{"event": "user.modified"}')
+
+    assert asyncio.run(enqueue(1)) == RemnawaveWebhookEnqueueResult.QUEUED
+    assert asyncio.run(enqueue(0)) == RemnawaveWebhookEnqueueResult.COALESCED
+    assert asyncio.run(enqueue(-1)) == RemnawaveWebhookEnqueueResult.DUPLICATE
+    kicked.assert_awaited_once()
+
+
+def test_enqueue_passes_entity_slot_and_due_time_to_the_script() -> None:
+    client = _client(enqueue=0)
+    service = RemnawaveWebhookQueueService(client)  # type: ignore[arg-type]
+
+    asyncio.run(service.enqueue(_payload("user.modified", SimpleNamespace(uuid="u1")), b"{}"))
+
+    (_, args), *_ = client.calls
+    keys, argv = args[:4], args[4:]
+    assert keys[1:] == (
+        "remnawave_webhook_pending",
+        "remnawave_webhook_queue",
+        "remnawave_webhook_sequence",
+    )
+    assert argv[:3] == ("user:u1", "user.modified", "{}")
+    assert argv[3] == 1002.0
+
+
+def test_drain_dispatches_claimed_entities_with_events_in_arrival_order(monkeypatch) -> None:
+    slots = {
+        "user.disabled": [7, '{"event": "user.disabled"}'],
+        "user.modified": [9, '{"event": "user.modified"}'],
+        "user.created": [3, '{"event": "user.created"}'],
+    }
+    client = _client(claim=[[b"user:u1", json.dumps(slots).encode()], []])
+    processed = AsyncMock()
+    monkeypatch.setattr(remnawave_tasks.process_remnawave_webhook_task, "kiq", processed)
+    service = RemnawaveWebhookQueueService(client)  # type: ignore[arg-type]
+
+    assert asyncio.run(service.drain()) == 1
+
+    processed.assert_awaited_once_with(
+        entity="user:u1",
+        payloads=[
+            '{"event": "user.created"}',
+            '{"event": "user.disabled"}',
+            '{"event": "user.modified"}',
+        ],
+    )
+    assert [name for name, _ in client.calls][-1] == "release"
+
+
+def test_drain_returns_at_once_while_another_drainer_holds_the_lock(monkeypatch) -> None:
+    client = _client(claim=[])
+    client.set = AsyncMock(return_value=None)
+    processed = AsyncMock()
+    monkeypatch.setattr(remnawave_tasks.process_remnawave_webhook_task, "kiq", processed)
+    service = RemnawaveWebhookQueueService(client)  # type: ignore[arg-type]
+
+    assert asyncio.run(service.drain()) == 0
+
+    assert client.calls == []
+    processed.assert_not_awaited()
+
+
+def test_drain_stops_when_its_lock_was_taken_over(monkeypatch) -> None:
+    client = _client(
+        claim=[[b"user:u1", json.dumps({"user.modified": [1, "{}"]}).encode()]], renew=0
+    )
+    processed = AsyncMock()
+    monkeypatch.setattr(remnawave_tasks.process_remnawave_webhook_task, "kiq", processed)
+    service = RemnawaveWebhookQueueService(client)  # type: ignore[arg-type]
+
+    assert asyncio.run(service.drain()) == 1
+
+    assert [name for name, _ in client.calls] == ["claim", "renew", "release"]
+
+
+def test_receipts_do_not_kick_a_drain_while_a_drainer_runs(monkeypatch) -> None:
+    kicked = AsyncMock()
+    monkeypatch.setattr(remnawave_tasks.drain_remnawave_webhooks_task, "kiq", kicked)
+    client = _client(enqueue=1)
+    client.exists = AsyncMock(return_value=1)
+    service = RemnawaveWebhookQueueService(client)  # type: ignore[arg-type]
+
+    asyncio.run(service.enqueue(_payload("user.modified", SimpleNamespace(uuid="u1")), b"{}"))
+
+    kicked.assert_not_awaited()
+
+
+def test_ack_schedules_a_drain_only_when_events_arrived_meanwhile(monkeypatch) -> None:
+    kicked = AsyncMock()
+    monkeypatch.setattr(remnawave_tasks.drain_remnawave_webhooks_task, "kiq", kicked)
+
+    for rescheduled in (0, 1):
+        service = RemnawaveWebhookQueueService(_client(ack=rescheduled))  # type: ignore[arg-type]
+        asyncio.run(service.ack("user:u1"))
+
+    kicked.assert_awaited_once()
+
+
+def test_fail_keeps_the_entity_for_redelivery_until_attempts_run_out() -> None:
+    client = _client(ack=0)
+    client.hincrby = AsyncMock(side_effect=[1, 5])
+    service = RemnawaveWebhookQueueService(client)  # type: ignore[arg-type]
+
+    assert asyncio.run(service.fail("user:u1")) is True
+    assert client.calls == []
+
+    assert asyncio.run(service.fail("user:u1")) is False
+    (name, args), *_ = client.calls
+    assert name == "ack"
+    assert args[3:5] == ("remnawave_webhook_attempts", "user:u1")
+
+
+def test_process_stops_at_the_first_failed_event_without_acking(monkeypatch) -> None:
+    results = iter([None, RuntimeError("boom")])
+    applied = AsyncMock(side_effect=lambda *args, **kwargs: next(results))
+    monkeypatch.setattr(remnawave_tasks, "_apply_webhook_event", applied)
+    notify = AsyncMock()
+    monkeypatch.setattr(remnawave_tasks, "_notify_dropped_webhook_event", notify)
+    queue_service = SimpleNamespace(ack=AsyncMock(), fail=AsyncMock(return_value=True))
+    container = SimpleNamespace(
+        get=AsyncMock(
+            side_effect=[SimpleNamespace(), SimpleNamespace(), SimpleNamespace(), queue_service]
+        )
+    )
+    payloads = [json.dumps({"event": "user.modified", "data": {}, "timestamp": None})] * 3
+    monkeypatch.setattr(
+        remnawave_tasks.WebhookPayloadDto,
+        "from_dict",
+        lambda data: _payload(data["event"], data["data"]),
+    )
+
+    asyncio.run(
+        remnawave_tasks.process_remnawave_webhook_task(
+            "user:u1",
+            payloads,
+            **{CONTAINER_NAME: container},
+        )
+    )
+
+    assert applied.await_count == 2
+    queue_service.fail.assert_awaited_once_with("user:u1")
+    queue_service.ack.assert_not_awaited()
+    notify.assert_not_awaited()
+
+
+def test_process_alerts_only_when_the_failed_events_are_dropped(monkeypatch) -> None:
+    error = RuntimeError("boom")
+    monkeypatch.setattr(remnawave_tasks, "_apply_webhook_event", AsyncMock(return_value=error))
+    notify = AsyncMock()
+    monkeypatch.setattr(remnawave_tasks, "_notify_dropped_webhook_event", notify)
+    queue_service = SimpleNamespace(ack=AsyncMock(), fail=AsyncMock(return_value=False))
+    container = SimpleNamespace(
+        get=AsyncMock(
+            side_effect=[SimpleNamespace(), SimpleNamespace(), SimpleNamespace(), queue_service]
+        )
+    )
+    monkeypatch.setattr(
+        remnawave_tasks.WebhookPayloadDto,
+        "from_dict",
+        lambda data: _payload(data["event"], data["data"]),
+    )
+
+    asyncio.run(
+        remnawave_tasks.process_remnawave_webhook_task(
+            "user:u1",
+            [json.dumps({"event": "user.modified", "data": {}, "timestamp": None})],
+            **{CONTAINER_NAME: container},
+        )
+    )
+
+    notify.assert_awaited_once()
+    assert notify.await_args.args[1] is error
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.services.request_loader import RequestDataLoader
+
+
+def test_load_shares_a_single_call_for_identical_keys() -> None:
+    loader = RequestDataLoader()
+    calls: list[str] = []
+
+    async def factory() -> str:
+        calls.append("settings")
+        await asyncio.sleep(0)
+        return "value"
+
+    async def scenario() -> list[str]:
+        concurrent = await asyncio.gather(
+            loader.load("settings", factory),
+            loader.load("settings", factory),
+        )
+        return [*concurrent, await loader.load("settings", factory)]
+
+    assert asyncio.run(scenario()) == ["value", "value", "value"]
+    assert calls == ["settings"]
+
+
+def test_load_evicts_failed_loads_and_forget_drops_cached_values() -> None:
+    loader = RequestDataLoader()
+    attempts: list[int] = []
+
+    async def factory() -> int:
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return len(attempts)
+
+    async def scenario() -> tuple[int, int, int]:
+        with pytest.raises(RuntimeError):
+            await loader.load("key", factory)
+        first = await loader.load("key", factory)
+        cached = await loader.load("key", factory)
+        loader.forget("key")
+        return first, cached, await loader.load("key", factory)
+
+    assert asyncio.run(scenario()) == (2, 2, 3)
+
+
+def test_load_many_batches_ids_requested_in_the_same_tick() -> None:
+    loader = RequestDataLoader()
+    batches: list[list[int]] = []
+
+    async def batch(ids: list[int]) -> dict[int, str]:
+        batches.append(ids)
+        return {item_id: f"item-{item_id}" for item_id in ids if item_id != 3}
+
+    async def scenario() -> tuple[list[str | None], str | None]:
+        many, single = await asyncio.gather(
+            loader.load_many("items", [1, 2, 3], batch),
+            loader.load_by_id("items", 4, batch),
+        )
+        await loader.load_many("items", [1, 4], batch)
+        return many, single
+
+    assert asyncio.run(scenario()) == (["item-1", "item-2", None], "item-4")
+    assert [sorted(ids) for ids in batches] == [[1, 2, 3, 4]]
+
+
+def test_batch_failure_propagates_to_every_waiter_and_is_retried() -> None:
+    loader = RequestDataLoader()
+    batches: list[list[int]] = []
+
+    async def batch(ids: list[int]) -> dict[int, int]:
+        batches.append(ids)
+        if len(batches) == 1:
+            raise RuntimeError("db down")
+        return {item_id: item_id for item_id in ids}
+
+    async def scenario() -> list[int | None]:
+        with pytest.raises(RuntimeError):
+            await loader.load_many("items", [1, 2], batch)
+        loader.forget_namespace("items")
+        return await loader.load_many("items", [1, 2], batch)
+
+    assert asyncio.run(scenario()) == [1, 2]
+    assert batches == [[1, 2], [1, 2]]
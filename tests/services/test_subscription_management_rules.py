@@ -19,6 +19,7 @@ from src.infrastructure.database.models.dto import (
     UserDto,
 )
 from src.services.plan import PlanDeletionBlockedError, PlanService
+from src.services.request_loader import RequestDataLoader
 from src.services.subscription import SubscriptionService
 from src.services.subscription_portal import SubscriptionPortalService
 
@@ -73,6 +74,7 @@ def build_subscription_service(*, uow) -> SubscriptionService:
         translator_hub=MagicMock(),
         uow=uow,
         user_service=MagicMock(),
+        request_loader=RequestDataLoader(),
     )
 
 
@@ -100,7 +100,12 @@ def build_runtime_service() -> SubscriptionRuntimeService:
         config=SimpleNamespace(),
         bot=SimpleNamespace(),
         redis_client=SimpleNamespace(set=AsyncMock(), ttl=AsyncMock(return_value=12)),
-        redis_repository=SimpleNamespace(get=AsyncMock(return_value=None), set=AsyncMock()),
+        redis_repository=SimpleNamespace(
+            get=AsyncMock(return_value=None),
+            get_many=AsyncMock(return_value=[]),
+            set=AsyncMock(),
+            set_many=AsyncMock(),
+        ),
         translator_hub=SimpleNamespace(),
         subscription_service=SimpleNamespace(
             get=AsyncMock(return_value=None),
@@ -138,7 +143,11 @@ def build_device_service(
             delete_device_by_subscription_uuid=AsyncMock(return_value=1),
         ),
         redis_repository=redis_repository
-        or SimpleNamespace(get=AsyncMock(return_value=None), set=AsyncMock()),
+        or SimpleNamespace(
+            get=AsyncMock(return_value=None),
+            set=AsyncMock(),
+            client=SimpleNamespace(publish=AsyncMock(return_value=0)),
+        ),
     )
 
 
@@ -191,12 +200,10 @@ def test_prepare_for_list_batch_deduplicates_refresh_ids() -> None:
         build_subscription(subscription_id=1, user_telegram_id=100),
         build_subscription(subscription_id=2, user_telegram_id=100),
     ]
-    service.prepare_for_list = AsyncMock(  # type: ignore[method-assign]
-        side_effect=[
-            (subscriptions[0], True),
-            (subscriptions[1], True),
-            (subscriptions[2], False),
-        ]
+    subscriptions[2].user_remna_id = uuid4()
+    fresh_snapshot = build_runtime_snapshot(subscriptions[2], refreshed_delta_seconds=0)
+    service.get_cached_runtimes = AsyncMock(  # type: ignore[method-assign]
+        return_value={subscriptions[2].user_remna_id: fresh_snapshot}
     )
     enqueue_runtime_refresh = AsyncMock()
     service._enqueue_runtime_refresh_if_needed = AsyncMock()  # type: ignore[method-assign]
@@ -210,13 +217,95 @@ def test_prepare_for_list_batch_deduplicates_refresh_ids() -> None:
     )
 
     assert prepared == subscriptions
+    service.get_cached_runtimes.assert_awaited_once_with(
+        [subscription.user_remna_id for subscription in subscriptions]
+    )
     service._enqueue_runtime_refresh_if_needed.assert_awaited_once_with(
         user_telegram_id=100,
-        subscription_ids=[1, 1],
+        subscription_ids=[1],
         enqueue_runtime_refresh=enqueue_runtime_refresh,
     )
 
 
+def test_get_cached_runtimes_reads_unique_keys_in_one_mget() -> None:
+    service = build_runtime_service()
+    first = build_subscription(subscription_id=1)
+    second = build_subscription(subscription_id=2)
+    second.user_remna_id = uuid4()
+    snapshot = build_runtime_snapshot(first, refreshed_delta_seconds=0)
+    service.redis_repository.get_many = AsyncMock(return_value=[snapshot, None])
+
+    snapshots = run_async(
+        service.get_cached_runtimes(
+            [first.user_remna_id, second.user_remna_id, first.user_remna_id]
+        )
+    )
+
+    assert snapshots == {first.user_remna_id: snapshot}
+    keys = service.redis_repository.get_many.await_args.args[0]
+    assert [key.user_remna_id for key in keys] == [
+        str(first.user_remna_id),
+        str(second.user_remna_id),
+    ]
+
+
+def test_refresh_runtime_snapshots_for_user_stores_all_snapshots_in_one_write() -> None:
+    service = build_runtime_service()
+    subscriptions = [
+        build_subscription(subscription_id=1, user_telegram_id=100),
+        build_subscription(subscription_id=2, user_telegram_id=100),
+    ]
+    subscriptions[1].user_remna_id = uuid4()
+    service.remnawave_service.get_user = AsyncMock(
+        return_value=SimpleNamespace(subscription_url="", user_traffic=None)
+    )
+    service._apply_refreshed_snapshot = AsyncMock()  # type: ignore[method-assign]
+
+    run_async(service._refresh_runtime_snapshots_for_user(subscriptions))
+
+    service.redis_repository.set_many.assert_awaited_once()
+    stored = service.redis_repository.set_many.await_args.args[0]
+    assert [key.user_remna_id for key, _ in stored] == [
+        str(subscription.user_remna_id) for subscription in subscriptions
+    ]
+    assert service._apply_refreshed_snapshot.await_count == 2
+
+
+def test_apply_refreshed_snapshot_publishes_only_when_runtime_values_change() -> None:
+    service = build_runtime_service()
+    service.redis_client.publish = AsyncMock()  # type: ignore[attr-defined]
+    service._persist_url_if_changed = AsyncMock()  # type: ignore[method-assign]
+    subscription = build_subscription()
+    previous = build_runtime_snapshot(subscription, refreshed_delta_seconds=30, traffic_used=10)
+    unchanged = build_runtime_snapshot(subscription, traffic_used=10)
+    changed = build_runtime_snapshot(subscription, traffic_used=20)
+
+    run_async(service._apply_refreshed_snapshot(subscription, unchanged, previous=previous))
+    service.redis_client.publish.assert_not_awaited()  # type: ignore[attr-defined]
+
+    run_async(service._apply_refreshed_snapshot(subscription, changed, previous=previous))
+    service.redis_client.publish.assert_awaited_once()  # type: ignore[attr-defined]
+    assert service._persist_url_if_changed.await_count == 2
+
+
+def test_refresh_runtime_snapshot_compares_against_previously_cached_snapshot() -> None:
+    service = build_runtime_service()
+    subscription = build_subscription()
+    previous = build_runtime_snapshot(subscription)
+    snapshot = build_runtime_snapshot(subscription, devices_count=1)
+    service.redis_repository.get_many = AsyncMock(return_value=[previous])
+    service._fetch_runtime_snapshot = AsyncMock(return_value=snapshot)  # type: ignore[method-assign]
+    service._apply_refreshed_snapshot = AsyncMock()  # type: ignore[method-assign]
+
+    run_async(service._refresh_runtime_snapshot_for_subscription(subscription))
+
+    service._apply_refreshed_snapshot.assert_awaited_once_with(
+        subscription,
+        snapshot,
+        previous=previous,
+    )
+
+
 def test_prepare_for_detail_falls_back_to_stale_snapshot_when_refresh_fails() -> None:
     service = build_runtime_service()
     subscription = build_subscription()
@@ -18,6 +18,7 @@ from src.infrastructure.database.models.dto import (
     SubscriptionDto,
     UserDto,
 )
+from src.services.request_loader import RequestDataLoader
 from src.services.subscription import SubscriptionService
 
 
@@ -63,6 +64,7 @@ def build_service(*, user_service=None, uow=None) -> tuple[SubscriptionService,
             set_current_subscription=AsyncMock(),
             clear_user_cache=AsyncMock(),
         ),
+        request_loader=RequestDataLoader(),
     )
     return service, actual_uow
 
@@ -326,6 +328,25 @@ def test_delete_subscription_marks_deleted_and_returns_success_flag() -> None:
     assert uow.commit.await_count == 2
 
 
+def test_load_all_by_user_reads_once_per_request_until_a_write() -> None:
+    service, uow = build_service()
+    uow.repository.subscriptions.get_all_by_user = AsyncMock(
+        return_value=[make_subscription_model(build_subscription())]
+    )
+    uow.repository.subscriptions.update = AsyncMock(return_value=None)
+
+    async def scenario() -> None:
+        first = await service.load_all_by_user(100)
+        second = await service.load_all_by_user(100)
+        assert first == second and first[0] is not second[0]
+        await service.delete_subscription(11)
+        await service.load_all_by_user(100)
+
+    run_async(scenario())
+
+    assert uow.repository.subscriptions.get_all_by_user.await_count == 2
+
+
 def test_get_traffic_reset_delta_preserves_existing_strategy_rules(monkeypatch) -> None:
     fixed_now = datetime(2026, 4, 13, 12, 0, 0, tzinfo=TIMEZONE)
     monkeypatch.setattr(subscription_plan_sync_module, "datetime_now", lambda: fixed_now)
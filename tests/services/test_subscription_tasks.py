@@ -7,6 +7,11 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
+from src.core.constants import (
+    EXPIRED_SUBSCRIPTION_CLEANUP_BATCH_SIZE,
+    EXPIRED_SUBSCRIPTION_CLEANUP_DAYS,
+    EXPIRED_SUBSCRIPTION_CLEANUP_MAX_ATTEMPTS,
+)
 from src.core.enums import (
     Currency,
     Locale,
@@ -24,6 +29,9 @@ from src.infrastructure.database.models.dto import (
     UserDto,
 )
 from src.infrastructure.database.models.dto.transaction import PriceDetailsDto
+from src.infrastructure.taskiq.tasks import (
+    subscriptions_lifecycle as subscriptions_lifecycle_tasks,
+)
 from src.infrastructure.taskiq.tasks import subscriptions_purchase as subscriptions_purchase_tasks
 from src.infrastructure.taskiq.tasks.subscriptions import (
     cleanup_expired_subscriptions_task,
@@ -109,6 +117,7 @@ def build_transaction(
 def test_purchase_subscription_task_uses_current_subscription_fallback_for_renew(
     monkeypatch,
 ) -> None:
+    redis_client = SimpleNamespace(publish=AsyncMock(return_value=0))
     user = build_user(telegram_id=701)
     plan = build_plan_snapshot(plan_id=41)
     transaction = build_transaction(user=user, plan=plan, purchase_type=PurchaseType.RENEW)
@@ -146,16 +155,19 @@ def test_purchase_subscription_task_uses_current_subscription_fallback_for_renew
             settings_service=settings_service,
             transaction_service=SimpleNamespace(update=AsyncMock()),
             plan_service=SimpleNamespace(),
+            redis_client=redis_client,
         )
     )
 
     assert remnawave_service.updated_user.await_args.kwargs["subscription"] is current_subscription
     redirect_to_success.assert_awaited_once_with(user, PurchaseType.RENEW)
+    assert redis_client.publish.await_args.args[0] == "user_events:701"
 
 
 def test_purchase_subscription_task_marks_failed_and_redirects_when_upgrade_has_no_selection(
     monkeypatch,
 ) -> None:
+    redis_client = SimpleNamespace(publish=AsyncMock(return_value=0))
     user = build_user(telegram_id=702)
     plan = build_plan_snapshot(plan_id=42)
     transaction = build_transaction(user=user, plan=plan, purchase_type=PurchaseType.UPGRADE)
@@ -190,6 +202,7 @@ def test_purchase_subscription_task_marks_failed_and_redirects_when_upgrade_has_
             settings_service=SimpleNamespace(get_max_subscriptions_for_user=AsyncMock(return_value=5)),
             transaction_service=transaction_service,
             plan_service=SimpleNamespace(),
+            redis_client=redis_client,
         )
     )
 
@@ -203,6 +216,7 @@ def test_purchase_subscription_task_marks_failed_and_redirects_when_upgrade_has_
 def test_purchase_subscription_task_checks_guardrail_before_panel_writes_for_new_purchase(
     monkeypatch,
 ) -> None:
+    redis_client = SimpleNamespace(publish=AsyncMock(return_value=0))
     user = build_user(telegram_id=703)
     plan = build_plan_snapshot(plan_id=43)
     transaction = build_transaction(user=user, plan=plan, purchase_type=PurchaseType.NEW)
@@ -252,6 +266,7 @@ def test_purchase_subscription_task_checks_guardrail_before_panel_writes_for_new
             ),
             transaction_service=SimpleNamespace(update=AsyncMock()),
             plan_service=SimpleNamespace(),
+            redis_client=redis_client,
         )
     )
 
@@ -320,7 +335,14 @@ def test_update_status_current_subscription_task_uses_matching_current_subscript
     subscription_service.update.assert_awaited_once_with(current_subscription)
 
 
-def test_cleanup_expired_subscriptions_task_continues_after_panel_delete_failure() -> None:
+def test_cleanup_expired_subscriptions_task_continues_after_panel_delete_failure(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(
+        subscriptions_lifecycle_tasks,
+        "EXPIRED_SUBSCRIPTION_CLEANUP_RETRY_DELAY_SECONDS",
+        0,
+    )
     first = build_subscription(
         subscription_id=16,
         user=build_user(telegram_id=706),
@@ -332,21 +354,70 @@ def test_cleanup_expired_subscriptions_task_continues_after_panel_delete_failure
         plan=build_plan_snapshot(plan_id=47),
     )
 
-    delete_user = AsyncMock(
-        side_effect=[RuntimeError("boom"), SimpleNamespace(is_deleted=True)]
+    async def delete_user(*, uuid: str):
+        if uuid == str(first.user_remna_id):
+            raise RuntimeError("boom")
+        return SimpleNamespace(is_deleted=True)
+
+    delete_user_mock = AsyncMock(side_effect=delete_user)
+    subscription_service = SimpleNamespace(
+        get_expired_subscription_refs_page=AsyncMock(
+            return_value=[
+                (first.id, first.user_remna_id),
+                (second.id, second.user_remna_id),
+            ]
+        ),
+        delete_subscriptions=AsyncMock(return_value=1),
     )
+    redis_repository = SimpleNamespace(
+        get=AsyncMock(return_value=None),
+        set=AsyncMock(),
+        delete=AsyncMock(),
+    )
+    remnawave = SimpleNamespace(users=SimpleNamespace(delete_user=delete_user_mock))
+
+    run_async(
+        unwrap_task(cleanup_expired_subscriptions_task)(
+            subscription_service=subscription_service,
+            remnawave=remnawave,
+            redis_repository=redis_repository,
+        )
+    )
+
+    assert delete_user_mock.await_count == EXPIRED_SUBSCRIPTION_CLEANUP_MAX_ATTEMPTS + 1
+    subscription_service.delete_subscriptions.assert_awaited_once_with([second.id])
+    subscription_service.get_expired_subscription_refs_page.assert_awaited_once_with(
+        days=EXPIRED_SUBSCRIPTION_CLEANUP_DAYS,
+        after_id=0,
+        limit=EXPIRED_SUBSCRIPTION_CLEANUP_BATCH_SIZE,
+    )
+    redis_repository.delete.assert_awaited_once()
+
+
+def test_cleanup_expired_subscriptions_task_resumes_from_checkpoint() -> None:
     subscription_service = SimpleNamespace(
-        get_expired_subscriptions_older_than=AsyncMock(return_value=[first, second]),
-        delete_subscription=AsyncMock(),
+        get_expired_subscription_refs_page=AsyncMock(side_effect=[[(42, None)]]),
+        delete_subscriptions=AsyncMock(return_value=1),
     )
-    remnawave = SimpleNamespace(users=SimpleNamespace(delete_user=delete_user))
+    redis_repository = SimpleNamespace(
+        get=AsyncMock(return_value=41),
+        set=AsyncMock(),
+        delete=AsyncMock(),
+    )
+    remnawave = SimpleNamespace(users=SimpleNamespace(delete_user=AsyncMock()))
 
     run_async(
         unwrap_task(cleanup_expired_subscriptions_task)(
             subscription_service=subscription_service,
             remnawave=remnawave,
+            redis_repository=redis_repository,
         )
     )
 
-    assert delete_user.await_count == 2
-    subscription_service.delete_subscription.assert_awaited_once_with(second.id)
+    assert (
+        subscription_service.get_expired_subscription_refs_page.await_args.kwargs["after_id"]
+        == 41
+    )
+    remnawave.users.delete_user.assert_not_awaited()
+    subscription_service.delete_subscriptions.assert_awaited_once_with([42])
+    assert redis_repository.set.await_args.args[1] == 42
@@ -59,7 +59,7 @@ def build_service(
         remnawave_service=SimpleNamespace(),
         subscription_service=SimpleNamespace(
             has_used_trial=AsyncMock(return_value=used_trial),
-            get_all_by_user=AsyncMock(return_value=subscriptions or []),
+            load_all_by_user=AsyncMock(return_value=subscriptions or []),
             create=AsyncMock(),
         ),
     )
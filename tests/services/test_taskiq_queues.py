@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from taskiq.message import BrokerMessage
+from taskiq_redis import RedisStreamBroker
+
+from src.core.config.taskiq import TaskiqConfig
+from src.core.enums import TaskQueue
+from src.infrastructure.taskiq.broker import (
+    QUEUE_NAME_LABEL,
+    TASK_QUEUE_STREAMS,
+    QueueRoutedStreamBroker,
+    queue_stream,
+)
+from src.infrastructure.taskiq.tasks.broadcast import send_broadcast_task
+from src.infrastructure.taskiq.tasks.notifications import send_user_notification_task
+from src.infrastructure.taskiq.tasks.payments import handle_payment_transaction_task
+
+
+def _message(labels: dict[str, str]) -> BrokerMessage:
+    return BrokerMessage(task_id="1", task_name="task", message=b"{}", labels=labels)
+
+
+def test_worker_consumes_only_its_configured_streams() -> None:
+    broker = QueueRoutedStreamBroker(
+        "redis://localhost",
+        consume_queues=[TaskQueue.CRITICAL, TaskQueue.DEFAULT],
+    )
+
+    assert broker.queue_name == "taskiq:critical"
+    assert broker.additional_streams == {"taskiq": ">"}
+
+
+def test_kick_routes_by_label_and_defaults_to_the_legacy_stream(monkeypatch) -> None:
+    kicked: list[str] = []
+
+    async def fake_kick(self: RedisStreamBroker, message: BrokerMessage) -> None:
+        kicked.append(message.labels[QUEUE_NAME_LABEL])
+
+    monkeypatch.setattr(RedisStreamBroker, "kick", fake_kick)
+    # A bulk-only worker still sends unlabeled tasks to the default stream.
+    broker = QueueRoutedStreamBroker("redis://localhost", consume_queues=[TaskQueue.BULK])
+
+    async def scenario() -> None:
+        await broker.kick(_message({}))
+        await broker.kick(_message({QUEUE_NAME_LABEL: queue_stream(TaskQueue.CRITICAL)}))
+
+    asyncio.run(scenario())
+
+    assert kicked == ["taskiq", "taskiq:critical"]
+
+
+def test_tasks_are_labeled_with_their_queue() -> None:
+    assert handle_payment_transaction_task.labels[QUEUE_NAME_LABEL] == "taskiq:critical"
+    assert send_broadcast_task.labels[QUEUE_NAME_LABEL] == "taskiq:bulk"
+    assert QUEUE_NAME_LABEL not in send_user_notification_task.labels
+    assert set(TASK_QUEUE_STREAMS) == set(TaskQueue)
+
+
+def test_taskiq_config_parses_and_dedupes_queues(monkeypatch) -> None:
+    monkeypatch.setenv("TASKIQ_QUEUES", "critical, critical,bulk")
+    assert TaskiqConfig().queues == [TaskQueue.CRITICAL, TaskQueue.BULK]
+
+    monkeypatch.setenv("TASKIQ_QUEUES", "")
+    with pytest.raises(ValueError):
+        TaskiqConfig()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.core.enums import UserStreamEventType
+from src.services.user_event_stream import (
+    UserEventStreamService,
+    UserStreamEvent,
+    publish_user_event,
+)
+
+
+def run_async(coroutine):
+    return asyncio.run(coroutine)
+
+
+class FakeFanout:
+    def __init__(self) -> None:
+        self.queues: dict[str, asyncio.Queue[str]] = {}
+        self.unsubscribed: list[str] = []
+
+    async def subscribe(self, channel: str) -> asyncio.Queue[str]:
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        self.queues[channel] = queue
+        return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue[str]) -> None:
+        del queue
+        self.unsubscribed.append(channel)
+
+
+def test_publish_user_event_targets_user_channel() -> None:
+    redis_client = SimpleNamespace(publish=AsyncMock(return_value=1))
+
+    run_async(
+        publish_user_event(
+            redis_client,  # type: ignore[arg-type]
+            42,
+            UserStreamEventType.DEVICE_CHANGED,
+            event="user_hwid_devices.deleted",
+        )
+    )
+
+    channel, message = redis_client.publish.await_args.args
+    assert channel == "user_events:42"
+    assert json.loads(message) == {
+        "type": "device_changed",
+        "payload": {"event": "user_hwid_devices.deleted"},
+    }
+
+
+def test_publish_user_event_swallows_redis_errors() -> None:
+    redis_client = SimpleNamespace(publish=AsyncMock(side_effect=ConnectionError("down")))
+
+    run_async(
+        publish_user_event(
+            redis_client,  # type: ignore[arg-type]
+            42,
+            UserStreamEventType.NOTIFICATION_CREATED,
+        )
+    )
+
+
+def test_listen_yields_events_and_heartbeats_then_unsubscribes() -> None:
+    fanout = FakeFanout()
+    service = UserEventStreamService(fanout)  # type: ignore[arg-type]
+
+    async def scenario() -> list[UserStreamEvent | None]:
+        received: list[UserStreamEvent | None] = []
+        stream = service.listen(user_telegram_id=7, heartbeat_seconds=0.01, max_seconds=0.2)
+        async for event in stream:
+            received.append(event)
+            if len(received) == 1:
+                fanout.queues["user_events:7"].put_nowait(
+                    UserStreamEvent(type=UserStreamEventType.PAYMENT_COMPLETED).model_dump_json()
+                )
+            if any(item is not None for item in received):
+                break
+        await stream.aclose()
+        return received
+
+    received = run_async(scenario())
+
+    assert received[0] is None
+    assert received[-1] == UserStreamEvent(type=UserStreamEventType.PAYMENT_COMPLETED)
+    assert fanout.unsubscribed == ["user_events:7"]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Optional
+from unittest.mock import AsyncMock
+
+from src.core.enums import UserNotificationType
+from src.core.storage.keys import UserNotificationTotalCountKey, UserNotificationUnreadCountKey
+from src.services.user_notification_event import UserNotificationEventService
+
+
+def run_async(coroutine):
+    return asyncio.run(coroutine)
+
+
+class FakeRedisRepository:
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+        self.client = SimpleNamespace(publish=AsyncMock(return_value=0))
+
+    async def get(self, key, validator, default=None):
+        del validator
+        return self.values.get(key.pack(), default)
+
+    async def get_many(self, keys, validator) -> list[Optional[Any]]:
+        del validator
+        return [self.values.get(key.pack()) for key in keys]
+
+    async def set(self, key, value, ex=None) -> None:
+        del ex
+        self.values[key.pack()] = value
+
+    async def increment_existing(self, key, amount: int = 1) -> Optional[int]:
+        packed = key.pack()
+        if packed not in self.values:
+            return None
+        self.values[packed] = max(self.values[packed] + amount, 0)
+        return self.values[packed]
+
+
+class DummyUow:
+    def __init__(self, *, total: int = 0, unread: int = 0) -> None:
+        self.repository = SimpleNamespace(
+            user_notification_events=SimpleNamespace(
+                create=AsyncMock(side_effect=lambda event: event),
+                count_by_user=AsyncMock(return_value=total),
+                count_unread_by_user=AsyncMock(return_value=unread),
+                mark_read=AsyncMock(return_value=True),
+                mark_read_by_id=AsyncMock(return_value=7),
+                mark_all_read=AsyncMock(return_value=3),
+            )
+        )
+        self.commit = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        del exc_type, exc, tb
+        return False
+
+
+def _unread(redis: FakeRedisRepository, user_telegram_id: int = 7) -> Optional[int]:
+    return redis.values.get(
+        UserNotificationUnreadCountKey(user_telegram_id=user_telegram_id).pack()
+    )
+
+
+def test_count_unread_rebuilds_counters_once_and_then_reads_redis() -> None:
+    uow = DummyUow(total=5, unread=2)
+    redis = FakeRedisRepository()
+    service = UserNotificationEventService(uow, redis)  # type: ignore[arg-type]
+
+    assert run_async(service.count_unread(user_telegram_id=7)) == 2
+    assert run_async(service.count_unread(user_telegram_id=7)) == 2
+
+    uow.repository.user_notification_events.count_unread_by_user.assert_awaited_once()
+    assert redis.values[UserNotificationTotalCountKey(user_telegram_id=7).pack()] == 5
+
+
+def test_counters_follow_create_and_mark_read_without_touching_db_counts() -> None:
+    uow = DummyUow(total=5, unread=2)
+    redis = FakeRedisRepository()
+    service = UserNotificationEventService(uow, redis)  # type: ignore[arg-type]
+    run_async(service.get_counters(user_telegram_id=7))
+
+    run_async(
+        service.create_event(
+            user_telegram_id=7,
+            ntf_type=next(iter(UserNotificationType)),
+            i18n_key="ntf-test",
+            i18n_kwargs={},
+            rendered_text="test",
+        )
+    )
+    assert run_async(service.get_counters(user_telegram_id=7)) == (6, 3)
+
+    run_async(service.mark_read(notification_id=1, user_telegram_id=7, read_source="web"))
+    run_async(service.mark_read_by_id(notification_id=2, read_source="bot"))
+    assert _unread(redis) == 1
+
+    run_async(service.mark_all_read(user_telegram_id=7, read_source="web"))
+    assert _unread(redis) == 0
+    uow.repository.user_notification_events.count_by_user.assert_awaited_once()
+    redis.client.publish.assert_awaited_once()
+
+
+def test_updates_do_not_create_counters_for_cold_users() -> None:
+    uow = DummyUow()
+    uow.repository.user_notification_events.mark_read_by_id.return_value = None
+    redis = FakeRedisRepository()
+    service = UserNotificationEventService(uow, redis)  # type: ignore[arg-type]
+
+    assert run_async(service.mark_read_by_id(notification_id=2, read_source="bot")) is False
+    run_async(service.mark_all_read(user_telegram_id=7, read_source="web"))
+
+    assert redis.values == {}
@@ -6,8 +6,10 @@ from unittest.mock import AsyncMock
 
 from sqlalchemy.exc import IntegrityError
 
+from src.core.constants import USER_SEARCH_LIMIT
 from src.core.enums import Currency, Locale, UserRole
 from src.infrastructure.database.models.dto import UserDto
+from src.infrastructure.redis import get_cache_spec
 from src.services.user import UserService
 
 
@@ -23,7 +25,7 @@ class DummyUow:
                 get=AsyncMock(return_value=None),
                 update=AsyncMock(),
                 delete=AsyncMock(return_value=True),
-                get_by_partial_name=AsyncMock(return_value=[]),
+                search_by_login_or_name=AsyncMock(return_value=[]),
                 get_by_referral_code=AsyncMock(return_value=None),
                 count=AsyncMock(return_value=0),
                 filter_by_role=AsyncMock(return_value=[]),
@@ -35,7 +37,7 @@ class DummyUow:
             ),
             web_accounts=SimpleNamespace(
                 get_by_username=AsyncMock(return_value=None),
-                get_by_partial_username=AsyncMock(return_value=[]),
+                get_by_email=AsyncMock(return_value=None),
             ),
         )
         self.commit = AsyncMock()
@@ -176,19 +178,54 @@ def test_search_supports_exact_web_login() -> None:
     assert [user.telegram_id for user in result] == [-555]
 
 
-def test_search_merges_partial_name_and_web_login_matches() -> None:
+def test_search_supports_exact_web_email() -> None:
     service, uow = build_service()
-    partial_name_user = make_user_dto(412289221, username="tg_412289221", name="Alina")
-    partial_login_user_model = make_user_model(-555, username="alice", name="Alice")
-    uow.repository.web_accounts.get_by_partial_username = AsyncMock(
-        return_value=[SimpleNamespace(user_telegram_id=-555)]
+    uow.repository.web_accounts.get_by_email = AsyncMock(
+        return_value=SimpleNamespace(user_telegram_id=-555)
+    )
+    uow.repository.users.get = AsyncMock(return_value=make_user_model(-555, username="alice"))
+
+    result = run_async(service._search_users_by_login_or_name("Alice@Example.com"))
+
+    assert [user.telegram_id for user in result] == [-555]
+    uow.repository.web_accounts.get_by_email.assert_awaited_once_with("alice@example.com")
+    uow.repository.users.search_by_login_or_name.assert_not_called()
+
+
+def test_search_returns_ranked_partial_matches_page() -> None:
+    service, uow = build_service()
+    ranked_models = [
+        make_user_model(-555, username="alice", name="Alice"),
+        make_user_model(412289221, username="tg_412289221", name="Alina"),
+    ]
+    uow.repository.users.search_by_login_or_name = AsyncMock(return_value=ranked_models)
+
+    result = run_async(service._search_users_by_login_or_name("ali", limit=2, offset=4))
+
+    assert [user.telegram_id for user in result] == [-555, 412289221]
+    uow.repository.users.search_by_login_or_name.assert_awaited_once_with(
+        "ali",
+        limit=2,
+        offset=4,
     )
-    uow.repository.users.get_by_ids = AsyncMock(return_value=[partial_login_user_model])
-    service.get_by_partial_name = AsyncMock(return_value=[partial_name_user])  # type: ignore[method-assign]
+    uow.repository.web_accounts.get_by_email.assert_not_called()
 
-    result = run_async(service._search_users_by_login_or_name("ali"))
 
-    assert {user.telegram_id for user in result} == {412289221, -555}
+def test_search_more_users_pages_ranked_matches_without_exact_lookup() -> None:
+    service, uow = build_service()
+    uow.repository.users.search_by_login_or_name = AsyncMock(
+        return_value=[make_user_model(412289221, username="tg_412289221", name="Alina")]
+    )
+
+    result = run_async(service.search_more_users("alice", offset=50))
+
+    assert [user.telegram_id for user in result] == [412289221]
+    uow.repository.users.search_by_login_or_name.assert_awaited_once_with(
+        "alice",
+        limit=USER_SEARCH_LIMIT,
+        offset=50,
+    )
+    uow.repository.web_accounts.get_by_username.assert_not_called()
 
 
 def test_create_placeholder_user_does_not_touch_recent_registered() -> None:
@@ -218,14 +255,78 @@ def test_get_recent_registered_users_prunes_missing_cached_users() -> None:
     service._remove_from_recent_registered.assert_awaited_once_with(2)
 
 
-def test_clear_user_cache_invalidates_user_and_list_caches() -> None:
+def test_clear_user_cache_invalidates_user_and_list_caches_in_one_call() -> None:
     service, _uow = build_service()
-    service._clear_list_caches = AsyncMock()  # type: ignore[method-assign]
+    pipe = FakePipeline(None)
+    service.redis_client.pipeline = lambda transaction: pipe
 
     run_async(service.clear_user_cache(412289221))
 
-    service.redis_client.delete.assert_awaited_once()
-    service._clear_list_caches.assert_awaited_once()
+    assert pipe.commands == [
+        ("delete", ("cache:get_user:412289221",)),
+        ("incr", ("cache_generation:user_lists",)),
+    ]
+
+
+class FakePipeline:
+    def __init__(self, cached_value: bytes | None) -> None:
+        self.cached_value = cached_value
+        self.commands: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        del exc_type, exc, tb
+        return False
+
+    def __getattr__(self, name: str):
+        return lambda *args: self.commands.append((name, args))
+
+    async def execute(self) -> list:
+        return [[self.cached_value, None] if name == "mget" else 1 for name, _ in self.commands]
+
+
+def build_cached_user(telegram_id: int) -> bytes:
+    spec = get_cache_spec(UserService.get)
+    return spec.encode(make_user_dto(telegram_id), [0], fresh_seconds=60).encode()
+
+
+def test_get_and_record_activity_reads_cached_user_in_one_debounced_pipeline(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr("src.services.user_recent._activity_recorded_at", {})
+    service, _uow = build_service()
+    cached_user = build_cached_user(412289221)
+    pipelines: list[FakePipeline] = []
+
+    def pipeline(transaction: bool) -> FakePipeline:
+        assert transaction is False
+        pipelines.append(FakePipeline(cached_user))
+        return pipelines[-1]
+
+    service.redis_client.pipeline = pipeline
+
+    first = run_async(service.get_and_record_activity(412289221))
+    second = run_async(service.get_and_record_activity(412289221))
+
+    assert first is not None and first.telegram_id == 412289221
+    assert second is not None and second.telegram_id == 412289221
+    assert [name for name, _ in pipelines[0].commands] == ["mget", "zadd", "zremrangebyrank"]
+    assert pipelines[0].commands[0][1][0][0] == "cache:get_user:412289221"
+    assert [name for name, _ in pipelines[1].commands] == ["mget"]
+
+
+def test_get_and_record_activity_falls_back_to_get_on_cache_miss(monkeypatch) -> None:
+    monkeypatch.setattr("src.services.user_recent._activity_recorded_at", {})
+    service, _uow = build_service()
+    service.redis_client.pipeline = lambda transaction: FakePipeline(None)
+    service.get = AsyncMock(return_value=make_user_dto(412289221))  # type: ignore[method-assign]
+
+    result = run_async(service.get_and_record_activity(412289221))
+
+    assert result is not None and result.telegram_id == 412289221
+    service.get.assert_awaited_once_with(412289221)
 
 
 def test_set_current_subscription_updates_repo_and_clears_cache() -> None:
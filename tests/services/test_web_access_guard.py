@@ -34,6 +34,7 @@ def build_guard(settings: SettingsDto) -> WebAccessGuardService:
         settings_service=SimpleNamespace(get=AsyncMock(return_value=settings)),
         web_account_service=SimpleNamespace(get_by_user_telegram_id=AsyncMock(return_value=None)),
         access_mode_policy_service=AccessModePolicyService(),
+        channel_membership_service=MagicMock(),
     )
 
 
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.core.enums import Locale, UserRole
-from src.core.security.password import hash_password
+from src.core.security.password import hash_password, needs_rehash, verify_password
 from src.core.utils.time import datetime_now
 from src.services.web_account import WebAccountService
 
@@ -232,6 +232,24 @@ def test_login_rejects_invalid_credentials_blocked_users_and_expired_temp_passwo
         run_async(service.login(username="alice", password="secret123"))
 
 
+def test_login_upgrades_outdated_password_hash() -> None:
+    service, uow = build_service()
+    account_model = make_web_account_model(password_hash=hash_password("secret123", rounds=4))
+    uow.repository.web_accounts.get_by_username = AsyncMock(return_value=account_model)
+    uow.repository.web_accounts.update = AsyncMock(return_value=account_model)
+    uow.repository.users.get = AsyncMock(
+        return_value=make_user_model(100, username="alice", name="Alice")
+    )
+
+    result = run_async(service.login(username="alice", password="secret123"))
+
+    assert result.web_account.username == "alice"
+    update_kwargs = uow.repository.web_accounts.update.await_args.kwargs
+    assert not needs_rehash(update_kwargs["password_hash"])
+    assert verify_password("secret123", update_kwargs["password_hash"])
+    uow.commit.assert_awaited_once()
+
+
 def test_get_or_create_for_telegram_user_returns_existing_linked_account() -> None:
     service, uow = build_service()
     user = SimpleNamespace(telegram_id=100, username="alice", name="Alice")
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from src.services import web_analytics_buffer as buffer_module
+from src.services.web_analytics_buffer import WebAnalyticsEventBuffer
+
+
+def run_async(coroutine):
+    return asyncio.run(coroutine)
+
+
+def install_fake_uow(
+    monkeypatch,
+    batches: list[list[dict[str, object]]],
+    *,
+    reject=lambda rows: False,
+) -> None:
+    class FakeUow:
+        def __init__(self, session_pool) -> None:
+            del session_pool
+
+            async def create_many(rows):
+                if reject(rows):
+                    raise RuntimeError("insert failed")
+                batches.append(list(rows))
+                return len(rows)
+
+            self.repository = SimpleNamespace(
+                web_analytics_events=SimpleNamespace(create_many=create_many)
+            )
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            del exc_type, exc, tb
+            return False
+
+    monkeypatch.setattr(buffer_module, "UnitOfWork", FakeUow)
+
+
+def test_buffer_flushes_full_batches_and_remaining_rows_on_interval(monkeypatch) -> None:
+    batches: list[list[dict[str, object]]] = []
+    install_fake_uow(monkeypatch, batches)
+    buffer = WebAnalyticsEventBuffer(
+        session_pool=None,  # type: ignore[arg-type]
+        batch_size=2,
+        flush_interval=0.01,
+    )
+
+    async def _run() -> None:
+        for index in range(3):
+            assert buffer.offer({"event_name": f"event-{index}"}) is True
+        await asyncio.sleep(0.05)
+        await buffer.close()
+
+    run_async(_run())
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert buffer.pending == 0
+
+
+def test_buffer_rejects_rows_when_full_and_flushes_backlog_on_close(monkeypatch) -> None:
+    batches: list[list[dict[str, object]]] = []
+    install_fake_uow(monkeypatch, batches)
+    buffer = WebAnalyticsEventBuffer(
+        session_pool=None,  # type: ignore[arg-type]
+        max_size=2,
+        batch_size=10,
+        flush_interval=10.0,
+    )
+
+    async def _run() -> list[bool]:
+        results = [buffer.offer({"event_name": f"event-{index}"}) for index in range(3)]
+        await buffer.close()
+        return results
+
+    results = run_async(_run())
+
+    assert results == [True, True, False]
+    assert [len(batch) for batch in batches] == [2]
+
+
+def test_close_flushes_the_batch_the_consumer_is_collecting(monkeypatch) -> None:
+    batches: list[list[dict[str, object]]] = []
+    install_fake_uow(monkeypatch, batches)
+    buffer = WebAnalyticsEventBuffer(
+        session_pool=None,  # type: ignore[arg-type]
+        batch_size=10,
+        flush_interval=10.0,
+    )
+
+    async def _run() -> None:
+        for index in range(3):
+            buffer.offer({"event_name": f"event-{index}"})
+        await asyncio.sleep(0.01)  # the consumer has taken the rows and waits for more
+        await buffer.close()
+
+    run_async(_run())
+
+    assert [len(batch) for batch in batches] == [3]
+    assert buffer.pending == 0
+
+
+def test_flush_retries_a_transient_failure_once(monkeypatch) -> None:
+    failures = [True]
+
+    def reject(rows) -> bool:
+        del rows
+        return failures.pop() if failures else False
+
+    batches: list[list[dict[str, object]]] = []
+    install_fake_uow(monkeypatch, batches, reject=reject)
+    buffer = WebAnalyticsEventBuffer(session_pool=None)  # type: ignore[arg-type]
+
+    run_async(buffer._flush([{"event_name": "a"}, {"event_name": "b"}]))
+
+    assert batches == [[{"event_name": "a"}, {"event_name": "b"}]]
+
+
+def test_flush_drops_only_the_rows_the_database_rejects(monkeypatch) -> None:
+    batches: list[list[dict[str, object]]] = []
+    install_fake_uow(
+        monkeypatch,
+        batches,
+        reject=lambda rows: any(row["event_name"] == "bad" for row in rows),
+    )
+    buffer = WebAnalyticsEventBuffer(session_pool=None)  # type: ignore[arg-type]
+    rows: list[dict[str, object]] = [{"event_name": name} for name in ("a", "b", "bad", "c", "d")]
+
+    run_async(buffer._flush(rows))
+
+    flushed = [row["event_name"] for batch in batches for row in batch]
+    assert sorted(flushed) == ["a", "b", "c", "d"]
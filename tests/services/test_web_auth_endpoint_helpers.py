@@ -15,6 +15,7 @@ from src.api.endpoints.web_auth import (
 )
 from src.core.enums import Locale, UserRole
 from src.infrastructure.database.models.dto import UserDto, WebAccountDto
+from src.infrastructure.redis import RateLimitDecision
 
 
 def run_async(coroutine):
@@ -85,33 +86,34 @@ def test_resolve_web_auth_message_returns_readable_strings_and_preserves_fallbac
     assert _resolve_web_auth_message("missing_key", "ru") == ""
 
 
-def test_enforce_rate_limit_sets_expiry_and_raises_after_limit() -> None:
+def test_enforce_rate_limit_raises_429_with_retry_after_when_limiter_rejects() -> None:
     config = build_config()
-    redis_client = SimpleNamespace(
-        incr=AsyncMock(side_effect=[1, 2, 3]),
-        expire=AsyncMock(),
+    rate_limiter = SimpleNamespace(
+        hit=AsyncMock(
+            side_effect=[
+                RateLimitDecision(allowed=True),
+                RateLimitDecision(allowed=False, retry_after=12.2),
+            ]
+        )
     )
 
-    run_async(_enforce_rate_limit(config, redis_client, "auth:key"))
-    run_async(_enforce_rate_limit(config, redis_client, "auth:key"))
+    run_async(_enforce_rate_limit(config, rate_limiter, "auth:key"))
 
     with pytest.raises(HTTPException) as error_info:
-        run_async(_enforce_rate_limit(config, redis_client, "auth:key"))
+        run_async(_enforce_rate_limit(config, rate_limiter, "auth:key"))
 
     assert error_info.value.status_code == 429
-    redis_client.expire.assert_awaited_once_with("auth:key", 60)
+    assert error_info.value.headers == {"Retry-After": "13"}
+    rate_limiter.hit.assert_awaited_with("auth:key", limit=2, window=60)
 
 
 def test_enforce_rate_limit_degrades_open_when_redis_errors() -> None:
     config = build_config()
-    redis_client = SimpleNamespace(
-        incr=AsyncMock(side_effect=RuntimeError("redis down")),
-        expire=AsyncMock(),
-    )
+    rate_limiter = SimpleNamespace(hit=AsyncMock(side_effect=RuntimeError("redis down")))
 
-    run_async(_enforce_rate_limit(config, redis_client, "auth:key"))
+    run_async(_enforce_rate_limit(config, rate_limiter, "auth:key"))
 
-    redis_client.expire.assert_not_awaited()
+    rate_limiter.hit.assert_awaited_once()
 
 
 def test_has_valid_cookie_session_truth_table() -> None:
@@ -145,9 +147,9 @@ def test_has_valid_cookie_session_truth_table() -> None:
 
     original_parser = _has_valid_cookie_session.__globals__["parse_token_subject_and_version"]
     try:
-        _has_valid_cookie_session.__globals__["parse_token_subject_and_version"] = (
-            lambda payload: (_ for _ in ()).throw(ValueError("bad payload"))
-        )
+        _has_valid_cookie_session.__globals__["parse_token_subject_and_version"] = lambda payload: (
+            _ for _ in ()
+        ).throw(ValueError("bad payload"))
         assert (
             run_async(
                 _has_valid_cookie_session(
@@ -160,8 +162,9 @@ def test_has_valid_cookie_session_truth_table() -> None:
             is False
         )
 
-        _has_valid_cookie_session.__globals__["parse_token_subject_and_version"] = (
-            lambda payload: (412289221, 7)
+        _has_valid_cookie_session.__globals__["parse_token_subject_and_version"] = lambda payload: (
+            412289221,
+            7,
         )
         web_account_service.get_by_user_telegram_id = AsyncMock(
             return_value=SimpleNamespace(token_version=6)
@@ -586,15 +586,14 @@ def test_user_service_search_supports_exact_web_login() -> None:
     assert [user.telegram_id for user in result] == [-555]
 
 
-def test_user_service_search_merges_partial_name_and_web_login_matches() -> None:
-    partial_name_user = make_user_dto(412289221, username="tg_412289221", name="Alina")
+def test_user_service_search_includes_partial_web_login_matches() -> None:
     partial_login_user_model = make_user_model(-555, username="alice", name="Alice")
+    partial_name_user_model = make_user_model(412289221, username="tg_412289221", name="Alina")
     uow = DummyUow()
     uow.repository.web_accounts.get_by_username = AsyncMock(return_value=None)
-    uow.repository.web_accounts.get_by_partial_username = AsyncMock(
-        return_value=[SimpleNamespace(user_telegram_id=-555)]
+    uow.repository.users.search_by_login_or_name = AsyncMock(
+        return_value=[partial_login_user_model, partial_name_user_model]
     )
-    uow.repository.users.get_by_ids = AsyncMock(return_value=[partial_login_user_model])
     service = UserService(
         config=SimpleNamespace(),
         bot=SimpleNamespace(),
@@ -603,11 +602,10 @@ def test_user_service_search_merges_partial_name_and_web_login_matches() -> None
         translator_hub=SimpleNamespace(),
         uow=uow,
     )
-    service.get_by_partial_name = AsyncMock(return_value=[partial_name_user])
 
     result = run_async(service._search_users_by_login_or_name("ali"))
 
-    assert {user.telegram_id for user in result} == {412289221, -555}
+    assert [user.telegram_id for user in result] == [-555, 412289221]
 
 
 def test_identity_kind_marks_web_only_and_linked_profiles() -> None:
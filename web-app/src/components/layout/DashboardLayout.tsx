@@ -5,6 +5,7 @@ import { useI18n } from '@/components/common/I18nProvider'
 import { useAccessStatusQuery } from '@/hooks/useAccessStatusQuery'
 import { useMobileTelegramUiV2 } from '@/hooks/useMobileTelegramUiV2'
 import { useTelegramWebApp } from '@/hooks/useTelegramWebApp'
+import { useUserEventStream } from '@/hooks/useUserEventStream'
 import { api, clearLegacyAuthStorage } from '@/lib/api'
 import { resolveAccessCapabilities } from '@/lib/access-capabilities'
 import { sendWebTelemetryEvent } from '@/lib/telemetry'
@@ -74,6 +75,7 @@ export function DashboardLayout() {
   const forceMobileShell = useMobileUiV2
   const isPartnerActive = Boolean(user?.is_partner_active)
   const { data: accessStatus } = useAccessStatusQuery({ enabled: Boolean(user) })
+  useUserEventStream({ enabled: Boolean(user) })
   const { isInTelegram, isReady: _isTelegramReady } = useTelegramWebApp()
   const [openForcePasswordPrompt, setOpenForcePasswordPrompt] = useState(false)
   const [forceCurrentPassword, setForceCurrentPassword] = useState('')
@@ -3,6 +3,7 @@ import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
 import { Bell, ChevronLeft, ChevronRight, Loader2 } from 'lucide-react'
 import { useI18n } from '@/components/common/I18nProvider'
 import { useDocumentVisibility } from '@/hooks/useDocumentVisibility'
+import { useUserEventStreamConnected } from '@/hooks/useUserEventStream'
 import { Badge } from '@/components/ui/badge'
 import { Button } from '@/components/ui/button'
 import { buildVisiblePollingQueryOptions } from '@/lib/query-defaults'
@@ -47,13 +48,14 @@ export function NotificationCenterDialog() {
   const [open, setOpen] = useState(false)
   const [page, setPage] = useState(1)
   const isDocumentVisible = useDocumentVisibility()
+  const isStreamConnected = useUserEventStreamConnected()
 
   const unreadQuery = useQuery<UnreadCountResponse>({
     queryKey: ['notifications', 'unread-count'],
     queryFn: () => api.notifications.unreadCount().then((response) => response.data),
     ...buildVisiblePollingQueryOptions({
       enabled: true,
-      active: isDocumentVisible,
+      active: isDocumentVisible && !isStreamConnected,
       intervalMs: UNREAD_POLL_MS,
       refetchOnWindowFocus: true,
     }),
@@ -64,7 +66,7 @@ export function NotificationCenterDialog() {
     queryFn: () => api.notifications.list(page, PAGE_SIZE).then((response) => response.data),
     ...buildVisiblePollingQueryOptions({
       enabled: open,
-      active: open && isDocumentVisible,
+      active: open && isDocumentVisible && !isStreamConnected,
       intervalMs: UNREAD_POLL_MS,
       refetchOnWindowFocus: true,
     }),
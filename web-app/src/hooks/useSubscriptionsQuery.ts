@@ -1,6 +1,7 @@
 import { useQuery, type UseQueryResult } from '@tanstack/react-query'
 import { api } from '@/lib/api'
 import { useDocumentVisibility } from '@/hooks/useDocumentVisibility'
+import { useUserEventStreamConnected } from '@/hooks/useUserEventStream'
 import { buildVisiblePollingQueryOptions } from '@/lib/query-defaults'
 import type { Subscription } from '@/types'
 
@@ -23,6 +24,7 @@ export function useSubscriptionsQuery(options?: {
   const enabled = options?.enabled ?? true
   const pollWhenVisible = options?.pollWhenVisible ?? false
   const isDocumentVisible = useDocumentVisibility()
+  const isStreamConnected = useUserEventStreamConnected()
 
   return useQuery<unknown, Error, Subscription[]>({
     queryKey: ['subscriptions'],
@@ -33,7 +35,7 @@ export function useSubscriptionsQuery(options?: {
     select: normalizeSubscriptions,
     ...buildVisiblePollingQueryOptions({
       enabled,
-      active: pollWhenVisible && isDocumentVisible,
+      active: pollWhenVisible && isDocumentVisible && !isStreamConnected,
       staleTime: 10_000,
       refetchOnWindowFocus: true,
     }),
@@ -0,0 +1,93 @@
+import { useEffect, useSyncExternalStore } from 'react'
+import { useQueryClient } from '@tanstack/react-query'
+
+const USER_EVENTS_URL = '/api/v1/user/events'
+
+type UserStreamEventType =
+  | 'notification_created'
+  | 'subscription_runtime_updated'
+  | 'device_changed'
+  | 'payment_completed'
+
+const INVALIDATED_QUERY_KEYS: Record<UserStreamEventType, string[][]> = {
+  notification_created: [['notifications']],
+  subscription_runtime_updated: [['subscriptions']],
+  device_changed: [['devices'], ['subscriptions']],
+  payment_completed: [['subscriptions'], ['user-profile'], ['user-transactions']],
+}
+
+let isStreamConnected = false
+const connectionListeners = new Set<() => void>()
+
+function setStreamConnected(value: boolean): void {
+  if (isStreamConnected === value) {
+    return
+  }
+  isStreamConnected = value
+  connectionListeners.forEach((listener) => listener())
+}
+
+function subscribeStreamConnection(listener: () => void): () => void {
+  connectionListeners.add(listener)
+  return () => {
+    connectionListeners.delete(listener)
+  }
+}
+
+/** True while the server push channel is open; polling queries can stand down meanwhile. */
+export function useUserEventStreamConnected(): boolean {
+  return useSyncExternalStore(
+    subscribeStreamConnection,
+    () => isStreamConnected,
+    () => false,
+  )
+}
+
+export function useUserEventStream(options?: { enabled?: boolean }): void {
+  const enabled = options?.enabled ?? true
+  const queryClient = useQueryClient()
+
+  useEffect(() => {
+    if (!enabled || typeof EventSource === 'undefined') {
+      return undefined
+    }
+
+    const source = new EventSource(USER_EVENTS_URL, { withCredentials: true })
+    const eventTypes = Object.keys(INVALIDATED_QUERY_KEYS) as UserStreamEventType[]
+    let hasConnected = false
+
+    const invalidate = (queryKeys: string[][]) => {
+      queryKeys.forEach((queryKey) => {
+        void queryClient.invalidateQueries({ queryKey })
+      })
+    }
+
+    const handleOpen = () => {
+      // Events published while reconnecting are lost, so catch up once per reconnect.
+      if (hasConnected) {
+        invalidate(eventTypes.flatMap((eventType) => INVALIDATED_QUERY_KEYS[eventType]))
+      }
+      hasConnected = true
+      setStreamConnected(true)
+    }
+    const handleError = () => {
+      setStreamConnected(false)
+    }
+    const eventHandlers = eventTypes.map((eventType) => {
+      const handler = () => invalidate(INVALIDATED_QUERY_KEYS[eventType])
+      source.addEventListener(eventType, handler)
+      return [eventType, handler] as const
+    })
+
+    source.addEventListener('open', handleOpen)
+    source.addEventListener('error', handleError)
+
+    return () => {
+      eventHandlers.forEach(([eventType, handler]) => source.removeEventListener(eventType, handler))
+      source.removeEventListener('open', handleOpen)
+      source.removeEventListener('error', handleError)
+      source.close()
+      setStreamConnected(false)
+    }
+  }, [enabled, queryClient])
+}